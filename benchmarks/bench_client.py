@@ -0,0 +1,93 @@
+from typing import Any, Callable, Dict
+
+from benchmarks.utils import mock_api, summarize, timeit
+from giza.cli.client import EndpointsClient, JobsClient, ModelsClient
+from giza.cli.mock_server import mock_token
+from giza.cli.schemas.endpoints import EndpointCreate
+from giza.cli.schemas.jobs import JobCreate
+from giza.cli.schemas.models import ModelCreate
+from giza.cli.utils.enums import Framework, JobSize
+
+MODELS = 100
+# Jobs tracked at once and polling ticks measured for them
+FLEET = 200
+FLEET_TICKS = 5
+# Predictions sent to an endpoint, one per request or coalesced in batches
+PREDICTIONS = 200
+PREDICT_BATCH_SIZE = 16
+
+
+def run(requests: int = 200) -> Dict[str, Any]:
+    """
+    Requests per second of the `get` and `list` calls of the clients, and duration of a polling
+    tick over a fleet of jobs, one `get` per job against a single `get_many`, and throughput of
+    the predictions on an endpoint with and without micro-batching.
+
+    Args:
+        requests (int): number of requests per call
+
+    Returns:
+        Dict[str, Any]: requests per second and latency of each call
+    """
+    with mock_api() as url:
+        token = mock_token()
+        models_client = ModelsClient(url, token=token)
+        jobs_client = JobsClient(url, token=token)
+        for i in range(MODELS):
+            models_client.create(ModelCreate(name=f"model-{i}"))
+        job = jobs_client.create(JobCreate(size=JobSize.S, framework=Framework.CAIRO))
+
+        calls: Dict[str, Callable[[], Any]] = {
+            "models_get": lambda: models_client.get(1),
+            "models_list": models_client.list,
+            "jobs_get": lambda: jobs_client.get(job.id),
+        }
+        results = {}
+        for name, call in calls.items():
+            durations = timeit(call, requests)
+            results[name] = {
+                "requests_per_s": requests / sum(durations),
+                **summarize(durations),
+            }
+
+        fleet = [
+            jobs_client.create(JobCreate(size=JobSize.S, framework=Framework.CAIRO)).id
+            for _ in range(FLEET)
+        ]
+        ticks: Dict[str, Callable[[], Any]] = {
+            "jobs_tick_get": lambda: [jobs_client.get(job_id) for job_id in fleet],
+            "jobs_tick_get_many": lambda: jobs_client.get_many(fleet),
+        }
+        for name, call in ticks.items():
+            results[name] = summarize(timeit(call, FLEET_TICKS))
+
+        endpoints_client = EndpointsClient(url, token=token)
+        endpoint = endpoints_client.create(
+            1, 1, EndpointCreate(size="S", model_id=1, version_id=1)
+        )
+        uri = endpoint.uri or ""
+
+        def predict(batch_size: int) -> None:
+            batcher = (
+                endpoints_client.batcher(uri, batch_size) if batch_size > 1 else None
+            )
+            try:
+                for prediction in endpoints_client.predict_many(
+                    uri, ([i] for i in range(PREDICTIONS)), batcher=batcher
+                ):
+                    if isinstance(prediction, Exception):
+                        raise prediction
+            finally:
+                if batcher is not None:
+                    batcher.close()
+
+        for name, batch_size in (
+            ("predict_many", 1),
+            ("predict_many_batched", PREDICT_BATCH_SIZE),
+        ):
+            durations = timeit(lambda: predict(batch_size), 3)  # noqa: B023
+            results[name] = {
+                "predictions_per_s": PREDICTIONS / min(durations),
+                **summarize(durations),
+            }
+    return results
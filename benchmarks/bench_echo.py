@@ -0,0 +1,35 @@
+import io
+from contextlib import redirect_stdout
+from typing import Any, Dict
+
+from benchmarks.utils import summarize, timeit
+from giza.cli.schemas.models import Model, ModelList
+from giza.cli.utils.echo import Echo
+
+ROWS = 10_000
+
+
+def run(rows: int = ROWS, repeat: int = 3) -> Dict[str, Any]:
+    """
+    Render time of `Echo.print_model` for a list of models.
+
+    Args:
+        rows (int): number of rows of the table
+        repeat (int): number of renders
+
+    Returns:
+        Dict[str, Any]: render time of the table
+    """
+    models = ModelList(
+        root=[
+            Model(id=i, name=f"model-{i}", description="Benchmark model")
+            for i in range(rows)
+        ]
+    )
+    echo = Echo()
+
+    def render() -> None:
+        with redirect_stdout(io.StringIO()):
+            echo.print_model(models)
+
+    return {f"print_model_{rows}_rows": summarize(timeit(render, repeat))}
@@ -0,0 +1,75 @@
+import os
+import tempfile
+from contextlib import redirect_stdout
+from typing import Any, Dict
+
+from benchmarks.utils import mock_api, run_isolated
+from giza.cli.mock_server import mock_token
+
+JOB_DURATION = 1.0
+
+
+def _prove(tmp_dir: str) -> None:
+    from giza.cli.frameworks import cairo
+
+    trace, memory = os.path.join(tmp_dir, "trace"), os.path.join(tmp_dir, "memory")
+    for path in (trace, memory):
+        with open(path, "wb") as f:
+            f.write(b"data")
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        cairo.prove(
+            data=[trace, memory],
+            debug=False,
+            output_path=os.path.join(tmp_dir, "zk.proof"),
+        )
+
+
+def _transpile(tmp_dir: str) -> None:
+    from giza.cli.frameworks import cairo
+
+    model_path = os.path.join(tmp_dir, "model.onnx")
+    with open(model_path, "wb") as f:
+        f.write(b"onnx")
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        cairo.transpile(
+            model_path=model_path,
+            model_id=None,
+            desc=None,
+            model_desc=None,
+            output_path=os.path.join(tmp_dir, "cairo_model"),
+            download_model=True,
+            download_sierra=False,
+            json=False,
+            debug=False,
+        )
+
+
+def run(job_duration: float = JOB_DURATION) -> Dict[str, Any]:
+    """
+    Time to detect the completion of a job or a transpilation by the wait loops of the commands.
+
+    The commands run in a fresh process pointed to the mock API, where the work takes `job_duration`
+    seconds. Everything above it is the latency added by the polling.
+
+    Args:
+        job_duration (float): seconds that the mock API takes to complete the work
+
+    Returns:
+        Dict[str, Any]: total duration and detection latency per wait loop
+    """
+    results = {}
+    with mock_api(job_duration=job_duration) as url:
+        os.environ["GIZA_API_HOST"] = url
+        os.environ["GIZA_TOKEN"] = mock_token()
+        try:
+            for name, command in {"prove": _prove, "transpile": _transpile}.items():
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    seconds = run_isolated(command, tmp_dir)["seconds"]
+                results[name] = {
+                    "seconds": seconds,
+                    "time_to_detect_s": seconds - job_duration,
+                }
+        finally:
+            del os.environ["GIZA_API_HOST"]
+            del os.environ["GIZA_TOKEN"]
+    return results
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+from typing import Any, Dict
+
+from benchmarks.utils import summarize, timeit
+
+# `--help` is answered before the version check, so no request is sent
+COMMAND = [
+    sys.executable,
+    "-c",
+    "import sys; sys.argv = ['giza', '--help']; "
+    "from giza.cli.cli import entrypoint; entrypoint()",
+]
+
+
+def run(repeat: int = 5) -> Dict[str, Any]:
+    """
+    Cold start time of the CLI, from the interpreter start until the help is printed.
+
+    Args:
+        repeat (int): number of runs
+
+    Returns:
+        Dict[str, Any]: duration of the runs
+    """
+
+    def start() -> None:
+        subprocess.run(COMMAND, check=True, stdout=subprocess.DEVNULL)
+
+    return {"cold_start": summarize(timeit(start, repeat))}
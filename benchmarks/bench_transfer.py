@@ -0,0 +1,73 @@
+import os
+import tempfile
+from typing import Any, Dict, List
+
+from benchmarks.utils import MB, mock_api, run_isolated
+from giza.cli.client import JobsClient, ModelsClient, ProofsClient, VersionsClient
+from giza.cli.mock_server import mock_token
+from giza.cli.schemas.jobs import JobCreate
+from giza.cli.schemas.models import ModelCreate
+from giza.cli.schemas.versions import VersionCreate
+from giza.cli.utils.enums import Framework, JobSize
+
+DEFAULT_SIZES_MB = [10, 100]
+
+
+def _download(url: str, token: str, proof_id: int) -> None:
+    ProofsClient(url, token=token).download(proof_id)
+
+
+def _upload(url: str, token: str, upload_url: str, path: str) -> None:
+    with open(path, "rb") as f:
+        VersionsClient(url, token=token)._upload(upload_url, f)
+
+
+def _throughput(size_mb: int, result: Dict[str, float]) -> Dict[str, float]:
+    return {
+        **result,
+        "mb_per_s": size_mb / result["seconds"],
+        "rss_increase_mb": result["peak_rss_mb"] - result["baseline_rss_mb"],
+    }
+
+
+def run(sizes_mb: List[int] = DEFAULT_SIZES_MB) -> Dict[str, Any]:
+    """
+    Throughput and peak RSS of `ProofsClient.download` and `VersionsClient._upload`.
+
+    Each transfer runs in a fresh process so its peak RSS is not shadowed by previous ones.
+
+    Args:
+        sizes_mb (List[int]): sizes of the synthetic payloads in MB
+
+    Returns:
+        Dict[str, Any]: duration, MB/s and peak RSS per size and direction
+    """
+    results = {}
+    for size_mb in sizes_mb:
+        size = size_mb * MB
+        with mock_api(payload_size=size, job_duration=0) as url:
+            token = mock_token()
+            jobs_client = JobsClient(url, token=token)
+            job = jobs_client.create(
+                JobCreate(size=JobSize.S, framework=Framework.CAIRO), b"trace"
+            )
+            # The mock generates the proof once the job is seen as completed
+            jobs_client.get(job.id)
+            proof = ProofsClient(url, token=token).get_by_job_id(job.id)
+            download = run_isolated(_download, url, token, proof.id)
+
+            model = ModelsClient(url, token=token).create(ModelCreate(name="model"))
+            _, upload_url = VersionsClient(url, token=token).create(
+                model.id, VersionCreate(size=size, framework=Framework.CAIRO), "model"
+            )
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, "model")
+                with open(path, "wb") as f:
+                    f.truncate(size)
+                upload = run_isolated(_upload, url, token, upload_url, path)
+
+        results[f"{size_mb}MB"] = {
+            "download": _throughput(size_mb, download),
+            "upload": _throughput(size_mb, upload),
+        }
+    return results
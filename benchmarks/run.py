@@ -0,0 +1,150 @@
+import datetime
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks import (
+    bench_client,
+    bench_echo,
+    bench_polling,
+    bench_startup,
+    bench_transfer,
+)
+from giza.cli import __version__
+from giza.cli.utils import echo
+
+app = typer.Typer()
+
+BENCHMARKS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "client": bench_client.run,
+    "transfer": bench_transfer.run,
+    "polling": bench_polling.run,
+    "echo": bench_echo.run,
+    "startup": bench_startup.run,
+}
+# Metrics where a higher value is better, for the rest lower is better
+HIGHER_IS_BETTER = ("_per_s",)
+# Metrics that describe the measurement rather than the performance
+IGNORED = ("baseline_rss_mb",)
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _flatten(results: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name))
+        elif isinstance(value, int | float) and not key.endswith(IGNORED):
+            flat[name] = float(value)
+    return flat
+
+
+@app.command()
+def run(
+    output: str = typer.Option(
+        "benchmark-results.json", "--output", "-o", help="Path of the results file"
+    ),
+    only: Optional[List[str]] = typer.Option(
+        None, "--only", help=f"Benchmarks to run: {', '.join(BENCHMARKS)}"
+    ),
+    sizes: str = typer.Option(
+        ",".join(str(s) for s in bench_transfer.DEFAULT_SIZES_MB),
+        "--sizes",
+        help="Comma separated payload sizes in MB for the transfer benchmark, e.g. 10,100,1024,2048",
+    ),
+) -> None:
+    """
+    Run the benchmarks against a local mock API and save the results as json.
+    """
+    selected = only or list(BENCHMARKS)
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        echo.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+        raise typer.Exit(1)
+
+    results: Dict[str, Any] = {
+        "metadata": {
+            "commit": _commit(),
+            "version": __version__,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        },
+        "benchmarks": {},
+    }
+    for name in selected:
+        echo(f"Running {name} benchmark...")
+        kwargs = {}
+        if name == "transfer":
+            kwargs["sizes_mb"] = [int(size) for size in sizes.split(",")]
+        start = time.perf_counter()
+        results["benchmarks"][name] = BENCHMARKS[name](**kwargs)
+        echo(f"Benchmark {name} finished in {time.perf_counter() - start:.2f}s ✅")
+
+    with open(output, "w") as f:
+        json.dump(results, f, indent=4)
+    echo(f"Results saved at: {output}")
+
+
+@app.command()
+def compare(
+    baseline: str = typer.Argument(..., help="Results file of the reference run"),
+    current: str = typer.Argument(..., help="Results file to compare"),
+    threshold: float = typer.Option(
+        0.1, help="Relative change considered a regression, 0.1 means 10%"
+    ),
+    fail: bool = typer.Option(
+        False, "--fail", help="Exit with an error if there is any regression"
+    ),
+) -> None:
+    """
+    Compare two results files, highlighting the regressions.
+    """
+    with open(baseline) as f:
+        base = _flatten(json.load(f)["benchmarks"])
+    with open(current) as f:
+        new = _flatten(json.load(f)["benchmarks"])
+
+    table = Table(title=f"{baseline} -> {current}")
+    for column in ("metric", "baseline", "current", "change"):
+        table.add_column(column)
+    regressions = 0
+    for metric in sorted(base.keys() & new.keys()):
+        before, after = base[metric], new[metric]
+        if not before:
+            table.add_row(metric, f"{before:.4g}", f"{after:.4g}", "n/a")
+            continue
+        change = (after - before) / before
+        if metric.endswith(HIGHER_IS_BETTER):
+            change = -change
+        color = "red" if change > threshold else "green" if change < -threshold else ""
+        regressions += change > threshold
+        table.add_row(
+            metric,
+            f"{before:.4g}",
+            f"{after:.4g}",
+            f"[{color}]{change:+.1%}[/{color}]" if color else f"{change:+.1%}",
+        )
+    Console().print(table)
+    echo("Positive changes are worse, negative changes are better")
+
+    if regressions:
+        echo.warning(f"{regressions} metrics regressed more than {threshold:.0%}")
+        if fail:
+            raise typer.Exit(1)
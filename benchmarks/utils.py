@@ -0,0 +1,125 @@
+import multiprocessing
+import resource
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Iterator, List
+
+from giza.cli.mock_server import MockApiServer, MockConfig
+
+MB = 1024 * 1024
+
+# Fresh interpreters, so each measurement has its own peak RSS
+_context = multiprocessing.get_context("spawn")
+
+
+def _serve(config: Dict[str, Any], urls: Any) -> None:
+    server = MockApiServer(config=MockConfig(**config))
+    urls.put(server.url)
+    server.serve_forever(poll_interval=0.05)
+
+
+@contextmanager
+def mock_api(**config: Any) -> Iterator[str]:
+    """
+    Run the mock API in its own process, so it does not compete with the client for the GIL
+    or inflate its memory usage.
+
+    Args:
+        config: fields of `MockConfig`
+
+    Yields:
+        str: url of the mock API
+    """
+    urls = _context.Queue()
+    process = _context.Process(
+        target=_serve, args=(asdict(MockConfig(**config)), urls), daemon=True
+    )
+    process.start()
+    try:
+        yield urls.get(timeout=30)
+    finally:
+        process.terminate()
+        process.join()
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak resident set size of the current process in MB.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / MB if sys.platform == "darwin" else peak / 1024
+
+
+def rss_mb() -> float:
+    """
+    Current resident set size of the process in MB, the peak where it is not available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except OSError:
+        return peak_rss_mb()
+    return pages * resource.getpagesize() / MB
+
+
+def _isolated(func: Callable, args: tuple, results: Any) -> None:
+    baseline = rss_mb()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    results.put(
+        {"seconds": elapsed, "baseline_rss_mb": baseline, "peak_rss_mb": peak_rss_mb()}
+    )
+
+
+def run_isolated(func: Callable, *args: Any) -> Dict[str, float]:
+    """
+    Run a function in a fresh process and measure its duration and peak RSS.
+
+    Args:
+        func (Callable): module level function to run
+        args: arguments of the function
+
+    Returns:
+        Dict[str, float]: seconds spent, RSS before the call and peak RSS, in MB
+    """
+    results = _context.Queue()
+    process = _context.Process(target=_isolated, args=(func, args, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> List[float]:
+    """
+    Measure the duration of each call of a function.
+
+    Args:
+        func (Callable[[], Any]): function to measure
+        repeat (int): number of calls
+
+    Returns:
+        List[float]: duration of each call in seconds
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def summarize(durations: List[float]) -> Dict[str, float]:
+    """
+    Median, min and max of a list of durations.
+    """
+    return {
+        "median_s": statistics.median(durations),
+        "min_s": min(durations),
+        "max_s": max(durations),
+    }
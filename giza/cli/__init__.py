@@ -1,4 +1,8 @@
 import os
+import time
+
+# Used by `--profile` to report the time spent importing the CLI
+STARTED_AT = time.perf_counter()
 
 __version__ = "0.18.0"
 # Until DNS is fixed
@@ -1,29 +1,43 @@
+import sys
+import time
+from typing import Optional
+
 import click
 import typer
 import typer.rich_utils
 from rich.traceback import install
 
+from giza.cli import STARTED_AT
 from giza.cli.commands.actions import app as actions_app
 from giza.cli.commands.agents import app as agents_app
 from giza.cli.commands.endpoints import app as deployments_app
 from giza.cli.commands.endpoints import deploy
+from giza.cli.commands.jobs import app as jobs_app
 from giza.cli.commands.models import app as models_app
+from giza.cli.commands.pipeline import pipeline
 from giza.cli.commands.prove import prove
 from giza.cli.commands.reset_password import (
     request_reset_password_token,
     reset_password,
 )
+from giza.cli.commands.resume import resume
 from giza.cli.commands.users import app as users_app
 from giza.cli.commands.verify import verify
 from giza.cli.commands.version import check_version
 from giza.cli.commands.versions import app as versions_app
 from giza.cli.commands.versions import transpile
 from giza.cli.commands.workspaces import app as workspaces_app
+from giza.cli.options import PROFILE_OPTION, PROFILE_OUTPUT_OPTION
 from giza.cli.utils import echo
+from giza.cli.utils.metrics import metrics
+from giza.cli.utils.profiling import Profiler, print_summary
+from giza.cli.utils.tracing import tracer
 
 install(suppress=[click])
 
 app = typer.Typer(rich_markup_mode="markdown", pretty_exceptions_show_locals=False)
+
+
 app.add_typer(
     users_app,
     name="users",
@@ -70,6 +84,13 @@ app.add_typer(
     help="""🚀 Utilities for managing endpoints""",
 )
 
+app.add_typer(
+    jobs_app,
+    name="jobs",
+    short_help="⏳ Utilities for following detached jobs",
+    help="""⏳ Utilities for following detached jobs""",
+)
+
 app.add_typer(
     actions_app,
     name="actions",
@@ -78,13 +99,56 @@ app.add_typer(
 )
 
 
+def main(
+    ctx: typer.Context,
+    profile: bool = PROFILE_OPTION,
+    profile_output: Optional[str] = PROFILE_OUTPUT_OPTION,
+) -> None:
+    """
+    Entrypoint of the CLI, checks for new versions and starts the profiler if requested.
+
+    Args:
+        ctx (typer.Context): context of the invocation
+        profile (bool): whether to profile the command
+        profile_output (Optional[str]): path prefix of the profile files
+    """
+    if profile:
+        _start_profiler(ctx, profile_output)
+    check_version()
+
+
+def _start_profiler(ctx: typer.Context, profile_output: Optional[str]) -> None:
+    """
+    Profile the command and write the results when it finishes.
+
+    Args:
+        ctx (typer.Context): context of the invocation, the profile is written when it is closed
+        profile_output (Optional[str]): path prefix of the profile files
+    """
+    import_time = time.perf_counter() - STARTED_AT
+    profiler = Profiler()
+    profiler.start()
+
+    def _write_profile() -> None:
+        profiler.stop()
+        command = metrics.command or ctx.invoked_subcommand or "giza"
+        prefix = profile_output or (
+            f"giza-profile-{command.replace(' ', '-')}-{time.strftime('%Y%m%d-%H%M%S')}"
+        )
+        folded_path, summary_path = profiler.write(prefix, import_time)
+        print_summary(profiler.summary(import_time))
+        echo(f"Profile saved at: {folded_path} and {summary_path} ✅")
+
+    ctx.call_on_close(_write_profile)
+
+
 app.callback(
     name="giza",
     help="""
     🔶 Giza-CLI to manage the resources at Giza 🔶.
     """,
     invoke_without_command=True,
-)(check_version)
+)(main)
 
 
 app.add_typer(
@@ -158,6 +222,10 @@ app.command(
 
         * Download the proof to the output path
 
+    The API can not refresh a login token, without an API key (`giza users create-api-key`) a job that
+    takes longer than the token fails to be collected. Use `--detach` and `giza jobs wait` after logging
+    in again in that case.
+
     """,
 )(prove)
 
@@ -185,9 +253,57 @@ app.command(
 
         * If the job its successfull the verification will be OK, otherwise it will fail
 
+    For Cairo, when `GIZA_VERIFIER_VERSION` is set, the successful verifications of proof files are
+    recorded in a local ledger keyed by the sha256 of the proof and that version, a proof already
+    verified is not uploaded again. Use `--force` to verify it anyway. Verifications linked to a
+    model version always run. Detached verifications are recorded by `giza jobs wait --kind VERIFY`.
+
     """,
 )(verify)
 
+app.command(
+    name="pipeline",
+    short_help="🏭 Runs transpile, deploy and prove from a single spec",
+    help="""🏭 Runs transpile, deploy and prove from a single YAML or TOML spec.
+
+    ```yaml
+    model:
+      path: model.onnx
+    transpile:
+      output_path: cairo_model
+    deploy:
+      size: S
+    proofs:
+      - trace: trace.bin
+        memory: memory.bin
+        output_path: zk.proof
+    ```
+
+    Every stage shares one session and the model is resolved once. The proving jobs start right away
+    as they do not depend on the model, the deployment and the download start as soon as the
+    transpilation is COMPLETED. The duration of each stage is reported at the end.
+    """,
+)(pipeline)
+
+app.command(
+    name="resume",
+    short_help="⏯️ Resumes an interrupted transpilation or proving workflow",
+    help="""⏯️ Resumes an interrupted transpilation or proving workflow.
+
+    `giza transpile` and `giza prove` keep a journal of each workflow at `~/.giza/runs` with the
+    model, version and job ids, whether the model was uploaded and where to download the results.
+    If the process dies, this command reattaches to the jobs and continues from the last completed stage:
+
+        * Uploads the model if the upload did not finish
+
+        * Waits for the transpilation or the proving job
+
+        * Downloads the transpiled model or the proof
+
+    Without a workflow id the most recent one is resumed, use `--list` to see all of them.
+    """,
+)(resume)
+
 app.command(
     name="reset-password",
     short_help="🔑 Reset the password for a user using a reset token",
@@ -214,5 +330,29 @@ app.command(
 )(request_reset_password_token)
 
 
+def _command_name(argv: list[str]) -> str:
+    """
+    Name of the invoked command, e.g. `versions transpile`, used to label the metrics.
+    """
+    groups = {group.name for group in app.registered_groups}
+    words = []
+    args = iter(argv)
+    for arg in args:
+        if arg == "--profile-output":
+            next(args, None)
+        elif arg.startswith("-"):
+            continue
+        elif len(words) < 2:
+            words.append(arg)
+    if words and words[0] in groups:
+        return " ".join(words[:2])
+    return " ".join(words[:1])
+
+
 def entrypoint():
-    app()
+    command = _command_name(sys.argv[1:])
+    metrics.command = command
+    metrics.export_at_exit()
+    tracer.configure()
+    with tracer.span(f"giza {command}".strip(), **{"giza.command": command}):
+        app()
@@ -1,20 +1,43 @@
 import copy
 import json
 import os
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BufferedReader, TextIOWrapper
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
 
 from jose import jwt
-from jose.exceptions import ExpiredSignatureError
+from jose.exceptions import ExpiredSignatureError, JWTError
 from pydantic import SecretStr
-from requests import HTTPError, Response, Session
+from requests import HTTPError, Response
+from requests.adapters import HTTPAdapter
 from rich import print, print_json
 
 from giza.cli.schemas import users
 from giza.cli.schemas.agents import Agent, AgentCreate, AgentList, AgentUpdate
-from giza.cli.schemas.endpoints import Endpoint, EndpointCreate, EndpointsList
+from giza.cli.schemas.endpoints import (
+    Endpoint,
+    EndpointCreate,
+    EndpointsList,
+    Prediction,
+)
 from giza.cli.schemas.jobs import Job, JobCreate, JobList
 from giza.cli.schemas.logs import Logs
 from giza.cli.schemas.message import Msg
@@ -25,13 +48,26 @@ from giza.cli.schemas.verify import VerifyResponse
 from giza.cli.schemas.versions import Version, VersionCreate, VersionList, VersionUpdate
 from giza.cli.schemas.workspaces import Workspace
 from giza.cli.utils import echo
+from giza.cli.utils.batching import DEFAULT_MAX_WAIT, MicroBatcher
 from giza.cli.utils.decorators import auth
-from giza.cli.utils.enums import VersionStatus
+from giza.cli.utils.enums import JobSize, VersionStatus
+from giza.cli.utils.files import atomic_write_json, file_lock
+from giza.cli.utils.metrics import record_response
+from giza.cli.utils.prediction_cache import PredictionCache
+from giza.cli.utils.rate_limit import get_rate_limited_adapter
+from giza.cli.utils.tracing import TracedSession
 
 DEFAULT_API_VERSION = "v1"
 GIZA_TOKEN_VARIABLE = "GIZA_TOKEN"
 MODEL_URL_HEADER = "X-MODEL-URL"
 API_KEY_HEADER = "X-API-KEY"
+CREDENTIALS_LOCK_FILE = ".credentials.lock"
+# Seconds before the token expiry when it is renewed
+TOKEN_RENEWAL_MARGIN = 300
+# Bytes read at a time when a download is spooled to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Predictions in flight at once when many inputs are sent to an endpoint
+PREDICT_CONCURRENCY = 8
 
 
 class ApiClient:
@@ -48,7 +84,6 @@ class ApiClient:
         verify: bool = True,
         debug: Optional[bool] = False,
     ) -> None:
-        self.session = Session()
         self.api_key = None
         self.token = None
 
@@ -57,6 +92,13 @@ class ApiClient:
         parsed_url = urlparse(host)
 
         self.url = f"{parsed_url.scheme}://{parsed_url.netloc}/api/{api_version}"
+        self.session = TracedSession(propagate_to=self.url)
+        # Only the API is rate limited, presigned urls are left untouched
+        self.session.mount(
+            f"{parsed_url.scheme}://{parsed_url.netloc}/",
+            get_rate_limited_adapter(parsed_url.netloc),
+        )
+        self.session.hooks["response"].append(self._record_response)
 
         if token is not None:
             headers = {"Authorization": "Bearer {token}", "Content-Type": "text/json"}
@@ -73,6 +115,28 @@ class ApiClient:
         self.verify = verify
         self.giza_dir = Path.home() / ".giza"
         self._default_credentials = self._load_credentials_file()
+        self._renewal_lock = threading.Lock()
+        self._renewal_timer: Optional[threading.Timer] = None
+        self._renewal_token: Optional[str] = None
+
+    def share_session(self, other: "ApiClient") -> None:
+        """
+        Send the requests through the session of another client, reusing its connections.
+
+        Args:
+            other (ApiClient): client whose session is used
+        """
+        self.session.close()
+        self.session = other.session
+
+    def _record_response(self, response: Response, *args: Any, **kwargs: Any) -> None:
+        """
+        Session hook to record the metrics of every request.
+
+        Args:
+            response (Response): response of the request
+        """
+        record_response(response, api=response.url.startswith(self.url))
 
     def _get_auth_header(self) -> Dict[str, str]:
         """
@@ -82,7 +146,10 @@ class ApiClient:
             Dict[str, str]: A dictionary containing the authorization header.
         """
 
-        if self.token is not None:
+        # Close to the expiry the API key is preferred so requests do not fail mid-flight
+        if self.token is not None and not (
+            self.api_key is not None and self._expires_soon(self.token)
+        ):
             header = {"Authorization": f"Bearer {self.token}"}
         elif self.api_key is not None:
             header = {"X-API-Key": self.api_key}
@@ -100,6 +167,32 @@ class ApiClient:
         if self.debug:
             print_json(message) if json else echo.debug(message)
 
+    def _download_to_file(self, url: str) -> BinaryIO:
+        """
+        Stream a download into a temporary file, so it is never fully held in memory.
+
+        Args:
+            url (str): url of the file, usually a presigned url
+
+        Raises:
+            HTTPError: if the download fails
+
+        Returns:
+            BinaryIO: temporary file positioned at the start, removed once closed
+        """
+        with self.session.get(url, stream=True) as response:
+            self._echo_debug(str(response))
+            response.raise_for_status()
+            file_ = tempfile.TemporaryFile()
+            try:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    file_.write(chunk)
+            except BaseException:
+                file_.close()
+                raise
+        file_.seek(0)
+        return file_
+
     def _load_credentials_file(self) -> Dict:
         """
         Checks if the `~/.giza/.credentials.json` exists to retrieve existing credentials.
@@ -109,17 +202,32 @@ class ApiClient:
             Dict: if the file exists return the credentials from the file if not return an empty dict.
         """
         if (self.giza_dir / ".credentials.json").exists():
-            with open(self.giza_dir / ".credentials.json") as f:
-                credentials = json.load(f)
-                self._echo_debug(
-                    f"Credentials loaded from: {self.giza_dir / '.credentials.json'}",
-                )
+            with file_lock(self.giza_dir / CREDENTIALS_LOCK_FILE, shared=True):
+                credentials = self._read_credentials_file()
         else:
             credentials = {}
             self._echo_debug("Credentials not found in default directory")
 
         return credentials
 
+    def _read_credentials_file(self) -> Dict:
+        """
+        Read the credentials file, the caller is responsible of holding the credentials lock.
+
+        Returns:
+            Dict: the credentials from the file or an empty dict if it can not be read.
+        """
+        try:
+            with open(self.giza_dir / ".credentials.json") as f:
+                credentials = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self._echo_debug("Credentials file could not be read")
+            return {}
+        self._echo_debug(
+            f"Credentials loaded from: {self.giza_dir / '.credentials.json'}",
+        )
+        return credentials
+
     def _get_oauth(self, user: str, password: str) -> None:
         """
         Retrieve JWT token.
@@ -164,10 +272,20 @@ class ApiClient:
             if not self.giza_dir.exists():
                 echo("Creating default giza dir")
                 self.giza_dir.mkdir()
-            kwargs.update({"token": self.token})
-            with open(self.giza_dir / ".credentials.json", "w") as f:
-                json.dump(kwargs, f, indent=4)
-            echo(f"Credentials written to: {self.giza_dir / '.credentials.json'}")
+            with file_lock(self.giza_dir / CREDENTIALS_LOCK_FILE):
+                self._dump_credentials(**kwargs)
+
+    def _dump_credentials(self, **kwargs: Any) -> None:
+        """
+        Atomically replace the credentials file, the caller is responsible of holding the credentials lock.
+
+        Args:
+            kwargs(dict): extra keyword arguments to save with the credentials, usually `user`.
+        """
+        kwargs.update({"token": self.token})
+        atomic_write_json(self.giza_dir / ".credentials.json", kwargs)
+        self._default_credentials = kwargs
+        echo(f"Credentials written to: {self.giza_dir / '.credentials.json'}")
 
     def _write_api_key(self, **kwargs: Any) -> None:
         """
@@ -180,8 +298,8 @@ class ApiClient:
             if not self.giza_dir.exists():
                 echo("Creating default giza dir")
                 self.giza_dir.mkdir()
-            with open(self.giza_dir / ".api_key.json", "w") as f:
-                json.dump(kwargs, f, indent=4)
+            with file_lock(self.giza_dir / CREDENTIALS_LOCK_FILE):
+                atomic_write_json(self.giza_dir / ".api_key.json", kwargs)
             echo(f"API Key written to: {self.giza_dir / '.api_key.json'}")
 
     def _is_expired(self, token: str) -> bool:
@@ -206,6 +324,171 @@ class ApiClient:
             self._echo_debug("Token is expired")
             return True
 
+    def _login(self, user: str, password: str, renew: bool = False) -> None:
+        """
+        Log in and store the new token, only one process logs in at a time.
+
+        The credentials lock is held during the login. Once acquired, the credentials file
+        is read again: if another process refreshed the token for the same user while we
+        were waiting, that token is reused instead of logging in again.
+
+        Args:
+            user (str): username used to retrieve the token
+            password (str): password to authenticate against the login endpoint
+            renew (bool): the token must be renewed even if the current one is valid
+        """
+        previous_token = self._default_credentials.get("token")
+        if not self.giza_dir.exists():
+            echo("Creating default giza dir")
+            self.giza_dir.mkdir()
+        with file_lock(self.giza_dir / CREDENTIALS_LOCK_FILE):
+            credentials = (
+                self._read_credentials_file()
+                if (self.giza_dir / ".credentials.json").exists()
+                else {}
+            )
+            token = credentials.get("token")
+            refreshed_by_other = token is not None and (
+                not renew or token != previous_token
+            )
+            if (
+                refreshed_by_other
+                and credentials.get("user") == user
+                and not self._is_expired(token)
+            ):
+                self._echo_debug("Token was refreshed by another process, reusing it")
+                self.token = token
+                self._default_credentials = credentials
+                return
+            self._get_oauth(user, password)
+            self._dump_credentials(user=user)
+
+    def _get_token_expiry(self, token: str) -> Optional[float]:
+        """
+        Get the expiry of the token from its `exp` claim.
+
+        Args:
+            token (str): token to check expiry
+
+        Returns:
+            Optional[float]: expiry as a timestamp or None if the token does not have one
+        """
+        try:
+            claims = jwt.get_unverified_claims(token)
+        except JWTError:
+            return None
+        exp = claims.get("exp")
+        return float(exp) if exp is not None else None
+
+    def _expires_soon(self, token: str) -> bool:
+        """
+        Check if the token expires within the renewal margin.
+
+        Args:
+            token (str): token to check expiry
+
+        Returns:
+            bool: if the token is about to expire
+        """
+        expiry = self._get_token_expiry(token)
+        return expiry is not None and expiry - time.time() <= TOKEN_RENEWAL_MARGIN
+
+    def _schedule_token_renewal(self) -> None:
+        """
+        Schedule the renewal of the current token in a background thread, right before it expires.
+
+        Only one renewal is scheduled per token, calling it several times with the same token is a no-op.
+        """
+        token = self.token
+        expiry = self._get_token_expiry(token) if token is not None else None
+        with self._renewal_lock:
+            if expiry is None or token == self._renewal_token:
+                return
+            if self._renewal_timer is not None:
+                self._renewal_timer.cancel()
+            delay = max(expiry - TOKEN_RENEWAL_MARGIN - time.time(), 0)
+            self._renewal_timer = threading.Timer(delay, self._renew_token)
+            self._renewal_timer.daemon = True
+            self._renewal_timer.start()
+            self._renewal_token = token
+        self._echo_debug(f"Token renewal scheduled in {delay:.0f}s")
+
+    def _renew_token(self) -> bool:
+        """
+        Keep authenticating once the current token expires.
+
+        The API can not refresh a token, so a newer one is only found in the credentials file,
+        when another process logged in again. Otherwise the API key is used, if available, for
+        the next requests.
+
+        Returns:
+            bool: whether the client can keep authenticating after the current token expiry
+        """
+        credentials = self._load_credentials_file()
+        token = credentials.get("token")
+        current_expiry = (
+            self._get_token_expiry(self.token) if self.token is not None else None
+        )
+        expiry = self._get_token_expiry(token) if token is not None else None
+        if (
+            expiry is not None
+            and (current_expiry is None or expiry > current_expiry)
+            and not self._is_expired(token)
+        ):
+            self._echo_debug("Token renewed from the credentials file")
+            self._default_credentials = credentials
+            self.token = token
+            self._schedule_token_renewal()
+            return True
+
+        self.retrieve_api_key()
+        if self.api_key is not None:
+            self._echo_debug("Token is about to expire, using the API key instead")
+            return True
+
+        echo.warning(
+            "Token is about to expire and no API key is available. "
+            "Log in again or create one using `giza users create-api-key`"
+        )
+        return False
+
+    def warn_token_expiry(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Warn when the client will stop authenticating, before a long wait starts.
+
+        Without an API key the client can not keep authenticating after its token expires, the
+        API can not refresh it, so a wait that lasts longer fails. The warning is only shown when
+        the token expires before `timeout`, or within the renewal margin when there is no timeout.
+
+        Args:
+            timeout (Optional[float]): seconds the wait can last, no limit by default
+
+        Returns:
+            Optional[float]: seconds until the token expires, None if there is an API key or
+                the token does not expire
+        """
+        self.retrieve_api_key()
+        expiry = (
+            self._get_token_expiry(self.token)
+            if self.api_key is None and self.token is not None
+            else None
+        )
+        if expiry is None:
+            return None
+        expires_in = max(expiry - time.time(), 0.0)
+        threshold = timeout if timeout is not None else TOKEN_RENEWAL_MARGIN
+        if expires_in < threshold:
+            echo.warning(
+                f"The token expires in {expires_in / 60:.0f} minutes and no API key is available, "
+                "waiting longer will fail. Create one using `giza users create-api-key` "
+                "or wait with `giza jobs wait` after logging in again"
+            )
+        else:
+            echo.debug(
+                f"The token expires in {expires_in / 60:.0f} minutes and can not be refreshed"
+            )
+        return expires_in
+
     def retrieve_api_key(self) -> None:
         """
         Retrieve the API key from the `~/.giza/.api_key.json` file.
@@ -278,10 +561,11 @@ class ApiClient:
             and user is not None
             and password is not None
         ):
-            self._get_oauth(user, password)
-            self._write_credentials(user=user)
+            self._login(user, password, renew=renew)
 
-        if getattr(self, "token", None) is None:
+        if getattr(self, "token", None) is not None:
+            self._schedule_token_renewal()
+        else:
             self.token = None
             echo.debug(
                 "Token is expired or could not retrieve it. "
@@ -599,6 +883,41 @@ class EndpointsClient(ApiClient):
 
         return Proof(**response.json())
 
+    @auth
+    def get_proof_download_url(
+        self, endpoint_id: int, proof_id: Union[int, str]
+    ) -> str:
+        """
+        Retrieve the presigned url to download a proof.
+
+        Args:
+            endpoint_id: Endpoint identifier
+            proof_id: Proof identifier
+
+        Returns:
+            The url of the proof binary file
+        """
+        headers = copy.deepcopy(self.default_headers)
+        headers.update(self._get_auth_header())
+
+        response = self.session.get(
+            "/".join(
+                [
+                    self.url,
+                    self.ENDPOINTS,
+                    str(endpoint_id),
+                    "proofs",
+                    f"{proof_id}:download",
+                ]
+            ),
+            headers=headers,
+        )
+
+        self._echo_debug(str(response))
+        response.raise_for_status()
+
+        return response.json()["download_url"]
+
     @auth
     def download_proof(self, endpoint_id: int, proof_id: Union[int, str]) -> bytes:
         """
@@ -669,12 +988,13 @@ class EndpointsClient(ApiClient):
         return Endpoint(**response.json())
 
     @auth
-    def get_logs(self, endpoint_id: int) -> Logs:
+    def get_logs(self, endpoint_id: int, offset: Optional[int] = None) -> Logs:
         """
         Get the latest logs of an endpoint.
 
         Args:
             endpoint_id: Endpoint identifier
+            offset: Only retrieve the logs after this offset, see `Logs.next_offset`
 
         Returns:
             Logs: The logs of the specified deployment
@@ -692,6 +1012,7 @@ class EndpointsClient(ApiClient):
                 ]
             ),
             headers=headers,
+            params={"offset": offset} if offset is not None else None,
         )
 
         self._echo_debug(str(response))
@@ -759,6 +1080,251 @@ class EndpointsClient(ApiClient):
 
         return VerifyResponse(**response.json())
 
+    @auth
+    def predict(
+        self,
+        uri: str,
+        args: Any,
+        job_size: JobSize = JobSize.S,
+        dry_run: bool = False,
+        cache: Optional[PredictionCache] = None,
+    ) -> Prediction:
+        """
+        Run a prediction on a deployed endpoint.
+
+        Args:
+            uri (str): uri of the endpoint, as returned by `get`
+            args (Any): input of the model, sent as `args`
+            job_size (JobSize): size of the proving job of the prediction
+            dry_run (bool): run the model without creating a proving job
+            cache (Optional[PredictionCache]): cache of the version deployed at the endpoint,
+                a cached prediction is returned without calling the endpoint. Dry runs bypass it
+
+        Returns:
+            Prediction: the output of the model and the id of the request
+        """
+        if cache is not None and not dry_run:
+            cached = cache.get(args)
+            if cached is not None:
+                return cached
+            prediction = self.predict(uri, args, job_size)
+            cache.put(args, prediction)
+            return prediction
+
+        headers = copy.deepcopy(self.default_headers)
+        headers.update(self._get_auth_header())
+        headers["Content-Type"] = "application/json"
+
+        response = self.session.post(
+            f"{uri.rstrip('/')}/cairo_run",
+            headers=headers,
+            json={"args": args, "job_size": job_size, "dry_run": dry_run},
+        )
+        self._echo_debug(str(response))
+
+        response.raise_for_status()
+
+        return Prediction(**response.json())
+
+    @auth
+    def predict_batch(
+        self,
+        uri: str,
+        batch: List[Any],
+        job_size: JobSize = JobSize.S,
+        dry_run: bool = False,
+    ) -> List[Union[Prediction, Exception]]:
+        """
+        Run the predictions of many inputs in a single request.
+
+        The inputs are sent as `batch` and the endpoint answers with one entry of `results` per
+        input, either the prediction or its `error`. A single input is sent as a plain prediction.
+
+        Args:
+            uri (str): uri of the endpoint, as returned by `get`
+            batch (List[Any]): inputs of the model
+            job_size (JobSize): size of the proving jobs of the predictions
+            dry_run (bool): run the model without creating proving jobs
+
+        Returns:
+            List[Union[Prediction, Exception]]: the prediction of each input, or its error
+        """
+        if len(batch) == 1:
+            return [self.predict(uri, batch[0], job_size, dry_run)]
+
+        headers = copy.deepcopy(self.default_headers)
+        headers.update(self._get_auth_header())
+        headers["Content-Type"] = "application/json"
+
+        response = self.session.post(
+            f"{uri.rstrip('/')}/cairo_run",
+            headers=headers,
+            json={"batch": batch, "job_size": job_size, "dry_run": dry_run},
+        )
+        self._echo_debug(str(response))
+
+        response.raise_for_status()
+
+        return [
+            (ValueError(result["error"]) if "error" in result else Prediction(**result))
+            for result in response.json()["results"]
+        ]
+
+    def batcher(
+        self,
+        uri: str,
+        max_batch_size: int,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        job_size: JobSize = JobSize.S,
+        dry_run: bool = False,
+        max_workers: int = PREDICT_CONCURRENCY,
+    ) -> MicroBatcher:
+        """
+        Coalesce the predictions submitted within `max_wait` seconds into batched requests.
+
+        Args:
+            uri (str): uri of the endpoint, as returned by `get`
+            max_batch_size (int): max number of inputs sent in a single request
+            max_wait (float): seconds a batch waits for more inputs after the first one
+            job_size (JobSize): size of the proving jobs of the predictions
+            dry_run (bool): run the model without creating proving jobs
+            max_workers (int): max number of batched requests in flight
+
+        Returns:
+            MicroBatcher: batcher whose `submit` returns the future `Prediction` of an input
+        """
+        return MicroBatcher(
+            lambda batch: self.predict_batch(uri, batch, job_size, dry_run),
+            max_batch_size=max_batch_size,
+            max_wait=max_wait,
+            max_workers=max_workers,
+            options={"job_size": job_size, "dry_run": dry_run},
+        )
+
+    def keep_alive(self, uri: str, connections: int) -> None:
+        """
+        Size the connection pool of an endpoint so every request in flight keeps its connection.
+
+        The API host is left untouched, it already has its own rate limited pool.
+
+        Args:
+            uri (str): uri of the endpoint
+            connections (int): number of requests sent at once
+        """
+        endpoint = urlparse(uri)
+        if not self.url.startswith(f"{endpoint.scheme}://{endpoint.netloc}/"):
+            self.session.mount(
+                f"{endpoint.scheme}://{endpoint.netloc}/",
+                HTTPAdapter(pool_connections=1, pool_maxsize=max(connections, 1)),
+            )
+
+    def predict_many(
+        self,
+        uri: str,
+        inputs: Iterable[Any],
+        concurrency: int = PREDICT_CONCURRENCY,
+        job_size: JobSize = JobSize.S,
+        dry_run: bool = False,
+        batcher: Optional[MicroBatcher] = None,
+        cache: Optional[PredictionCache] = None,
+    ) -> Iterator[Union[Prediction, Exception]]:
+        """
+        Run a prediction for each input, keeping up to `concurrency` of them in flight.
+
+        The inputs are consumed lazily and the results are yielded in the order of the inputs,
+        so arbitrarily long streams use bounded memory. The connections to the endpoint are
+        kept alive and reused, one per request in flight.
+
+        With a `batcher`, see `EndpointsClient.batcher`, the inputs are coalesced into batched
+        requests instead and up to `concurrency` full batches are kept in flight.
+
+        Args:
+            uri (str): uri of the endpoint, as returned by `get`
+            inputs (Iterable[Any]): inputs of the model
+            concurrency (int): max number of requests in flight
+            job_size (JobSize): size of the proving jobs of the predictions
+            dry_run (bool): run the model without creating proving jobs
+            batcher (Optional[MicroBatcher]): batcher of the endpoint, sized for `concurrency`
+                and built with the same `job_size` and `dry_run`
+            cache (Optional[PredictionCache]): cache of the version deployed at the endpoint,
+                the cached inputs are answered without a request. Dry runs bypass it
+
+        Raises:
+            ValueError: if the batcher was built with a different `job_size` or `dry_run`
+
+        Returns:
+            Iterator[Union[Prediction, Exception]]: the prediction of each input, or the
+                exception raised by its request
+        """
+        concurrency = max(concurrency, 1)
+        if batcher is not None:
+            options = {"job_size": job_size, "dry_run": dry_run}
+            if batcher.options != options:
+                raise ValueError(
+                    f"The batcher was built with {batcher.options}, not {options}"
+                )
+        self.keep_alive(uri, concurrency)
+
+        if batcher is not None:
+            yield from self._ordered(
+                inputs,
+                batcher.submit,
+                concurrency * batcher.max_batch_size,
+                cache if not dry_run else None,
+            )
+            return
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="giza-predict"
+        ) as executor:
+            yield from self._ordered(
+                inputs,
+                lambda args: executor.submit(
+                    self.predict, uri, args, job_size, dry_run
+                ),
+                concurrency,
+                cache if not dry_run else None,
+            )
+
+    def _ordered(
+        self,
+        inputs: Iterable[Any],
+        submit: Callable[[Any], Future],
+        window_size: int,
+        cache: Optional[PredictionCache] = None,
+    ) -> Iterator[Union[Prediction, Exception]]:
+        window: Deque[Future] = deque()
+        for args in inputs:
+            if len(window) >= window_size:
+                yield self._prediction_result(window.popleft())
+            cached = cache.get(args) if cache is not None else None
+            if cached is not None:
+                future: Future = Future()
+                future.set_result(cached)
+            else:
+                future = submit(args)
+                if cache is not None:
+                    future.add_done_callback(self._cache_prediction(cache, args))
+            window.append(future)
+        while window:
+            yield self._prediction_result(window.popleft())
+
+    @staticmethod
+    def _cache_prediction(
+        cache: PredictionCache, args: Any
+    ) -> Callable[[Future], None]:
+        def _store(future: Future) -> None:
+            if future.exception() is None:
+                cache.put(args, future.result())
+
+        return _store
+
+    @staticmethod
+    def _prediction_result(future: Future) -> Union[Prediction, Exception]:
+        try:
+            return future.result()
+        except Exception as e:
+            return e
+
 
 # For downstream dependencies until they are updated
 DeploymentsClient = EndpointsClient
@@ -991,12 +1557,13 @@ class JobsClient(ApiClient):
         return Job(**response.json())
 
     @auth
-    def get_logs(self, job_id: int) -> Logs:
+    def get_logs(self, job_id: int, offset: Optional[int] = None) -> Logs:
         """
         Make a call to the API to retrieve job logs.
 
         Args:
             job_id: Job identfier to retrieve the logs for
+            offset: Only retrieve the logs after this offset, see `Logs.next_offset`
 
         Returns:
             Logs: the logs of the specified job
@@ -1007,6 +1574,7 @@ class JobsClient(ApiClient):
         response = self.session.get(
             f"{self.url}/{self.JOBS_ENDPOINT}/{job_id}/logs",
             headers=headers,
+            params={"offset": offset} if offset is not None else None,
         )
         self._echo_debug(str(response))
 
@@ -1075,6 +1643,30 @@ class JobsClient(ApiClient):
 
         return [Job(**job) for job in response.json()]
 
+    def get_many(
+        self, job_ids: Iterable[int], params: Optional[dict[str, str]] = None
+    ) -> Dict[int, Job]:
+        """
+        Retrieve the information of several jobs with a single `list` call.
+
+        Jobs missing from the list, like verification jobs which need the `kind`, are retrieved
+        one by one.
+
+        Args:
+            job_ids: Job identifiers to retrieve information
+            params: Parameters of the calls for the missing jobs
+
+        Returns:
+            Dict[int, Job]: jobs by id
+        """
+        wanted = set(job_ids)
+        if not wanted:
+            return {}
+        jobs = {job.id: job for job in self.list() if job.id in wanted}
+        for job_id in wanted - jobs.keys():
+            jobs[job_id] = self.get(job_id, params=params)
+        return jobs
+
 
 class VersionJobsClient(ApiClient):
     """
@@ -1247,15 +1839,16 @@ class ProofsClient(ApiClient):
         return Proof(**response.json()[0])
 
     @auth
-    def download(self, proof_id: int) -> bytes:
+    def download(self, proof_id: int, stream: bool = False) -> Union[bytes, BinaryIO]:
         """
         Download a proof.
 
         Args:
             proof_id: Proof identifier
+            stream: spool the proof to a temporary file instead of loading it in memory
 
         Returns:
-            The proof binary file
+            The proof binary file, or a temporary file when streaming
         """
         headers = copy.deepcopy(self.default_headers)
         headers.update(self._get_auth_header())
@@ -1269,6 +1862,8 @@ class ProofsClient(ApiClient):
         response.raise_for_status()
 
         url = response.json()["download_url"]
+        if stream:
+            return self._download_to_file(url)
 
         download_response = self.session.get(url)
 
@@ -1369,13 +1964,16 @@ class VersionsClient(ApiClient):
         return Version(**response.json())
 
     @auth
-    def get_logs(self, model_id: int, version_id: int) -> Logs:
+    def get_logs(
+        self, model_id: int, version_id: int, offset: Optional[int] = None
+    ) -> Logs:
         """
         Get a version transpilation logs.
 
         Args:
             model_id: Model identifier
             version_id: Version identifier
+            offset: Only retrieve the logs after this offset, see `Logs.next_offset`
 
         Returns:
             The version transpilation logs
@@ -1386,6 +1984,7 @@ class VersionsClient(ApiClient):
         response = self.session.get(
             f"{self._get_version_url(model_id)}/{version_id}/logs",
             headers=headers,
+            params={"offset": offset} if offset is not None else None,
         )
 
         self._echo_debug(str(response))
@@ -1467,8 +2066,8 @@ class VersionsClient(ApiClient):
 
     @auth
     def download(
-        self, model_id: int, version_id: int, params: Dict
-    ) -> Dict[str, bytes]:
+        self, model_id: int, version_id: int, params: Dict, stream: bool = False
+    ) -> Dict[str, Union[bytes, BinaryIO]]:
         """
         Download a version.
 
@@ -1476,9 +2075,10 @@ class VersionsClient(ApiClient):
             model_id: Model identifier
             version_id: Version identifier
             params: Additional parameters to pass to the request
+            stream: spool the files to temporary files instead of loading them in memory
 
         Returns:
-            The version binary file
+            The version binary files, or temporary files when streaming
         """
         headers = copy.deepcopy(self.default_headers)
         headers.update(self._get_auth_header())
@@ -1497,21 +2097,27 @@ class VersionsClient(ApiClient):
 
         if params["download_model"] and "download_url" in urls:
             model_url = urls["download_url"]
-            download_response = self.session.get(
-                model_url,
-            )
+            if stream:
+                downloads["model"] = self._download_to_file(model_url)
+            else:
+                download_response = self.session.get(
+                    model_url,
+                )
 
-            self._echo_debug(str(download_response))
-            download_response.raise_for_status()
-            downloads["model"] = download_response.content
+                self._echo_debug(str(download_response))
+                download_response.raise_for_status()
+                downloads["model"] = download_response.content
 
         if params["download_sierra"] and "sierra_url" in urls:
             sierra_url = urls["sierra_url"]
-            sierra_response = self.session.get(sierra_url)
-
-            sierra_response.raise_for_status()
-            self._echo_debug(str(sierra_response))
-            downloads["inference.sierra.json"] = sierra_response.content
+            if stream:
+                downloads["inference.sierra.json"] = self._download_to_file(sierra_url)
+            else:
+                sierra_response = self.session.get(sierra_url)
+
+                sierra_response.raise_for_status()
+                self._echo_debug(str(sierra_response))
+                downloads["inference.sierra.json"] = sierra_response.content
 
         return downloads
 
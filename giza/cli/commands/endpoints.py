@@ -1,29 +1,43 @@
+import json as json_
+import random
 import sys
-from typing import Optional
+import time
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, TextIO
 
 import typer
 from pydantic import ValidationError
 from requests import HTTPError
 
 from giza.cli import API_HOST
-from giza.cli.client import EndpointsClient
+from giza.cli.client import PREDICT_CONCURRENCY, EndpointsClient
 from giza.cli.frameworks import cairo, ezkl
 from giza.cli.options import (
     DEBUG_OPTION,
     ENDPOINT_OPTION,
+    FOLLOW_INTERVAL_OPTION,
+    FOLLOW_OPTION,
     FRAMEWORK_OPTION,
     JSON_OPTION,
     MODEL_OPTION,
     VERSION_OPTION,
 )
-from giza.cli.schemas.endpoints import EndpointsList
+from giza.cli.schemas.endpoints import BenchReport, EndpointsList
 from giza.cli.schemas.proofs import Proof, ProofList
 from giza.cli.utils import echo, get_response_info
-from giza.cli.utils.enums import Framework, ServiceSize
+from giza.cli.utils.batching import DEFAULT_MAX_WAIT
+from giza.cli.utils.enums import Framework, JobSize, ServiceSize
 from giza.cli.utils.exception_handling import ExceptionHandler
+from giza.cli.utils.load_test import run_load_test
+from giza.cli.utils.log_stream import follow_logs
+from giza.cli.utils.prediction_cache import PredictionCache, prediction_cache_dir
+from giza.cli.utils.proof_sync import MANIFEST_FILE, S3Sink, sync_proofs
 
 app = typer.Typer()
 
+# Random inputs generated for `bench` when no file is provided, reused in a loop
+SYNTHETIC_INPUTS = 100
+
 
 def deploy(
     data: str = typer.Argument(None),
@@ -392,17 +406,397 @@ def verify(
     what its happening under the hood.
 
     If no logs are available, an empty string is printed.
+
+    With `--follow`, the new lines are printed as they are written until the endpoint is deleted.
     """,
 )
 def logs(
     endpoint_id: int = ENDPOINT_OPTION,
+    follow: bool = FOLLOW_OPTION,
+    interval: float = FOLLOW_INTERVAL_OPTION,
     debug: Optional[bool] = DEBUG_OPTION,
 ) -> None:
     echo(f"Getting logs for endpoint {endpoint_id} ✅ ")
     with ExceptionHandler(debug=debug):
         client = EndpointsClient(API_HOST)
+        if follow:
+            try:
+                follow_logs(
+                    lambda offset: client.get_logs(endpoint_id, offset=offset),
+                    lambda: not client.get(endpoint_id).is_active,
+                    print,
+                    interval,
+                )
+            except KeyboardInterrupt:
+                echo("Stopped following the logs")
+            return
         logs = client.get_logs(endpoint_id)
         if logs.logs == "":
             echo.warning("No logs available")
         else:
             print(logs.logs)
+
+
+def _read_inputs(f: TextIO) -> Iterator[Any]:
+    """
+    Parse the inputs lazily, one JSON document per line, skipping blank lines.
+
+    Args:
+        f (TextIO): file with the inputs
+
+    Raises:
+        ValueError: if a line is not valid JSON
+
+    Returns:
+        Iterator[Any]: the inputs
+    """
+    for number, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json_.loads(line)
+        except json_.JSONDecodeError as e:
+            raise ValueError(f"Line {number} is not valid JSON: {e}") from e
+
+
+@app.command(
+    short_help="🔮 Runs predictions on an endpoint.",
+    help="""🔮 Runs predictions on an endpoint.
+
+    Reads one input per line as JSON, from a file or from the standard input, and sends them to the
+    endpoint keeping up to `--concurrency` requests in flight over reused connections.
+    The predictions are written as JSON lines in the order of the inputs as soon as they are ready,
+    with the `index` of the input and its `request_id`, or the `error` if it failed.
+
+    With `--batch-size` above 1, the inputs that arrive within `--batch-window` seconds are sent
+    together in a single request, and the batch sizes and latencies are reported at the end.
+
+    With `--cache`, the predictions of the version are remembered and repeated inputs are answered
+    with the cached output and request id without calling the endpoint. `--disk-cache` also keeps
+    them across runs in `~/.giza/predictions`, or the folder set at `GIZA_PREDICTION_CACHE_DIR`.
+    Dry runs are never cached.
+
+    When the predictions are written to the standard output, the logs are saved to `giza.log`.
+    Exits with 1 if any prediction failed.
+    """,
+)
+def predict(
+    endpoint_id: int = ENDPOINT_OPTION,
+    input_path: str = typer.Option(
+        "-",
+        "--input",
+        "-i",
+        help="JSON lines file with the inputs, `-` to read the standard input",
+    ),
+    output_path: str = typer.Option(
+        "-",
+        "--output-path",
+        "-o",
+        help="File to write the predictions to, `-` for the standard output",
+    ),
+    concurrency: int = typer.Option(
+        PREDICT_CONCURRENCY,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Max number of predictions in flight",
+    ),
+    job_size: JobSize = typer.Option(JobSize.S, "--job-size", "-s"),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Run the model without creating proving jobs"
+    ),
+    batch_size: int = typer.Option(
+        1,
+        "--batch-size",
+        min=1,
+        help="Max number of inputs sent in a single request, 1 disables batching",
+    ),
+    batch_window: float = typer.Option(
+        DEFAULT_MAX_WAIT,
+        "--batch-window",
+        min=0,
+        help="Seconds a batch waits for more inputs after the first one",
+    ),
+    cache: bool = typer.Option(
+        False, "--cache", help="Answer repeated inputs from a local cache"
+    ),
+    disk_cache: bool = typer.Option(
+        False, "--disk-cache", help="Also keep the cache on disk across runs"
+    ),
+    debug: Optional[bool] = DEBUG_OPTION,
+) -> None:
+    if output_path == "-":
+        echo.set_log_file()
+    with ExceptionHandler(debug=debug):
+        client = EndpointsClient(API_HOST)
+        endpoint = client.get(endpoint_id)
+    if not endpoint.is_active or endpoint.uri is None:
+        echo.error(f"⛔️Endpoint {endpoint_id} is not active⛔️")
+        sys.exit(1)
+    echo(f"Running predictions on endpoint {endpoint_id} at {endpoint.uri} ✅ ")
+    prediction_cache = None
+    if cache or disk_cache:
+        if endpoint.model_id is None or endpoint.version_id is None:
+            echo.error(
+                "⛔️The version of the endpoint is unknown, it can not be cached⛔️"
+            )
+            sys.exit(1)
+        prediction_cache = PredictionCache(
+            endpoint.model_id,
+            endpoint.version_id,
+            directory=prediction_cache_dir() if disk_cache else None,
+        )
+
+    try:
+        source = sys.stdin if input_path == "-" else open(input_path)
+    except OSError as e:
+        echo.error(f"⛔️Could not read the inputs -> {e}⛔️")
+        if debug:
+            raise e
+        sys.exit(1)
+    try:
+        sink = sys.stdout if output_path == "-" else open(output_path, "w")
+    except OSError as e:
+        if source is not sys.stdin:
+            source.close()
+        echo.error(f"⛔️Could not write the predictions -> {e}⛔️")
+        if debug:
+            raise e
+        sys.exit(1)
+    batcher = (
+        client.batcher(
+            endpoint.uri,
+            batch_size,
+            batch_window,
+            job_size=job_size,
+            dry_run=dry_run,
+            max_workers=concurrency,
+        )
+        if batch_size > 1
+        else None
+    )
+    total = failed = 0
+    start = time.perf_counter()
+    try:
+        predictions = client.predict_many(
+            endpoint.uri,
+            _read_inputs(source),
+            concurrency=concurrency,
+            job_size=job_size,
+            dry_run=dry_run,
+            batcher=batcher,
+            cache=prediction_cache,
+        )
+        for index, prediction in enumerate(predictions):
+            if isinstance(prediction, Exception):
+                failed += 1
+                line = {"index": index, "error": str(prediction)}
+            else:
+                line = {
+                    "index": index,
+                    "request_id": prediction.request_id,
+                    "result": prediction.result,
+                }
+            sink.write(json_.dumps(line) + "\n")
+            sink.flush()
+            total += 1
+    except ValueError as e:
+        echo.error(f"⛔️Could not read the inputs -> {e}⛔️")
+        if debug:
+            raise e
+        sys.exit(1)
+    except OSError as e:
+        echo.error(f"⛔️Could not write the predictions -> {e}⛔️")
+        if debug:
+            raise e
+        sys.exit(1)
+    finally:
+        if batcher is not None:
+            batcher.close()
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+    elapsed = time.perf_counter() - start
+    echo(f"{total} predictions in {elapsed:.2f}s, {failed} failed ✅")
+    if batcher is not None:
+        echo(f"Batching: {batcher.report()} 📦")
+    if prediction_cache is not None:
+        echo(f"Cache: {prediction_cache.report()} 🗃️")
+    if failed:
+        echo.error(f"⛔️{failed} predictions failed⛔️")
+        sys.exit(1)
+
+
+def _synthetic_inputs(size: int, count: int = SYNTHETIC_INPUTS) -> List[List[int]]:
+    rng = random.Random(0)
+    return [[rng.randint(0, 255) for _ in range(size)] for _ in range(count)]
+
+
+@app.command(
+    short_help="🏋️ Load tests an endpoint.",
+    help="""🏋️ Load tests an endpoint.
+
+    Sends predictions to the endpoint from `--concurrency` parallel clients for `--duration` seconds,
+    optionally capped at `--rate` requests per second, and reports the throughput, the p50/p95/p99
+    latencies and the error rate. Use it to compare the sizes and versions of a deployment, with
+    `--json` to save the reports.
+
+    The inputs are read from a JSON lines file, one input per line, and reused in a loop, or
+    generated as lists of `--input-size` random integers. The requests are dry runs unless
+    `--no-dry-run` is set, which creates a proving job for each of them.
+    """,
+)
+def bench(
+    endpoint_id: int = ENDPOINT_OPTION,
+    input_path: Optional[str] = typer.Option(
+        None,
+        "--input",
+        "-i",
+        help="JSON lines file with the inputs, random inputs are used by default",
+    ),
+    input_size: int = typer.Option(
+        10, "--input-size", min=1, help="Length of the random inputs"
+    ),
+    concurrency: int = typer.Option(
+        4, "--concurrency", "-c", min=1, help="Number of requests in flight"
+    ),
+    rate: Optional[float] = typer.Option(
+        None, "--rate", "-r", min=0, help="Max requests per second, no limit by default"
+    ),
+    duration: float = typer.Option(
+        30, "--duration", "-d", min=0, help="Seconds the test runs"
+    ),
+    max_requests: Optional[int] = typer.Option(
+        None, "--requests", "-n", min=1, help="Stop after this many requests"
+    ),
+    job_size: JobSize = typer.Option(JobSize.S, "--job-size", "-s"),
+    dry_run: bool = typer.Option(
+        True,
+        "--dry-run/--no-dry-run",
+        help="Run the model without creating proving jobs",
+    ),
+    json: Optional[bool] = JSON_OPTION,
+    debug: Optional[bool] = DEBUG_OPTION,
+) -> None:
+    if json:
+        echo.set_log_file()
+    with ExceptionHandler(debug=debug):
+        client = EndpointsClient(API_HOST)
+        endpoint = client.get(endpoint_id)
+    if not endpoint.is_active or endpoint.uri is None:
+        echo.error(f"⛔️Endpoint {endpoint_id} is not active⛔️")
+        sys.exit(1)
+
+    if input_path is not None:
+        try:
+            with open(input_path) as f:
+                inputs: List[Any] = [*_read_inputs(f)]
+        except (OSError, ValueError) as e:
+            echo.error(f"⛔️Could not read the inputs -> {e}⛔️")
+            if debug:
+                raise e
+            sys.exit(1)
+        if not inputs:
+            echo.error(f"⛔️There are no inputs in {input_path}⛔️")
+            sys.exit(1)
+    else:
+        inputs = _synthetic_inputs(input_size)
+    uri = endpoint.uri
+
+    echo(
+        f"Load testing endpoint {endpoint_id} for {duration:.0f}s with {concurrency} clients ✅ "
+    )
+    with ExceptionHandler(debug=debug):
+        # Authenticate and size the connection pool before the clock starts
+        client.retrieve_token()
+        client.keep_alive(uri, concurrency)
+        stats = run_load_test(
+            lambda args: client.predict(uri, args, job_size, dry_run),
+            inputs,
+            duration,
+            concurrency=concurrency,
+            rate=rate,
+            max_requests=max_requests,
+        )
+    report = BenchReport(
+        endpoint_id=endpoint_id,
+        model_id=endpoint.model_id,
+        version_id=endpoint.version_id,
+        size=endpoint.size,
+        concurrency=concurrency,
+        rate=rate,
+        duration=stats.elapsed,
+        **stats.summary(),
+    )
+    echo(
+        f"{report.requests} requests, {report.throughput:.1f} req/s, "
+        f"p50 {report.latency_p50_ms:.0f}ms p95 {report.latency_p95_ms:.0f}ms "
+        f"p99 {report.latency_p99_ms:.0f}ms, {report.error_rate:.1%} errors ✅"
+    )
+    echo.print_model(report)
+
+
+@app.command(
+    name="sync-proofs",
+    short_help="🔄 Mirrors the proofs of an endpoint into a folder.",
+    help=f"""🔄 Mirrors the proofs of an endpoint into a folder.
+
+    Only the proofs that are not in the folder yet are downloaded, `{MANIFEST_FILE}` keeps track of
+    the mirrored ones with their sha256. The downloads run concurrently, are validated against the
+    size and checksum announced by the storage and resume from where they stopped if interrupted.
+
+    With `--s3-uri`, the new proofs are also copied to an S3 compatible bucket, which requires
+    `boto3`. Exits with 1 if any proof could not be mirrored.
+    """,
+)
+def sync_proofs_command(
+    endpoint_id: int = ENDPOINT_OPTION,
+    output_path: str = typer.Option(
+        "proofs", "--output-path", "-o", help="Folder of the mirror"
+    ),
+    workers: int = typer.Option(
+        4, "--workers", "-w", min=1, help="Number of concurrent downloads"
+    ),
+    verify: bool = typer.Option(
+        False,
+        "--verify",
+        help="Hash the mirrored proofs to detect local corruption, not only their size",
+    ),
+    s3_uri: Optional[str] = typer.Option(
+        None, "--s3-uri", help="Also copy the proofs to `s3://bucket/prefix`"
+    ),
+    s3_endpoint_url: Optional[str] = typer.Option(
+        None,
+        "--s3-endpoint-url",
+        help="Endpoint of an S3 compatible storage, AWS S3 by default",
+    ),
+    debug: Optional[bool] = DEBUG_OPTION,
+) -> None:
+    sink = None
+    if s3_uri is not None:
+        try:
+            sink = S3Sink(s3_uri, endpoint_url=s3_endpoint_url)
+        except ValueError as e:
+            echo.error(f"⛔️{e}⛔️")
+            sys.exit(1)
+    echo(f"Syncing proofs of endpoint {endpoint_id} into {output_path} ✅ ")
+    start = time.perf_counter()
+    with ExceptionHandler(debug=debug):
+        result = sync_proofs(
+            EndpointsClient(API_HOST),
+            endpoint_id,
+            Path(output_path),
+            workers=workers,
+            verify=verify,
+            sink=sink,
+        )
+    echo(
+        f"{len(result.downloaded)} proofs mirrored, {len(result.skipped)} up to date, "
+        f"{len(result.failed)} failed in {time.perf_counter() - start:.2f}s ✅"
+    )
+    if result.failed:
+        for proof_id, error in sorted(result.failed.items()):
+            echo.error(f"⛔️Proof {proof_id} -> {error}⛔️")
+        sys.exit(1)
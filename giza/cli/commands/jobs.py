@@ -0,0 +1,363 @@
+import sys
+import time
+from typing import Dict, List, Optional, Union
+
+import typer
+from rich.live import Live
+from rich.table import Table
+
+from giza.cli import API_HOST
+from giza.cli.client import JobsClient, VersionJobsClient, VersionsClient
+from giza.cli.frameworks import cairo
+from giza.cli.options import (
+    DEBUG_OPTION,
+    FOLLOW_INTERVAL_OPTION,
+    FOLLOW_OPTION,
+    JSON_OPTION,
+    MODEL_OPTION,
+    VERSION_OPTION,
+)
+from giza.cli.schemas.jobs import Job
+from giza.cli.schemas.verify import VerifyResponse
+from giza.cli.schemas.versions import Version
+from giza.cli.utils import echo
+from giza.cli.utils.enums import JobKind, JobStatus, VersionStatus
+from giza.cli.utils.exception_handling import ExceptionHandler
+from giza.cli.utils.log_stream import follow_logs
+from giza.cli.utils.metrics import metrics
+from giza.cli.utils.runs import COMPLETED, find_runs
+from giza.cli.utils.verification_ledger import collect_verification
+
+app = typer.Typer()
+
+JOB_OPTION = typer.Option(None, "--job-id", help="The ID of the job")
+KIND_OPTION = typer.Option(
+    JobKind.PROOF, "--kind", "-k", help="Kind of the job, PROOF or VERIFY"
+)
+
+# Statuses after which a job or a transpilation does not change anymore
+SUCCESS_STATUSES = (
+    JobStatus.COMPLETED,
+    VersionStatus.COMPLETED,
+    VersionStatus.PARTIALLY_SUPPORTED,
+)
+FAILED_STATUSES = (JobStatus.FAILED, VersionStatus.FAILED)
+
+
+def _check_target(
+    job_id: Optional[int], model_id: Optional[int], version_id: Optional[int]
+) -> None:
+    if job_id is None and (model_id is None or version_id is None):
+        echo.error(
+            "⛔️Provide a job id, or a model id and version id to follow a transpilation⛔️"
+        )
+        sys.exit(1)
+    if (model_id is None) != (version_id is None):
+        echo.error("⛔️Model ID and version ID must be provided together⛔️")
+        sys.exit(1)
+
+
+def _get(
+    job_id: Optional[int],
+    model_id: Optional[int],
+    version_id: Optional[int],
+    kind: JobKind,
+) -> Union[Job, Version]:
+    """
+    Retrieve what a detached command submitted.
+
+    Args:
+        job_id (Optional[int]): proving or verification job, or setup job when the version is also set
+        model_id (Optional[int]): model of the version
+        version_id (Optional[int]): version, its transpilation is followed when there is no job
+        kind (JobKind): kind of the job
+
+    Returns:
+        Union[Job, Version]: the job, or the version when following a transpilation
+    """
+    if job_id is None:
+        return VersionsClient(API_HOST).get(model_id, version_id)  # type: ignore
+    if model_id is not None and version_id is not None:
+        return VersionJobsClient(API_HOST).get(model_id, version_id, job_id)
+    if kind == JobKind.VERIFY:
+        return JobsClient(API_HOST).get(job_id, params={"kind": JobKind.VERIFY})
+    return JobsClient(API_HOST).get(job_id)
+
+
+@app.command(
+    short_help="📜 Retrieves the status of a job or a transpilation.",
+    help="""📜 Retrieves the status of a job or a transpilation.
+
+    Use the job id printed by `giza prove --detach` or `giza verify --detach`, the model and version ids
+    printed by `giza transpile --detach`, or all of them for an EZKL setup job.
+    """,
+)
+def status(
+    job_id: Optional[int] = JOB_OPTION,
+    model_id: Optional[int] = MODEL_OPTION,
+    version_id: Optional[int] = VERSION_OPTION,
+    kind: JobKind = KIND_OPTION,
+    json: Optional[bool] = JSON_OPTION,
+    debug: Optional[bool] = DEBUG_OPTION,
+) -> None:
+    if json:
+        echo.set_log_file()
+    _check_target(job_id, model_id, version_id)
+    with ExceptionHandler(debug=debug):
+        current = _get(job_id, model_id, version_id, kind)
+    echo.print_model(current)
+
+
+@app.command(
+    short_help="⏳ Waits until a job or a transpilation finishes.",
+    help="""⏳ Waits until a job or a transpilation finishes.
+
+    Polls the status of what a detached `giza prove`, `giza verify` or `giza transpile` submitted.
+    Exits with 0 if it succeeds and with 1 if it fails or the timeout is reached, printing the logs
+    of failed jobs.
+
+    The API can not refresh a login token, without an API key (`giza users create-api-key`) a wait
+    that lasts longer than the token fails.
+    """,
+)
+def wait(
+    job_id: Optional[int] = JOB_OPTION,
+    model_id: Optional[int] = MODEL_OPTION,
+    version_id: Optional[int] = VERSION_OPTION,
+    kind: JobKind = KIND_OPTION,
+    interval: float = typer.Option(
+        20, "--interval", help="Seconds between status checks"
+    ),
+    timeout: Optional[float] = typer.Option(
+        None, "--timeout", help="Seconds to wait before giving up, no limit by default"
+    ),
+    debug: Optional[bool] = DEBUG_OPTION,
+) -> None:
+    _check_target(job_id, model_id, version_id)
+    name = f"Job {job_id}" if job_id is not None else f"Version {version_id}"
+    with ExceptionHandler(debug=debug):
+        if job_id is None:
+            client = VersionsClient(API_HOST)
+            client.warn_token_expiry(timeout)
+            current: Union[Job, Version] = cairo.wait_for_transpilation(
+                client,
+                model_id,  # type: ignore
+                version_id,  # type: ignore
+                echo,
+                interval=interval,
+                timeout=timeout,
+            )
+            runs = find_runs("transpile", model_id=model_id, version_id=version_id)
+        elif model_id is None:
+            current = cairo.wait_for_job(
+                JobsClient(API_HOST),
+                job_id,
+                echo,
+                kind=kind if kind == JobKind.VERIFY else None,
+                name=name,
+                interval=interval,
+                timeout=timeout,
+            )
+            runs = find_runs("prove", job_id=job_id) if kind == JobKind.PROOF else []
+        else:
+            current = _wait_setup_job(
+                model_id, version_id, job_id, name, interval, timeout  # type: ignore
+            )
+            runs = []
+    # Verifications detached from `giza verify` are recorded in the ledger once collected
+    verifying = job_id is not None and model_id is None and kind == JobKind.VERIFY
+    if current.status in FAILED_STATUSES:
+        # Nothing left to collect
+        for run in runs:
+            run.finish()
+        if verifying:
+            collect_verification(job_id, None)  # type: ignore
+        sys.exit(1)
+    if current.status not in SUCCESS_STATUSES:
+        sys.exit(1)
+    for run in runs:
+        run.update(stage=COMPLETED)
+    if verifying:
+        collect_verification(
+            job_id,  # type: ignore
+            VerifyResponse(
+                verification=True,
+                verification_time=current.elapsed_time,  # type: ignore
+            ),
+        )
+    echo(f"{name} finished with status '{current.status}' ✅")
+
+
+def _wait_setup_job(
+    model_id: int,
+    version_id: int,
+    job_id: int,
+    name: str,
+    interval: float,
+    timeout: Optional[float],
+) -> Job:
+    """
+    Poll an EZKL setup job until it finishes, setup jobs do not expose their logs.
+
+    Returns:
+        Job: the job, COMPLETED or FAILED, or still running if the timeout is reached
+    """
+    client = VersionJobsClient(API_HOST)
+    client.warn_token_expiry(timeout)
+    start_time = time.time()
+    with Live() as live, metrics.phase("job_wait"):
+        while True:
+            with metrics.poll("job_wait"):
+                current = client.get(model_id, version_id, job_id)
+            spent = time.time() - start_time
+            if current.status in FAILED_STATUSES:
+                live.update(echo.format_error(f"{name} failed"))
+                return current
+            if current.status in SUCCESS_STATUSES or (
+                timeout is not None and spent >= timeout
+            ):
+                return current
+            live.update(
+                echo.format_message(
+                    f"{name} status is '{current.status}', elapsed {spent:.0f}s"
+                )
+            )
+            time.sleep(interval)
+
+
+def _jobs_table(jobs: Dict[int, Optional[Job]]) -> Table:
+    table = Table(title="Jobs")
+    for column in ("id", "name", "size", "status", "elapsed"):
+        table.add_column(column)
+    for job_id, job in sorted(jobs.items()):
+        if job is None:
+            table.add_row(str(job_id), "", "", "...", "")
+            continue
+        elapsed = f"{job.elapsed_time:.0f}s" if job.elapsed_time is not None else ""
+        table.add_row(
+            str(job_id), job.job_name or "", job.size, str(job.status), elapsed
+        )
+    return table
+
+
+@app.command(
+    short_help="👀 Watches many jobs in a single table.",
+    help="""👀 Watches many jobs in a single table.
+
+    All the jobs are refreshed with one `list` call per interval instead of one call per job.
+    Without job ids, the proving jobs pending in `giza resume --list` are watched.
+    Exits with 0 once every job is COMPLETED and with 1 if any fails or the timeout is reached.
+    """,
+)
+def watch(
+    job_ids: Optional[List[int]] = typer.Argument(None, help="The IDs of the jobs"),
+    kind: JobKind = KIND_OPTION,
+    interval: float = typer.Option(
+        20, "--interval", help="Seconds between status checks"
+    ),
+    timeout: Optional[float] = typer.Option(
+        None, "--timeout", help="Seconds to wait before giving up, no limit by default"
+    ),
+    debug: Optional[bool] = DEBUG_OPTION,
+) -> None:
+    if not job_ids:
+        job_ids = [
+            run.job_id
+            for run in find_runs("prove")
+            if run.job_id is not None and run.stage != COMPLETED
+        ]
+    if not job_ids:
+        echo.error("⛔️No jobs to watch, provide their ids⛔️")
+        sys.exit(1)
+    jobs: Dict[int, Optional[Job]] = dict.fromkeys(job_ids)
+    params = {"kind": kind} if kind == JobKind.VERIFY else None
+    client = JobsClient(API_HOST)
+    pending = list(jobs)
+    start_time = time.time()
+    with ExceptionHandler(debug=debug), Live(_jobs_table(jobs)) as live:
+        with metrics.phase("job_wait"):
+            while True:
+                with metrics.poll("job_wait"):
+                    jobs.update(client.get_many(pending, params=params))
+                live.update(_jobs_table(jobs))
+                pending = [
+                    job_id
+                    for job_id, job in jobs.items()
+                    if job is None
+                    or job.status not in (JobStatus.COMPLETED, JobStatus.FAILED)
+                ]
+                if not pending:
+                    break
+                if timeout is not None and time.time() - start_time >= timeout:
+                    echo.error(
+                        f"⛔️{len(pending)} jobs did not finish after {timeout:.0f}s⛔️"
+                    )
+                    sys.exit(1)
+                time.sleep(interval)
+    failed = [
+        job_id
+        for job_id, job in jobs.items()
+        if job is not None and job.status == JobStatus.FAILED
+    ]
+    if failed:
+        echo.error(f"⛔️Failed jobs -> {', '.join(str(job_id) for job_id in failed)}⛔️")
+        sys.exit(1)
+    echo(f"All {len(jobs)} jobs are completed ✅")
+
+
+@app.command(
+    short_help="📜 Retrieves the logs of a job.",
+    help="""📜 Retrieves the logs of a job.
+
+    With `--follow`, the new lines are printed as they are written until the job finishes.
+    """,
+)
+def logs(
+    job_id: int = typer.Option(..., "--job-id", help="The ID of the job"),
+    follow: bool = FOLLOW_OPTION,
+    interval: float = FOLLOW_INTERVAL_OPTION,
+    debug: Optional[bool] = DEBUG_OPTION,
+) -> None:
+    with ExceptionHandler(debug=debug):
+        client = JobsClient(API_HOST)
+        if not follow:
+            job_logs = client.get_logs(job_id)
+            if job_logs.logs == "":
+                echo.warning("No logs available")
+            else:
+                print(job_logs.logs)
+            return
+        try:
+            follow_logs(
+                lambda offset: client.get_logs(job_id, offset=offset),
+                lambda: client.get(job_id).status
+                in (JobStatus.COMPLETED, JobStatus.FAILED),
+                print,
+                interval,
+            )
+        except KeyboardInterrupt:
+            echo("Stopped following the logs")
+
+
+@app.command(
+    short_help="📥 Downloads the proof generated by a proving job.",
+    help="""📥 Downloads the proof generated by a proving job.
+
+    The job must be COMPLETED, use `giza jobs wait` to wait for it.
+    """,
+)
+def download(
+    job_id: int = typer.Option(..., "--job-id", help="The ID of the job"),
+    output_path: str = typer.Option("zk.proof", "--output-path", "-o"),
+    debug: Optional[bool] = DEBUG_OPTION,
+) -> None:
+    with ExceptionHandler(debug=debug):
+        job: Job = JobsClient(API_HOST).get(job_id)
+        if job.status != JobStatus.COMPLETED:
+            echo.error(
+                f"⛔️Job {job_id} has status '{job.status}', proofs are only available once it is COMPLETED⛔️"
+            )
+            sys.exit(1)
+        cairo.download_proof(job_id, output_path, echo)
+    for run in find_runs("prove", job_id=job_id):
+        run.finish()
@@ -0,0 +1,312 @@
+import os
+import sys
+import threading
+import time
+import tomllib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import typer
+from pydantic import ValidationError
+
+from giza.cli import API_HOST
+from giza.cli.client import (
+    EndpointsClient,
+    JobsClient,
+    ModelsClient,
+    ProofsClient,
+    VersionsClient,
+)
+from giza.cli.frameworks import cairo
+from giza.cli.options import DEBUG_OPTION
+from giza.cli.schemas.endpoints import Endpoint, EndpointCreate
+from giza.cli.schemas.jobs import Job, JobCreate
+from giza.cli.schemas.models import Model, ModelCreate
+from giza.cli.schemas.pipeline import DeploySpec, PipelineSpec, ProofSpec
+from giza.cli.schemas.versions import VersionCreate
+from giza.cli.utils import Echo, echo
+from giza.cli.utils.enums import Framework, JobStatus, VersionStatus
+from giza.cli.utils.exception_handling import ExceptionHandler
+from giza.cli.utils.metrics import metrics
+from giza.cli.utils.pipeline import Pipeline
+
+# Seconds between the status checks of the proving jobs
+PROOF_POLL_INTERVAL = 20
+
+
+def load_spec(path: str) -> PipelineSpec:
+    """
+    Read a pipeline spec from a YAML or TOML file.
+
+    Relative paths in the spec are resolved against the folder of the file.
+
+    Args:
+        path (str): path of the spec, `.toml`, `.yaml` or `.yml`
+
+    Raises:
+        ValueError: if the format is not supported or the file can not be parsed
+        ValidationError: if the spec is not valid
+
+    Returns:
+        PipelineSpec: the spec
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".toml":
+        with open(path, "rb") as f:
+            try:
+                data = tomllib.load(f)
+            except tomllib.TOMLDecodeError as e:
+                raise ValueError(f"Invalid TOML: {e}") from e
+    elif suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError as e:  # pragma: no cover
+            raise ValueError("Reading YAML specs requires `pyyaml`") from e
+        with open(path) as f:
+            try:
+                data = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML: {e}") from e
+    else:
+        raise ValueError(f"Unsupported spec format '{suffix}', use TOML or YAML")
+
+    spec = PipelineSpec.model_validate(data or {})
+    base = Path(path).parent
+
+    def _resolve(value: str) -> str:
+        return str(base / value) if not os.path.isabs(value) else value
+
+    spec.model.path = _resolve(spec.model.path)
+    spec.transpile.output_path = _resolve(spec.transpile.output_path)
+    for proof in spec.proofs:
+        proof.trace = _resolve(proof.trace)
+        proof.memory = _resolve(proof.memory)
+        proof.output_path = _resolve(proof.output_path)
+    return spec
+
+
+def _resolve_model(client: ModelsClient, spec: PipelineSpec, echo: Echo) -> Model:
+    if spec.model.id is not None:
+        model = client.get(spec.model.id)
+        echo(f"Model found with id -> {model.id}! ✅")
+        return model
+    name = spec.model.name or Path(spec.model.path).name.split(".")[0]
+    model = client.get_by_name(name)
+    if model is not None:
+        echo(f"Model found with id -> {model.id}! ✅")
+        return model
+    model = client.create(ModelCreate(name=name, description=spec.model.description))
+    echo(f"Model Created with id -> {model.id}! ✅")
+    return model
+
+
+def _deploy(
+    client: EndpointsClient,
+    model_id: int,
+    version_id: int,
+    spec: DeploySpec,
+    echo: Echo,
+) -> Endpoint:
+    endpoints = client.list(
+        params={"model_id": model_id, "version_id": version_id, "is_active": True}
+    ).root
+    if endpoints:
+        echo(f"Endpoint for version {version_id} already exists, reusing it ✅")
+        return endpoints[0]
+    endpoint = client.create(
+        model_id,
+        version_id,
+        EndpointCreate(size=spec.size, model_id=model_id, version_id=version_id),
+        None,
+    )
+    echo(f"Endpoint created with id -> {endpoint.id} ✅")
+    return endpoint
+
+
+def _prove(
+    jobs_client: JobsClient,
+    proofs_client: ProofsClient,
+    proofs: List[ProofSpec],
+    stop: threading.Event,
+    echo: Echo,
+) -> Dict[int, Job]:
+    """
+    Create the proving jobs, wait for all of them with one call per tick and download their proofs.
+
+    Args:
+        jobs_client (JobsClient): client of the jobs
+        proofs_client (ProofsClient): client of the proofs
+        proofs (List[ProofSpec]): proofs to generate
+        stop (threading.Event): set to stop waiting when another stage fails
+        echo (Echo): echo of the command
+
+    Returns:
+        Dict[int, Job]: the jobs by id, COMPLETED or FAILED
+    """
+    outputs: Dict[int, str] = {}
+    for proof in proofs:
+        with open(proof.trace, "rb") as trace, open(proof.memory, "rb") as memory:
+            job = jobs_client.create(
+                JobCreate(size=proof.size, framework=Framework.CAIRO), trace, memory
+            )
+        echo(f"Proving job created with id -> {job.id} ✅")
+        outputs[job.id] = proof.output_path
+
+    jobs: Dict[int, Job] = {}
+    pending = list(outputs)
+    while pending:
+        with metrics.poll("proofs"):
+            jobs.update(jobs_client.get_many(pending))
+        pending = [
+            job_id
+            for job_id in outputs
+            if jobs[job_id].status not in (JobStatus.COMPLETED, JobStatus.FAILED)
+        ]
+        if pending and stop.wait(PROOF_POLL_INTERVAL):
+            break
+
+    for job_id, job in jobs.items():
+        if job.status == JobStatus.COMPLETED:
+            cairo.download_proof(job_id, outputs[job_id], echo, proofs_client)
+        elif job.status == JobStatus.FAILED:
+            echo.error(f"⛔️Proving job {job_id} failed⛔️")
+    return jobs
+
+
+def run_pipeline(spec: PipelineSpec, debug: Optional[bool] = False) -> Dict[str, Any]:
+    """
+    Transpile a model, deploy it and generate proofs, overlapping the independent stages.
+
+    The proving jobs do not depend on the model and start right away, the deployment and the
+    download start as soon as the transpilation finishes. Every client shares one session.
+
+    Args:
+        spec (PipelineSpec): what to run
+        debug (Optional[bool]): raise the exceptions instead of exiting
+
+    Returns:
+        Dict[str, Any]: the model, version, endpoint and proving jobs
+    """
+    echo = Echo(debug=debug)
+    models_client = ModelsClient(API_HOST)
+    versions_client = VersionsClient(API_HOST)
+    endpoints_client = EndpointsClient(API_HOST)
+    jobs_client = JobsClient(API_HOST)
+    proofs_client = ProofsClient(API_HOST)
+    for client in (versions_client, endpoints_client, jobs_client, proofs_client):
+        client.share_session(models_client)
+
+    results: Dict[str, Any] = {}
+    stop = threading.Event()
+    with Pipeline(max_workers=3) as pipeline:
+        try:
+            proofs = (
+                pipeline.submit(
+                    "proofs",
+                    _prove,
+                    jobs_client,
+                    proofs_client,
+                    spec.proofs,
+                    stop,
+                    echo,
+                )
+                if spec.proofs
+                else None
+            )
+            with pipeline.stage("model_lookup"):
+                model = _resolve_model(models_client, spec, echo)
+            with pipeline.stage("version_create"):
+                version, upload_url = versions_client.create(
+                    model.id,
+                    VersionCreate(
+                        description=spec.transpile.description or "Intial version",
+                        size=Path(spec.model.path).stat().st_size,
+                        framework=Framework.CAIRO,
+                    ),
+                    Path(spec.model.path).name,
+                )
+                echo(f"Version Created with id -> {version.version}! ✅")
+            with pipeline.stage("upload"):
+                cairo.upload_model(
+                    versions_client,
+                    model.id,
+                    version.version,
+                    spec.model.path,
+                    upload_url,
+                    echo,
+                )
+            with pipeline.stage("transpilation"):
+                version = cairo.wait_for_transpilation(
+                    versions_client, model.id, version.version, echo
+                )
+            results.update(model=model, version=version)
+            if version.status == VersionStatus.FAILED:
+                sys.exit(1)
+
+            download = pipeline.submit(
+                "download",
+                cairo.download_transpilation,
+                versions_client,
+                model.id,
+                version.version,
+                spec.transpile.output_path,
+                spec.transpile.download_model,
+                spec.transpile.download_sierra,
+                echo,
+                debug,
+            )
+            if spec.deploy is not None and version.status == VersionStatus.COMPLETED:
+                results["endpoint"] = pipeline.submit(
+                    "deploy",
+                    _deploy,
+                    endpoints_client,
+                    model.id,
+                    version.version,
+                    spec.deploy,
+                    echo,
+                ).result()
+            elif spec.deploy is not None:
+                echo.warning(
+                    "Skipping the deployment, the version is not fully supported"
+                )
+            download.result()
+            if proofs is not None:
+                results["jobs"] = proofs.result()
+        finally:
+            stop.set()
+    echo(f"Stage timings: {pipeline.report()} ⏱️")
+    return results
+
+
+def pipeline(
+    spec_path: str = typer.Argument(..., help="Path of the YAML or TOML spec"),
+    debug: Optional[bool] = DEBUG_OPTION,
+) -> None:
+    try:
+        spec = load_spec(spec_path)
+    except ValidationError as e:
+        echo.error("⛔️Invalid pipeline spec⛔️")
+        echo.error(str(e))
+        if debug:
+            raise e
+        sys.exit(1)
+    except (OSError, ValueError) as e:
+        echo.error(f"⛔️Could not read the pipeline spec -> {e}⛔️")
+        if debug:
+            raise e
+        sys.exit(1)
+
+    start = time.perf_counter()
+    with ExceptionHandler(debug=debug):
+        results = run_pipeline(spec, debug)
+    if "endpoint" in results:
+        echo(f"Endpoint ready at: {results['endpoint'].uri} 🚀")
+    failed = [
+        job_id
+        for job_id, job in results.get("jobs", {}).items()
+        if job.status != JobStatus.COMPLETED
+    ]
+    if failed:
+        echo.error(f"⛔️Proving jobs failed -> {', '.join(map(str, failed))}⛔️")
+        sys.exit(1)
+    echo(f"Pipeline finished in {time.perf_counter() - start:.2f}s ✅")
@@ -5,6 +5,7 @@ import typer
 from giza.cli.frameworks import cairo, ezkl
 from giza.cli.options import (
     DEBUG_OPTION,
+    DETACH_OPTION,
     FRAMEWORK_OPTION,
     MODEL_OPTION,
     VERSION_OPTION,
@@ -21,10 +22,17 @@ def prove(
     size: JobSize = typer.Option(JobSize.S, "--size", "-s"),
     framework: Framework = FRAMEWORK_OPTION,
     output_path: str = typer.Option("zk.proof", "--output-path", "-o"),
+    detach: bool = DETACH_OPTION,
     debug: Optional[bool] = DEBUG_OPTION,
 ) -> None:
     if framework == Framework.CAIRO:
-        cairo.prove(data=data, size=size, output_path=output_path, debug=debug)
+        cairo.prove(
+            data=data,
+            size=size,
+            output_path=output_path,
+            debug=debug,
+            detach=detach,
+        )
     elif framework == Framework.EZKL:
         ezkl.prove(
             input_data=data[0],
@@ -33,6 +41,7 @@ def prove(
             size=size,
             output_path=output_path,
             debug=debug,
+            detach=detach,
         )
     else:
         raise typer.BadParameter(
@@ -0,0 +1,146 @@
+import os
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from giza.cli import API_HOST
+from giza.cli.client import JobsClient, VersionsClient
+from giza.cli.frameworks import cairo, ezkl
+from giza.cli.options import DEBUG_OPTION
+from giza.cli.utils import echo
+from giza.cli.utils.enums import Framework, JobStatus, VersionStatus
+from giza.cli.utils.exception_handling import ExceptionHandler
+from giza.cli.utils.onnx_optimizer import optimize_file
+from giza.cli.utils.runs import COMPLETED, UPLOADED, Run, list_runs, load_run
+
+
+def _print_runs(runs: list[Run]) -> None:
+    table = Table(title="Workflows to resume")
+    for column in ("id", "stage", "model", "version", "job", "updated"):
+        table.add_column(column)
+    for run in runs:
+        table.add_row(
+            run.id,
+            run.stage,
+            str(run.model_id or ""),
+            str(run.version_id or ""),
+            str(run.job_id or ""),
+            time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(run.updated_at)),
+        )
+    Console().print(table)
+
+
+def _resume_transpile(run: Run, debug: Optional[bool]) -> None:
+    client = VersionsClient(API_HOST)
+    if not run.uploaded:
+        if (
+            run.upload_url is None
+            or run.model_path is None
+            or not os.path.exists(run.model_path)
+        ):
+            echo.error(
+                "⛔️The model was not uploaded and can not be anymore, "
+                f"run `giza transpile --model-id {run.model_id}` again⛔️"
+            )
+            run.finish()
+            sys.exit(1)
+        echo("Sending model for transpilation ✅ ")
+        with TemporaryDirectory() as optimized_dir:
+            model_path = run.model_path
+            if run.options.get("optimize"):
+                # The optimized file is gone with the process that transpiled it
+                model_path = os.path.join(optimized_dir, Path(run.model_path).name)
+                optimize_file(
+                    run.model_path,
+                    model_path,
+                    quantize=run.options.get("quantize", False),
+                )
+            cairo.upload_model(
+                client,
+                run.model_id,  # type: ignore
+                run.version_id,  # type: ignore
+                model_path,
+                run.upload_url,
+                echo,
+            )
+        run.update(stage=UPLOADED, uploaded=True, upload_url=None)
+    if run.stage != COMPLETED:
+        version = cairo.wait_for_transpilation(
+            client, run.model_id, run.version_id, echo  # type: ignore
+        )
+        if version.status == VersionStatus.FAILED:
+            run.finish()
+            sys.exit(1)
+        run.update(stage=COMPLETED)
+    cairo.download_transpilation(
+        client,
+        run.model_id,  # type: ignore
+        run.version_id,  # type: ignore
+        run.output_path or "cairo_model",
+        run.options.get("download_model", True),
+        run.options.get("download_sierra", False),
+        echo,
+        debug,
+    )
+
+
+def _resume_prove(run: Run) -> None:
+    framework = ezkl if run.framework == Framework.EZKL else cairo
+    if run.stage != COMPLETED:
+        job = framework.wait_for_job(JobsClient(API_HOST), run.job_id, echo)  # type: ignore
+        if job.status == JobStatus.FAILED:
+            run.finish()
+            sys.exit(1)
+        run.update(stage=COMPLETED)
+    framework.download_proof(run.job_id, run.output_path or "zk.proof", echo)  # type: ignore
+
+
+def resume(
+    run_id: Optional[str] = typer.Argument(
+        None, help="Id of the workflow to resume, the most recent one by default"
+    ),
+    list_: bool = typer.Option(
+        False, "--list", "-l", help="List the workflows that can be resumed"
+    ),
+    discard: bool = typer.Option(
+        False, "--discard", help="Forget the workflow instead of resuming it"
+    ),
+    debug: Optional[bool] = DEBUG_OPTION,
+) -> None:
+    runs = list_runs()
+    if list_:
+        _print_runs(runs)
+        return
+    if run_id is not None:
+        run = load_run(run_id)
+        if run is None:
+            echo.error(f"⛔️Workflow {run_id} not found, use `giza resume --list`⛔️")
+            sys.exit(1)
+    elif runs:
+        run = runs[0]
+    else:
+        echo("There are no workflows to resume ✅")
+        return
+
+    if discard:
+        run.finish()
+        echo(f"Workflow {run.id} discarded ✅")
+        return
+
+    echo(f"Resuming {run.command} {run.id} from stage '{run.stage}' ✅")
+    with ExceptionHandler(debug=debug):
+        if run.command == "transpile":
+            _resume_transpile(run, debug)
+        elif run.command == "prove":
+            _resume_prove(run)
+        else:
+            echo.error(f"⛔️Workflows of `{run.command}` can not be resumed⛔️")
+            sys.exit(1)
+    run.finish()
+    echo(f"Workflow {run.id} finished ✅")
@@ -5,6 +5,7 @@ import typer
 from giza.cli.frameworks import cairo, ezkl
 from giza.cli.options import (
     DEBUG_OPTION,
+    DETACH_OPTION,
     FRAMEWORK_OPTION,
     MODEL_OPTION,
     VERSION_OPTION,
@@ -22,6 +23,12 @@ def verify(
     proof: Optional[str] = typer.Option(None, "--proof", "-P"),
     size: JobSize = typer.Option(JobSize.S, "--size", "-s"),
     framework: Framework = FRAMEWORK_OPTION,
+    detach: bool = DETACH_OPTION,
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Verify the proof again even if the local verification ledger already has it (Cairo only)",
+    ),
     debug: Optional[bool] = DEBUG_OPTION,
 ) -> None:
     if framework == Framework.CAIRO:
@@ -33,6 +40,8 @@ def verify(
             debug=debug,
             proof=proof,
             use_job=use_job,
+            detach=detach,
+            force=force,
         )
     elif framework == Framework.EZKL:
         ezkl.verify(
@@ -42,6 +51,7 @@ def verify(
             size=size,
             debug=debug,
             proof=proof,
+            detach=detach,
         )
     else:
         raise typer.BadParameter(
@@ -1,9 +1,8 @@
-import glob
 import os
 import sys
 import zipfile
 from tempfile import TemporaryDirectory
-from typing import Dict, Optional
+from typing import BinaryIO, Dict, Optional
 
 import typer
 
@@ -13,6 +12,9 @@ from giza.cli.frameworks import cairo, ezkl
 from giza.cli.options import (
     DEBUG_OPTION,
     DESCRIPTION_OPTION,
+    DETACH_OPTION,
+    FOLLOW_INTERVAL_OPTION,
+    FOLLOW_OPTION,
     FRAMEWORK_OPTION,
     INPUT_OPTION,
     JSON_OPTION,
@@ -21,21 +23,37 @@ from giza.cli.options import (
     VERSION_OPTION,
 )
 from giza.cli.schemas.versions import Version, VersionList
-from giza.cli.utils import echo
+from giza.cli.utils import build_cache, echo
 from giza.cli.utils.enums import Framework, VersionStatus
 from giza.cli.utils.exception_handling import ExceptionHandler
+from giza.cli.utils.files import file_hash
+from giza.cli.utils.log_stream import follow_logs
 from giza.cli.utils.misc import download_model_or_sierra, scarb_build, zip_folder
 
 app = typer.Typer()
 
 
-def update_sierra(model_id: int, version_id: int, model_path: str):
-    sierra_path = glob.glob(
-        os.path.join(model_path, "inference", "**/*.sierra.json"), recursive=True
-    )[0]
+def update_sierra(
+    model_id: int, version_id: int, model_path: str, use_cache: bool = True
+):
+    folder = os.path.join(model_path, "inference")
+    sierra_path = build_cache.find_sierra(folder)
+    if sierra_path is None:
+        raise ValueError("⛔️Sierra file not found, the model needs to be built⛔️")
+
+    uploaded = {
+        "model_id": model_id,
+        "version_id": version_id,
+        "sha256": file_hash(sierra_path),
+    }
+    if use_cache and build_cache.load(folder).get("uploaded_sierra") == uploaded:
+        echo("Sierra did not change since the last upload, skipping it ✅ ")
+        return
+
     with open(sierra_path, "rb") as f:
         TranspileClient(API_HOST).update_transpilation(model_id, version_id, f)
         echo("Sierra updated ✅ ")
+    build_cache.update(folder, uploaded_sierra=uploaded)
 
 
 @app.command(
@@ -83,10 +101,34 @@ def transpile(
         "--download-sierra",
         help="Download the siera file is the modle is fully compatible. CAIRO only.",
     ),
+    check: bool = typer.Option(
+        False,
+        "--check",
+        help="Check locally if the operators of the model are supported, without uploading it. CAIRO only.",
+    ),
+    optimize: bool = typer.Option(
+        False,
+        "--optimize",
+        help="Optimize the ONNX graph locally before uploading it: constant folding, identity and reshape elimination and dead code removal. CAIRO only.",
+    ),
+    quantize: bool = typer.Option(
+        False,
+        "--quantize",
+        help="Round the weights to the FP16x16 fixed point used by Orion, requires --optimize. CAIRO only.",
+    ),
+    detach: bool = DETACH_OPTION,
     json: Optional[bool] = JSON_OPTION,
     debug: Optional[bool] = DEBUG_OPTION,
 ) -> None:
-    if framework == Framework.CAIRO:
+    if (check or optimize) and framework != Framework.CAIRO:
+        raise typer.BadParameter(
+            f"Checking and optimizing the model are only available for {Framework.CAIRO}"
+        )
+    if quantize and not optimize:
+        raise typer.BadParameter("--quantize requires --optimize")
+    if check:
+        cairo.check(model_path=model_path, json=json, debug=debug)
+    elif framework == Framework.CAIRO:
         cairo.transpile(
             model_path=model_path,
             model_id=model_id,
@@ -97,6 +139,9 @@ def transpile(
             download_sierra=download_sierra,
             json=json,
             debug=debug,
+            optimize=optimize,
+            quantize=quantize,
+            detach=detach,
         )
     elif framework == Framework.EZKL:
         ezkl.setup(
@@ -106,6 +151,7 @@ def transpile(
             model_desc=model_desc,
             input_data=input_data,
             debug=debug,
+            detach=detach,
         )
     else:
         raise typer.BadParameter(
@@ -151,6 +197,11 @@ def update(
     model_path: str = typer.Option(
         None, "--model-path", "-M", help="Path of the model to update"
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Build and upload the model even if it did not change since the last update",
+    ),
     json: Optional[bool] = JSON_OPTION,
     debug: bool = DEBUG_OPTION,
 ) -> None:
@@ -175,8 +226,8 @@ def update(
             version.status == VersionStatus.PARTIALLY_SUPPORTED
             and model_path is not None
         ):
-            scarb_build(os.path.join(model_path, "inference"))
-            update_sierra(model_id, version_id, model_path)
+            scarb_build(os.path.join(model_path, "inference"), use_cache=not no_cache)
+            update_sierra(model_id, version_id, model_path, use_cache=not no_cache)
             with TemporaryDirectory() as tmp_dir:
                 zip_path = zip_folder(model_path, tmp_dir)
                 version = client.upload_cairo(model_id, version_id, zip_path)
@@ -251,16 +302,18 @@ def download(
             raise ValueError(f"Model version status is not completed {version.status}")
 
         echo("Data is ready, downloading! ✅")
-        downloads: Dict[str, bytes] = client.download(
+        downloads: Dict[str, BinaryIO] = client.download(
             model_id,
             version.version,
             {"download_model": download_model, "download_sierra": download_sierra},
+            stream=True,
         )
 
         for name, content in downloads.items():
             try:
                 echo(f"Downloading {name} ✅")
-                download_model_or_sierra(content, output_path, name)
+                with content:
+                    download_model_or_sierra(content, output_path, name)
             except zipfile.BadZipFile as zip_error:
                 raise ValueError(
                     "Something went wrong with the download", zip_error.args[0]
@@ -315,12 +368,16 @@ def download_original(
 
     This commands needs a model id and version id to retrieve data from the server.
 
+    With `--follow`, the new lines are printed as they are written until the transpilation finishes.
+
     If no version exists an error will be thrown.
     """,
 )
 def logs(
     model_id: int = MODEL_OPTION,
     version_id: int = VERSION_OPTION,
+    follow: bool = FOLLOW_OPTION,
+    interval: float = FOLLOW_INTERVAL_OPTION,
     debug: bool = DEBUG_OPTION,
 ) -> None:
     if any([model_id is None, version_id is None]):
@@ -329,6 +386,22 @@ def logs(
     echo("Retrieving logs ✅ ")
     with ExceptionHandler(debug=debug):
         client = VersionsClient(API_HOST)
+        if follow:
+            try:
+                follow_logs(
+                    lambda offset: client.get_logs(model_id, version_id, offset=offset),
+                    lambda: client.get(model_id, version_id).status
+                    in (
+                        VersionStatus.COMPLETED,
+                        VersionStatus.PARTIALLY_SUPPORTED,
+                        VersionStatus.FAILED,
+                    ),
+                    print,
+                    interval,
+                )
+            except KeyboardInterrupt:
+                echo("Stopped following the logs")
+            return
         logs = client.get_logs(model_id, version_id)
         if logs.logs == "":
             echo.warning("No logs available")
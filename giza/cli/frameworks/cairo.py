@@ -1,16 +1,22 @@
 import json
+import os
+import shutil
 import sys
 import time
 import zipfile
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Optional
 
 import typer
 from pydantic import ValidationError
 from requests import HTTPError
+from rich import print_json
+from rich.console import Console
 from rich.live import Live
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.spinner import Spinner
+from rich.table import Table
 
 from giza.cli import API_HOST
 from giza.cli.client import (
@@ -25,8 +31,10 @@ from giza.cli.schemas.endpoints import Endpoint, EndpointCreate, EndpointsList
 from giza.cli.schemas.jobs import Job, JobCreate
 from giza.cli.schemas.models import ModelCreate
 from giza.cli.schemas.proofs import Proof
-from giza.cli.schemas.versions import VersionCreate, VersionUpdate
+from giza.cli.schemas.verify import VerifyResponse
+from giza.cli.schemas.versions import Version, VersionCreate, VersionUpdate
 from giza.cli.utils import Echo, echo, get_response_info
+from giza.cli.utils.compatibility import check_operators, load_supported_operators
 from giza.cli.utils.enums import (
     Framework,
     JobKind,
@@ -35,27 +43,139 @@ from giza.cli.utils.enums import (
     ServiceSize,
     VersionStatus,
 )
-from giza.cli.utils.misc import download_model_or_sierra
+from giza.cli.utils.files import file_hash
+from giza.cli.utils.metrics import metrics
+from giza.cli.utils.misc import content_size, download_model_or_sierra
+from giza.cli.utils.onnx_graph import OnnxParseError, load_model
+from giza.cli.utils.onnx_optimizer import OptimizationReport, optimize_file
+from giza.cli.utils.runs import COMPLETED, SUBMITTED, UPLOADED, Run
+from giza.cli.utils.verification_ledger import VerificationLedger, verifier_version
 
 app = typer.Typer()
 
 
+def wait_for_job(
+    client: JobsClient,
+    job_id: int,
+    echo: Echo,
+    kind: Optional[JobKind] = None,
+    name: str = "Proving",
+    interval: float = 20,
+    timeout: Optional[float] = None,
+) -> Job:
+    """
+    Poll a job until it finishes, printing its logs if it fails.
+
+    Args:
+        client (JobsClient): client to retrieve the job
+        job_id (int): job to wait for
+        echo (Echo): echo of the command
+        kind (Optional[JobKind]): kind of the job, needed to retrieve verification jobs
+        name (str): name of the job in the messages
+        interval (float): seconds between status checks
+        timeout (Optional[float]): seconds to wait before giving up, no limit by default
+
+    Returns:
+        Job: the job, COMPLETED or FAILED, or still running if the timeout is reached
+    """
+    params = {"kind": kind} if kind is not None else None
+    client.warn_token_expiry(timeout)
+    start_time = time.time()
+    with Live() as live:
+        with metrics.phase("job_wait"):
+            while True:
+                with metrics.poll("job_wait"):
+                    current_job: Job = (
+                        client.get(job_id, params=params)
+                        if params
+                        else client.get(job_id)
+                    )
+                if current_job.status == JobStatus.COMPLETED:
+                    live.update(echo.format_message(f"{name} job is successful ✅"))
+                    return current_job
+                elif current_job.status == JobStatus.FAILED:
+                    live.update(
+                        echo.format_error(
+                            f"{name} Job with name '{current_job.job_name}' and id {current_job.id} failed"
+                        )
+                    )
+                    logs = client.get_logs(job_id)
+                    if logs.logs == "":
+                        echo.warning("No logs available")
+                    else:
+                        print(logs.logs)
+                    return current_job
+                elif timeout is not None and time.time() - start_time >= timeout:
+                    live.update(
+                        echo.format_error(
+                            f"{name} job did not finish after {timeout:.0f}s, status is '{current_job.status}'"
+                        )
+                    )
+                    return current_job
+                else:
+                    live.update(
+                        echo.format_message(
+                            f"Job status is '{current_job.status}', elapsed {current_job.elapsed_time}s"
+                        )
+                    )
+                    time.sleep(interval)
+
+
+def download_proof(
+    job_id: int,
+    output_path: str,
+    echo: Echo,
+    proof_client: Optional[ProofsClient] = None,
+) -> Proof:
+    """
+    Download the proof generated by a proving job.
+
+    Args:
+        job_id (int): completed proving job
+        output_path (str): path to save the proof at
+        echo (Echo): echo of the command
+        proof_client (Optional[ProofsClient]): client of the proofs, a new one by default
+
+    Returns:
+        Proof: the downloaded proof
+    """
+    with metrics.phase("proof_download"):
+        proof_client = proof_client or ProofsClient(API_HOST)
+        proof: Proof = proof_client.get_by_job_id(job_id)
+        echo("Proof metrics:")
+        echo.print_model(proof)
+        with proof_client.download(proof.id, stream=True) as content, open(  # type: ignore
+            output_path, "wb"
+        ) as f:
+            metrics.inc(
+                "giza_phase_bytes_total",
+                content_size(content),
+                phase="proof_download",
+            )
+            shutil.copyfileobj(content, f)
+        echo(f"Proof saved at: {output_path}")
+    return proof
+
+
 def prove(
     data: list[str],
     debug: Optional[bool],
     size: JobSize = JobSize.S,
     framework: Framework = Framework.CAIRO,
     output_path: str = "zk.proof",
+    detach: bool = False,
 ) -> None:
     """
     Command to prove as spceific cairo program, previously converted to CASM.
     This will create a proving job and check the status, once it finishes if COMPLETED the proof is downloaded at the output path
-    The daily jobs allowed are rate limited by the backend.
+    The daily jobs allowed are rate limited by the backend, rejected requests are queued
+    locally until the backend allows them again (see `GIZA_RATE_LIMIT_MAX_WAIT`).
 
     Args:
         data: main CASM file
         size: Size of the job, allowed values are S, M, L and XL. Defaults to S.
         output_path: output path of the zk proof generated in the job
+        detach: return once the job is created, without waiting for the proof. Defaults to False.
         debug (Optional[bool], optional): Whether to add debug information, will show requests, extra logs and traceback if there is an Exception. Defaults to DEBUG_OPTION (False).
 
     Raises:
@@ -65,43 +185,32 @@ def prove(
     try:
         client = JobsClient(API_HOST)
         trace_path, memory_path = data
-        with open(trace_path, "rb") as trace, open(memory_path, "rb") as memory:
-            job: Job = client.create(
-                JobCreate(size=size, framework=framework), trace, memory
-            )
+        with metrics.phase("job_create"):
+            with open(trace_path, "rb") as trace, open(memory_path, "rb") as memory:
+                job: Job = client.create(
+                    JobCreate(size=size, framework=framework), trace, memory
+                )
         echo(f"Proving job created with name '{job.job_name}' and id -> {job.id} ✅")
-        with Live() as live:
-            while True:
-                current_job: Job = client.get(job.id)
-                if current_job.status == JobStatus.COMPLETED:
-                    live.update(echo.format_message("Proving job is successful ✅"))
-                    break
-                elif current_job.status == JobStatus.FAILED:
-                    live.update(
-                        echo.format_error(
-                            f"Proving Job with name '{current_job.job_name}' and id {current_job.id} failed"
-                        )
-                    )
-                    logs = client.get_logs(job.id)
-                    if logs.logs == "":
-                        echo.warning("No logs available")
-                    else:
-                        print(logs.logs)
-                    sys.exit(1)
-                else:
-                    live.update(
-                        echo.format_message(
-                            f"Job status is '{current_job.status}', elapsed {current_job.elapsed_time}s"
-                        )
-                    )
-                    time.sleep(20)
-        with open(output_path, "wb") as f:
-            proof_client = ProofsClient(API_HOST)
-            proof: Proof = proof_client.get_by_job_id(current_job.id)
-            echo("Proof metrics:")
-            echo.print_model(proof)
-            f.write(proof_client.download(proof.id))
-            echo(f"Proof saved at: {output_path}")
+        run = Run.start(
+            "prove",
+            framework,
+            stage=SUBMITTED,
+            job_id=job.id,
+            output_path=output_path,
+        )
+        if detach:
+            echo(
+                f"Detached, wait for it with `giza jobs wait --job-id {job.id}` "
+                f"and get the proof with `giza jobs download --job-id {job.id}` ⏏️"
+            )
+            return
+        current_job = wait_for_job(client, job.id, echo)
+        if current_job.status == JobStatus.FAILED:
+            run.finish()
+            sys.exit(1)
+        run.update(stage=COMPLETED)
+        download_proof(current_job.id, output_path, echo)
+        run.finish()
     except ValidationError as e:
         echo.error("Job validation error")
         echo.error("Review the provided information")
@@ -166,20 +275,9 @@ def deploy(
 
         spinner = Spinner(name="aesthetic", text="Creating endpoint!")
 
-        with Live(renderable=spinner):
-            if data is None:
-                endpoint = client.create(
-                    model_id,
-                    version_id,
-                    EndpointCreate(
-                        size=size,
-                        model_id=model_id,
-                        version_id=version_id,
-                    ),
-                    None,
-                )
-            else:
-                with open(data, "rb") as sierra:
+        with metrics.phase("endpoint_create"):
+            with Live(renderable=spinner):
+                if data is None:
                     endpoint = client.create(
                         model_id,
                         version_id,
@@ -188,8 +286,20 @@ def deploy(
                             model_id=model_id,
                             version_id=version_id,
                         ),
-                        sierra,
+                        None,
                     )
+                else:
+                    with open(data, "rb") as sierra:
+                        endpoint = client.create(
+                            model_id,
+                            version_id,
+                            EndpointCreate(
+                                size=size,
+                                model_id=model_id,
+                                version_id=version_id,
+                            ),
+                            sierra,
+                        )
 
     except ValidationError as e:
         echo.error("Endpoint validation error")
@@ -220,6 +330,109 @@ def deploy(
     return endpoint
 
 
+def check(model_path: str, json: Optional[bool], debug: Optional[bool]) -> None:
+    """
+    Check locally if the operators of an ONNX model are supported by the transpiler, before
+    any upload. Exits with an error if any operator is not supported.
+
+    Args:
+        model_path (str): Path of the ONNX model.
+        json (bool, optional): Print the report as json.
+        debug (bool, optional): A flag used to determine whether to raise exceptions or not.
+    """
+    echo = Echo(debug=debug, output_json=json)
+    if model_path is None:
+        echo.error("No model name provided, please provide a model path ⛔️")
+        sys.exit(1)
+    try:
+        model = load_model(model_path)
+    except (OSError, OnnxParseError) as e:
+        echo.error(f"⛔️Could not read the model -> {e}⛔️")
+        if debug:
+            raise e
+        sys.exit(1)
+    supported = load_supported_operators()
+    report = check_operators(model, supported)
+
+    if json:
+        print_json(
+            data={
+                "supported": report.is_supported,
+                "operators_version": supported.version,
+                "opsets": model.opsets,
+                "operators": {
+                    f"{domain}.{op_type}": count
+                    for (domain, op_type), count in sorted(model.operators.items())
+                },
+                "unsupported": {
+                    f"{domain}.{op_type}": count
+                    for (domain, op_type), count in report.unsupported.items()
+                },
+                "parameters": model.parameters,
+                "parameters_bytes": model.parameters_bytes,
+                "file_size": model.file_size,
+            }
+        )
+    else:
+        echo(
+            f"Checking against supported operators {supported.version} ({supported.source}) ✅"
+        )
+        table = Table(title=f"Operators of {model_path}")
+        for column in ("operator", "domain", "nodes", "supported"):
+            table.add_column(column)
+        for (domain, op_type), count in sorted(model.operators.items()):
+            table.add_row(
+                op_type,
+                domain,
+                str(count),
+                "⛔️" if (domain, op_type) in report.unsupported else "✅",
+            )
+        Console().print(table)
+        opsets = ", ".join(
+            f"{domain} {version}" for domain, version in model.opsets.items()
+        )
+        echo(f"Opsets: {opsets}")
+        echo(
+            f"Estimated model size: {model.parameters} parameters, "
+            f"{model.parameters_bytes / 1024 / 1024:.2f} MB of weights, "
+            f"{model.file_size / 1024 / 1024:.2f} MB file"
+        )
+
+    if report.is_supported:
+        echo("All the operators are supported, the model is ready for transpilation ✅")
+        return
+    unsupported = ", ".join(op_type for _, op_type in report.unsupported)
+    echo.error(f"⛔️ Unsupported operators -> {unsupported} ⛔️")
+    echo.warning(
+        "Please check the compatibility list in Orion: "
+        "https://cli.gizatech.xyz/frameworks/cairo/transpile#supported-operators"
+    )
+    sys.exit(1)
+
+
+def print_optimization_report(report: OptimizationReport) -> None:
+    """
+    Print the size of the model before and after the optimization.
+
+    Args:
+        report (OptimizationReport): result of the optimization
+    """
+    table = Table(title="ONNX optimization")
+    for column in ("", "before", "after"):
+        table.add_column(column)
+    before, after = report.before, report.after
+    table.add_row("nodes", str(before.nodes), str(after.nodes))
+    table.add_row("parameters", str(before.parameters), str(after.parameters))
+    table.add_row(
+        "file size (MB)",
+        f"{before.file_size / 1024 / 1024:.2f}",
+        f"{after.file_size / 1024 / 1024:.2f}",
+    )
+    Console().print(table)
+    changes = ", ".join(f"{name}: {count}" for name, count in report.passes.items())
+    echo(f"Model optimized ✅ ({changes})")
+
+
 def transpile(
     model_path: str,
     model_id: int,
@@ -230,6 +443,9 @@ def transpile(
     download_sierra: bool,
     json: Optional[bool],
     debug: Optional[bool],
+    optimize: bool = False,
+    quantize: bool = False,
+    detach: bool = False,
 ) -> None:
     """
     This function is responsible for transpiling a model. The overall objective is to prepare a model for use by converting it into a different format (transpiling).
@@ -252,6 +468,9 @@ def transpile(
         download_model (bool): A flag used to determine whether to download the model or not.
         download_sierra (bool): A flag used to determine whether to download the sierra or not.
         debug (bool, optional): A flag used to determine whether to raise exceptions or not. Defaults to DEBUG_OPTION.
+        optimize (bool): Optimize the ONNX graph locally before uploading it. Defaults to False.
+        quantize (bool): Round the weights to fixed point while optimizing. Defaults to False.
+        detach (bool): Return once the model is uploaded, without waiting for the transpilation. Defaults to False.
 
     Raises:
         ValidationError: If there is a validation error with the model or version.
@@ -269,97 +488,104 @@ def transpile(
         echo(
             "Model description is not required when model id is provided, ignoring provided description ✅ "
         )
+    # Journaled instead of the optimized file, which is removed once the command finishes
+    source_path = os.path.abspath(model_path)
+    if optimize:
+        # Removed once the command finishes, the original file name is kept for the version
+        optimized_dir = TemporaryDirectory()
+        optimized_path = os.path.join(optimized_dir.name, Path(model_path).name)
+        try:
+            with metrics.phase("optimization"):
+                report = optimize_file(model_path, optimized_path, quantize=quantize)
+        except (OSError, OnnxParseError) as e:
+            echo.error(f"⛔️Could not optimize the model -> {e}⛔️")
+            if debug:
+                raise e
+            sys.exit(1)
+        print_optimization_report(report)
+        model_path = optimized_path
     try:
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             transient=True,
         ) as progress:
+            echo.debug(f"Reading model from path: {model_path}")
             model_task = progress.add_task(
                 description="Retrieving Model...", total=None
             )
-            echo.debug(f"Reading model from path: {model_path}")
-            models_client = ModelsClient(API_HOST)
-            if model_id is None:
-                model = models_client.get_by_name(model_name)
-                if model is not None:
-                    echo("Model already exists, using existing model ✅ ")
-                    echo(f"Model found with id -> {model.id}! ✅")
+            with metrics.phase("model_lookup"):
+                models_client = ModelsClient(API_HOST)
+                if model_id is None:
+                    model = models_client.get_by_name(model_name)
+                    if model is not None:
+                        echo("Model already exists, using existing model ✅ ")
+                        echo(f"Model found with id -> {model.id}! ✅")
+                    else:
+                        model_create = ModelCreate(
+                            name=model_name, description=model_desc
+                        )
+                        model = models_client.create(model_create)
+                        echo(f"Model Created with id -> {model.id}! ✅")
                 else:
-                    model_create = ModelCreate(name=model_name, description=model_desc)
-                    model = models_client.create(model_create)
-                    echo(f"Model Created with id -> {model.id}! ✅")
-            else:
-                model = models_client.get(model_id)
-                echo(f"Model found with id -> {model.id}! ✅")
+                    model = models_client.get(model_id)
+                    echo(f"Model found with id -> {model.id}! ✅")
             progress.update(model_task, completed=True, visible=False)
             version_task = progress.add_task(
                 description="Creating Version...", total=None
             )
-            client = VersionsClient(API_HOST)
-            version_create = VersionCreate(
-                description=desc if desc else "Intial version",
-                size=Path(model_path).stat().st_size,
-                framework=Framework.CAIRO,
-            )
-            version, upload_url = client.create(
-                model.id, version_create, model_path.split("/")[-1]
+            with metrics.phase("version_create"):
+                client = VersionsClient(API_HOST)
+                version_create = VersionCreate(
+                    description=desc if desc else "Intial version",
+                    size=Path(model_path).stat().st_size,
+                    framework=Framework.CAIRO,
+                )
+                version, upload_url = client.create(
+                    model.id, version_create, model_path.split("/")[-1]
+                )
+                echo(f"Version Created with id -> {version.version}! ✅")
+            run = Run.start(
+                "transpile",
+                Framework.CAIRO,
+                model_id=model.id,
+                version_id=version.version,
+                model_path=source_path,
+                upload_url=upload_url,
+                output_path=output_path,
+                options={
+                    "download_model": download_model,
+                    "download_sierra": download_sierra,
+                    "optimize": optimize,
+                    "quantize": quantize,
+                },
             )
-            echo(f"Version Created with id -> {version.version}! ✅")
             progress.update(version_task, completed=True, visible=False)
             echo("Sending model for transpilation ✅ ")
-            with open(model_path, "rb") as f:
-                client._upload(upload_url, f)
-                echo.debug("Model Uploaded! ✅")
-
-            client.update(
-                model.id, version.version, VersionUpdate(status=VersionStatus.UPLOADED)
-            )
+            with metrics.phase("upload"):
+                upload_model(
+                    client, model.id, version.version, model_path, upload_url, echo
+                )
+                metrics.inc(
+                    "giza_phase_bytes_total", version_create.size, phase="upload"
+                )
+            run.update(stage=UPLOADED, uploaded=True, upload_url=None)
+            if detach:
+                echo(
+                    f"Detached, wait for it with `giza jobs wait --model-id {model.id} --version-id {version.version}` "
+                    f"and get the model with `giza versions download --model-id {model.id} --version-id {version.version}` ⏏️"
+                )
+                return
 
             progress.add_task(description="Transpiling Model...", total=None)
-            start_time = time.time()
-            while True:
-                version = client.get(model.id, version.version)
-                if version.status not in (
-                    VersionStatus.COMPLETED,
-                    VersionStatus.FAILED,
-                    VersionStatus.PARTIALLY_SUPPORTED,
-                ):
-                    spent = time.time() - start_time
-                    echo.debug(
-                        f"[{spent:.2f}s]Transpilation is not ready yet, retrying in 10s"
-                    )
-                    time.sleep(10)
-                elif version.status == VersionStatus.COMPLETED:
-                    echo.debug("Transpilation is ready, downloading! ✅")
-                    echo(
-                        "Transpilation is fully compatible. Version compiled and Sierra is saved at Giza ✅"
-                    )
-                    break
-                elif version.status == VersionStatus.PARTIALLY_SUPPORTED:
-                    echo.warning(
-                        "🔎 Transpilation is partially supported. "
-                        "Some operators are not yet supported in the Transpiler/Orion"
-                    )
-                    echo.warning(
-                        "Please check the compatibility list in Orion: "
-                        "https://cli.gizatech.xyz/frameworks/cairo/transpile#supported-operators"
-                    )
-                    break
-                elif version.status == VersionStatus.FAILED:
-                    echo.error("⛔️ Transpilation failed! ⛔️")
-                    echo.error(f"⛔️ Reason -> {version.message} ⛔️")
-                    logs = client.get_logs(model.id, version.version)
-                    if logs.logs == "":
-                        echo.warning("No logs available")
-                    else:
-                        echo.error("##### Printing Transpilation Logs #####")
-                        echo(
-                            "Note: These logs are retrieved from the platform execution environment"
-                        )
-                        print(logs.logs)
-                        echo.error("##### End of Logs #####")
-                    sys.exit(1)
+            with metrics.phase("transpilation"):
+                version = wait_for_transpilation(
+                    client, model.id, version.version, echo
+                )
+            if version.status == VersionStatus.FAILED:
+                run.finish()
+                sys.exit(1)
+            run.update(stage=COMPLETED)
     except ValidationError as e:
         echo.error("Version validation error")
         echo.error("Review the provided information")
@@ -384,16 +610,166 @@ def transpile(
             raise e
         sys.exit(1)
 
+    download_transpilation(
+        client,
+        model.id,
+        version.version,
+        output_path,
+        download_model,
+        download_sierra,
+        echo,
+        debug,
+    )
+    run.finish()
+    echo.print_model(model, title="Model")
+    echo.print_model(version, title="Version")
+
+
+def upload_model(
+    client: VersionsClient,
+    model_id: int,
+    version_id: int,
+    model_path: str,
+    upload_url: str,
+    echo: Echo,
+) -> None:
+    """
+    Upload the model of a version and mark it as UPLOADED, which starts the transpilation.
+
+    Args:
+        client (VersionsClient): client of the versions
+        model_id (int): model of the version
+        version_id (int): version to upload the model to
+        model_path (str): path of the model
+        upload_url (str): presigned url returned when the version was created
+        echo (Echo): echo of the command
+    """
+    with open(model_path, "rb") as f:
+        client._upload(upload_url, f)
+        echo.debug("Model Uploaded! ✅")
+
+    client.update(
+        model_id,
+        version_id,
+        VersionUpdate(status=VersionStatus.UPLOADED),
+    )
+
+
+def wait_for_transpilation(
+    client: VersionsClient,
+    model_id: int,
+    version_id: int,
+    echo: Echo,
+    interval: float = 10,
+    timeout: Optional[float] = None,
+) -> Version:
+    """
+    Poll a version until its transpilation finishes, printing the logs if it fails.
+
+    Args:
+        client (VersionsClient): client of the versions
+        model_id (int): model of the version
+        version_id (int): version being transpiled
+        echo (Echo): echo of the command
+        interval (float): seconds between status checks
+        timeout (Optional[float]): seconds to wait before giving up, no limit by default
+
+    Returns:
+        Version: the version, COMPLETED, PARTIALLY_SUPPORTED or FAILED, or still running
+            if the timeout is reached
+    """
+    start_time = time.time()
+    while True:
+        with metrics.poll("transpilation"):
+            version = client.get(model_id, version_id)
+        if version.status not in (
+            VersionStatus.COMPLETED,
+            VersionStatus.FAILED,
+            VersionStatus.PARTIALLY_SUPPORTED,
+        ):
+            spent = time.time() - start_time
+            if timeout is not None and spent >= timeout:
+                echo.error(
+                    f"⛔️Transpilation did not finish after {spent:.0f}s, status is '{version.status}'⛔️"
+                )
+                return version
+            echo.debug(
+                f"[{spent:.2f}s]Transpilation is not ready yet, retrying in {interval:.0f}s"
+            )
+            time.sleep(interval)
+        elif version.status == VersionStatus.COMPLETED:
+            echo.debug("Transpilation is ready, downloading! ✅")
+            echo(
+                "Transpilation is fully compatible. Version compiled and Sierra is saved at Giza ✅"
+            )
+            return version
+        elif version.status == VersionStatus.PARTIALLY_SUPPORTED:
+            echo.warning(
+                "🔎 Transpilation is partially supported. "
+                "Some operators are not yet supported in the Transpiler/Orion"
+            )
+            echo.warning(
+                "Please check the compatibility list in Orion: "
+                "https://cli.gizatech.xyz/frameworks/cairo/transpile#supported-operators"
+            )
+            return version
+        elif version.status == VersionStatus.FAILED:
+            echo.error("⛔️ Transpilation failed! ⛔️")
+            echo.error(f"⛔️ Reason -> {version.message} ⛔️")
+            logs = client.get_logs(model_id, version_id)
+            if logs.logs == "":
+                echo.warning("No logs available")
+            else:
+                echo.error("##### Printing Transpilation Logs #####")
+                echo(
+                    "Note: These logs are retrieved from the platform execution environment"
+                )
+                print(logs.logs)
+                echo.error("##### End of Logs #####")
+            return version
+
+
+def download_transpilation(
+    client: VersionsClient,
+    model_id: int,
+    version_id: int,
+    output_path: str,
+    download_model: bool,
+    download_sierra: bool,
+    echo: Echo,
+    debug: Optional[bool],
+) -> None:
+    """
+    Download the transpiled model and the sierra of a version.
+
+    Args:
+        client (VersionsClient): client of the versions
+        model_id (int): model of the version
+        version_id (int): transpiled version
+        output_path (str): folder to extract the files to
+        download_model (bool): whether to download the transpiled model
+        download_sierra (bool): whether to download the sierra
+        echo (Echo): echo of the command
+        debug (Optional[bool]): raise the exceptions instead of exiting
+    """
+    if not (download_model or download_sierra):
+        return
+    params = {
+        "download_model": download_model,
+        "download_sierra": download_sierra,
+    }
     try:
-        if download_model or download_sierra:
-            params = {
-                "download_model": download_model,
-                "download_sierra": download_sierra,
-            }
-            downloads = client.download(model.id, version.version, params)
+        with metrics.phase("download"):
+            downloads = client.download(model_id, version_id, params, stream=True)
             for name, content in downloads.items():
                 echo(f"Downloading {name} ✅")
-                download_model_or_sierra(content, output_path, name)
+                metrics.inc(
+                    "giza_phase_bytes_total",
+                    content_size(content),
+                    phase="download",
+                )
+                with metrics.phase("extraction"), content:
+                    download_model_or_sierra(content, output_path, name)
                 echo(f"{name} saved at: {output_path}")
     except zipfile.BadZipFile as zip_error:
         echo.error("Something went wrong with the transpiled file")
@@ -401,8 +777,6 @@ def transpile(
         if debug:
             raise zip_error
         sys.exit(1)
-    echo.print_model(model, title="Model")
-    echo.print_model(version, title="Version")
 
 
 def verify(
@@ -413,11 +787,17 @@ def verify(
     debug: Optional[bool] = False,
     size: JobSize = JobSize.S,
     use_job: Optional[bool] = False,
+    detach: bool = False,
+    force: bool = False,
 ):
     """
     Create a verification job.
     This command will create a verification job with the provided proof id.
     The job size, model id, and version id can be optionally specified.
+
+    When `GIZA_VERIFIER_VERSION` is set, a proof file already verified with that verifier version
+    is not uploaded again, its result is read from the local verification ledger unless `force` is
+    set. Verifications linked to a model version always run, so the version gets its result.
     """
     echo = Echo()
     if use_job and (not model_id or not version_id):
@@ -433,27 +813,8 @@ def verify(
     try:
         job: Job
         client = JobsClient(API_HOST)
-        if proof_id and use_job:
-            job = client.create(
-                JobCreate(
-                    size=size,
-                    framework=Framework.CAIRO,
-                    kind=JobKind.VERIFY,
-                    model_id=model_id,
-                    version_id=version_id,
-                    proof_id=proof_id,
-                ),
-                None,
-            )
-        elif proof_id and not use_job:
-            echo("Verifying proof...")
-            proofs_client = ProofsClient(API_HOST)
-            verification_result = proofs_client.verify_proof(proof_id)
-            echo(f"Verification result: {verification_result.verification}")
-            echo(f"Verification time: {verification_result.verification_time}")
-            sys.exit(0)
-        elif proof:
-            with open(proof, "rb") as data:
+        with metrics.phase("job_create"):
+            if proof_id and use_job:
                 job = client.create(
                     JobCreate(
                         size=size,
@@ -461,39 +822,70 @@ def verify(
                         kind=JobKind.VERIFY,
                         model_id=model_id,
                         version_id=version_id,
+                        proof_id=proof_id,
                     ),
-                    data,
+                    None,
                 )
+            elif proof_id and not use_job:
+                echo("Verifying proof...")
+                proofs_client = ProofsClient(API_HOST)
+                verification_result = proofs_client.verify_proof(proof_id)
+                echo(f"Verification result: {verification_result.verification}")
+                echo(f"Verification time: {verification_result.verification_time}")
+                sys.exit(0)
+            elif proof:
+                ledger = (
+                    VerificationLedger(Framework.CAIRO.value)
+                    if verifier_version() and not (model_id and version_id)
+                    else None
+                )
+                proof_sha256 = file_hash(proof) if ledger is not None else ""
+                record = None if force or ledger is None else ledger.get(proof_sha256)
+                if record is not None:
+                    echo(
+                        f"Proof already verified by job {record.job_id} at {record.verified_at}, "
+                        f"verifier version {record.verifier_version} ✅"
+                    )
+                    echo(f"Verification result: {record.verification}")
+                    echo(f"Verification time: {record.verification_time}")
+                    echo("Use `--force` to verify it again")
+                    return
+                with open(proof, "rb") as data:
+                    job = client.create(
+                        JobCreate(
+                            size=size,
+                            framework=Framework.CAIRO,
+                            kind=JobKind.VERIFY,
+                            model_id=model_id,
+                            version_id=version_id,
+                        ),
+                        data,
+                    )
         echo(
             f"Verification job created with name '{job.job_name}' and id -> {job.id} ✅"
         )
-        with Live() as live:
-            while True:
-                current_job: Job = client.get(job.id, params={"kind": JobKind.VERIFY})
-                if current_job.status == JobStatus.COMPLETED:
-                    live.update(
-                        echo.format_message("Verification job is successful ✅")
-                    )
-                    break
-                elif current_job.status == JobStatus.FAILED:
-                    live.update(
-                        echo.format_error(
-                            f"Verification Job with name '{current_job.job_name}' and id {current_job.id} failed"
-                        )
-                    )
-                    logs = client.get_logs(job.id)
-                    if logs.logs == "":
-                        echo.warning("No logs available")
-                    else:
-                        print(logs.logs)
-                    sys.exit(1)
-                else:
-                    live.update(
-                        echo.format_message(
-                            f"Job status is '{current_job.status}', elapsed {current_job.elapsed_time}s"
-                        )
-                    )
-                    time.sleep(20)
+        if detach:
+            if proof and ledger is not None:
+                # Recorded once `giza jobs wait` collects the result
+                ledger.submit(proof_sha256, job.id)
+            echo(
+                f"Detached, wait for it with `giza jobs wait --job-id {job.id} --kind VERIFY` ⏏️"
+            )
+            return
+        current_job = wait_for_job(
+            client, job.id, echo, kind=JobKind.VERIFY, name="Verification"
+        )
+        if current_job.status == JobStatus.FAILED:
+            sys.exit(1)
+        if proof and ledger is not None:
+            # Failed jobs are not recorded, they can fail for reasons other than the proof
+            ledger.record(
+                proof_sha256,
+                VerifyResponse(
+                    verification=True, verification_time=current_job.elapsed_time
+                ),
+                job_id=current_job.id,
+            )
     except ValidationError as e:
         echo.error("Job validation error")
         echo.error("Review the provided information")
@@ -1,4 +1,5 @@
 import json
+import shutil
 import sys
 import time
 from pathlib import Path
@@ -26,6 +27,9 @@ from giza.cli.schemas.proofs import Proof
 from giza.cli.schemas.versions import VersionCreate, VersionStatus, VersionUpdate
 from giza.cli.utils import Echo, get_response_info
 from giza.cli.utils.enums import Framework, JobKind, JobSize, JobStatus, ServiceSize
+from giza.cli.utils.metrics import metrics
+from giza.cli.utils.misc import content_size
+from giza.cli.utils.runs import COMPLETED, SUBMITTED, Run
 
 
 def setup(
@@ -36,6 +40,7 @@ def setup(
     input_data: str,
     debug: Optional[bool],
     size: JobSize = JobSize.S,
+    detach: bool = False,
 ) -> None:
     """
     This function executes the setup of the model and creates the outputs, handled by Giza.
@@ -63,39 +68,46 @@ def setup(
             TextColumn("[progress.description]{task.description}"),
             transient=True,
         ) as progress:
+            echo.debug(f"Reading model from path: {model_path}")
             model_task = progress.add_task(
                 description="Retrieving Model...", total=None
             )
-            echo.debug(f"Reading model from path: {model_path}")
-            models_client = ModelsClient(API_HOST)
-            if model_id is None:
-                model = models_client.get_by_name(model_name)
-                if model is not None:
-                    echo("Model already exists, using existing model ✅ ")
+            with metrics.phase("model_lookup"):
+                models_client = ModelsClient(API_HOST)
+                if model_id is None:
+                    model = models_client.get_by_name(model_name)
+                    if model is not None:
+                        echo("Model already exists, using existing model ✅ ")
+                    else:
+                        model_create = ModelCreate(
+                            name=model_name, description=model_desc
+                        )
+                        model = models_client.create(model_create)
+                        echo(f"Model Created with id -> {model.id}! ✅")
                 else:
-                    model_create = ModelCreate(name=model_name, description=model_desc)
-                    model = models_client.create(model_create)
-                    echo(f"Model Created with id -> {model.id}! ✅")
-            else:
-                model = models_client.get(model_id)
-                echo(f"Model found with id -> {model.id}! ✅")
+                    model = models_client.get(model_id)
+                    echo(f"Model found with id -> {model.id}! ✅")
             progress.update(model_task, completed=True, visible=False)
             version_task = progress.add_task(
                 description="Creating Version...", total=None
             )
-            client = VersionsClient(API_HOST)
-            version_create = VersionCreate(
-                description=desc if desc else "Intial version",
-                size=Path(model_path).stat().st_size,
-                framework=Framework.EZKL,
-            )
-            version, upload_url = client.create(
-                model.id, version_create, model_path.split("/")[-1]
-            )
+            with metrics.phase("version_create"):
+                client = VersionsClient(API_HOST)
+                version_create = VersionCreate(
+                    description=desc if desc else "Intial version",
+                    size=Path(model_path).stat().st_size,
+                    framework=Framework.EZKL,
+                )
+                version, upload_url = client.create(
+                    model.id, version_create, model_path.split("/")[-1]
+                )
             progress.update(version_task, completed=True, visible=False)
             echo("Sending model for setup ✅ ")
-            with open(model_path, "rb") as f:
+            with metrics.phase("upload"), open(model_path, "rb") as f:
                 client._upload(upload_url, f)
+                metrics.inc(
+                    "giza_phase_bytes_total", version_create.size, phase="upload"
+                )
                 echo.debug("Model Uploaded! ✅")
 
             client.update(
@@ -103,34 +115,45 @@ def setup(
             )
         echo(f"Using model with id -> {model.id} and version -> {version.version} ✅")
         jobs_client = VersionJobsClient(API_HOST)
-        with open(input_data) as casm:
-            job: Job = jobs_client.create(
-                model.id,
-                version.version,
-                JobCreate(size=size, framework=Framework.EZKL),
-                casm,
-            )
+        with metrics.phase("job_create"):
+            with open(input_data) as casm:
+                job: Job = jobs_client.create(
+                    model.id,
+                    version.version,
+                    JobCreate(size=size, framework=Framework.EZKL),
+                    casm,
+                )
         echo(f"Setup job created with name '{job.job_name}' and id -> {job.id} ✅")
+        if detach:
+            echo(
+                f"Detached, wait for it with `giza jobs wait --job-id {job.id} "
+                f"--model-id {model.id} --version-id {version.version}` ⏏️"
+            )
+            return
         with Live() as live:
-            while True:
-                current_job: Job = jobs_client.get(model.id, version.version, job.id)
-                if current_job.status == JobStatus.COMPLETED:
-                    live.update(echo.format_message("Setup job is successful ✅"))
-                    break
-                elif current_job.status == JobStatus.FAILED:
-                    live.update(
-                        echo.format_error(
-                            f"Setup Job with name '{current_job.job_name}' and id {current_job.id} failed"
+            with metrics.phase("job_wait"):
+                while True:
+                    with metrics.poll("job_wait"):
+                        current_job: Job = jobs_client.get(
+                            model.id, version.version, job.id
                         )
-                    )
-                    sys.exit(1)
-                else:
-                    live.update(
-                        echo.format_message(
-                            f"Job status is '{current_job.status}', elapsed {current_job.elapsed_time}s"
+                    if current_job.status == JobStatus.COMPLETED:
+                        live.update(echo.format_message("Setup job is successful ✅"))
+                        break
+                    elif current_job.status == JobStatus.FAILED:
+                        live.update(
+                            echo.format_error(
+                                f"Setup Job with name '{current_job.job_name}' and id {current_job.id} failed"
+                            )
                         )
-                    )
-                    time.sleep(20)
+                        sys.exit(1)
+                    else:
+                        live.update(
+                            echo.format_message(
+                                f"Job status is '{current_job.status}', elapsed {current_job.elapsed_time}s"
+                            )
+                        )
+                        time.sleep(20)
     except ValidationError as e:
         echo.error("Job validation error")
         echo.error("Review the provided information")
@@ -156,45 +179,34 @@ def setup(
         sys.exit(1)
 
 
-def prove(
-    model_id: Optional[int],
-    version_id: Optional[int],
-    input_data: str,
-    output_path: str,
-    debug: Optional[bool],
-    size: JobSize = JobSize.S,
-) -> None:
-    echo = Echo(debug=debug)
-    if model_id is None or version_id is None or input_data is None:
-        echo.error("model_id, version_id, and input_data are all required")
-        sys.exit(1)
-    try:
-        client = JobsClient(API_HOST)
-        with open(input_data) as data:
-            job: Job = client.create(
-                JobCreate(
-                    size=size,
-                    framework=Framework.EZKL,
-                    kind=JobKind.PROOF,
-                    model_id=model_id,
-                    version_id=version_id,
-                ),
-                data,
-            )
-        echo(f"Proving job created with name '{job.job_name}' and id -> {job.id} ✅")
-        with Live() as live:
+def wait_for_job(client: JobsClient, job_id: int, echo: Echo) -> Job:
+    """
+    Poll an EZKL proving job until it finishes.
+
+    Args:
+        client (JobsClient): client to retrieve the job
+        job_id (int): job to wait for
+        echo (Echo): echo of the command
+
+    Returns:
+        Job: the job, COMPLETED or FAILED
+    """
+    client.warn_token_expiry()
+    with Live() as live:
+        with metrics.phase("job_wait"):
             while True:
-                current_job: Job = client.get(job.id)
+                with metrics.poll("job_wait"):
+                    current_job: Job = client.get(job_id)
                 if current_job.status == JobStatus.COMPLETED:
                     live.update(echo.format_message("Proving job is successful ✅"))
-                    break
+                    return current_job
                 elif current_job.status == JobStatus.FAILED:
                     live.update(
                         echo.format_error(
                             f"Proving Job with name '{current_job.job_name}' and id {current_job.id} failed"
                         )
                     )
-                    sys.exit(1)
+                    return current_job
                 else:
                     live.update(
                         echo.format_message(
@@ -202,14 +214,95 @@ def prove(
                         )
                     )
                     time.sleep(20)
-        with open(output_path, "wb") as f:
-            proof_client = ProofsClient(API_HOST)
-            proof: Proof = proof_client.get_by_job_id(current_job.id)
-            echo(f"Proof created with id -> {proof.id} ✅")
-            echo("Proof metrics:")
-            echo.print_model(proof)
-            f.write(proof_client.download(proof.id))
-            echo(f"Proof saved at: {output_path}")
+
+
+def download_proof(
+    job_id: int,
+    output_path: str,
+    echo: Echo,
+    proof_client: Optional[ProofsClient] = None,
+) -> Proof:
+    """
+    Download the proof generated by an EZKL proving job.
+
+    Args:
+        job_id (int): completed proving job
+        output_path (str): path to save the proof at
+        echo (Echo): echo of the command
+        proof_client (Optional[ProofsClient]): client of the proofs, a new one by default
+
+    Returns:
+        Proof: the downloaded proof
+    """
+    with metrics.phase("proof_download"):
+        proof_client = proof_client or ProofsClient(API_HOST)
+        proof: Proof = proof_client.get_by_job_id(job_id)
+        echo(f"Proof created with id -> {proof.id} ✅")
+        echo("Proof metrics:")
+        echo.print_model(proof)
+        with proof_client.download(proof.id, stream=True) as content, open(  # type: ignore
+            output_path, "wb"
+        ) as f:
+            metrics.inc(
+                "giza_phase_bytes_total",
+                content_size(content),
+                phase="proof_download",
+            )
+            shutil.copyfileobj(content, f)
+        echo(f"Proof saved at: {output_path}")
+    return proof
+
+
+def prove(
+    model_id: Optional[int],
+    version_id: Optional[int],
+    input_data: str,
+    output_path: str,
+    debug: Optional[bool],
+    size: JobSize = JobSize.S,
+    detach: bool = False,
+) -> None:
+    echo = Echo(debug=debug)
+    if model_id is None or version_id is None or input_data is None:
+        echo.error("model_id, version_id, and input_data are all required")
+        sys.exit(1)
+    try:
+        client = JobsClient(API_HOST)
+        with metrics.phase("job_create"):
+            with open(input_data) as data:
+                job: Job = client.create(
+                    JobCreate(
+                        size=size,
+                        framework=Framework.EZKL,
+                        kind=JobKind.PROOF,
+                        model_id=model_id,
+                        version_id=version_id,
+                    ),
+                    data,
+                )
+        echo(f"Proving job created with name '{job.job_name}' and id -> {job.id} ✅")
+        run = Run.start(
+            "prove",
+            Framework.EZKL,
+            stage=SUBMITTED,
+            model_id=model_id,
+            version_id=version_id,
+            job_id=job.id,
+            output_path=output_path,
+        )
+        if detach:
+            echo(
+                f"Detached, wait for it with `giza jobs wait --job-id {job.id}` "
+                f"and get the proof with `giza jobs download --job-id {job.id}` ⏏️"
+            )
+            return
+        current_job = wait_for_job(client, job.id, echo)
+        if current_job.status == JobStatus.FAILED:
+            run.finish()
+            sys.exit(1)
+        run.update(stage=COMPLETED)
+        download_proof(current_job.id, output_path, echo)
+        run.finish()
     except ValidationError as e:
         echo.error("Job validation error")
         echo.error("Review the provided information")
@@ -242,6 +335,7 @@ def verify(
     proof: Optional[str] = None,
     debug: Optional[bool] = False,
     size: JobSize = JobSize.S,
+    detach: bool = False,
 ):
     """
     Create a verification job.
@@ -258,20 +352,8 @@ def verify(
     try:
         job: Job
         client = JobsClient(API_HOST)
-        if proof_id:
-            job = client.create(
-                JobCreate(
-                    size=size,
-                    framework=Framework.EZKL,
-                    kind=JobKind.VERIFY,
-                    model_id=model_id,
-                    version_id=version_id,
-                    proof_id=proof_id,
-                ),
-                None,
-            )
-        elif proof:
-            with open(proof) as data:
+        with metrics.phase("job_create"):
+            if proof_id:
                 job = client.create(
                     JobCreate(
                         size=size,
@@ -279,34 +361,56 @@ def verify(
                         kind=JobKind.VERIFY,
                         model_id=model_id,
                         version_id=version_id,
+                        proof_id=proof_id,
                     ),
-                    data,
+                    None,
                 )
+            elif proof:
+                with open(proof) as data:
+                    job = client.create(
+                        JobCreate(
+                            size=size,
+                            framework=Framework.EZKL,
+                            kind=JobKind.VERIFY,
+                            model_id=model_id,
+                            version_id=version_id,
+                        ),
+                        data,
+                    )
         echo(
             f"Verification job created with name '{job.job_name}' and id -> {job.id} ✅"
         )
+        if detach:
+            echo(
+                f"Detached, wait for it with `giza jobs wait --job-id {job.id} --kind VERIFY` ⏏️"
+            )
+            return
         with Live() as live:
-            while True:
-                current_job: Job = client.get(job.id, params={"kind": JobKind.VERIFY})
-                if current_job.status == JobStatus.COMPLETED:
-                    live.update(
-                        echo.format_message("Verification job is successful ✅")
-                    )
-                    break
-                elif current_job.status == JobStatus.FAILED:
-                    live.update(
-                        echo.format_error(
-                            f"Verification Job with name '{current_job.job_name}' and id {current_job.id} failed"
+            with metrics.phase("job_wait"):
+                while True:
+                    with metrics.poll("job_wait"):
+                        current_job: Job = client.get(
+                            job.id, params={"kind": JobKind.VERIFY}
                         )
-                    )
-                    sys.exit(1)
-                else:
-                    live.update(
-                        echo.format_message(
-                            f"Job status is '{current_job.status}', elapsed {current_job.elapsed_time}s"
+                    if current_job.status == JobStatus.COMPLETED:
+                        live.update(
+                            echo.format_message("Verification job is successful ✅")
                         )
-                    )
-                    time.sleep(20)
+                        break
+                    elif current_job.status == JobStatus.FAILED:
+                        live.update(
+                            echo.format_error(
+                                f"Verification Job with name '{current_job.job_name}' and id {current_job.id} failed"
+                            )
+                        )
+                        sys.exit(1)
+                    else:
+                        live.update(
+                            echo.format_message(
+                                f"Job status is '{current_job.status}', elapsed {current_job.elapsed_time}s"
+                            )
+                        )
+                        time.sleep(20)
     except ValidationError as e:
         echo.error("Job validation error")
         echo.error("Review the provided information")
@@ -370,18 +474,19 @@ def deploy(
 
         spinner = Spinner(name="aesthetic", text="Creating endpoint!")
 
-        with Live(renderable=spinner):
-            endpoint = client.create(
-                model_id,
-                version_id,
-                EndpointCreate(
-                    size=size,
-                    model_id=model_id,
-                    version_id=version_id,
-                    framework=Framework.EZKL,
-                ),
-                None,
-            )
+        with metrics.phase("endpoint_create"):
+            with Live(renderable=spinner):
+                endpoint = client.create(
+                    model_id,
+                    version_id,
+                    EndpointCreate(
+                        size=size,
+                        model_id=model_id,
+                        version_id=version_id,
+                        framework=Framework.EZKL,
+                    ),
+                    None,
+                )
     except ValidationError as e:
         echo.error("Endpoint validation error")
         echo.error("Review the provided information")
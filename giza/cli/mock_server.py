@@ -0,0 +1,837 @@
+import base64
+import datetime
+import hashlib
+import io
+import json
+import random
+import re
+import threading
+import time
+import uuid
+import zipfile
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import typer
+from jose import jwt
+
+from giza.cli.utils import REQUEST_ID_HEADER, echo
+from giza.cli.utils.enums import JobKind, JobStatus, VersionStatus
+
+API_PREFIX = "/api/v1"
+PRESIGNED_PREFIX = "/presigned/"
+# Deployed endpoints are served outside the API, at their `uri`
+SERVED_ROUTE = re.compile(r"^/endpoints/(?P<endpoint_id>\d+)/cairo_run$")
+MODEL_URL_HEADER = "X-MODEL-URL"
+TOKEN_LIFETIME = 3600
+
+Body = Any
+Result = Tuple[int, Body, Dict[str, str]]
+
+
+@dataclass
+class MockConfig:
+    """
+    Behaviour of the mock API.
+
+    Args:
+        latency (float): seconds added to every response
+        jitter (float): max random seconds added on top of the latency
+        job_duration (float): seconds that jobs and transpilations take to finish
+        payload_size (int): size in bytes of the generated proofs, models and sierra files
+        error_rate (float): probability of answering any request with `error_status`
+        error_status (int): status code of the injected errors, 429 answers include a `Retry-After`
+        failure_rate (float): probability of a job or transpilation to end as `FAILED`
+        seed (Optional[int]): seed of the random generator for reproducible runs
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    job_duration: float = 1.0
+    payload_size: int = 1024
+    error_rate: float = 0.0
+    error_status: int = 500
+    failure_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+def _now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+
+class MockState:
+    """
+    In memory storage of the mock API, shared by all the request handlers.
+    """
+
+    def __init__(self, config: MockConfig) -> None:
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.lock = threading.Lock()
+        self.models: Dict[int, Dict] = {}
+        self.versions: Dict[Tuple[int, int], Dict] = {}
+        self.jobs: Dict[int, Dict] = {}
+        self.proofs: Dict[int, Dict] = {}
+        self.endpoints: Dict[int, Dict] = {}
+        self.agents: Dict[int, Dict] = {}
+        self.workspace: Optional[Dict] = None
+        self.objects: Dict[str, bytes] = {}
+        self.requests: Dict[str, int] = {}
+        self._ids: Dict[str, int] = {}
+
+    def next_id(self, kind: str) -> int:
+        self._ids[kind] = self._ids.get(kind, 0) + 1
+        return self._ids[kind]
+
+    def payload(self) -> bytes:
+        return self.random.randbytes(self.config.payload_size)
+
+    def finished(self, started_at: float) -> bool:
+        return time.monotonic() - started_at >= self.config.job_duration
+
+    def fails(self) -> bool:
+        return self.random.random() < self.config.failure_rate
+
+
+def mock_token(username: str = "mock") -> str:
+    """
+    Build a token accepted by the clients, valid for `TOKEN_LIFETIME` seconds.
+
+    Args:
+        username (str): subject of the token
+
+    Returns:
+        str: the encoded token
+    """
+    return jwt.encode(
+        {"sub": username, "exp": int(time.time()) + TOKEN_LIFETIME},
+        "mock",
+        algorithm="HS256",
+    )
+
+
+def _public(entity: Dict) -> Dict:
+    return {k: v for k, v in entity.items() if not k.startswith("_")}
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    """
+    Request handler implementing the endpoints used by the API clients.
+    """
+
+    server: "MockApiServer"
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, avoid the delayed ACK stall on keep-alive connections
+    disable_nagle_algorithm = True
+    routes: List[Tuple[str, Pattern, str]] = []
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    @property
+    def state(self) -> MockState:
+        return self.server.state
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_PATCH(self) -> None:
+        self._dispatch("PATCH")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        parsed = urlparse(self.path)
+        self.query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(length) if length else b""
+
+        config = self.state.config
+        delay = config.latency + (
+            config.jitter and self.state.random.uniform(0, config.jitter)
+        )
+        if delay:
+            time.sleep(delay)
+
+        result: Result
+        handler, params = self._route(method, parsed.path)
+        with self.state.lock:
+            self.state.requests[handler or "not_found"] = (
+                self.state.requests.get(handler or "not_found", 0) + 1
+            )
+            injected = self.state.random.random() < config.error_rate
+        if handler is None:
+            result = (404, {"detail": "Not Found"}, {})
+        elif injected:
+            headers = {"Retry-After": "1"} if config.error_status == 429 else {}
+            result = (config.error_status, {"detail": "Injected error"}, headers)
+        else:
+            try:
+                with self.state.lock:
+                    result = getattr(self, handler)(**params)
+            except KeyError:
+                result = (404, {"detail": "Not Found"}, {})
+        self._send(*result)
+
+    def _route(self, method: str, path: str) -> Tuple[Optional[str], Dict[str, Any]]:
+        if path.startswith(PRESIGNED_PREFIX):
+            return f"presigned_{method.lower()}", {"key": path[len(PRESIGNED_PREFIX) :]}
+        served = SERVED_ROUTE.match(path)
+        if served and method == "POST":
+            return "predict", {"endpoint_id": int(served["endpoint_id"])}
+        if not path.startswith(API_PREFIX):
+            return None, {}
+        path = path[len(API_PREFIX) :].rstrip("/") or "/"
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(path)
+            if route_method == method and match:
+                return handler, {
+                    k: int(v) if v.isdigit() else v
+                    for k, v in match.groupdict().items()
+                }
+        return None, {}
+
+    def _send(self, status: int, body: Body, headers: Dict[str, str]) -> None:
+        if isinstance(body, bytes):
+            content = body
+            content_type = "application/octet-stream"
+        else:
+            content = json.dumps(body).encode()
+            content_type = "application/json"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header(REQUEST_ID_HEADER, uuid.uuid4().hex)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _json(self) -> Dict:
+        return json.loads(self.body) if self.body else {}
+
+    def _presigned_url(self, key: str) -> str:
+        return f"{self.server.url}{PRESIGNED_PREFIX}{key}"
+
+    # Presigned urls
+
+    def presigned_get(self, key: str) -> Result:
+        content = self.state.objects[key]
+        headers = {"ETag": f'"{hashlib.md5(content).hexdigest()}"'}
+        if self.headers.get("x-amz-checksum-mode") == "ENABLED":
+            headers["x-amz-checksum-sha256"] = base64.b64encode(
+                hashlib.sha256(content).digest()
+            ).decode()
+        match = re.match(r"bytes=(\d+)-$", self.headers.get("Range") or "")
+        if match and int(match[1]) >= len(content):
+            return 416, b"", {"Content-Range": f"bytes */{len(content)}"}
+        if match:
+            start = int(match[1])
+            headers["Content-Range"] = (
+                f"bytes {start}-{len(content) - 1}/{len(content)}"
+            )
+            return 206, content[start:], headers
+        return 200, content, headers
+
+    def presigned_put(self, key: str) -> Result:
+        self.state.objects[key] = self.body
+        return 200, b"", {}
+
+    # Users
+
+    def login(self) -> Result:
+        form = {k: v[-1] for k, v in parse_qs(self.body.decode()).items()}
+        token = mock_token(form.get("username", "mock"))
+        return 200, {"access_token": token, "token_type": "bearer"}, {}
+
+    def create_user(self) -> Result:
+        body = self._json()
+        return (
+            201,
+            {"username": body["username"], "email": body["email"], "is_active": False},
+            {},
+        )
+
+    def me(self) -> Result:
+        return (
+            200,
+            {"username": "mock", "email": "mock@gizatech.xyz", "is_active": True},
+            {},
+        )
+
+    def create_api_key(self) -> Result:
+        return 201, {"id": uuid.uuid4().hex}, {}
+
+    def message(self) -> Result:
+        return 200, {"msg": "Done"}, {}
+
+    # Models
+
+    def list_models(self) -> Result:
+        models = list(self.state.models.values())
+        if "name" in self.query:
+            models = [m for m in models if m["name"] == self.query["name"]]
+            if not models:
+                return 404, {"detail": "Model not found"}, {}
+        return 200, models, {}
+
+    def create_model(self) -> Result:
+        body = self._json()
+        model_id = self.state.next_id("models")
+        model = {
+            "id": model_id,
+            "name": body["name"],
+            "description": body.get("description"),
+        }
+        self.state.models[model_id] = model
+        return 201, model, {}
+
+    def get_model(self, model_id: int) -> Result:
+        return 200, self.state.models[model_id], {}
+
+    def update_model(self, model_id: int) -> Result:
+        self.state.models[model_id].update(self._json())
+        return 200, self.state.models[model_id], {}
+
+    # Versions
+
+    def _version(self, model_id: int, version_id: int) -> Dict:
+        version = self.state.versions[(model_id, version_id)]
+        started_at = version.get("_started_at")
+        if (
+            version["status"] in (VersionStatus.UPLOADED, VersionStatus.PROCESSING)
+            and started_at
+        ):
+            if not self.state.finished(started_at):
+                version["status"] = VersionStatus.PROCESSING
+            elif version["_fails"]:
+                version["status"] = VersionStatus.FAILED
+                version["message"] = "Injected failure"
+            else:
+                version["status"] = VersionStatus.COMPLETED
+                self._store_transpilation(model_id, version_id)
+            version["last_update"] = _now()
+        return version
+
+    def _store_transpilation(self, model_id: int, version_id: int) -> None:
+        content = io.BytesIO()
+        with zipfile.ZipFile(content, "w") as zip_file:
+            zip_file.writestr("src/payload.bin", self.state.payload())
+        prefix = f"models/{model_id}/versions/{version_id}"
+        self.state.objects[f"{prefix}/model.zip"] = content.getvalue()
+        self.state.objects[f"{prefix}/inference.sierra.json"] = self.state.payload()
+
+    def list_versions(self, model_id: int) -> Result:
+        versions = [
+            _public(self._version(m, v))
+            for (m, v) in self.state.versions
+            if m == model_id
+        ]
+        return 200, versions, {}
+
+    def create_version(self, model_id: int) -> Result:
+        self.state.models[model_id]
+        body = self._json()
+        version_id = len([m for (m, _) in self.state.versions if m == model_id]) + 1
+        version = {
+            "version": version_id,
+            "size": body["size"],
+            "status": VersionStatus.STARTING,
+            "message": None,
+            "description": body.get("description"),
+            "created_date": _now(),
+            "last_update": _now(),
+            "framework": body["framework"],
+            "_fails": self.state.fails(),
+        }
+        self.state.versions[(model_id, version_id)] = version
+        filename = self.query.get("filename", "model")
+        upload_url = self._presigned_url(
+            f"models/{model_id}/versions/{version_id}/{filename}"
+        )
+        version["_original"] = upload_url
+        return 201, _public(version), {MODEL_URL_HEADER: upload_url}
+
+    def get_version(self, model_id: int, version_id: int) -> Result:
+        return 200, _public(self._version(model_id, version_id)), {}
+
+    def update_version(self, model_id: int, version_id: int) -> Result:
+        version = self._version(model_id, version_id)
+        update = {k: v for k, v in self._json().items() if v is not None}
+        version.update(update)
+        if update.get("status") == VersionStatus.UPLOADED:
+            version["_started_at"] = time.monotonic()
+        version["last_update"] = _now()
+        return 200, _public(version), {}
+
+    def _logs(self, status: str, finished: Tuple[str, ...]) -> Result:
+        # Only appended to, so they can be read by offset
+        logs = "Mock logs, started\n"
+        if status in finished:
+            logs += f"Mock logs, finished with status {status}\n"
+        if "offset" not in self.query:
+            return 200, {"logs": logs}, {}
+        offset = int(self.query["offset"])
+        return 200, {"logs": logs[offset:], "next_offset": len(logs)}, {}
+
+    def version_logs(self, model_id: int, version_id: int) -> Result:
+        version = self._version(model_id, version_id)
+        return self._logs(
+            version["status"],
+            (
+                VersionStatus.COMPLETED,
+                VersionStatus.PARTIALLY_SUPPORTED,
+                VersionStatus.FAILED,
+            ),
+        )
+
+    def download_version(self, model_id: int, version_id: int) -> Result:
+        self._version(model_id, version_id)
+        prefix = f"models/{model_id}/versions/{version_id}"
+        urls = {}
+        if f"{prefix}/model.zip" in self.state.objects:
+            urls["download_url"] = self._presigned_url(f"{prefix}/model.zip")
+            urls["sierra_url"] = self._presigned_url(f"{prefix}/inference.sierra.json")
+        return 200, urls, {}
+
+    def download_original(self, model_id: int, version_id: int) -> Result:
+        return (
+            200,
+            {"download_url": self._version(model_id, version_id)["_original"]},
+            {},
+        )
+
+    def cairo_url(self, model_id: int, version_id: int) -> Result:
+        self._version(model_id, version_id)
+        key = f"models/{model_id}/versions/{version_id}/model.zip"
+        return 200, {"upload_url": self._presigned_url(key)}, {}
+
+    def transpilation_upload_url(self, model_id: int, version_id: int) -> Result:
+        self._version(model_id, version_id)
+        key = f"models/{model_id}/versions/{version_id}/transpilation.zip"
+        return 200, {"upload_url": self._presigned_url(key)}, {}
+
+    def update_transpilation(self, model_id: int, version_id: int) -> Result:
+        return 200, _public(self._version(model_id, version_id)), {}
+
+    # Jobs and proofs
+
+    def _job(self, job_id: int) -> Dict:
+        job = self.state.jobs[job_id]
+        if job["status"] in (JobStatus.STARTING, JobStatus.PROCESSING):
+            started_at = job["_started_at"]
+            job["elapsed_time"] = round(time.monotonic() - started_at, 2)
+            if not self.state.finished(started_at):
+                job["status"] = JobStatus.PROCESSING
+            elif job["_fails"]:
+                job["status"] = JobStatus.FAILED
+            else:
+                job["status"] = JobStatus.COMPLETED
+                if job["_kind"] != JobKind.VERIFY:
+                    self._create_proof(
+                        job_id, job.get("_endpoint_id"), job["request_id"]
+                    )
+            job["last_update"] = _now()
+        return job
+
+    def _create_proof(
+        self, job_id: int, endpoint_id: Optional[int], request_id: str
+    ) -> Dict:
+        proof_id = self.state.next_id("proofs")
+        proof = {
+            "id": proof_id,
+            "job_id": job_id,
+            "proving_time": self.state.config.job_duration,
+            "cairo_execution_time": 0.1,
+            "metrics": {},
+            "created_date": _now(),
+            "request_id": request_id,
+            "_endpoint_id": endpoint_id,
+        }
+        self.state.proofs[proof_id] = proof
+        self.state.objects[f"proofs/{proof_id}"] = self.state.payload()
+        return proof
+
+    def _new_job(self, size: str, kind: str, endpoint_id: Optional[int] = None) -> Dict:
+        job_id = self.state.next_id("jobs")
+        job = {
+            "id": job_id,
+            "job_name": f"mock-job-{job_id}",
+            "size": size,
+            "status": JobStatus.STARTING,
+            "elapsed_time": 0.0,
+            "created_date": _now(),
+            "last_update": _now(),
+            "request_id": uuid.uuid4().hex,
+            "_kind": kind,
+            "_started_at": time.monotonic(),
+            "_fails": self.state.fails(),
+            "_endpoint_id": endpoint_id,
+        }
+        self.state.jobs[job_id] = job
+        return job
+
+    def create_job(self) -> Result:
+        job = self._new_job(
+            self.query.get("size", "S"), self.query.get("kind", JobKind.PROOF)
+        )
+        return 201, _public(job), {}
+
+    def create_version_job(self, model_id: int, version_id: int) -> Result:
+        self._version(model_id, version_id)
+        job = self._new_job(self.query.get("size", "S"), "SETUP")
+        job["_version"] = (model_id, version_id)
+        return 201, _public(job), {}
+
+    def list_jobs(self) -> Result:
+        return 200, [_public(self._job(job_id)) for job_id in self.state.jobs], {}
+
+    def list_version_jobs(self, model_id: int, version_id: int) -> Result:
+        jobs = [
+            _public(self._job(job_id))
+            for job_id, job in self.state.jobs.items()
+            if job.get("_version") == (model_id, version_id)
+        ]
+        return 200, jobs, {}
+
+    def get_job(self, job_id: int, **_: Any) -> Result:
+        return 200, _public(self._job(job_id)), {}
+
+    def job_logs(self, job_id: int) -> Result:
+        job = self._job(job_id)
+        return self._logs(job["status"], (JobStatus.COMPLETED, JobStatus.FAILED))
+
+    def _proof(self, proof_id: Any, endpoint_id: Optional[int] = None) -> Dict:
+        for proof in self.state.proofs.values():
+            if proof_id in (proof["id"], proof["request_id"]) and (
+                endpoint_id is None or proof["_endpoint_id"] == endpoint_id
+            ):
+                return proof
+        raise KeyError(proof_id)
+
+    def list_proofs(self) -> Result:
+        for job_id in list(self.state.jobs):
+            self._job(job_id)
+        proofs = list(self.state.proofs.values())
+        if "job_id" in self.query:
+            proofs = [p for p in proofs if str(p["job_id"]) == self.query["job_id"]]
+        return 200, [_public(p) for p in proofs], {}
+
+    def get_proof(self, proof_id: Any, endpoint_id: Optional[int] = None) -> Result:
+        return 200, _public(self._proof(proof_id, endpoint_id)), {}
+
+    def download_proof(
+        self, proof_id: Any, endpoint_id: Optional[int] = None
+    ) -> Result:
+        proof = self._proof(proof_id, endpoint_id)
+        return 200, {"download_url": self._presigned_url(f"proofs/{proof['id']}")}, {}
+
+    def verify_proof(self, proof_id: Any, endpoint_id: Optional[int] = None) -> Result:
+        self._proof(proof_id, endpoint_id)
+        return 200, {"verification": True, "verification_time": 0.1}, {}
+
+    # Endpoints
+
+    def create_endpoint(self) -> Result:
+        endpoint_id = self.state.next_id("endpoints")
+        endpoint = {
+            "id": endpoint_id,
+            "status": "COMPLETED",
+            "uri": f"{self.server.url}/endpoints/{endpoint_id}",
+            "size": self.query.get("size", "S"),
+            "service_name": f"mock-endpoint-{endpoint_id}",
+            "model_id": int(self.query["model_id"]),
+            "version_id": int(self.query["version_id"]),
+            "is_active": True,
+        }
+        self.state.endpoints[endpoint_id] = endpoint
+        return 201, endpoint, {}
+
+    def list_endpoints(self) -> Result:
+        endpoints = list(self.state.endpoints.values())
+        for key in ("model_id", "version_id"):
+            if key in self.query:
+                endpoints = [e for e in endpoints if str(e[key]) == self.query[key]]
+        if "is_active" in self.query:
+            active = self.query["is_active"].lower() == "true"
+            endpoints = [e for e in endpoints if e["is_active"] == active]
+        return 200, endpoints, {}
+
+    def get_endpoint(self, endpoint_id: int) -> Result:
+        return 200, self.state.endpoints[endpoint_id], {}
+
+    def delete_endpoint(self, endpoint_id: int) -> Result:
+        self.state.endpoints[endpoint_id]["is_active"] = False
+        return 204, b"", {}
+
+    def endpoint_logs(self, endpoint_id: int) -> Result:
+        self.state.endpoints[endpoint_id]
+        return self._logs("", ())
+
+    def endpoint_jobs(self, endpoint_id: int) -> Result:
+        jobs = [
+            _public(self._job(job_id))
+            for job_id, job in self.state.jobs.items()
+            if job["_endpoint_id"] == endpoint_id
+        ]
+        return 200, jobs, {}
+
+    def predict(self, endpoint_id: int) -> Result:
+        if not self.state.endpoints[endpoint_id]["is_active"]:
+            return 404, {"detail": "Endpoint is not active"}, {}
+        body = self._json()
+
+        def _run(args: Any) -> Dict:
+            if body.get("dry_run"):
+                return {"result": args, "request_id": uuid.uuid4().hex}
+            # Each prediction is proven by a job of the endpoint
+            job = self._new_job(body.get("job_size", "S"), JobKind.PROOF, endpoint_id)
+            return {"result": args, "request_id": job["request_id"]}
+
+        if "batch" in body:
+            return 200, {"results": [_run(args) for args in body["batch"]]}, {}
+        return 200, _run(body.get("args")), {}
+
+    def endpoint_proofs(self, endpoint_id: int) -> Result:
+        for job_id, job in list(self.state.jobs.items()):
+            if job["_endpoint_id"] == endpoint_id:
+                self._job(job_id)
+        proofs = [
+            _public(p)
+            for p in self.state.proofs.values()
+            if p["_endpoint_id"] == endpoint_id
+        ]
+        return 200, proofs, {}
+
+    # Agents
+
+    def create_agent(self) -> Result:
+        agent_id = self.state.next_id("agents")
+        agent = {
+            **self._json(),
+            "id": agent_id,
+            "created_date": _now(),
+            "last_update": _now(),
+        }
+        self.state.agents[agent_id] = agent
+        return 201, agent, {}
+
+    def list_agents(self) -> Result:
+        return 200, list(self.state.agents.values()), {}
+
+    def get_agent(self, agent_id: int) -> Result:
+        return 200, self.state.agents[agent_id], {}
+
+    def update_agent(self, agent_id: int) -> Result:
+        agent = self.state.agents[agent_id]
+        agent.update(self._json())
+        agent["last_update"] = _now()
+        return 200, agent, {}
+
+    def delete_agent(self, agent_id: int) -> Result:
+        del self.state.agents[agent_id]
+        return 204, b"", {}
+
+    # Workspaces
+
+    def get_workspace(self) -> Result:
+        if self.state.workspace is None:
+            return 404, {"detail": "Workspace not found"}, {}
+        return 200, self.state.workspace, {}
+
+    def create_workspace(self) -> Result:
+        if self.state.workspace is not None:
+            return 400, {"detail": "Workspace already exists"}, {}
+        self.state.workspace = {
+            "url": f"{self.server.url}/workspace",
+            "status": "COMPLETED",
+        }
+        return 201, self.state.workspace, {}
+
+    def delete_workspace(self) -> Result:
+        if self.state.workspace is None:
+            return 404, {"detail": "Workspace not found"}, {}
+        self.state.workspace = None
+        return 204, b"", {}
+
+
+_VERSION = r"/models/(?P<model_id>\d+)/versions/(?P<version_id>\d+)"
+_PROOF = r"(?P<proof_id>[^/:]+)"
+_ENDPOINT = r"/endpoints/(?P<endpoint_id>\d+)"
+
+MockApiHandler.routes = [
+    (method, re.compile(f"^{path}$"), handler)
+    for method, path, handler in [
+        ("POST", r"/login/access-token", "login"),
+        ("POST", r"/users", "create_user"),
+        ("GET", r"/users/me", "me"),
+        ("POST", r"/users/create-api-key", "create_api_key"),
+        ("POST", r"/users/resend-email", "message"),
+        ("POST", r"/users/reset-password-token", "message"),
+        ("POST", r"/users/reset-password", "message"),
+        ("GET", r"/models", "list_models"),
+        ("POST", r"/models", "create_model"),
+        ("GET", r"/models/(?P<model_id>\d+)", "get_model"),
+        ("PUT", r"/models/(?P<model_id>\d+)", "update_model"),
+        ("GET", r"/models/(?P<model_id>\d+)/versions", "list_versions"),
+        ("POST", r"/models/(?P<model_id>\d+)/versions", "create_version"),
+        ("GET", _VERSION, "get_version"),
+        ("PUT", _VERSION, "update_version"),
+        ("GET", f"{_VERSION}/logs", "version_logs"),
+        ("GET", f"{_VERSION}:download", "download_version"),
+        ("GET", f"{_VERSION}:download_original", "download_original"),
+        ("GET", f"{_VERSION}:cairo_url", "cairo_url"),
+        ("GET", f"{_VERSION}/transpilations/upload_url", "transpilation_upload_url"),
+        ("PUT", f"{_VERSION}/transpilations", "update_transpilation"),
+        ("GET", f"{_VERSION}/jobs", "list_version_jobs"),
+        ("POST", f"{_VERSION}/jobs", "create_version_job"),
+        ("GET", f"{_VERSION}/jobs/(?P<job_id>\\d+)", "get_job"),
+        ("GET", r"/jobs", "list_jobs"),
+        ("POST", r"/jobs", "create_job"),
+        ("GET", r"/jobs/(?P<job_id>\d+)", "get_job"),
+        ("GET", r"/jobs/(?P<job_id>\d+)/logs", "job_logs"),
+        ("GET", r"/proofs", "list_proofs"),
+        ("GET", f"/proofs/{_PROOF}", "get_proof"),
+        ("GET", f"/proofs/{_PROOF}:download", "download_proof"),
+        ("POST", f"/proofs/{_PROOF}:verify", "verify_proof"),
+        ("GET", r"/endpoints", "list_endpoints"),
+        ("POST", r"/endpoints", "create_endpoint"),
+        ("GET", _ENDPOINT, "get_endpoint"),
+        ("DELETE", _ENDPOINT, "delete_endpoint"),
+        ("GET", f"{_ENDPOINT}/logs", "endpoint_logs"),
+        ("GET", f"{_ENDPOINT}/jobs", "endpoint_jobs"),
+        ("GET", f"{_ENDPOINT}/proofs", "endpoint_proofs"),
+        ("GET", f"{_ENDPOINT}/proofs/{_PROOF}", "get_proof"),
+        ("GET", f"{_ENDPOINT}/proofs/{_PROOF}:download", "download_proof"),
+        ("POST", f"{_ENDPOINT}/proofs/{_PROOF}:verify", "verify_proof"),
+        ("GET", r"/agents", "list_agents"),
+        ("POST", r"/agents", "create_agent"),
+        ("GET", r"/agents/(?P<agent_id>\d+)", "get_agent"),
+        ("PATCH", r"/agents/(?P<agent_id>\d+)", "update_agent"),
+        ("DELETE", r"/agents/(?P<agent_id>\d+)", "delete_agent"),
+        ("GET", r"/workspaces", "get_workspace"),
+        ("POST", r"/workspaces", "create_workspace"),
+        ("DELETE", r"/workspaces", "delete_workspace"),
+    ]
+]
+
+
+class MockApiServer(ThreadingHTTPServer):
+    """
+    Local stand-in of the Giza API, to measure the clients end to end without network access.
+
+    The server can be used as a context manager, running in a background thread:
+
+        with MockApiServer(config=MockConfig(latency=0.05)) as server:
+            client = ModelsClient(server.url, api_key="mock")
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        config: Optional[MockConfig] = None,
+        verbose: bool = False,
+    ) -> None:
+        super().__init__((host, port), MockApiHandler)
+        self.state = MockState(config or MockConfig())
+        self.verbose = verbose
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockApiServer":
+        """
+        Serve the requests in a background thread.
+        """
+        self._thread = threading.Thread(
+            target=self.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="giza-mock-api",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop the background thread and close the socket.
+        """
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockApiServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+
+app = typer.Typer()
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", help="Host to listen on"),
+    port: int = typer.Option(8000, help="Port to listen on"),
+    latency: float = typer.Option(0.0, help="Seconds added to every response"),
+    jitter: float = typer.Option(0.0, help="Max random seconds added to the latency"),
+    job_duration: float = typer.Option(
+        1.0, help="Seconds that jobs and transpilations take to finish"
+    ),
+    payload_size: int = typer.Option(
+        1024, help="Size in bytes of the generated proofs, models and sierra files"
+    ),
+    error_rate: float = typer.Option(
+        0.0, help="Probability of answering a request with an error"
+    ),
+    error_status: int = typer.Option(500, help="Status code of the injected errors"),
+    failure_rate: float = typer.Option(
+        0.0, help="Probability of a job or transpilation to fail"
+    ),
+    seed: Optional[int] = typer.Option(None, help="Seed for reproducible runs"),
+    verbose: bool = typer.Option(False, help="Log every request"),
+) -> None:
+    """
+    Run a local mock of the Giza API.
+    """
+    config = MockConfig(
+        latency=latency,
+        jitter=jitter,
+        job_duration=job_duration,
+        payload_size=payload_size,
+        error_rate=error_rate,
+        error_status=error_status,
+        failure_rate=failure_rate,
+        seed=seed,
+    )
+    server = MockApiServer(host, port, config, verbose=verbose)
+    echo(f"Mock Giza API listening at {server.url} ✅")
+    echo(
+        f"Point the CLI to it with: GIZA_API_HOST={server.url} GIZA_TOKEN={mock_token()}"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    app()
@@ -2,6 +2,7 @@ import typer
 
 from giza.cli.callbacks import debug_callback
 from giza.cli.utils.enums import Framework
+from giza.cli.utils.log_stream import FOLLOW_INTERVAL
 
 DEBUG_OPTION = typer.Option(
     False,
@@ -46,3 +47,32 @@ JSON_OPTION = typer.Option(
     "-j",
     help="Whether to print the output as JSON. This will make that the only ouput is the json and the logs will be saved to `giza.log`",
 )
+PROFILE_OPTION = typer.Option(
+    False,
+    "--profile",
+    is_flag=True,
+    help="""
+    Profile the command, writing a folded stacks file for flamegraphs and a summary of the import,
+    CPU, network and sleep time.
+
+
+    Disabled by default.""",
+)
+PROFILE_OUTPUT_OPTION = typer.Option(
+    None,
+    "--profile-output",
+    help="Path prefix of the profile files, defaults to `giza-profile-<command>-<timestamp>` in the current directory",
+)
+DETACH_OPTION = typer.Option(
+    False,
+    "--detach",
+    help="Return right after submitting the job, collect it later with `giza jobs wait`",
+)
+FOLLOW_OPTION = typer.Option(
+    False,
+    "--follow",
+    help="Keep printing the new lines of the logs until it finishes, Ctrl-C to stop",
+)
+FOLLOW_INTERVAL_OPTION = typer.Option(
+    FOLLOW_INTERVAL, "--interval", help="Seconds between two fetches of the logs"
+)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, ConfigDict, RootModel
 
@@ -35,3 +35,30 @@ class Endpoint(BaseModel):
 
 class EndpointsList(RootModel):
     root: list[Endpoint]
+
+
+class Prediction(BaseModel):
+    result: Any = None
+    request_id: Optional[str] = None
+
+
+class BenchReport(BaseModel):
+    endpoint_id: int
+    model_id: Optional[int] = None
+    version_id: Optional[int] = None
+    size: ServiceSize
+    concurrency: int
+    rate: Optional[float] = None
+    duration: float
+    requests: int
+    errors: int
+    error_rate: float
+    throughput: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    latency_max_ms: float
+    errors_by_kind: Dict[str, int] = {}
+
+    model_config = ConfigDict(from_attributes=True)
+    model_config["protected_namespaces"] = ()
@@ -1,5 +1,9 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
 class Logs(BaseModel):
     logs: str
+    # Offset to request the next logs from, when the API supports reading them by offset
+    next_offset: Optional[int] = None
@@ -0,0 +1,47 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from giza.cli.utils.enums import JobSize, ServiceSize
+
+
+class ModelSpec(BaseModel):
+    path: str
+    id: Optional[int] = None
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class TranspileSpec(BaseModel):
+    description: Optional[str] = None
+    output_path: str = "cairo_model"
+    download_model: bool = True
+    download_sierra: bool = False
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class DeploySpec(BaseModel):
+    size: ServiceSize = ServiceSize.S
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ProofSpec(BaseModel):
+    trace: str
+    memory: str
+    size: JobSize = JobSize.S
+    output_path: str = "zk.proof"
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class PipelineSpec(BaseModel):
+    model: ModelSpec
+    transpile: TranspileSpec = TranspileSpec()
+    deploy: Optional[DeploySpec] = None
+    proofs: List[ProofSpec] = []
+
+    model_config = ConfigDict(extra="forbid", protected_namespaces=())
@@ -1,3 +1,4 @@
+import datetime
 from typing import Optional
 
 from pydantic import BaseModel
@@ -6,3 +7,10 @@ from pydantic import BaseModel
 class VerifyResponse(BaseModel):
     verification: Optional[bool] = None
     verification_time: Optional[float] = None
+
+
+class VerificationRecord(VerifyResponse):
+    proof_sha256: str
+    verifier_version: str
+    job_id: Optional[int] = None
+    verified_at: Optional[datetime.datetime] = None
@@ -0,0 +1,155 @@
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from giza.cli.utils.metrics import metrics, percentile
+
+# Requests coalesced in a single call and seconds waited for more to arrive
+DEFAULT_MAX_BATCH_SIZE = 16
+DEFAULT_MAX_WAIT = 0.01
+
+_CLOSE = object()
+
+
+class MicroBatcher:
+    """
+    Coalesce the items submitted from any thread within a time window into batches.
+
+    A batch is dispatched when it reaches `max_batch_size` items or `max_wait` seconds after its
+    first item arrived, whatever happens first, so a lone request is only delayed by the window.
+    `dispatch` receives the items of a batch and returns one result per item, in the same order;
+    a result that is an exception is raised to the caller of that item only. Up to `max_workers`
+    batches are in flight at once.
+
+    The size of each batch and the latency of each item are recorded in the
+    `giza_predict_batch_size` and `giza_predict_latency_seconds` histograms.
+
+    `options` records the settings `dispatch` was built with, so the callers sharing the batcher
+    can check they match their own.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        max_workers: int = 4,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.dispatch = dispatch
+        self.options = dict(options or {})
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max(max_wait, 0.0)
+        self.batch_sizes: Counter = Counter()
+        self.latencies: List[float] = []
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(max_workers, 1), thread_name_prefix="giza-batch"
+        )
+        self._collector = threading.Thread(
+            target=self._collect, name="giza-batcher", daemon=True
+        )
+        self._closed = False
+        self._collector.start()
+
+    def __enter__(self) -> "MicroBatcher":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def submit(self, item: Any) -> Future:
+        """
+        Queue an item for the next batch.
+
+        Args:
+            item (Any): item to dispatch
+
+        Raises:
+            RuntimeError: if the batcher is closed
+
+        Returns:
+            Future: the result of the item
+        """
+        if self._closed:
+            raise RuntimeError("The batcher is closed")
+        future: Future = Future()
+        self._queue.put((item, future, time.perf_counter()))
+        return future
+
+    def close(self) -> None:
+        """
+        Dispatch the queued items and wait for every batch to finish.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_CLOSE)
+        self._collector.join()
+        self._executor.shutdown(wait=True)
+
+    def _collect(self) -> None:
+        closing = False
+        while not closing:
+            first = self._queue.get()
+            if first is _CLOSE:
+                break
+            batch = [first]
+            deadline = time.perf_counter() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.perf_counter()
+                try:
+                    entry = (
+                        self._queue.get(timeout=timeout)
+                        if timeout > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if entry is _CLOSE:
+                    closing = True
+                    break
+                batch.append(entry)
+            self._executor.submit(self._run, batch)
+
+    def _run(self, batch: List[Tuple[Any, Future, float]]) -> None:
+        metrics.observe("giza_predict_batch_size", len(batch))
+        try:
+            results = list(self.dispatch([item for item, _, _ in batch]))
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Expected {len(batch)} results for the batch, got {len(results)}"
+                )
+        except Exception as e:
+            results = [e] * len(batch)
+
+        now = time.perf_counter()
+        with self._lock:
+            self.batch_sizes[len(batch)] += 1
+            for _, _, submitted in batch:
+                self.latencies.append(now - submitted)
+        for (_, future, submitted), result in zip(batch, results, strict=True):
+            metrics.observe("giza_predict_latency_seconds", now - submitted)
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def report(self) -> str:
+        """
+        Summary of the batch sizes and the latencies of the dispatched items.
+
+        Returns:
+            str: the number of batches of each size and the p50, p95 and p99 latencies
+        """
+        with self._lock:
+            sizes = sorted(self.batch_sizes.items())
+            latencies = list(self.latencies)
+        batches = ", ".join(f"{size}x{count}" for size, count in sizes)
+        return f"batches (size x count) {batches or 'none'}, latency " + " ".join(
+            f"p{q} {percentile(latencies, q) * 1000:.1f}ms" for q in (50, 95, 99)
+        )
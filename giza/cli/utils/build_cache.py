@@ -0,0 +1,83 @@
+import glob
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+from giza.cli.utils.files import atomic_write_json, file_hash
+
+# Stored in scarb's `target` folder, which is already ignored when zipping a model
+BUILD_CACHE_FILE = os.path.join("target", ".giza-build.json")
+# Folders that do not affect the build
+IGNORED_FOLDERS = {"target", ".git"}
+
+
+def source_hash(folder: str) -> str:
+    """
+    Hash of a scarb project, covering `Scarb.toml` and every source file with its relative path.
+
+    Args:
+        folder (str): root of the scarb project
+
+    Returns:
+        str: hex digest of the project
+    """
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(folder):
+        dirs[:] = sorted(d for d in dirs if d not in IGNORED_FOLDERS)
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            digest.update(os.path.relpath(path, folder).encode())
+            digest.update(file_hash(path).encode())
+    return digest.hexdigest()
+
+
+def load(folder: str) -> Dict[str, Any]:
+    """
+    Load the build cache of a scarb project.
+
+    Args:
+        folder (str): root of the scarb project
+
+    Returns:
+        Dict[str, Any]: cache entries, empty if there is no cache or it can not be read
+    """
+    try:
+        with open(os.path.join(folder, BUILD_CACHE_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def update(folder: str, **entries: Any) -> None:
+    """
+    Add entries to the build cache of a scarb project.
+
+    Args:
+        folder (str): root of the scarb project
+        entries: values to store
+    """
+    cache = load(folder)
+    cache.update(entries)
+    atomic_write_json(os.path.join(folder, BUILD_CACHE_FILE), cache, mode=0o644)
+
+
+def find_sierra(folder: str) -> Optional[str]:
+    """
+    Locate the sierra file produced by the build, remembering it for the next calls.
+
+    Args:
+        folder (str): root of the scarb project
+
+    Returns:
+        Optional[str]: path to the sierra file, None if the project has not been built
+    """
+    cached = load(folder).get("sierra_path")
+    if cached is not None and os.path.exists(os.path.join(folder, cached)):
+        return os.path.join(folder, cached)
+
+    paths = glob.glob(os.path.join(folder, "**/*.sierra.json"), recursive=True)
+    if not paths:
+        return None
+    update(folder, sierra_path=os.path.relpath(paths[0], folder))
+    return paths[0]
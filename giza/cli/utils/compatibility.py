@@ -0,0 +1,245 @@
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional, Tuple
+
+import requests
+
+from giza.cli.utils.files import atomic_write_json, file_lock
+from giza.cli.utils.onnx_graph import DEFAULT_DOMAIN, OnnxModel
+
+# Url of a json document `{"version": str, "operators": [str]}` with the supported operators
+SUPPORTED_OPERATORS_URL_VARIABLE = "GIZA_SUPPORTED_OPERATORS_URL"
+# Seconds before the cached list is refreshed from the url
+SUPPORTED_OPERATORS_TTL = 24 * 60 * 60
+SUPPORTED_OPERATORS_FILE = "supported_operators.json"
+
+# Operators of the default ONNX domain supported by the Cairo transpiler and Orion, see
+# https://cli.gizatech.xyz/frameworks/cairo/transpile#supported-operators
+BUNDLED_VERSION = "2024.05"
+BUNDLED_OPERATORS = frozenset(
+    {
+        "Abs",
+        "Acos",
+        "Acosh",
+        "Add",
+        "And",
+        "ArgMax",
+        "ArgMin",
+        "Asin",
+        "Asinh",
+        "Atan",
+        "Atanh",
+        "BitShift",
+        "Cast",
+        "Ceil",
+        "Clip",
+        "Compress",
+        "Concat",
+        "Constant",
+        "ConstantOfShape",
+        "Conv",
+        "ConvTranspose",
+        "Cos",
+        "Cosh",
+        "CumSum",
+        "DepthToSpace",
+        "Div",
+        "Equal",
+        "Erf",
+        "Exp",
+        "Flatten",
+        "Gather",
+        "GatherElements",
+        "GatherND",
+        "Gemm",
+        "GlobalAveragePool",
+        "Greater",
+        "GreaterOrEqual",
+        "HardSigmoid",
+        "Identity",
+        "IsInf",
+        "IsNaN",
+        "LeakyRelu",
+        "Less",
+        "LessOrEqual",
+        "Log",
+        "LogSoftmax",
+        "MatMul",
+        "MatMulInteger",
+        "Max",
+        "MaxPool",
+        "Min",
+        "Mul",
+        "Neg",
+        "Not",
+        "OneHot",
+        "Or",
+        "Pow",
+        "Range",
+        "Reciprocal",
+        "ReduceL1",
+        "ReduceL2",
+        "ReduceMean",
+        "ReduceMin",
+        "ReduceProd",
+        "ReduceSum",
+        "ReduceSumSquare",
+        "Relu",
+        "Reshape",
+        "Resize",
+        "Round",
+        "ScatterElements",
+        "ScatterND",
+        "Shape",
+        "Shrink",
+        "Sigmoid",
+        "Sign",
+        "Sin",
+        "Sinh",
+        "Slice",
+        "Softmax",
+        "Softplus",
+        "Softsign",
+        "SpaceToDepth",
+        "Split",
+        "Sqrt",
+        "Squeeze",
+        "Sub",
+        "Tanh",
+        "ThresholdedRelu",
+        "Tile",
+        "TopK",
+        "Transpose",
+        "Trilu",
+        "Unique",
+        "Unsqueeze",
+        "Where",
+        "Xor",
+    }
+)
+
+
+@dataclass
+class SupportedOperators:
+    """
+    Operators supported by the transpiler and where the list comes from.
+    """
+
+    version: str
+    operators: FrozenSet[str]
+    source: str = "bundled"
+
+
+@dataclass
+class CompatibilityReport:
+    """
+    Result of checking the operators of a model against the supported ones.
+    """
+
+    model: OnnxModel
+    supported: SupportedOperators
+    # Number of nodes per unsupported `(domain, op_type)`
+    unsupported: Dict[Tuple[str, str], int] = field(default_factory=dict)
+
+    @property
+    def is_supported(self) -> bool:
+        return not self.unsupported
+
+
+def _validate(data: Dict) -> SupportedOperators:
+    if not isinstance(data.get("version"), str) or not isinstance(
+        data.get("operators"), list
+    ):
+        raise ValueError("Invalid list of supported operators")
+    return SupportedOperators(
+        version=data["version"], operators=frozenset(data["operators"])
+    )
+
+
+def load_supported_operators(
+    giza_dir: Optional[Path] = None, refresh: bool = False
+) -> SupportedOperators:
+    """
+    Retrieve the supported operators.
+
+    When `GIZA_SUPPORTED_OPERATORS_URL` is set the list is downloaded from it and cached at
+    `~/.giza/supported_operators.json` for a day, otherwise the list bundled with the CLI is used.
+    A stale cache or the bundled list are used if the download fails.
+
+    Args:
+        giza_dir (Optional[Path]): folder of the cache. Defaults to `~/.giza`.
+        refresh (bool): ignore the age of the cache and download the list again
+
+    Returns:
+        SupportedOperators: the supported operators with their version
+    """
+    bundled = SupportedOperators(version=BUNDLED_VERSION, operators=BUNDLED_OPERATORS)
+    url = os.environ.get(SUPPORTED_OPERATORS_URL_VARIABLE)
+    if not url:
+        return bundled
+
+    cache_path = Path(giza_dir or Path.home() / ".giza") / SUPPORTED_OPERATORS_FILE
+    cached: Optional[SupportedOperators] = None
+    with file_lock(cache_path.with_suffix(".lock")):
+        try:
+            with open(cache_path) as f:
+                data = json.load(f)
+            if data.get("url") == url:
+                cached = _validate(data)
+                cached.source = str(cache_path)
+                fresh = (
+                    time.time() - data.get("fetched_at", 0) < SUPPORTED_OPERATORS_TTL
+                )
+                if fresh and not refresh:
+                    return cached
+        except (OSError, ValueError):
+            pass
+
+        try:
+            response = requests.get(url, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+            supported = _validate(data)
+        except (requests.RequestException, ValueError):
+            return cached or bundled
+
+        atomic_write_json(
+            cache_path,
+            {
+                "url": url,
+                "fetched_at": time.time(),
+                "version": supported.version,
+                "operators": sorted(supported.operators),
+            },
+            mode=0o644,
+        )
+    supported.source = url
+    return supported
+
+
+def check_operators(
+    model: OnnxModel, supported: SupportedOperators
+) -> CompatibilityReport:
+    """
+    Compare the operators of a model with the supported ones.
+
+    Operators from other domains than the default ONNX one are always reported as unsupported.
+
+    Args:
+        model (OnnxModel): parsed model
+        supported (SupportedOperators): supported operators
+
+    Returns:
+        CompatibilityReport: the unsupported operators of the model
+    """
+    unsupported = {
+        (domain, op_type): count
+        for (domain, op_type), count in sorted(model.operators.items())
+        if domain != DEFAULT_DOMAIN or op_type not in supported.operators
+    }
+    return CompatibilityReport(
+        model=model, supported=supported, unsupported=unsupported
+    )
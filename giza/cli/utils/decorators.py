@@ -44,6 +44,11 @@ def auth(func: Callable[P, R]) -> Callable[P, R]:
         if self_.token is not None:
             expired = self_._is_expired(self_.token)
 
+        if self_.token is not None and expired and self_.api_key is None:
+            # Another process might have renewed it
+            self_._renew_token()
+            expired = self_._is_expired(self_.token)
+
         if (self_.token is None or expired) and self_.api_key is None:
             raise Exception(
                 "Token expired or not set. API Key not available. Log in again."
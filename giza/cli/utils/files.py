@@ -0,0 +1,103 @@
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover, windows
+    fcntl = None  # type: ignore
+    import msvcrt
+
+PathLike = Union[str, Path]
+
+
+@contextmanager
+def file_lock(path: PathLike, shared: bool = False) -> Iterator[None]:
+    """
+    Inter-process lock backed by a lock file, blocks until the lock is acquired.
+
+    The lock is advisory, every process touching the protected resource must use it.
+
+    Args:
+        path (PathLike): path of the lock file, created if it does not exist
+        shared (bool): acquire a shared (read) lock instead of an exclusive one. Windows only supports exclusive locks.
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:  # pragma: no cover
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        yield
+    finally:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:  # pragma: no cover
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+
+def atomic_write_text(path: PathLike, content: str, mode: int = 0o600) -> None:
+    """
+    Write a text file atomically.
+
+    The content is written to a temporary file in the same folder and then moved over
+    the destination, readers see either the old or the new content but never a partial one.
+
+    Args:
+        path (PathLike): destination of the file
+        content (str): content of the file
+        mode (int): permissions of the file. Defaults to 0o600 as it usually contains secrets.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_json(path: PathLike, data: Any, mode: int = 0o600) -> None:
+    """
+    Write a json file atomically, see `atomic_write_text`.
+
+    Args:
+        path (PathLike): destination of the file
+        data (Any): json serializable content
+        mode (int): permissions of the file. Defaults to 0o600 as it usually contains secrets.
+    """
+    atomic_write_text(path, json.dumps(data, indent=4), mode=mode)
+
+
+def file_hash(path: PathLike) -> str:
+    """
+    Sha256 of a file, read in chunks.
+
+    Args:
+        path (PathLike): path to the file
+
+    Returns:
+        str: hex digest of the file
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
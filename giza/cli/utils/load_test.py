@@ -0,0 +1,120 @@
+import itertools
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from requests import HTTPError
+
+from giza.cli.utils.metrics import percentile
+from giza.cli.utils.rate_limit import TokenBucket
+
+
+@dataclass
+class LoadTestStats:
+    """
+    Outcome of a load test: the latency of every successful call and the errors by kind.
+    """
+
+    latencies: List[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+    elapsed: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies) + sum(self.errors.values())
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Throughput, error rate and latency percentiles of the test.
+
+        Returns:
+            Dict[str, Any]: the summary, latencies in milliseconds
+        """
+        requests = self.requests
+        return {
+            "requests": requests,
+            "errors": sum(self.errors.values()),
+            "error_rate": sum(self.errors.values()) / requests if requests else 0.0,
+            "throughput": len(self.latencies) / self.elapsed if self.elapsed else 0.0,
+            "latency_p50_ms": percentile(self.latencies, 50) * 1000,
+            "latency_p95_ms": percentile(self.latencies, 95) * 1000,
+            "latency_p99_ms": percentile(self.latencies, 99) * 1000,
+            "latency_max_ms": max(self.latencies, default=0.0) * 1000,
+            "errors_by_kind": dict(self.errors),
+        }
+
+
+def _error_kind(error: Exception) -> str:
+    if isinstance(error, HTTPError) and error.response is not None:
+        return f"HTTP {error.response.status_code}"
+    return type(error).__name__
+
+
+def run_load_test(
+    call: Callable[[Any], Any],
+    inputs: Sequence[Any],
+    duration: float,
+    concurrency: int = 1,
+    rate: Optional[float] = None,
+    max_requests: Optional[int] = None,
+) -> LoadTestStats:
+    """
+    Drive `call` from `concurrency` threads until `duration` seconds pass or `max_requests` are sent.
+
+    Each thread sends a request as soon as the previous one finishes, so `concurrency` requests are
+    always in flight, unless `rate` caps the requests per second started by all the threads.
+
+    Args:
+        call (Callable[[Any], Any]): request to measure, receives an input
+        inputs (Sequence[Any]): inputs of the requests, reused in a loop
+        duration (float): seconds the test runs
+        concurrency (int): number of requests in flight
+        rate (Optional[float]): max requests started per second, no limit by default
+        max_requests (Optional[int]): stop after this many requests
+
+    Returns:
+        LoadTestStats: latencies and errors of the requests
+    """
+    stats = LoadTestStats()
+    lock = threading.Lock()
+    source = itertools.cycle(inputs)
+    bucket = TokenBucket(rate, capacity=1) if rate else None
+    sent = 0
+    start = time.perf_counter()
+    deadline = start + duration
+
+    def _worker() -> None:
+        nonlocal sent
+        while True:
+            if bucket is not None:
+                bucket.acquire()
+            with lock:
+                if time.perf_counter() >= deadline or (
+                    max_requests is not None and sent >= max_requests
+                ):
+                    return
+                sent += 1
+                args = next(source)
+            begin = time.perf_counter()
+            try:
+                call(args)
+            except Exception as e:
+                with lock:
+                    stats.errors[_error_kind(e)] += 1
+            else:
+                latency = time.perf_counter() - begin
+                with lock:
+                    stats.latencies.append(latency)
+
+    threads = [
+        threading.Thread(target=_worker, name=f"giza-load-{i}", daemon=True)
+        for i in range(max(concurrency, 1))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats.elapsed = time.perf_counter() - start
+    return stats
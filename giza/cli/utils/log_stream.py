@@ -0,0 +1,72 @@
+import time
+from typing import Callable, Optional
+
+from giza.cli.schemas.logs import Logs
+
+# Seconds between two fetches of the logs
+FOLLOW_INTERVAL = 5.0
+# Longest partial line kept while waiting for the rest of it
+MAX_PARTIAL_LINE = 64 * 1024
+
+
+def follow_logs(
+    fetch: Callable[[Optional[int]], Logs],
+    finished: Callable[[], bool],
+    write: Callable[[str], None],
+    interval: float = FOLLOW_INTERVAL,
+    timeout: Optional[float] = None,
+) -> int:
+    """
+    Stream the logs of something that is running, writing each new line once.
+
+    Only the logs after the last offset read are requested. Once the API answers without
+    `next_offset` it is unknown whether it honoured the offset, so the whole logs are requested
+    from then on and the part already written is skipped. Only the offset and, at most,
+    one partial line are kept between fetches, so the memory used does not grow with the logs.
+    The logs are fetched one last time once `finished` returns True.
+
+    Args:
+        fetch (Callable[[Optional[int]], Logs]): retrieve the logs from an offset, or the whole
+            logs for None
+        finished (Callable[[], bool]): whether the logs will not change anymore
+        write (Callable[[str], None]): output of each line, without the line break
+        interval (float): seconds between fetches
+        timeout (Optional[float]): seconds to follow the logs, no limit by default
+
+    Returns:
+        int: the offset after the last line read
+    """
+    offset = 0
+    by_offset = True
+    partial = ""
+    start = time.time()
+    while True:
+        # Checked before fetching so the last lines are read after it finishes
+        done = finished() or (timeout is not None and time.time() - start >= timeout)
+        logs = fetch(offset if by_offset else None)
+        if by_offset and logs.next_offset is None:
+            by_offset = False
+            if offset:
+                # Can be the whole logs or only the new ones, read them again from the start
+                logs = fetch(None)
+        if by_offset and logs.next_offset is not None:
+            chunk = logs.logs
+            offset = logs.next_offset
+        else:
+            if len(logs.logs) < offset:
+                # The logs were truncated or rotated, start over
+                offset = 0
+            chunk = logs.logs[offset:]
+            offset = len(logs.logs)
+
+        *lines, partial = (partial + chunk).split("\n")
+        for line in lines:
+            write(line)
+        if len(partial) > MAX_PARTIAL_LINE:
+            write(partial)
+            partial = ""
+        if done:
+            if partial:
+                write(partial)
+            return offset
+        time.sleep(interval)
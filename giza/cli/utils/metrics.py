@@ -0,0 +1,387 @@
+import atexit
+import bisect
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from giza.cli.utils.files import atomic_write_json, atomic_write_text, file_lock
+from giza.cli.utils.misc import endpoint_template
+from giza.cli.utils.tracing import Span, tracer
+
+METRICS_FILE_VARIABLE = "GIZA_METRICS_FILE"
+
+DURATION_BUCKETS = [
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    120,
+    300,
+    600,
+    1800,
+    3600,
+]
+BYTES_BUCKETS = [float(1024 * 4**i) for i in range(12)]
+BATCH_SIZE_BUCKETS = [float(2**i) for i in range(10)]
+LATENCY_BUCKETS = [0.005, 0.01, 0.025] + DURATION_BUCKETS[:9]
+
+HISTOGRAMS = {
+    "giza_http_request_duration_seconds": (
+        "Duration of the HTTP requests until the response headers are received",
+        DURATION_BUCKETS,
+    ),
+    "giza_http_request_size_bytes": (
+        "Size of the HTTP request bodies",
+        BYTES_BUCKETS,
+    ),
+    "giza_http_response_size_bytes": (
+        "Size of the HTTP response bodies",
+        BYTES_BUCKETS,
+    ),
+    "giza_phase_duration_seconds": (
+        "Duration of each phase of a command",
+        DURATION_BUCKETS,
+    ),
+    "giza_predict_batch_size": (
+        "Number of predictions sent to an endpoint in a single request",
+        BATCH_SIZE_BUCKETS,
+    ),
+    "giza_predict_latency_seconds": (
+        "Duration of each prediction, from its submission until its result is ready",
+        LATENCY_BUCKETS,
+    ),
+}
+COUNTERS = {
+    "giza_http_requests_total": "Number of HTTP requests",
+    "giza_http_retries_total": "Number of HTTP requests sent again",
+    "giza_http_rate_limit_wait_seconds_total": "Seconds spent waiting for the rate limiter",
+    "giza_phase_bytes_total": "Bytes transferred in each phase of a command",
+    "giza_polls_total": "Number of status polls in each phase of a command",
+    "giza_prediction_cache_total": "Number of prediction cache lookups by result",
+    "giza_verification_ledger_total": "Number of verification ledger lookups by result",
+}
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+
+def _format_labels(labels: LabelSet, **extra: str) -> str:
+    items = list(labels) + list(extra.items())
+    if not items:
+        return ""
+    rendered = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in items
+    )
+    return "{" + rendered + "}"
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Metrics:
+    """
+    Process wide registry of counters and histograms.
+
+    The metrics are exported when the process exits to the file set at `GIZA_METRICS_FILE`:
+
+        * A `.prom` file is rendered in the Prometheus textfile format, accumulating the values
+          of every run so the node-exporter textfile collector can scrape it.
+        * Any other extension appends a json line per run with the raw observations.
+    """
+
+    def __init__(self) -> None:
+        self.command = ""
+        self._lock = threading.Lock()
+        self._observations: Dict[Tuple[str, LabelSet], List[float]] = defaultdict(list)
+        self._counters: Dict[Tuple[str, LabelSet], float] = defaultdict(float)
+        self._export_registered = False
+
+    def _key(self, name: str, labels: Dict[str, Any]) -> Tuple[str, LabelSet]:
+        if self.command and "command" not in labels:
+            labels["command"] = self.command
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """
+        Record a value in a histogram.
+
+        Args:
+            name (str): name of the histogram
+            value (float): value to record
+            labels: labels of the observation
+        """
+        key = self._key(name, labels)
+        with self._lock:
+            self._observations[key].append(value)
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            name (str): name of the counter
+            value (float): amount to increment. Defaults to 1.
+            labels: labels of the counter
+        """
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] += value
+
+    @contextmanager
+    def phase(self, name: str, parent: Optional[Span] = None) -> Iterator[None]:
+        """
+        Measure the duration of a phase of the current command, e.g. `upload`.
+
+        The phase is traced as a child span of the active one.
+
+        Args:
+            name (str): name of the phase
+            parent (Optional[Span]): parent span, needed when the phase runs in another thread
+        """
+        start = time.perf_counter()
+        try:
+            with tracer.span(name, parent=parent):
+                yield
+        finally:
+            self.observe(
+                "giza_phase_duration_seconds", time.perf_counter() - start, phase=name
+            )
+
+    @contextmanager
+    def poll(self, phase: str) -> Iterator[None]:
+        """
+        Count a status poll of a phase, each poll is also traced as its own span.
+
+        Args:
+            phase (str): name of the phase polling for a status
+        """
+        self.inc("giza_polls_total", phase=phase)
+        with tracer.span("poll", phase=phase):
+            yield
+
+    def values(self, name: str, **labels: Any) -> List[float]:
+        """
+        Retrieve the observations of a histogram matching the provided labels.
+
+        Args:
+            name (str): name of the histogram
+            labels: labels to filter the observations
+
+        Returns:
+            List[float]: the matching observations
+        """
+        wanted = {(k, str(v)) for k, v in labels.items()}
+        with self._lock:
+            return [
+                value
+                for (metric, label_set), values in self._observations.items()
+                if metric == name and wanted.issubset(label_set)
+                for value in values
+            ]
+
+    def counter(self, name: str, **labels: Any) -> float:
+        """
+        Retrieve the sum of the counters matching the provided labels.
+
+        Args:
+            name (str): name of the counter
+            labels: labels to filter the counters
+
+        Returns:
+            float: the sum of the matching counters
+        """
+        wanted = {(k, str(v)) for k, v in labels.items()}
+        with self._lock:
+            return sum(
+                value
+                for (metric, label_set), value in self._counters.items()
+                if metric == name and wanted.issubset(label_set)
+            )
+
+    def reset(self) -> None:
+        """
+        Clear all the recorded metrics.
+        """
+        with self._lock:
+            self._observations.clear()
+            self._counters.clear()
+
+    def export(self, path: str) -> None:
+        """
+        Export the metrics to a Prometheus textfile (`.prom`) or a json lines file.
+
+        Args:
+            path (str): destination of the metrics
+        """
+        with file_lock(f"{path}.lock"):
+            if path.endswith(".prom"):
+                self._export_prometheus(path)
+            else:
+                self._export_json(path)
+
+    def export_at_exit(self) -> None:
+        """
+        Export the metrics when the process exits, if `GIZA_METRICS_FILE` is set.
+        """
+        path = os.environ.get(METRICS_FILE_VARIABLE)
+        if path and not self._export_registered:
+            atexit.register(self.export, path)
+            self._export_registered = True
+
+    def _export_json(self, path: str) -> None:
+        with self._lock:
+            record = {
+                "timestamp": time.time(),
+                "command": self.command,
+                "histograms": [
+                    {"name": name, "labels": dict(labels), "values": values}
+                    for (name, labels), values in self._observations.items()
+                ],
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in self._counters.items()
+                ],
+            }
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def _export_prometheus(self, path: str) -> None:
+        # Textfile metrics must be cumulative across runs, the state is kept next to the file
+        state_path = Path(f"{path}.state.json")
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            state = {}
+        histograms: Dict[str, Dict] = state.get("histograms", {})
+        counters: Dict[str, Dict] = state.get("counters", {})
+
+        with self._lock:
+            for (name, labels), values in self._observations.items():
+                _, buckets = HISTOGRAMS.get(name, ("", DURATION_BUCKETS))
+                entry = histograms.setdefault(
+                    json.dumps([name, labels]),
+                    {"buckets": [0] * (len(buckets) + 1), "sum": 0.0, "count": 0},
+                )
+                for value in values:
+                    entry["buckets"][bisect.bisect_left(buckets, value)] += 1
+                    entry["sum"] += value
+                    entry["count"] += 1
+            for (name, labels), value in self._counters.items():
+                key = json.dumps([name, labels])
+                counters[key] = counters.get(key, 0.0) + value
+
+        atomic_write_json(state_path, {"histograms": histograms, "counters": counters})
+        atomic_write_text(path, self._render_prometheus(histograms, counters), 0o644)
+
+    def _render_prometheus(self, histograms: Dict, counters: Dict) -> str:
+        lines: List[str] = []
+        by_name: Dict[str, List[Tuple[LabelSet, Any]]] = defaultdict(list)
+        for key, entry in sorted(histograms.items()):
+            name, labels = json.loads(key)
+            by_name[name].append((tuple(tuple(label) for label in labels), entry))
+        for name, entries in by_name.items():
+            description, buckets = HISTOGRAMS.get(name, ("", DURATION_BUCKETS))
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, entry in entries:
+                cumulative = 0
+                for bound, count in zip(
+                    [*buckets, float("inf")], entry["buckets"], strict=True
+                ):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else _format_float(bound)
+                    lines.append(
+                        f"{name}_bucket{_format_labels(labels, le=le)} {cumulative}"
+                    )
+                lines.append(
+                    f"{name}_sum{_format_labels(labels)} {_format_float(entry['sum'])}"
+                )
+                lines.append(f"{name}_count{_format_labels(labels)} {entry['count']}")
+
+        by_name.clear()
+        for key, value in sorted(counters.items()):
+            name, labels = json.loads(key)
+            by_name[name].append((tuple(tuple(label) for label in labels), value))
+        for name, entries in by_name.items():
+            lines.append(f"# HELP {name} {COUNTERS.get(name, '')}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in entries:
+                lines.append(f"{name}{_format_labels(labels)} {_format_float(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile of some values.
+
+    Args:
+        values (List[float]): values, in any order
+        q (float): percentile, between 0 and 100
+
+    Returns:
+        float: the percentile, 0 if there are no values
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(-(-q * len(ordered) // 100)), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _content_length(headers: Any, body: Any = None) -> Optional[int]:
+    """
+    Size of a request or response body, from its headers or from the body itself.
+    """
+    length = headers.get("Content-Length") if headers is not None else None
+    if length is not None:
+        try:
+            return int(length)
+        except ValueError:
+            return None
+    if isinstance(body, bytes | str):
+        return len(body)
+    return None
+
+
+def record_response(response: Any, api: bool = True) -> None:
+    """
+    Record the duration and size of an HTTP call.
+
+    Args:
+        response (Response): the response of the request
+        api (bool): whether the request was sent to the API or to a presigned url
+    """
+    request = response.request
+    endpoint = endpoint_template(request.path_url.split("?")[0]) if api else "presigned"
+    labels = {"method": request.method, "endpoint": endpoint}
+    metrics.inc("giza_http_requests_total", status=response.status_code, **labels)
+    metrics.observe(
+        "giza_http_request_duration_seconds",
+        response.elapsed.total_seconds(),
+        **labels,
+    )
+    request_size = _content_length(request.headers, request.body)
+    if request_size is not None:
+        metrics.observe("giza_http_request_size_bytes", request_size, **labels)
+    response_size = _content_length(response.headers)
+    if response_size is not None:
+        metrics.observe("giza_http_response_size_bytes", response_size, **labels)
+
+
+# Provided an instance for ease of use
+metrics = Metrics()
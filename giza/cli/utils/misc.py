@@ -1,14 +1,20 @@
 import json
 import os
 import re
+import shutil
 import subprocess
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Union
 
 from giza.cli.exceptions import PasswordError, ScarbBuildError, ScarbNotFound
-from giza.cli.utils import echo
+from giza.cli.utils import build_cache, echo
+
+_ID_SEGMENT = re.compile(r"^\d+(?=$|:)")
+# Threads used to extract the members of an archive
+EXTRACTION_WORKERS = min(8, os.cpu_count() or 1)
 
 
 def _check_password_strength(password: str) -> None:
@@ -28,27 +34,85 @@ def _check_password_strength(password: str) -> None:
         )
 
 
+def content_size(content: Union[bytes, BinaryIO]) -> int:
+    """
+    Size of a downloaded content, either in memory or spooled to a file.
+
+    Args:
+        content (Union[bytes, BinaryIO]): file content or seekable file
+
+    Returns:
+        int: size in bytes
+    """
+    if isinstance(content, bytes):
+        return len(content)
+    position = content.tell()
+    size = content.seek(0, os.SEEK_END)
+    content.seek(position)
+    return size
+
+
+def extract_zip(
+    zip_file: zipfile.ZipFile, output_path: str, workers: int = EXTRACTION_WORKERS
+) -> None:
+    """
+    Extract all the members of an archive, in parallel when there are several of them.
+
+    Args:
+        zip_file (zipfile.ZipFile): archive to extract
+        output_path (str): folder where the members are extracted
+        workers (int): number of threads extracting members
+
+    Raises:
+        zipfile.BadZipFile: if a member would be extracted outside of `output_path`
+    """
+    root = os.path.realpath(output_path)
+    members = []
+    for member in zip_file.infolist():
+        target = os.path.realpath(os.path.join(root, member.filename))
+        if os.path.commonpath([root, target]) != root:
+            raise zipfile.BadZipFile(f"Unsafe path in archive: {member.filename}")
+        if member.is_dir():
+            os.makedirs(target, exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            members.append((member, target))
+
+    def _extract(member: zipfile.ZipInfo, target: str) -> None:
+        with zip_file.open(member) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+
+    if workers <= 1 or len(members) <= 1:
+        for member, target in members:
+            _extract(member, target)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(_extract, *item) for item in members]:
+            future.result()
+
+
 def download_model_or_sierra(
-    content: bytes, output_path: str, name: Optional[str] = None
+    content: Union[bytes, BinaryIO], output_path: str, name: Optional[str] = None
 ):
     """
     Download the model or sierra file.
 
     Args:
-        content (bytes): file content
+        content (Union[bytes, BinaryIO]): file content, or a seekable file with it
         output_path (str): path to save the file
         name (str): file name. Defaults to None.
     """
-    f = BytesIO(content)
+    f = BytesIO(content) if isinstance(content, bytes) else content
     is_zip = zipfile.is_zipfile(f)
+    f.seek(0)
     if not is_zip and name is not None:
         if not os.path.exists(output_path):
             os.makedirs(output_path)
         with open(os.path.join(output_path, name), "wb") as file_:
-            file_.write(content)
+            shutil.copyfileobj(f, file_)
     else:
-        zip_file = zipfile.ZipFile(f)
-        zip_file.extractall(output_path)
+        with zipfile.ZipFile(f) as zip_file:
+            extract_zip(zip_file, output_path)
 
 
 def zip_folder(source_folder: str, dst_folder: str) -> str:
@@ -75,13 +139,25 @@ def zip_folder(source_folder: str, dst_folder: str) -> str:
     return zip_file_path
 
 
-def scarb_build(folder) -> None:
+def scarb_build(folder, use_cache: bool = True) -> None:
     """
     Build the scarb model.
 
+    The build is skipped when the sources did not change since the last successful build.
+
     Args:
         folder (str): path to the folder
+        use_cache (bool): skip the build if the project is up to date. Defaults to True.
     """
+    if (
+        use_cache
+        and build_cache.load(folder).get("source_hash")
+        == build_cache.source_hash(folder)
+        and build_cache.find_sierra(folder) is not None
+    ):
+        echo("Sources did not change since the last build, skipping compilation ✅")
+        return
+
     try:
         subprocess.run(["scarb", "--version"], check=True)
     except subprocess.CalledProcessError as e:
@@ -102,6 +178,10 @@ def scarb_build(folder) -> None:
         echo.error("Compilation failed")
         raise ScarbBuildError("Compilation failed") from e
     echo("Compilation successful")
+    # Hashed after the build as scarb may generate files like `Scarb.lock`
+    build_cache.update(
+        folder, source_hash=build_cache.source_hash(folder), sierra_path=None
+    )
 
 
 def get_ape_accounts() -> Dict[str, Path]:
@@ -150,3 +230,16 @@ def load_json_file(file_path: str) -> Dict:
     """
     with open(file_path) as file_:
         return json.load(file_)
+
+
+def endpoint_template(path: str) -> str:
+    """
+    Replace the identifiers of an API path to keep a low cardinality in the labels.
+
+    Args:
+        path (str): path of the request, e.g. `/api/v1/models/1/versions/2:download`
+
+    Returns:
+        str: the templated path, e.g. `/api/v1/models/{id}/versions/{id}:download`
+    """
+    return "/".join(_ID_SEGMENT.sub("{id}", segment) for segment in path.split("/"))
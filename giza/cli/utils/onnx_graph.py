@@ -0,0 +1,272 @@
+import mmap
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, Tuple, Union
+
+# Protobuf wire types
+VARINT = 0
+FIXED64 = 1
+LENGTH_DELIMITED = 2
+FIXED32 = 5
+
+# Field numbers of the ONNX messages, see onnx/onnx.proto
+MODEL_IR_VERSION = 1
+MODEL_PRODUCER_NAME = 2
+MODEL_GRAPH = 7
+MODEL_OPSET_IMPORT = 8
+OPSET_DOMAIN = 1
+OPSET_VERSION = 2
+GRAPH_NODE = 1
+GRAPH_INITIALIZER = 5
+NODE_OP_TYPE = 4
+NODE_ATTRIBUTE = 5
+NODE_DOMAIN = 7
+ATTRIBUTE_GRAPH = 6
+ATTRIBUTE_GRAPHS = 11
+TENSOR_DIMS = 1
+TENSOR_DATA_TYPE = 2
+
+# Bytes per element of each `TensorProto.DataType`, strings are not counted
+ELEMENT_SIZES = {
+    1: 4,  # FLOAT
+    2: 1,  # UINT8
+    3: 1,  # INT8
+    4: 2,  # UINT16
+    5: 2,  # INT16
+    6: 4,  # INT32
+    7: 8,  # INT64
+    9: 1,  # BOOL
+    10: 2,  # FLOAT16
+    11: 8,  # DOUBLE
+    12: 4,  # UINT32
+    13: 8,  # UINT64
+    14: 8,  # COMPLEX64
+    15: 16,  # COMPLEX128
+    16: 2,  # BFLOAT16
+}
+DEFAULT_DOMAIN = "ai.onnx"
+
+Buffer = Union[bytes, memoryview]
+Value = Union[int, memoryview]
+
+
+class OnnxParseError(ValueError):
+    """
+    The file is not a valid ONNX model.
+    """
+
+
+@dataclass
+class OnnxModel:
+    """
+    Summary of an ONNX model, enough to check its compatibility without loading its weights.
+    """
+
+    ir_version: int = 0
+    producer: str = ""
+    opsets: Dict[str, int] = field(default_factory=dict)
+    # Number of nodes per `(domain, op_type)`, including the ones in subgraphs
+    operators: Counter = field(default_factory=Counter)
+    parameters: int = 0
+    parameters_bytes: int = 0
+    file_size: int = 0
+
+    @property
+    def nodes(self) -> int:
+        return sum(self.operators.values())
+
+
+def decode_varint(buf: Buffer, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        if pos >= len(buf):
+            raise OnnxParseError("Truncated varint")
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+        if shift > 63:
+            raise OnnxParseError("Varint is too long")
+
+
+def iter_fields(buf: Buffer) -> Iterator[Tuple[int, int, Value]]:
+    """
+    Iterate over the fields of a protobuf message, length delimited values are not copied.
+
+    Args:
+        buf (Buffer): serialized message
+
+    Yields:
+        Tuple[int, int, Value]: field number, wire type and value
+    """
+    view = memoryview(buf)
+    pos = 0
+    while pos < len(view):
+        key, pos = decode_varint(view, pos)
+        number, wire_type = key >> 3, key & 0x7
+        if wire_type == VARINT:
+            value, pos = decode_varint(view, pos)
+            yield number, wire_type, value
+        elif wire_type == LENGTH_DELIMITED:
+            length, pos = decode_varint(view, pos)
+            if pos + length > len(view):
+                raise OnnxParseError("Truncated message")
+            yield number, wire_type, view[pos : pos + length]
+            pos += length
+        elif wire_type in (FIXED64, FIXED32):
+            size = 8 if wire_type == FIXED64 else 4
+            yield number, wire_type, int.from_bytes(view[pos : pos + size], "little")
+            pos += size
+        else:
+            raise OnnxParseError(f"Unsupported wire type {wire_type}")
+
+
+def encode_varint(value: int) -> bytes:
+    """
+    Encode an int as a protobuf varint, negative values as 64 bits two's complement.
+    """
+    value &= (1 << 64) - 1
+    out = bytearray()
+    while True:
+        byte, value = value & 0x7F, value >> 7
+        out.append(byte | (0x80 if value else 0))
+        if not value:
+            return bytes(out)
+
+
+def encode_fields(fields: Iterable[Tuple[int, int, Union[Value, bytes]]]) -> bytes:
+    """
+    Serialize protobuf fields, the inverse of `iter_fields`.
+
+    Args:
+        fields (Iterable[Tuple[int, int, Union[Value, bytes]]]): field number, wire type and value
+
+    Returns:
+        bytes: serialized message
+    """
+    out = bytearray()
+    for number, wire_type, value in fields:
+        out += encode_varint(number << 3 | wire_type)
+        if wire_type == VARINT:
+            out += encode_varint(value)  # type: ignore
+        elif wire_type == LENGTH_DELIMITED:
+            out += encode_varint(len(value))  # type: ignore
+            out += value  # type: ignore
+        else:
+            size = 8 if wire_type == FIXED64 else 4
+            out += value.to_bytes(size, "little")  # type: ignore
+    return bytes(out)
+
+
+def decode_string(value: Value) -> str:
+    if not isinstance(value, memoryview):
+        raise OnnxParseError("Expected a string")
+    return bytes(value).decode("utf-8", errors="replace")
+
+
+def _tensor(buf: memoryview, model: OnnxModel) -> None:
+    dims = []
+    data_type = 0
+    for number, wire_type, value in iter_fields(buf):
+        if number == TENSOR_DIMS and wire_type == VARINT:
+            dims.append(value)
+        elif number == TENSOR_DIMS and wire_type == LENGTH_DELIMITED:
+            pos = 0
+            while pos < len(value):  # type: ignore
+                dim, pos = decode_varint(value, pos)  # type: ignore
+                dims.append(dim)
+        elif number == TENSOR_DATA_TYPE:
+            data_type = value  # type: ignore
+    elements = 1
+    for dim in dims:
+        elements *= dim
+    model.parameters += elements
+    model.parameters_bytes += elements * ELEMENT_SIZES.get(data_type, 0)
+
+
+def _graph(buf: memoryview, model: OnnxModel) -> None:
+    for number, _, value in iter_fields(buf):
+        if number == GRAPH_NODE:
+            _node(value, model)  # type: ignore
+        elif number == GRAPH_INITIALIZER:
+            _tensor(value, model)  # type: ignore
+
+
+def _node(buf: memoryview, model: OnnxModel) -> None:
+    op_type, domain = "", ""
+    for number, _, value in iter_fields(buf):
+        if number == NODE_OP_TYPE:
+            op_type = decode_string(value)
+        elif number == NODE_DOMAIN:
+            domain = decode_string(value)
+        elif number == NODE_ATTRIBUTE:
+            # Control flow operators like `If` or `Loop` keep their bodies as attributes
+            for attr_number, _, attr_value in iter_fields(value):  # type: ignore
+                if attr_number in (ATTRIBUTE_GRAPH, ATTRIBUTE_GRAPHS):
+                    _graph(attr_value, model)  # type: ignore
+    model.operators[(domain or DEFAULT_DOMAIN, op_type)] += 1
+
+
+def parse_model(buf: Buffer) -> OnnxModel:
+    """
+    Parse the operators, opsets and initializers of a serialized ONNX model.
+
+    Args:
+        buf (Buffer): serialized `ModelProto`
+
+    Raises:
+        OnnxParseError: if the content is not a valid ONNX model
+
+    Returns:
+        OnnxModel: summary of the model
+    """
+    model = OnnxModel(file_size=len(buf))
+    has_graph = False
+    for number, _, value in iter_fields(buf):
+        if number == MODEL_IR_VERSION:
+            model.ir_version = value  # type: ignore
+        elif number == MODEL_PRODUCER_NAME:
+            model.producer = decode_string(value)
+        elif number == MODEL_OPSET_IMPORT:
+            domain, version = "", 0
+            for opset_number, _, opset_value in iter_fields(value):  # type: ignore
+                if opset_number == OPSET_DOMAIN:
+                    domain = decode_string(opset_value)
+                elif opset_number == OPSET_VERSION:
+                    version = opset_value  # type: ignore
+            model.opsets[domain or DEFAULT_DOMAIN] = version
+        elif number == MODEL_GRAPH:
+            has_graph = True
+            _graph(value, model)  # type: ignore
+    if not has_graph or model.ir_version == 0:
+        raise OnnxParseError("The file is not an ONNX model")
+    return model
+
+
+def load_model(path: str) -> OnnxModel:
+    """
+    Parse an ONNX file, memory mapped so the weights are never loaded.
+
+    Args:
+        path (str): path to the ONNX file
+
+    Raises:
+        OnnxParseError: if the file is not a valid ONNX model
+
+    Returns:
+        OnnxModel: summary of the model
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            raise OnnxParseError("The file is empty") from e
+        with mapped:
+            try:
+                return parse_model(mapped)  # type: ignore
+            except OnnxParseError as e:
+                # Raised once the traceback, holding views of the mapping, is released
+                message = str(e)
+    raise OnnxParseError(message)
@@ -0,0 +1,690 @@
+import math
+import sys
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from giza.cli.utils.onnx_graph import (
+    ATTRIBUTE_GRAPH,
+    ATTRIBUTE_GRAPHS,
+    DEFAULT_DOMAIN,
+    GRAPH_INITIALIZER,
+    GRAPH_NODE,
+    LENGTH_DELIMITED,
+    MODEL_GRAPH,
+    MODEL_IR_VERSION,
+    MODEL_OPSET_IMPORT,
+    NODE_ATTRIBUTE,
+    NODE_DOMAIN,
+    NODE_OP_TYPE,
+    OPSET_DOMAIN,
+    OPSET_VERSION,
+    TENSOR_DATA_TYPE,
+    TENSOR_DIMS,
+    VARINT,
+    OnnxModel,
+    OnnxParseError,
+    Value,
+    decode_string,
+    decode_varint,
+    encode_fields,
+    encode_varint,
+    iter_fields,
+    parse_model,
+)
+
+# Field numbers of the ONNX messages, see onnx/onnx.proto
+NODE_INPUT = 1
+NODE_OUTPUT = 2
+GRAPH_INPUT = 11
+GRAPH_OUTPUT = 12
+GRAPH_VALUE_INFO = 13
+VALUE_INFO_NAME = 1
+ATTRIBUTE_NAME = 1
+ATTRIBUTE_I = 3
+ATTRIBUTE_T = 5
+ATTRIBUTE_INTS = 8
+TENSOR_FLOAT_DATA = 4
+TENSOR_INT64_DATA = 7
+TENSOR_NAME = 8
+TENSOR_RAW_DATA = 9
+TENSOR_DATA_LOCATION = 14
+
+FLOAT = 1
+INT64 = 7
+EXTERNAL = 1
+# Initializers are not required to be graph inputs since IR version 4
+MIN_IR_VERSION = 4
+# Orion represents floats as FP16x16 by default, 16 bits for the integer part and 16 for the fraction
+FIXED_POINT_SCALE = 2**16
+FIXED_POINT_MIN = -(2**15)
+FIXED_POINT_MAX = 2**15 - 1 / FIXED_POINT_SCALE
+# Operators only changing the shape of a tensor, they can be folded without touching its data
+SHAPE_OPERATORS = {"Identity", "Reshape", "Flatten", "Squeeze", "Unsqueeze"}
+MAX_ITERATIONS = 10
+
+RawField = Tuple[int, int, Union[Value, bytes]]
+
+
+def _int64(value: int) -> int:
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _product(dims: List[int]) -> int:
+    result = 1
+    for dim in dims:
+        result *= dim
+    return result
+
+
+@dataclass
+class Tensor:
+    """
+    Initializer of a graph, the fields holding its data are kept untouched.
+    """
+
+    name: str
+    dims: List[int]
+    data_type: int
+    fields: List[RawField] = field(default_factory=list)
+
+    @classmethod
+    def parse(cls, buf: memoryview) -> "Tensor":
+        tensor = cls(name="", dims=[], data_type=0)
+        for number, wire_type, value in iter_fields(buf):
+            if number == TENSOR_NAME:
+                tensor.name = decode_string(value)
+            elif number == TENSOR_DIMS and wire_type == VARINT:
+                tensor.dims.append(_int64(value))  # type: ignore
+            elif number == TENSOR_DIMS:
+                pos = 0
+                while pos < len(value):  # type: ignore
+                    dim, pos = decode_varint(value, pos)  # type: ignore
+                    tensor.dims.append(_int64(dim))
+            elif number == TENSOR_DATA_TYPE:
+                tensor.data_type = value  # type: ignore
+            else:
+                tensor.fields.append((number, wire_type, value))
+        return tensor
+
+    @classmethod
+    def from_int64(cls, name: str, values: List[int]) -> "Tensor":
+        raw = b"".join(v.to_bytes(8, "little", signed=True) for v in values)
+        return cls(
+            name=name,
+            dims=[len(values)],
+            data_type=INT64,
+            fields=[(TENSOR_RAW_DATA, LENGTH_DELIMITED, raw)],
+        )
+
+    @property
+    def external(self) -> bool:
+        return any(
+            number == TENSOR_DATA_LOCATION and value == EXTERNAL
+            for number, _, value in self.fields
+        )
+
+    def int64_values(self) -> Optional[List[int]]:
+        """
+        Values of an int64 tensor, `None` if it is another type or its data is external.
+        """
+        if self.data_type != INT64 or self.external:
+            return None
+        values: List[int] = []
+        for number, wire_type, value in self.fields:
+            if number == TENSOR_RAW_DATA:
+                raw = bytes(value)  # type: ignore
+                return [
+                    int.from_bytes(raw[i : i + 8], "little", signed=True)
+                    for i in range(0, len(raw), 8)
+                ]
+            if number == TENSOR_INT64_DATA and wire_type == VARINT:
+                values.append(_int64(value))  # type: ignore
+            elif number == TENSOR_INT64_DATA:
+                pos = 0
+                while pos < len(value):  # type: ignore
+                    item, pos = decode_varint(value, pos)  # type: ignore
+                    values.append(_int64(item))
+        return values
+
+    def to_bytes(self) -> bytes:
+        packed = b"".join(encode_varint(dim) for dim in self.dims)
+        fields: List[RawField] = (
+            [(TENSOR_DIMS, LENGTH_DELIMITED, packed)] if packed else []
+        )
+        fields.append((TENSOR_DATA_TYPE, VARINT, self.data_type))
+        fields.append((TENSOR_NAME, LENGTH_DELIMITED, self.name.encode()))
+        return encode_fields(fields + self.fields)
+
+
+@dataclass
+class Node:
+    """
+    Node of a graph, its attributes are only decoded when they are needed.
+    """
+
+    op_type: str
+    domain: str
+    inputs: List[str]
+    outputs: List[str]
+    attributes: List[memoryview] = field(default_factory=list)
+    fields: List[RawField] = field(default_factory=list)
+
+    @classmethod
+    def parse(cls, buf: memoryview) -> "Node":
+        node = cls(op_type="", domain="", inputs=[], outputs=[])
+        for number, wire_type, value in iter_fields(buf):
+            if number == NODE_INPUT:
+                node.inputs.append(decode_string(value))
+            elif number == NODE_OUTPUT:
+                node.outputs.append(decode_string(value))
+            elif number == NODE_OP_TYPE:
+                node.op_type = decode_string(value)
+            elif number == NODE_DOMAIN:
+                node.domain = decode_string(value)
+            elif number == NODE_ATTRIBUTE:
+                node.attributes.append(value)  # type: ignore
+            else:
+                node.fields.append((number, wire_type, value))
+        return node
+
+    @property
+    def is_default_domain(self) -> bool:
+        return self.domain in ("", DEFAULT_DOMAIN)
+
+    def attribute(self, name: str) -> Optional[Dict[int, List[Value]]]:
+        """
+        Fields of an attribute by number, `None` if the node does not have it.
+        """
+        for attribute in self.attributes:
+            fields: Dict[int, List[Value]] = {}
+            for number, _, value in iter_fields(attribute):
+                fields.setdefault(number, []).append(value)
+            if decode_string(fields.get(ATTRIBUTE_NAME, [memoryview(b"")])[0]) == name:  # type: ignore
+                return fields
+        return None
+
+    def int_attribute(self, name: str, default: int) -> int:
+        fields = self.attribute(name)
+        return _int64(fields[ATTRIBUTE_I][0]) if fields and ATTRIBUTE_I in fields else default  # type: ignore
+
+    def ints_attribute(self, name: str) -> Optional[List[int]]:
+        fields = self.attribute(name)
+        if fields is None:
+            return None
+        values: List[int] = []
+        for value in fields.get(ATTRIBUTE_INTS, []):
+            if isinstance(value, int):
+                values.append(_int64(value))
+            else:
+                pos = 0
+                while pos < len(value):
+                    item, pos = decode_varint(value, pos)
+                    values.append(_int64(item))
+        return values
+
+    def subgraphs(self) -> List[memoryview]:
+        graphs = []
+        for attribute in self.attributes:
+            for number, _, value in iter_fields(attribute):
+                if number in (ATTRIBUTE_GRAPH, ATTRIBUTE_GRAPHS):
+                    graphs.append(value)
+        return graphs  # type: ignore
+
+    def to_bytes(self) -> bytes:
+        fields: List[RawField] = [
+            (NODE_INPUT, LENGTH_DELIMITED, name.encode()) for name in self.inputs
+        ]
+        fields += [
+            (NODE_OUTPUT, LENGTH_DELIMITED, name.encode()) for name in self.outputs
+        ]
+        fields.append((NODE_OP_TYPE, LENGTH_DELIMITED, self.op_type.encode()))
+        fields += [
+            (NODE_ATTRIBUTE, LENGTH_DELIMITED, value) for value in self.attributes
+        ]
+        if self.domain:
+            fields.append((NODE_DOMAIN, LENGTH_DELIMITED, self.domain.encode()))
+        return encode_fields(fields + self.fields)
+
+
+def _subgraph_names(buf: memoryview, names: Set[str]) -> None:
+    """
+    Collect every value used by the nodes of a subgraph, they may come from the outer graph.
+    """
+    for number, _, value in iter_fields(buf):
+        if number == GRAPH_NODE:
+            node = Node.parse(value)  # type: ignore
+            names.update(node.inputs)
+            for subgraph in node.subgraphs():
+                _subgraph_names(subgraph, names)
+
+
+def _value_info_name(buf: memoryview) -> str:
+    for number, _, value in iter_fields(buf):
+        if number == VALUE_INFO_NAME:
+            return decode_string(value)
+    return ""
+
+
+@dataclass
+class Graph:
+    """
+    Editable main graph of a model, fields that are not optimized are kept untouched.
+    """
+
+    nodes: List[Node] = field(default_factory=list)
+    initializers: Dict[str, Tensor] = field(default_factory=dict)
+    inputs: List[Tuple[str, memoryview]] = field(default_factory=list)
+    outputs: List[Tuple[str, memoryview]] = field(default_factory=list)
+    value_info: List[Tuple[str, memoryview]] = field(default_factory=list)
+    fields: List[RawField] = field(default_factory=list)
+    # Values referenced from the subgraphs, they are never renamed nor removed
+    pinned: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def parse(cls, buf: memoryview) -> "Graph":
+        graph = cls()
+        for number, wire_type, value in iter_fields(buf):
+            if number == GRAPH_NODE:
+                node = Node.parse(value)  # type: ignore
+                for subgraph in node.subgraphs():
+                    _subgraph_names(subgraph, graph.pinned)
+                graph.nodes.append(node)
+            elif number == GRAPH_INITIALIZER:
+                tensor = Tensor.parse(value)  # type: ignore
+                graph.initializers[tensor.name] = tensor
+            elif number == GRAPH_INPUT:
+                graph.inputs.append((_value_info_name(value), value))  # type: ignore
+            elif number == GRAPH_OUTPUT:
+                graph.outputs.append((_value_info_name(value), value))  # type: ignore
+            elif number == GRAPH_VALUE_INFO:
+                graph.value_info.append((_value_info_name(value), value))  # type: ignore
+            else:
+                graph.fields.append((number, wire_type, value))
+        return graph
+
+    @property
+    def output_names(self) -> Set[str]:
+        return {name for name, _ in self.outputs}
+
+    def consumers(self) -> Counter:
+        counts: Counter = Counter()
+        for node in self.nodes:
+            counts.update(name for name in node.inputs if name)
+        return counts
+
+    def constant(self, name: str) -> Optional[Tensor]:
+        """
+        Initializer with a given name, unless it is also an input that can override it.
+        """
+        if any(name == input_name for input_name, _ in self.inputs):
+            return None
+        return self.initializers.get(name)
+
+    def producers(self) -> Dict[str, Node]:
+        return {name: node for node in self.nodes for name in node.outputs if name}
+
+    def rename(self, old: str, new: str) -> None:
+        """
+        Rename a value everywhere it is used or produced.
+        """
+        for node in self.nodes:
+            node.inputs = [new if name == old else name for name in node.inputs]
+            node.outputs = [new if name == old else name for name in node.outputs]
+        self.value_info = [
+            (name, info) for name, info in self.value_info if name != old
+        ]
+
+    def to_bytes(self) -> bytes:
+        fields: List[RawField] = list(self.fields)
+        fields += [
+            (GRAPH_NODE, LENGTH_DELIMITED, node.to_bytes()) for node in self.nodes
+        ]
+        fields += [
+            (GRAPH_INITIALIZER, LENGTH_DELIMITED, tensor.to_bytes())
+            for tensor in self.initializers.values()
+        ]
+        fields += [(GRAPH_INPUT, LENGTH_DELIMITED, info) for _, info in self.inputs]
+        fields += [(GRAPH_OUTPUT, LENGTH_DELIMITED, info) for _, info in self.outputs]
+        fields += [
+            (GRAPH_VALUE_INFO, LENGTH_DELIMITED, info) for _, info in self.value_info
+        ]
+        return encode_fields(fields)
+
+
+def fold_constants(graph: Graph, opset: int) -> int:
+    """
+    Turn `Constant` nodes into initializers, and fold the operators that only change the shape
+    of a constant, e.g. `Reshape` of a weight, or that read it, e.g. `Shape`.
+
+    Returns:
+        int: number of folded nodes
+    """
+    folded = 0
+    kept = []
+    for node in graph.nodes:
+        tensor = _fold(graph, node, opset)
+        if tensor is None:
+            kept.append(node)
+            continue
+        graph.initializers[tensor.name] = tensor
+        folded += 1
+    graph.nodes = kept
+    return folded
+
+
+def _fold(graph: Graph, node: Node, opset: int) -> Optional[Tensor]:
+    if not node.is_default_domain or len(node.outputs) != 1:
+        return None
+    output = node.outputs[0]
+    if output in graph.pinned or output in graph.output_names:
+        return None
+
+    if node.op_type == "Constant":
+        fields = node.attribute("value")
+        if fields is None or ATTRIBUTE_T not in fields:
+            return None
+        return replace(Tensor.parse(fields[ATTRIBUTE_T][0]), name=output)  # type: ignore
+
+    inputs = [graph.constant(name) for name in node.inputs if name]
+    if not inputs or any(tensor is None for tensor in inputs):
+        return None
+    data: Tensor = inputs[0]  # type: ignore
+    if node.op_type == "Shape":
+        if len(node.attributes) > 0:  # `start` and `end`
+            return None
+        return Tensor.from_int64(output, data.dims)
+    if node.op_type not in SHAPE_OPERATORS:
+        return None
+    dims = _folded_dims(node, data, inputs[1:], opset)  # type: ignore
+    if dims is None:
+        return None
+    return replace(data, name=output, dims=dims, fields=list(data.fields))
+
+
+def _folded_dims(
+    node: Node, data: Tensor, extra: List[Tensor], opset: int
+) -> Optional[List[int]]:
+    dims = data.dims
+    if node.op_type == "Identity":
+        return list(dims)
+    if node.op_type == "Reshape":
+        shape = extra[0].int64_values() if extra else None
+        if shape is None or 0 in shape or shape.count(-1) > 1:
+            return None
+        if -1 in shape:
+            known = _product([dim for dim in shape if dim != -1])
+            if known == 0 or _product(dims) % known:
+                return None
+            shape = [_product(dims) // known if dim == -1 else dim for dim in shape]
+        return shape if _product(shape) == _product(dims) else None
+    if node.op_type == "Flatten":
+        axis = node.int_attribute("axis", 1)
+        axis = axis + len(dims) if axis < 0 else axis
+        return [_product(dims[:axis]), _product(dims[axis:])]
+
+    # Squeeze and Unsqueeze take the axes as an input since opset 13
+    if opset >= 13 and extra:
+        axes = extra[0].int64_values()
+        if axes is None:
+            return None
+    elif opset >= 13:
+        axes = None
+    else:
+        axes = node.ints_attribute("axes")
+    if node.op_type == "Squeeze":
+        if axes is None:
+            return [dim for dim in dims if dim != 1]
+        axes = [axis + len(dims) if axis < 0 else axis for axis in axes]
+        if any(dims[axis] != 1 for axis in axes):
+            return None
+        return [dim for i, dim in enumerate(dims) if i not in axes]
+    if axes is None:
+        return None
+    rank = len(dims) + len(axes)
+    axes = sorted(axis + rank if axis < 0 else axis for axis in axes)
+    result = list(dims)
+    for axis in axes:
+        result.insert(axis, 1)
+    return result
+
+
+def eliminate_identities(graph: Graph) -> int:
+    """
+    Remove the `Identity` nodes, connecting their consumers to their input.
+
+    Returns:
+        int: number of removed nodes
+    """
+    removed = 0
+    for node in list(graph.nodes):
+        if node.op_type != "Identity" or not node.is_default_domain:
+            continue
+        if len(node.inputs) != 1 or len(node.outputs) != 1:
+            continue
+        source, target = node.inputs[0], node.outputs[0]
+        if target in graph.pinned:
+            continue
+        if target not in graph.output_names:
+            graph.nodes.remove(node)
+            graph.rename(target, source)
+            removed += 1
+            continue
+        # The output name must be kept, the producer of the input is renamed instead
+        producer = graph.producers().get(source)
+        if (
+            producer is None
+            or source in graph.output_names
+            or source in graph.pinned
+            or graph.consumers()[source] > 1
+        ):
+            continue
+        graph.nodes.remove(node)
+        graph.rename(source, target)
+        removed += 1
+    return removed
+
+
+def eliminate_reshapes(graph: Graph) -> int:
+    """
+    Connect chained `Reshape` nodes to the input of the first one, the last shape is the only one
+    that matters when it does not copy dimensions from its input.
+
+    Returns:
+        int: number of bypassed nodes
+    """
+    bypassed = 0
+    producers = graph.producers()
+    consumers = graph.consumers()
+    for node in graph.nodes:
+        if node.op_type != "Reshape" or not node.is_default_domain:
+            continue
+        inner = producers.get(node.inputs[0])
+        if inner is None or inner.op_type != "Reshape" or not inner.is_default_domain:
+            continue
+        shape = graph.constant(node.inputs[1]) if len(node.inputs) > 1 else None
+        values = shape.int64_values() if shape is not None else None
+        if values is None or 0 in values:
+            continue
+        if (
+            consumers[inner.outputs[0]] != 1
+            or inner.outputs[0] in graph.output_names
+            or inner.outputs[0] in graph.pinned
+        ):
+            continue
+        node.inputs[0] = inner.inputs[0]
+        bypassed += 1
+    return bypassed
+
+
+def remove_dead_code(graph: Graph) -> Tuple[int, int]:
+    """
+    Remove the nodes whose outputs are never used, and the initializers nobody reads.
+
+    Returns:
+        Tuple[int, int]: number of removed nodes and initializers
+    """
+    removed_nodes = 0
+    while True:
+        used = set(graph.consumers()) | graph.output_names | graph.pinned
+        alive = [
+            node
+            for node in graph.nodes
+            if any(name in used for name in node.outputs if name)
+        ]
+        if len(alive) == len(graph.nodes):
+            break
+        removed_nodes += len(graph.nodes) - len(alive)
+        graph.nodes = alive
+
+    used = set(graph.consumers()) | graph.output_names | graph.pinned
+    dead = [name for name in graph.initializers if name not in used]
+    for name in dead:
+        del graph.initializers[name]
+    graph.inputs = [(name, info) for name, info in graph.inputs if name not in dead]
+    values = used | {name for node in graph.nodes for name in node.outputs}
+    graph.value_info = [
+        (name, info) for name, info in graph.value_info if name in values
+    ]
+    return removed_nodes, len(dead)
+
+
+def _to_fixed_point(value: float) -> float:
+    if math.isnan(value):
+        return value
+    value = max(FIXED_POINT_MIN, min(FIXED_POINT_MAX, value))
+    return round(value * FIXED_POINT_SCALE) / FIXED_POINT_SCALE
+
+
+def quantize_fixed_point(graph: Graph) -> int:
+    """
+    Round the float initializers to the closest value representable in FP16x16, so the weights
+    the transpiler converts to fixed point are exact, and clamp them to its range.
+
+    Returns:
+        int: number of quantized initializers
+    """
+    quantized = 0
+    for tensor in graph.initializers.values():
+        if tensor.data_type != FLOAT or tensor.external:
+            continue
+        values = array("f")
+        fields: List[RawField] = []
+        for number, wire_type, value in tensor.fields:
+            if number == TENSOR_RAW_DATA:
+                values.frombytes(bytes(value))  # type: ignore
+                if sys.byteorder == "big":
+                    values.byteswap()
+            elif number == TENSOR_FLOAT_DATA and wire_type == LENGTH_DELIMITED:
+                values.frombytes(bytes(value))  # type: ignore
+                if sys.byteorder == "big":
+                    values.byteswap()
+            else:
+                fields.append((number, wire_type, value))
+        if not values:
+            continue
+        rounded = array("f", (_to_fixed_point(value) for value in values))
+        if sys.byteorder == "big":
+            rounded.byteswap()
+        fields.append((TENSOR_RAW_DATA, LENGTH_DELIMITED, rounded.tobytes()))
+        tensor.fields = fields
+        quantized += 1
+    return quantized
+
+
+@dataclass
+class OptimizationReport:
+    """
+    Summary of the model before and after the optimization, and what each pass did.
+    """
+
+    before: OnnxModel
+    after: OnnxModel
+    passes: Dict[str, int] = field(default_factory=dict)
+
+
+def optimize_model(
+    content: bytes, quantize: bool = False
+) -> Tuple[bytes, Dict[str, int]]:
+    """
+    Optimize the main graph of a serialized ONNX model.
+
+    Args:
+        content (bytes): serialized `ModelProto`
+        quantize (bool): round the float weights to fixed point
+
+    Raises:
+        OnnxParseError: if the content is not a valid ONNX model
+
+    Returns:
+        Tuple[bytes, Dict[str, int]]: optimized model and the number of changes of each pass
+    """
+    fields = list(iter_fields(content))
+    ir_version, opset, graph_index = 0, 0, None
+    for index, (number, _, value) in enumerate(fields):
+        if number == MODEL_IR_VERSION:
+            ir_version = value  # type: ignore
+        elif number == MODEL_GRAPH:
+            graph_index = index
+        elif number == MODEL_OPSET_IMPORT:
+            domain, version = "", 0
+            for opset_number, _, opset_value in iter_fields(value):  # type: ignore
+                if opset_number == OPSET_DOMAIN:
+                    domain = decode_string(opset_value)
+                elif opset_number == OPSET_VERSION:
+                    version = opset_value  # type: ignore
+            if domain in ("", DEFAULT_DOMAIN):
+                opset = version
+    if graph_index is None:
+        raise OnnxParseError("The file is not an ONNX model")
+
+    graph = Graph.parse(fields[graph_index][2])  # type: ignore
+    passes: Counter = Counter()
+    for _ in range(MAX_ITERATIONS):
+        changes = 0
+        if ir_version >= MIN_IR_VERSION:
+            folded = fold_constants(graph, opset)
+            passes["constant_folding"] += folded
+            changes += folded
+        identities = eliminate_identities(graph)
+        reshapes = eliminate_reshapes(graph)
+        nodes, initializers = remove_dead_code(graph)
+        passes["identity_elimination"] += identities
+        passes["reshape_elimination"] += reshapes
+        passes["dead_nodes"] += nodes
+        passes["dead_initializers"] += initializers
+        changes += identities + reshapes + nodes + initializers
+        if not changes:
+            break
+    if quantize:
+        passes["quantized_initializers"] = quantize_fixed_point(graph)
+
+    fields[graph_index] = (MODEL_GRAPH, LENGTH_DELIMITED, graph.to_bytes())
+    return encode_fields(fields), dict(passes)
+
+
+def optimize_file(src: str, dst: str, quantize: bool = False) -> OptimizationReport:
+    """
+    Optimize an ONNX file before uploading it.
+
+    Args:
+        src (str): path to the ONNX model
+        dst (str): path where the optimized model is written
+        quantize (bool): round the float weights to fixed point
+
+    Raises:
+        OnnxParseError: if the file is not a valid ONNX model
+
+    Returns:
+        OptimizationReport: the model before and after the optimization
+    """
+    with open(src, "rb") as f:
+        content = f.read()
+    before = parse_model(content)
+    optimized, passes = optimize_model(content, quantize=quantize)
+    with open(dst, "wb") as f:
+        f.write(optimized)
+    return OptimizationReport(
+        before=before, after=parse_model(optimized), passes=passes
+    )
@@ -0,0 +1,86 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Set, TypeVar
+
+from giza.cli.utils.metrics import metrics
+from giza.cli.utils.tracing import Span, tracer
+
+T = TypeVar("T")
+
+
+class Pipeline:
+    """
+    Run the stages of a command, moving to the background the ones that do not depend on the
+    previous stages so they overlap with the API round-trips.
+
+    Each stage is measured as a phase (see `metrics.phase`) and its duration is kept for the report.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.timings: Dict[str, float] = {}
+        self._background: Set[str] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="giza-stage"
+        )
+
+    def __enter__(self) -> "Pipeline":
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+    @contextmanager
+    def stage(self, name: str, parent: Optional[Span] = None) -> Iterator[None]:
+        """
+        Measure a stage running in the current thread.
+
+        Args:
+            name (str): name of the stage
+            parent (Optional[Span]): parent span when running in another thread
+        """
+        start = time.perf_counter()
+        try:
+            with metrics.phase(name, parent=parent):
+                yield
+        finally:
+            with self._lock:
+                self.timings[name] = time.perf_counter() - start
+
+    def submit(self, name: str, func: Callable[..., T], *args: Any) -> "Future[T]":
+        """
+        Run a stage in the background.
+
+        Args:
+            name (str): name of the stage
+            func (Callable[..., T]): function of the stage
+            args: arguments of the function
+
+        Returns:
+            Future[T]: result of the stage, exceptions are raised when it is retrieved
+        """
+        parent = tracer.current_span
+
+        def _run() -> T:
+            with self.stage(name, parent=parent):
+                return func(*args)
+
+        self._background.add(name)
+        return self._executor.submit(_run)
+
+    def report(self) -> str:
+        """
+        Summary of the duration of each stage, in the order they finished.
+
+        Returns:
+            str: one `name duration` entry per stage, background stages are flagged
+        """
+        with self._lock:
+            timings = list(self.timings.items())
+        return ", ".join(
+            f"{name} {seconds:.2f}s"
+            + (" (background)" if name in self._background else "")
+            for name, seconds in timings
+        )
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from giza.cli.schemas.endpoints import Prediction
+from giza.cli.utils.files import atomic_write_json
+from giza.cli.utils.metrics import metrics
+
+# Folder of the on-disk cache, one subfolder per model version
+PREDICTION_CACHE_DIR_VARIABLE = "GIZA_PREDICTION_CACHE_DIR"
+DEFAULT_MEMORY_ENTRIES = 1024
+DEFAULT_DISK_ENTRIES = 10_000
+
+
+def prediction_cache_dir() -> Path:
+    """
+    Folder of the on-disk prediction cache, `~/.giza/predictions` unless
+    `GIZA_PREDICTION_CACHE_DIR` is set.
+    """
+    return Path(
+        os.environ.get(PREDICTION_CACHE_DIR_VARIABLE)
+        or Path.home() / ".giza" / "predictions"
+    )
+
+
+def input_hash(args: Any) -> str:
+    """
+    Canonical hash of the input of a model.
+
+    The input is serialized as JSON with sorted keys and without whitespace, so equal inputs
+    always have the same hash regardless of how they were built.
+
+    Args:
+        args (Any): input of the model, JSON serializable
+
+    Returns:
+        str: hex digest of the input
+    """
+    canonical = json.dumps(
+        args, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class PredictionCache:
+    """
+    Cache of the predictions of a model version, which are deterministic for a given input.
+
+    The most recent entries are kept in memory. When `directory` is set they are also stored on
+    disk, one file per input, and the least recently used files are evicted once there are more
+    than `max_disk_entries`. Only the predictions that ran the model for real are stored, so a
+    cached entry always comes with the `request_id` of its proof.
+    """
+
+    def __init__(
+        self,
+        model_id: int,
+        version_id: int,
+        max_entries: int = DEFAULT_MEMORY_ENTRIES,
+        directory: Optional[Path] = None,
+        max_disk_entries: int = DEFAULT_DISK_ENTRIES,
+    ) -> None:
+        self.model_id = model_id
+        self.version_id = version_id
+        self.max_entries = max(max_entries, 1)
+        self.max_disk_entries = max(max_disk_entries, 1)
+        self.directory = (
+            Path(directory) / f"{model_id}-{version_id}"
+            if directory is not None
+            else None
+        )
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, Prediction]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_entries: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"  # type: ignore
+
+    def get(self, args: Any) -> Optional[Prediction]:
+        """
+        Retrieve the prediction of an input.
+
+        Args:
+            args (Any): input of the model
+
+        Returns:
+            Optional[Prediction]: the cached prediction, None if it is not cached
+        """
+        key = input_hash(args)
+        with self._lock:
+            prediction = self._memory.get(key)
+            if prediction is not None:
+                self._memory.move_to_end(key)
+        if prediction is None and self.directory is not None:
+            prediction = self._load(key)
+            if prediction is not None:
+                self._remember(key, prediction)
+        with self._lock:
+            if prediction is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        metrics.inc(
+            "giza_prediction_cache_total",
+            result="miss" if prediction is None else "hit",
+        )
+        return prediction
+
+    def put(self, args: Any, prediction: Prediction) -> None:
+        """
+        Store the prediction of an input.
+
+        Args:
+            args (Any): input of the model
+            prediction (Prediction): its prediction
+        """
+        key = input_hash(args)
+        self._remember(key, prediction)
+        if self.directory is None:
+            return
+        path = self._path(key)
+        new = not path.exists()
+        atomic_write_json(path, prediction.model_dump())
+        if new:
+            self._trim_disk()
+
+    def report(self) -> str:
+        """
+        Summary of the lookups.
+
+        Returns:
+            str: the number of hits and misses
+        """
+        with self._lock:
+            return f"{self.hits} hits, {self.misses} misses"
+
+    def _remember(self, key: str, prediction: Prediction) -> None:
+        with self._lock:
+            self._memory[key] = prediction
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[Prediction]:
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                prediction = Prediction(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        # The modification time tracks the last use for the eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return prediction
+
+    def _trim_disk(self) -> None:
+        with self._lock:
+            if self._disk_entries is None:
+                self._disk_entries = sum(1 for _ in self.directory.glob("*.json"))  # type: ignore
+            else:
+                self._disk_entries += 1
+            if self._disk_entries <= self.max_disk_entries:
+                return
+            entries = []
+            for path in self.directory.glob("*.json"):  # type: ignore
+                try:
+                    entries.append((path.stat().st_mtime, path))
+                except OSError:
+                    continue
+            entries.sort()
+            # Evict a tenth of the entries at once so the folder is not listed on every write
+            keep = self.max_disk_entries - self.max_disk_entries // 10
+            for _, path in entries[: max(len(entries) - keep, 0)]:
+                path.unlink(missing_ok=True)
+            self._disk_entries = min(len(entries), keep)
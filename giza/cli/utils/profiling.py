@@ -0,0 +1,199 @@
+import json
+import os
+import socket
+import ssl
+import sys
+import threading
+import time
+from collections import Counter
+from functools import wraps
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from giza.cli.utils import echo
+
+DEFAULT_INTERVAL = 0.005
+_MISSING = object()
+# Socket calls that block waiting on the network, both plain and TLS sockets
+_SOCKET_METHODS = ("connect", "send", "sendall", "recv", "recv_into")
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    for path in sys.path:
+        if path and filename.startswith(path):
+            filename = filename[len(path) :].lstrip(os.sep)
+            break
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class Profiler:
+    """
+    Sampling profiler for a whole command execution.
+
+    A background thread samples the stacks of every thread at a fixed interval and aggregates them
+    in the folded format (`frame;frame;frame count`) used by `flamegraph.pl`, speedscope and similar
+    tools. While running, `time.sleep` and the socket calls are wrapped to account for the wall time
+    blocked on them, so slow commands can be split between CPU, network and waiting.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL) -> None:
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.sleep_time = 0.0
+        self.network_time = 0.0
+        self.network_calls = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._patched: List[Tuple[Any, str, Any]] = []
+        self._started_at = 0.0
+        self._cpu_started_at = 0.0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+
+    def _blocking(self, func: Callable, kind: str) -> Callable:
+        """
+        Wrap a blocking call to measure the time spent in it, nested calls are only counted once.
+        """
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if getattr(self._local, "blocked", False):
+                return func(*args, **kwargs)
+            self._local.blocked = True
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._local.blocked = False
+                with self._lock:
+                    if kind == "sleep":
+                        self.sleep_time += elapsed
+                    else:
+                        self.network_time += elapsed
+                        self.network_calls += 1
+
+        return wrapper
+
+    def _patch(self, owner: Any, name: str, kind: str) -> None:
+        self._patched.append((owner, name, owner.__dict__.get(name, _MISSING)))
+        setattr(owner, name, self._blocking(getattr(owner, name), kind))
+
+    def _sample(self) -> None:
+        own_id = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack: List[str] = []
+                current: Optional[FrameType] = frame
+                while current is not None:
+                    stack.append(_frame_label(current))
+                    current = current.f_back
+                if thread_id not in names:
+                    names = {t.ident: t.name for t in threading.enumerate()}
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self) -> None:
+        """
+        Start sampling and measuring the blocking calls.
+        """
+        self._patch(time, "sleep", "sleep")
+        self._patch(socket, "getaddrinfo", "network")
+        for owner in (socket.socket, ssl.SSLSocket):
+            for name in _SOCKET_METHODS:
+                self._patch(owner, name, "network")
+        self._started_at = time.perf_counter()
+        self._cpu_started_at = time.process_time()
+        self._thread = threading.Thread(
+            target=self._sample, name="giza-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop sampling and restore the patched calls.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.wall_time = time.perf_counter() - self._started_at
+        self.cpu_time = time.process_time() - self._cpu_started_at
+        for owner, name, original in reversed(self._patched):
+            if original is _MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self._patched.clear()
+
+    def summary(self, import_time: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Summary of where the wall time went.
+
+        Args:
+            import_time (Optional[float]): seconds spent importing the CLI before the command started
+
+        Returns:
+            Dict[str, Any]: the times in seconds and the number of samples
+        """
+        return {
+            "import_time": import_time,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "network_time": self.network_time,
+            "network_calls": self.network_calls,
+            "sleep_time": self.sleep_time,
+            "samples": self.samples,
+            "interval": self.interval,
+        }
+
+    def write(
+        self, prefix: str, import_time: Optional[float] = None
+    ) -> Tuple[Path, Path]:
+        """
+        Write the folded stacks to `<prefix>.folded` and the summary to `<prefix>.json`.
+
+        Args:
+            prefix (str): path prefix of the generated files
+            import_time (Optional[float]): seconds spent importing the CLI before the command started
+
+        Returns:
+            Tuple[Path, Path]: paths of the folded stacks and the summary
+        """
+        folded_path = Path(f"{prefix}.folded")
+        summary_path = Path(f"{prefix}.json")
+        folded_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(folded_path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        with open(summary_path, "w") as f:
+            json.dump(self.summary(import_time), f, indent=4)
+        return folded_path, summary_path
+
+
+def print_summary(summary: Dict[str, Any]) -> None:
+    """
+    Print the profile summary.
+
+    Args:
+        summary (Dict[str, Any]): summary generated by `Profiler.summary`
+    """
+    echo("Profile summary:")
+    if summary["import_time"] is not None:
+        echo(f"  Import time:  {summary['import_time']:.3f}s")
+    echo(f"  Wall time:    {summary['wall_time']:.3f}s")
+    echo(f"  CPU time:     {summary['cpu_time']:.3f}s")
+    echo(
+        f"  Network time: {summary['network_time']:.3f}s "
+        f"({summary['network_calls']} socket calls)"
+    )
+    echo(f"  Sleep time:   {summary['sleep_time']:.3f}s")
@@ -0,0 +1,267 @@
+import base64
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from requests import Session
+
+from giza.cli.schemas.proofs import Proof
+from giza.cli.utils.files import atomic_write_json, file_hash
+
+# Kept in the output folder, records every proof already mirrored
+MANIFEST_FILE = ".giza-proofs.json"
+SYNC_CHUNK_SIZE = 1024 * 1024
+CHECKSUM_HEADER = "x-amz-checksum-sha256"
+# S3 only sends the checksum of an object when it is asked for
+CHECKSUM_MODE_HEADER = "x-amz-checksum-mode"
+
+
+class ChecksumError(Exception):
+    """
+    Raised when a downloaded proof does not match the checksum or size announced for it.
+    """
+
+
+@dataclass
+class SyncResult:
+    downloaded: List[int] = field(default_factory=list)
+    skipped: List[int] = field(default_factory=list)
+    failed: Dict[int, str] = field(default_factory=dict)
+
+
+class S3Sink:
+    """
+    Copy the mirrored proofs to an S3 compatible bucket.
+
+    `boto3` is only needed when a sink is used, install it with `pip install boto3`.
+    The credentials are read by `boto3` from the environment or its config files.
+    """
+
+    def __init__(
+        self, uri: str, endpoint_url: Optional[str] = None, client: Any = None
+    ) -> None:
+        parsed = urlparse(uri)
+        if parsed.scheme != "s3" or not parsed.netloc:
+            raise ValueError(f"Invalid S3 uri '{uri}', use s3://bucket/prefix")
+        self.bucket = parsed.netloc
+        self.prefix = parsed.path.strip("/")
+        if client is None:
+            try:
+                import boto3
+            except ImportError as e:
+                raise ValueError(
+                    "Syncing to S3 requires `boto3`, install it with `pip install boto3`"
+                ) from e
+            client = boto3.client("s3", endpoint_url=endpoint_url)
+        self.client = client
+
+    def key(self, name: str) -> str:
+        return f"{self.prefix}/{name}" if self.prefix else name
+
+    def upload(self, path: Path, sha256: str) -> str:
+        """
+        Upload a proof, the bucket validates it against its checksum.
+
+        Args:
+            path (Path): local copy of the proof
+            sha256 (str): hex digest of the proof
+
+        Returns:
+            str: uri of the uploaded proof
+        """
+        key = self.key(path.name)
+        with open(path, "rb") as f:
+            self.client.put_object(
+                Bucket=self.bucket,
+                Key=key,
+                Body=f,
+                ChecksumSHA256=base64.b64encode(bytes.fromhex(sha256)).decode(),
+            )
+        return f"s3://{self.bucket}/{key}"
+
+
+def load_manifest(output_dir: Path) -> Dict[str, Any]:
+    """
+    Load the manifest of a mirror.
+
+    Args:
+        output_dir (Path): folder of the mirror
+
+    Returns:
+        Dict[str, Any]: the manifest, with an entry per mirrored proof id in `proofs`
+    """
+    try:
+        with open(output_dir / MANIFEST_FILE) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"proofs": {}}
+    manifest.setdefault("proofs", {})
+    return manifest
+
+
+def download_resumable(session: Session, url: str, path: Path) -> str:
+    """
+    Download a file, resuming from the partial download left by a previous attempt.
+
+    The content is written to `<path>.part` and moved to `path` once its size and checksum
+    are validated against the `Content-Length`/`Content-Range` and `x-amz-checksum-sha256`
+    headers, when the server sends them. A `.part` left complete by an attempt that stopped
+    before moving it is answered with a 416, it is moved into place if its size matches.
+
+    Args:
+        session (Session): session used for the download
+        url (str): url of the file, usually presigned
+        path (Path): destination of the file
+
+    Raises:
+        HTTPError: if the download fails
+        ChecksumError: if the content does not match what the server announced
+
+    Returns:
+        str: hex sha256 of the file
+    """
+    part = path.with_name(path.name + ".part")
+    offset = part.stat().st_size if part.exists() else 0
+    headers = {CHECKSUM_MODE_HEADER: "ENABLED"}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+    with session.get(url, headers=headers, stream=True) as response:
+        if offset and response.status_code == 416:
+            # Nothing left to download, the server only sends the size with `bytes */<size>`
+            total = response.headers.get("Content-Range", "").rpartition("/")[2]
+            if total != str(offset):
+                part.unlink(missing_ok=True)
+                raise ChecksumError(
+                    f"{path.name}: the partial download does not match the file"
+                )
+            os.replace(part, path)
+            return file_hash(path)
+        response.raise_for_status()
+        if response.status_code != 206:
+            # The server sent the whole file
+            offset = 0
+        total = response.headers.get("Content-Range", "").rpartition("/")[2]
+        length = response.headers.get("Content-Length")
+        expected_size: Optional[int] = None
+        if total.isdigit():
+            expected_size = int(total)
+        elif length is not None and length.isdigit():
+            expected_size = offset + int(length)
+        # Also the checksum of the whole file for a 206, compared once the file is complete
+        expected_sha = response.headers.get(CHECKSUM_HEADER)
+        with open(part, "ab" if offset else "wb") as f:
+            for chunk in response.iter_content(chunk_size=SYNC_CHUNK_SIZE):
+                f.write(chunk)
+
+    size = part.stat().st_size
+    sha256 = file_hash(part)
+    mismatch = None
+    if expected_size is not None and size != expected_size:
+        mismatch = f"expected {expected_size} bytes, got {size}"
+    elif expected_sha and base64.b64decode(expected_sha).hex() != sha256:
+        mismatch = "sha256 does not match"
+    if mismatch:
+        part.unlink(missing_ok=True)
+        raise ChecksumError(f"{path.name}: {mismatch}")
+    os.replace(part, path)
+    return sha256
+
+
+def sync_proofs(
+    client: Any,
+    endpoint_id: int,
+    output_dir: Path,
+    workers: int = 4,
+    verify: bool = False,
+    sink: Optional[S3Sink] = None,
+) -> SyncResult:
+    """
+    Mirror the proofs of an endpoint into a folder, downloading only the new ones.
+
+    A proof is skipped when the manifest lists it and its file is still there with the same
+    size, or the same sha256 when `verify` is set. The manifest is saved after each download,
+    so an interrupted sync continues where it stopped.
+
+    Args:
+        client (EndpointsClient): client of the endpoints
+        endpoint_id (int): endpoint whose proofs are mirrored
+        output_dir (Path): folder of the mirror
+        workers (int): number of concurrent downloads
+        verify (bool): hash the mirrored proofs instead of only checking their size
+        sink (Optional[S3Sink]): also copy the new proofs to a bucket
+
+    Returns:
+        SyncResult: ids of the proofs downloaded, skipped and failed
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    manifest["endpoint_id"] = endpoint_id
+    entries: Dict[str, Dict[str, Any]] = manifest["proofs"]
+    lock = threading.Lock()
+    result = SyncResult()
+
+    def _is_mirrored(proof: Proof) -> bool:
+        entry = entries.get(str(proof.id))
+        if entry is None:
+            return False
+        path = output_dir / entry["file"]
+        if not path.exists() or path.stat().st_size != entry["size"]:
+            return False
+        if verify and file_hash(path) != entry["sha256"]:
+            return False
+        return sink is None or entry.get("sink") is not None
+
+    def _mirror(proof: Proof) -> None:
+        path = output_dir / f"{proof.id}.proof"
+        entry = entries.get(str(proof.id))
+        if (
+            entry is not None
+            and path.exists()
+            and path.stat().st_size == entry["size"]
+            and file_hash(path) == entry["sha256"]
+        ):
+            # Only missing from the sink
+            sha256 = entry["sha256"]
+        else:
+            url = client.get_proof_download_url(endpoint_id, proof.id)
+            sha256 = download_resumable(client.session, url, path)
+        entry = {
+            "file": path.name,
+            "size": path.stat().st_size,
+            "sha256": sha256,
+            "request_id": proof.request_id,
+            "created_date": proof.created_date.isoformat(),
+        }
+        if sink is not None:
+            entry["sink"] = sink.upload(path, sha256)
+        with lock:
+            entries[str(proof.id)] = entry
+            atomic_write_json(output_dir / MANIFEST_FILE, manifest, mode=0o644)
+
+    pending = []
+    for proof in client.list_proofs(endpoint_id).root:
+        if _is_mirrored(proof):
+            result.skipped.append(proof.id)
+        else:
+            pending.append(proof)
+
+    with ThreadPoolExecutor(
+        max_workers=max(workers, 1), thread_name_prefix="giza-sync"
+    ) as executor:
+        futures = {executor.submit(_mirror, proof): proof.id for proof in pending}
+        for future in as_completed(futures):
+            proof_id = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                result.failed[proof_id] = str(e)
+            else:
+                result.downloaded.append(proof_id)
+
+    atomic_write_json(output_dir / MANIFEST_FILE, manifest, mode=0o644)
+    return result
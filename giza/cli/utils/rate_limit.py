@@ -0,0 +1,421 @@
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from math import ceil
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+from giza.cli.utils import echo
+from giza.cli.utils.metrics import metrics
+
+RATE_LIMIT_VARIABLE = "GIZA_RATE_LIMIT"
+RATE_LIMIT_BURST_VARIABLE = "GIZA_RATE_LIMIT_BURST"
+RATE_LIMIT_MAX_WAIT_VARIABLE = "GIZA_RATE_LIMIT_MAX_WAIT"
+
+RETRY_AFTER_HEADER = "Retry-After"
+RATE_LIMIT_LIMIT_HEADER = "X-RateLimit-Limit"
+RATE_LIMIT_REMAINING_HEADER = "X-RateLimit-Remaining"
+RATE_LIMIT_RESET_HEADER = "X-RateLimit-Reset"
+
+DEFAULT_MAX_WAIT = 3600.0
+# Used when the API answers 429 without telling us how long to wait
+DEFAULT_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+# The last requests are spread until the reset once the remaining quota is below
+# this fraction of the limit, or below LOW_QUOTA_REMAINING when the limit is unknown
+LOW_QUOTA_FRACTION = 0.1
+LOW_QUOTA_REMAINING = 5
+# Reset values above this are epoch timestamps, below are seconds from now
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a header or environment value as a float.
+
+    Args:
+        value (Optional[str]): value to parse
+
+    Returns:
+        Optional[float]: the parsed value or None if it is missing or invalid
+    """
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse the `Retry-After` header, which can be either seconds or an HTTP date.
+
+    Args:
+        value (Optional[str]): value of the header
+
+    Returns:
+        Optional[float]: seconds to wait or None if it could not be parsed
+    """
+    seconds = _parse_float(value)
+    if seconds is not None:
+        return max(seconds, 0.0)
+    if value is None:
+        return None
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket used to pace the requests sent to the API.
+
+    When `rate` is `None` the bucket does not throttle by itself, but it still
+    honors the pauses requested with `pause_for`.
+    """
+
+    def __init__(self, rate: Optional[float] = None, capacity: Optional[float] = None):
+        self.rate = rate if rate and rate > 0 else None
+        self.capacity = capacity if capacity and capacity > 0 else (self.rate or 1.0)
+        self._tokens = self.capacity
+        self._paused_until = 0.0
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self.rate is not None:
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def acquire(self) -> float:
+        """
+        Take a token from the bucket, blocking until one is available.
+
+        Returns:
+            float: seconds spent waiting for the token
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self.rate is None:
+                    return waited
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                else:
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def pause_for(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for the specified amount of seconds.
+
+        Args:
+            seconds (float): seconds to pause the bucket
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+
+def quota_scope(request: PreparedRequest) -> str:
+    """
+    Endpoint of the API a request counts against, its method and path with the ids replaced.
+
+    Args:
+        request (PreparedRequest): request to the API
+
+    Returns:
+        str: scope of the request, e.g. `POST /api/v1/models/{id}/versions/{id}/jobs`
+    """
+    path = urlparse(request.url or "").path
+    segments = ["{id}" if s.isdigit() else s for s in path.split("/")]
+    return f"{request.method} {'/'.join(segments)}"
+
+
+@dataclass
+class _Quota:
+    remaining: float
+    limit: Optional[float]
+    reset_at: float
+    sent_at: float = 0.0
+
+
+class QuotaTracker:
+    """
+    Thread safe record of the quota the API reports for each endpoint.
+
+    The quota of an endpoint only delays the requests to that endpoint. Requests are sent as
+    they come while there is plenty of quota left. Once it is nearly used up, the last ones
+    are spread until the quota resets, and once it is used up they wait for the reset.
+    """
+
+    def __init__(self) -> None:
+        self._quotas: Dict[str, _Quota] = {}
+        self._lock = threading.Lock()
+
+    def update(self, scope: str, headers: Mapping[str, str]) -> None:
+        """
+        Record the quota reported in the headers of a response.
+
+        Args:
+            scope (str): endpoint of the request, see `quota_scope`
+            headers (Mapping[str, str]): headers of the API response
+        """
+        remaining = _parse_float(headers.get(RATE_LIMIT_REMAINING_HEADER))
+        reset = _parse_float(headers.get(RATE_LIMIT_RESET_HEADER))
+        if remaining is None or reset is None:
+            return
+        if reset > _EPOCH_THRESHOLD:
+            reset = reset - time.time()
+        now = time.monotonic()
+        with self._lock:
+            previous = self._quotas.get(scope)
+            self._quotas[scope] = _Quota(
+                remaining=remaining,
+                limit=_parse_float(headers.get(RATE_LIMIT_LIMIT_HEADER)),
+                reset_at=now + max(reset, 0.0),
+                sent_at=previous.sent_at if previous is not None else 0.0,
+            )
+
+    def pause(self, scope: str, seconds: float) -> None:
+        """
+        Hold the requests to an endpoint, after the API rejected one with a 429.
+
+        Args:
+            scope (str): endpoint of the request, see `quota_scope`
+            seconds (float): seconds to hold the requests
+        """
+        with self._lock:
+            self._quotas[scope] = _Quota(
+                remaining=0, limit=None, reset_at=time.monotonic() + seconds
+            )
+
+    def delay(self, scope: str) -> Tuple[float, bool]:
+        """
+        Time to wait before sending a request to an endpoint.
+
+        Args:
+            scope (str): endpoint of the request, see `quota_scope`
+
+        Returns:
+            Tuple[float, bool]: seconds to wait and whether the quota is used up
+        """
+        now = time.monotonic()
+        with self._lock:
+            quota = self._quotas.get(scope)
+            if quota is None:
+                return 0.0, False
+            window = quota.reset_at - now
+            if window <= 0:
+                # The quota has been reset
+                del self._quotas[scope]
+                return 0.0, False
+            if quota.remaining <= 0:
+                return window, True
+            low = (
+                max(quota.limit * LOW_QUOTA_FRACTION, 1.0)
+                if quota.limit
+                else LOW_QUOTA_REMAINING
+            )
+            if quota.remaining > low:
+                return 0.0, False
+            # Spread the last requests until the reset
+            return max(quota.sent_at + window / quota.remaining - now, 0.0), False
+
+    def sent(self, scope: str) -> None:
+        """
+        Record that a request to an endpoint was sent.
+
+        Args:
+            scope (str): endpoint of the request, see `quota_scope`
+        """
+        with self._lock:
+            quota = self._quotas.get(scope)
+            if quota is not None:
+                quota.sent_at = time.monotonic()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    Transport adapter that paces requests with a `TokenBucket`, follows the quota of each
+    endpoint and queues the requests rejected with a 429 until the API allows them again.
+
+    No request waits more than `max_wait` for the quota, when it would the request is not
+    sent and a 429 response is returned instead.
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        quotas: Optional[QuotaTracker] = None,
+        **kwargs,
+    ) -> None:
+        self.bucket = bucket
+        self.max_wait = max_wait
+        self.quotas = quotas if quotas is not None else QuotaTracker()
+        super().__init__(**kwargs)
+
+    def _rewind(self, request: PreparedRequest) -> bool:
+        """
+        Make sure the body of the request can be sent again.
+
+        Args:
+            request (PreparedRequest): request to resend
+
+        Returns:
+            bool: whether the request can be replayed
+        """
+        body = request.body
+        if body is None or isinstance(body, bytes | str):
+            return True
+        if hasattr(body, "seek") and hasattr(body, "seekable") and body.seekable():
+            body.seek(0)
+            return True
+        return False
+
+    def _quota_exceeded(self, request: PreparedRequest, delay: float) -> Response:
+        """
+        Build the response of a request held back because the quota is used up.
+        """
+        response = Response()
+        response.status_code = 429
+        response.reason = "Too Many Requests"
+        response.url = request.url or ""
+        response.request = request
+        response.headers[RETRY_AFTER_HEADER] = str(ceil(delay))
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(
+            {
+                "detail": f"Quota used up, it resets in {delay:.0f}s which is more "
+                f"than {RATE_LIMIT_MAX_WAIT_VARIABLE} ({self.max_wait:.0f}s)"
+            }
+        ).encode()
+        return response
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:  # type: ignore
+        scope = quota_scope(request)
+        waited = 0.0
+        backoff = DEFAULT_BACKOFF
+        while True:
+            delay, exhausted = self.quotas.delay(scope)
+            if delay and waited + delay > self.max_wait:
+                if exhausted:
+                    echo.warning(
+                        f"Quota of {scope} used up for {delay:.0f}s, "
+                        f"more than {RATE_LIMIT_MAX_WAIT_VARIABLE} ({self.max_wait:.0f}s)"
+                    )
+                    return self._quota_exceeded(request, delay)
+                # Spreading the last requests would take too long, let the API decide
+                delay = 0.0
+            if delay:
+                if delay >= 1:
+                    echo.warning(
+                        f"Quota of {scope} nearly used up, request delayed {delay:.1f}s"
+                    )
+                time.sleep(delay)
+                metrics.inc("giza_http_rate_limit_wait_seconds_total", delay)
+                waited += delay
+
+            wait = self.bucket.acquire()
+            if wait:
+                metrics.inc("giza_http_rate_limit_wait_seconds_total", wait)
+            waited += wait
+            self.quotas.sent(scope)
+            response = super().send(request, **kwargs)
+            self.quotas.update(scope, response.headers)
+
+            if response.status_code != 429:
+                return response
+
+            delay = parse_retry_after(response.headers.get(RETRY_AFTER_HEADER))
+            if delay is None:
+                delay = backoff
+                backoff = min(backoff * 2, MAX_BACKOFF)
+            if waited + delay > self.max_wait or not self._rewind(request):
+                return response
+
+            echo.warning(
+                f"Rate limited by the API, request queued for {delay:.1f}s "
+                f"({request.method} {request.path_url})"
+            )
+            metrics.inc("giza_http_retries_total", reason="rate_limit")
+            response.close()
+            self.quotas.pause(scope, delay)
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_quota_trackers: Dict[str, QuotaTracker] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(host: str) -> TokenBucket:
+    """
+    Retrieve the token bucket for a host, shared by all the clients of the process.
+
+    The rate can be configured with `GIZA_RATE_LIMIT` (requests per second) and
+    `GIZA_RATE_LIMIT_BURST` (max burst of requests).
+
+    Args:
+        host (str): host of the API
+
+    Returns:
+        TokenBucket: the bucket used for the host
+    """
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = TokenBucket(
+                rate=_parse_float(os.environ.get(RATE_LIMIT_VARIABLE)),
+                capacity=_parse_float(os.environ.get(RATE_LIMIT_BURST_VARIABLE)),
+            )
+        return _limiters[host]
+
+
+def get_quota_tracker(host: str) -> QuotaTracker:
+    """
+    Retrieve the quotas of a host, shared by all the clients of the process.
+
+    Args:
+        host (str): host of the API
+
+    Returns:
+        QuotaTracker: the quotas of the host
+    """
+    with _limiters_lock:
+        return _quota_trackers.setdefault(host, QuotaTracker())
+
+
+def get_rate_limited_adapter(host: str) -> RateLimitedAdapter:
+    """
+    Build an adapter for a host using the shared bucket of the host.
+
+    The maximum time a request can be queued is configured with `GIZA_RATE_LIMIT_MAX_WAIT`.
+
+    Args:
+        host (str): host of the API
+
+    Returns:
+        RateLimitedAdapter: adapter to mount in the session
+    """
+    max_wait = _parse_float(os.environ.get(RATE_LIMIT_MAX_WAIT_VARIABLE))
+    return RateLimitedAdapter(
+        get_rate_limiter(host),
+        max_wait=max_wait if max_wait is not None else DEFAULT_MAX_WAIT,
+        quotas=get_quota_tracker(host),
+    )
@@ -0,0 +1,158 @@
+import json
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from giza.cli.utils.files import atomic_write_json
+
+# Folder of the journals, one json file per workflow that did not finish
+RUNS_DIR_VARIABLE = "GIZA_RUNS_DIR"
+
+# Stages of a workflow, in order
+CREATED = "created"
+UPLOADED = "uploaded"
+SUBMITTED = "submitted"
+COMPLETED = "completed"
+
+
+def runs_dir() -> Path:
+    """
+    Folder where the journals are stored, `~/.giza/runs` unless `GIZA_RUNS_DIR` is set.
+    """
+    return Path(os.environ.get(RUNS_DIR_VARIABLE) or Path.home() / ".giza" / "runs")
+
+
+@dataclass
+class Run:
+    """
+    Journal of a long workflow, `transpile` or `prove`, saved after each completed stage
+    so `giza resume` can reattach to it if the process dies.
+    """
+
+    command: str
+    framework: str
+    id: str = ""
+    stage: str = CREATED
+    model_id: Optional[int] = None
+    version_id: Optional[int] = None
+    job_id: Optional[int] = None
+    # Local file uploaded to the version and the presigned url to upload it
+    model_path: Optional[str] = None
+    upload_url: Optional[str] = None
+    uploaded: bool = False
+    output_path: Optional[str] = None
+    # Command specific options needed to finish the workflow, like what to download
+    options: Dict[str, Any] = field(default_factory=dict)
+    created_at: float = 0.0
+    updated_at: float = 0.0
+
+    @property
+    def path(self) -> Path:
+        return runs_dir() / f"{self.id}.json"
+
+    @classmethod
+    def start(cls, command: str, framework: str, **values: Any) -> "Run":
+        """
+        Create the journal of a new workflow.
+
+        Args:
+            command (str): command of the workflow, `transpile` or `prove`
+            framework (str): framework of the workflow
+            values: initial values of the journal
+
+        Returns:
+            Run: the saved journal
+        """
+        now = time.time()
+        run = cls(
+            command=command,
+            framework=framework,
+            id=f"{command}-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}",
+            created_at=now,
+            **values,
+        )
+        run.save()
+        return run
+
+    def update(self, **values: Any) -> None:
+        """
+        Record the progress of the workflow.
+
+        Args:
+            values: fields to update
+        """
+        for name, value in values.items():
+            setattr(self, name, value)
+        self.save()
+
+    def save(self) -> None:
+        self.updated_at = time.time()
+        atomic_write_json(self.path, asdict(self))
+
+    def finish(self) -> None:
+        """
+        Remove the journal, the workflow does not need to be resumed.
+        """
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def load_run(run_id: str) -> Optional[Run]:
+    """
+    Load the journal of a workflow.
+
+    Args:
+        run_id (str): id of the workflow
+
+    Returns:
+        Optional[Run]: the journal, None if it does not exist or can not be read
+    """
+    try:
+        with open(runs_dir() / f"{run_id}.json") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    known = {f.name for f in fields(Run)}
+    try:
+        return Run(**{k: v for k, v in data.items() if k in known})
+    except TypeError:
+        return None
+
+
+def list_runs() -> List[Run]:
+    """
+    Journals of the workflows that did not finish, the most recent first.
+
+    Returns:
+        List[Run]: the journals
+    """
+    runs = [load_run(path.stem) for path in runs_dir().glob("*.json")]
+    return sorted(
+        (run for run in runs if run is not None),
+        key=lambda run: run.updated_at,
+        reverse=True,
+    )
+
+
+def find_runs(command: str, **values: Any) -> List[Run]:
+    """
+    Journals of the workflows of a command matching some values, like the job they submitted.
+
+    Args:
+        command (str): command of the workflows, `transpile` or `prove`
+        values: fields the journals must match
+
+    Returns:
+        List[Run]: the matching journals, the most recent first
+    """
+    return [
+        run
+        for run in list_runs()
+        if run.command == command
+        and all(getattr(run, name) == value for name, value in values.items())
+    ]
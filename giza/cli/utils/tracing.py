@@ -0,0 +1,302 @@
+import atexit
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+from requests import PreparedRequest, Response, Session
+
+from giza.cli import __version__
+from giza.cli.utils import REQUEST_ID_HEADER, echo
+from giza.cli.utils.files import file_lock
+from giza.cli.utils.misc import endpoint_template
+
+TRACES_FILE_VARIABLE = "GIZA_TRACES_FILE"
+OTLP_ENDPOINT_VARIABLE = "OTEL_EXPORTER_OTLP_ENDPOINT"
+OTLP_TRACES_ENDPOINT_VARIABLE = "OTEL_EXPORTER_OTLP_TRACES_ENDPOINT"
+SERVICE_NAME = "giza-cli"
+TRACEPARENT_HEADER = "traceparent"
+OTLP_TIMEOUT = 5
+
+
+class SpanKind(IntEnum):
+    """
+    Kind of the span, values match the OTLP protocol.
+    """
+
+    INTERNAL = 1
+    CLIENT = 3
+
+
+class StatusCode(IntEnum):
+    """
+    Status of the span, values match the OTLP protocol.
+    """
+
+    UNSET = 0
+    OK = 1
+    ERROR = 2
+
+
+def _attribute_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+@dataclass
+class Span:
+    """
+    Unit of work of a trace, e.g. a phase of a command or an HTTP request.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    kind: SpanKind = SpanKind.INTERNAL
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start_time: int = field(default_factory=time.time_ns)
+    end_time: Optional[int] = None
+    status: StatusCode = StatusCode.UNSET
+    status_message: str = ""
+
+    @property
+    def traceparent(self) -> str:
+        """
+        W3C trace context header so the API can attach its spans to this trace.
+        """
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        self.status = StatusCode.ERROR
+        self.status_message = message
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """
+        Render the span in the OTLP/JSON format.
+        """
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": int(self.kind),
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time or time.time_ns()),
+            "attributes": [
+                {"key": key, "value": _attribute_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": {"code": int(self.status)},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+class Tracer:
+    """
+    Minimal OpenTelemetry compatible tracer.
+
+    Tracing is enabled by setting `OTEL_EXPORTER_OTLP_ENDPOINT` (or `OTEL_EXPORTER_OTLP_TRACES_ENDPOINT`)
+    and/or `GIZA_TRACES_FILE`. When the process exits the spans are sent to the collector using OTLP/HTTP
+    with json encoding. If no collector is configured or it can not be reached the spans are appended to
+    `GIZA_TRACES_FILE` (defaults to `~/.giza/traces.jsonl`), one OTLP/JSON request per line, which is the
+    format read by the `otlpjsonfile` receiver of the collector.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._finished: List[Span] = []
+        self._export_registered = False
+
+    def _stack(self) -> List[Span]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @property
+    def current_span(self) -> Optional[Span]:
+        """
+        Active span of the current thread, if any.
+        """
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        parent: Optional[Span] = None,
+        **attributes: Any,
+    ) -> Iterator[Optional[Span]]:
+        """
+        Start a span as a child of the active one, yields `None` when tracing is disabled.
+
+        Args:
+            name (str): name of the span
+            kind (SpanKind): kind of the span. Defaults to INTERNAL.
+            parent (Optional[Span]): explicit parent, needed when the span is created in another thread.
+            attributes: attributes of the span
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        parent = parent or self.current_span
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            kind=kind,
+            attributes={k: v for k, v in attributes.items() if v is not None},
+        )
+        stack = self._stack()
+        stack.append(span)
+        try:
+            yield span
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                span.set_error(f"Exit code {e.code}")
+            raise
+        except BaseException as e:
+            span.set_error(f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            stack.remove(span)
+            span.end_time = time.time_ns()
+            with self._lock:
+                self._finished.append(span)
+
+    def configure(self) -> None:
+        """
+        Enable the tracer if an exporter is configured and export the spans when the process exits.
+        """
+        if self._endpoint() or os.environ.get(TRACES_FILE_VARIABLE):
+            self.enabled = True
+            if not self._export_registered:
+                atexit.register(self.export)
+                self._export_registered = True
+
+    def _endpoint(self) -> Optional[str]:
+        endpoint = os.environ.get(OTLP_TRACES_ENDPOINT_VARIABLE)
+        if endpoint:
+            return endpoint
+        endpoint = os.environ.get(OTLP_ENDPOINT_VARIABLE)
+        return f"{endpoint.rstrip('/')}/v1/traces" if endpoint else None
+
+    def _payload(self, spans: List[Span]) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": _attribute_value(SERVICE_NAME),
+                            },
+                            {
+                                "key": "service.version",
+                                "value": _attribute_value(__version__),
+                            },
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "giza.cli", "version": __version__},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def export(self) -> None:
+        """
+        Send the finished spans to the collector, falling back to the traces file.
+        """
+        with self._lock:
+            spans, self._finished = self._finished, []
+        if not spans:
+            return
+        payload = self._payload(spans)
+
+        endpoint = self._endpoint()
+        if endpoint:
+            try:
+                response = requests.post(endpoint, json=payload, timeout=OTLP_TIMEOUT)
+                response.raise_for_status()
+                return
+            except requests.RequestException as e:
+                echo.warning(
+                    f"Could not export traces to {endpoint}, saving them locally: {e}"
+                )
+
+        path = Path(
+            os.environ.get(TRACES_FILE_VARIABLE)
+            or Path.home() / ".giza" / "traces.jsonl"
+        )
+        with file_lock(f"{path}.lock"), open(path, "a") as f:
+            f.write(json.dumps(payload) + "\n")
+
+
+class TracedSession(Session):
+    """
+    Session that records every request as a client span.
+
+    The trace context is only propagated to the API, presigned urls are left untouched
+    as extra headers could break their signature.
+    """
+
+    def __init__(self, propagate_to: Optional[str] = None) -> None:
+        super().__init__()
+        self.propagate_to = propagate_to
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:  # type: ignore
+        if not tracer.enabled:
+            return super().send(request, **kwargs)
+
+        url = (request.url or "").split("?")[0]
+        is_api = self.propagate_to is not None and url.startswith(self.propagate_to)
+        endpoint = endpoint_template(request.path_url.split("?")[0])
+        with tracer.span(
+            f"{request.method} {endpoint if is_api else 'presigned'}",
+            kind=SpanKind.CLIENT,
+            **{"http.request.method": request.method, "url.full": url},
+        ) as span:
+            assert span is not None
+            if is_api:
+                request.headers[TRACEPARENT_HEADER] = span.traceparent
+            response = super().send(request, **kwargs)
+            span.set_attribute("http.response.status_code", response.status_code)
+            span.set_attribute(
+                "http.request_id", response.headers.get(REQUEST_ID_HEADER)
+            )
+            if response.status_code >= 400:
+                span.set_error(f"HTTP {response.status_code}")
+            return response
+
+
+# Provided an instance for ease of use
+tracer = Tracer()
@@ -0,0 +1,174 @@
+import datetime
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from giza.cli.schemas.verify import VerificationRecord, VerifyResponse
+from giza.cli.utils.files import atomic_write_json
+from giza.cli.utils.metrics import metrics
+
+# Folder of the ledger, one subfolder per framework and verifier version
+VERIFICATION_LEDGER_DIR_VARIABLE = "GIZA_VERIFICATION_LEDGER_DIR"
+# Version of the verifier the results are valid for, changing it verifies every proof again.
+# The API does not report it, so the ledger is only used when it is set
+VERIFIER_VERSION_VARIABLE = "GIZA_VERIFIER_VERSION"
+
+
+def verification_ledger_dir() -> Path:
+    """
+    Folder of the verification ledger, `~/.giza/verifications` unless
+    `GIZA_VERIFICATION_LEDGER_DIR` is set.
+    """
+    return Path(
+        os.environ.get(VERIFICATION_LEDGER_DIR_VARIABLE)
+        or Path.home() / ".giza" / "verifications"
+    )
+
+
+def verifier_version() -> Optional[str]:
+    """
+    Version of the verifier, `GIZA_VERIFIER_VERSION` or None when it is not set.
+    """
+    return os.environ.get(VERIFIER_VERSION_VARIABLE) or None
+
+
+class VerificationLedger:
+    """
+    Local record of the proofs already verified, keyed by the sha256 of the proof.
+
+    A proof verified by a given verifier always gives the same result, so it does not need to be
+    uploaded and verified again. The results are stored per framework and verifier version, one
+    file per proof, so several processes can use the ledger at once.
+
+    The verifications submitted with `--detach` are kept as pending, by job id, until
+    `giza jobs wait` collects them with `collect_verification`.
+    """
+
+    def __init__(
+        self,
+        framework: str,
+        version: Optional[str] = None,
+        directory: Optional[Path] = None,
+    ) -> None:
+        version = version or verifier_version()
+        if not version:
+            raise ValueError(
+                f"The verifier version is unknown, set {VERIFIER_VERSION_VARIABLE}"
+            )
+        self.framework = framework
+        self.version = version
+        self.root = Path(directory or verification_ledger_dir())
+        self.directory = self.root / f"{framework}-{self.version}".lower()
+
+    def _path(self, proof_sha256: str) -> Path:
+        return self.directory / f"{proof_sha256}.json"
+
+    def get(self, proof_sha256: str) -> Optional[VerificationRecord]:
+        """
+        Retrieve the verification of a proof.
+
+        Args:
+            proof_sha256 (str): hex sha256 of the proof
+
+        Returns:
+            Optional[VerificationRecord]: the recorded verification, None if the proof was not
+                verified with this verifier version
+        """
+        try:
+            with open(self._path(proof_sha256)) as f:
+                record: Optional[VerificationRecord] = VerificationRecord(
+                    **json.load(f)
+                )
+        except (OSError, ValueError, TypeError):
+            record = None
+        metrics.inc(
+            "giza_verification_ledger_total",
+            result="miss" if record is None else "hit",
+        )
+        return record
+
+    def record(
+        self,
+        proof_sha256: str,
+        verification: VerifyResponse,
+        job_id: Optional[int] = None,
+    ) -> VerificationRecord:
+        """
+        Store the verification of a proof.
+
+        Args:
+            proof_sha256 (str): hex sha256 of the proof
+            verification (VerifyResponse): result and time of the verification
+            job_id (Optional[int]): verification job that produced the result
+
+        Returns:
+            VerificationRecord: the stored record
+        """
+        record = VerificationRecord(
+            verification=verification.verification,
+            verification_time=verification.verification_time,
+            proof_sha256=proof_sha256,
+            verifier_version=self.version,
+            job_id=job_id,
+            verified_at=datetime.datetime.now(datetime.timezone.utc),
+        )
+        atomic_write_json(
+            self._path(proof_sha256), record.model_dump(mode="json"), mode=0o644
+        )
+        return record
+
+    def submit(self, proof_sha256: str, job_id: int) -> None:
+        """
+        Keep a detached verification job as pending until its result is collected.
+
+        Args:
+            proof_sha256 (str): hex sha256 of the proof
+            job_id (int): verification job of the proof
+        """
+        atomic_write_json(
+            _pending_path(self.root, job_id),
+            {
+                "framework": self.framework,
+                "version": self.version,
+                "proof_sha256": proof_sha256,
+            },
+            mode=0o644,
+        )
+
+
+def _pending_path(root: Path, job_id: int) -> Path:
+    return root / "pending" / f"{job_id}.json"
+
+
+def collect_verification(
+    job_id: int,
+    verification: Optional[VerifyResponse],
+    directory: Optional[Path] = None,
+) -> Optional[VerificationRecord]:
+    """
+    Record the result of a detached verification job, if it is pending in the ledger.
+
+    Args:
+        job_id (int): verification job
+        verification (Optional[VerifyResponse]): result of the job, None if it failed, failed
+            jobs are not recorded as they can fail for reasons other than the proof
+        directory (Optional[Path]): folder of the ledger
+
+    Returns:
+        Optional[VerificationRecord]: the stored record, None if nothing was recorded
+    """
+    path = _pending_path(Path(directory or verification_ledger_dir()), job_id)
+    try:
+        with open(path) as f:
+            pending = json.load(f)
+        ledger = VerificationLedger(
+            pending["framework"], version=pending["version"], directory=directory
+        )
+        proof_sha256 = pending["proof_sha256"]
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    path.unlink(missing_ok=True)
+    if verification is None:
+        return None
+    return ledger.record(proof_sha256, verification, job_id=job_id)
@@ -1,11 +1,14 @@
+import json
 from unittest.mock import patch
 
 from requests import HTTPError
 
 from giza.cli.commands.endpoints import EndpointsClient, cairo
 from giza.cli.frameworks import ezkl
-from giza.cli.schemas.endpoints import Endpoint, EndpointsList
+from giza.cli.schemas.endpoints import Endpoint, EndpointsList, Prediction
+from giza.cli.schemas.logs import Logs
 from giza.cli.schemas.verify import VerifyResponse
+from giza.cli.utils.proof_sync import SyncResult
 from tests.conftest import invoke_cli_runner
 
 
@@ -247,3 +250,290 @@ def test_endpoints_verify():
     assert result.exit_code == 0
     assert "verification" in result.stdout
     assert "True" in result.stdout
+
+
+def _endpoint(is_active=True):
+    return Endpoint(
+        id=1,
+        uri="https://endpoint.giza.io",
+        size="S",
+        model_id=1,
+        version_id=2,
+        is_active=is_active,
+    )
+
+
+def test_endpoints_predict(tmpdir):
+    inputs, output = tmpdir / "inputs.jsonl", tmpdir / "predictions.jsonl"
+    inputs.write("[1]\n\n[2]\n[3]\n")
+
+    def predict(uri, args, job_size, dry_run):
+        if args == [2]:
+            raise HTTPError("boom")
+        return Prediction(result=args, request_id=str(args[0]))
+
+    with patch.object(EndpointsClient, "get", return_value=_endpoint()), patch.object(
+        EndpointsClient, "predict", side_effect=predict
+    ):
+        result = invoke_cli_runner(
+            [
+                "endpoints",
+                "predict",
+                "--endpoint-id",
+                "1",
+                "-i",
+                str(inputs),
+                "-o",
+                str(output),
+                "--concurrency",
+                "2",
+            ],
+            expected_error=True,
+        )
+
+    assert result.exit_code == 1
+    assert "1 predictions failed" in result.stdout
+    lines = [json.loads(line) for line in output.readlines()]
+    assert lines[0] == {"index": 0, "request_id": "1", "result": [1]}
+    assert lines[1] == {"index": 1, "error": "boom"}
+    assert lines[2]["result"] == [3]
+
+
+def test_endpoints_predict_invalid_input(tmpdir):
+    inputs = tmpdir / "inputs.jsonl"
+    inputs.write("[1]\n{not json\n")
+    with patch.object(EndpointsClient, "get", return_value=_endpoint()), patch.object(
+        EndpointsClient, "predict", return_value=Prediction(result=1)
+    ):
+        result = invoke_cli_runner(
+            [
+                "endpoints",
+                "predict",
+                "-e",
+                "1",
+                "-i",
+                str(inputs),
+                "-o",
+                str(tmpdir / "out"),
+            ],
+            expected_error=True,
+        )
+
+    assert result.exit_code == 1
+    assert "Line 2 is not valid JSON" in result.stdout
+
+
+def test_endpoints_predict_missing_input(tmpdir):
+    with patch.object(EndpointsClient, "get", return_value=_endpoint()):
+        result = invoke_cli_runner(
+            [
+                "endpoints",
+                "predict",
+                "-e",
+                "1",
+                "-i",
+                str(tmpdir / "missing.jsonl"),
+                "-o",
+                str(tmpdir / "out"),
+            ],
+            expected_error=True,
+        )
+
+    assert result.exit_code == 1
+    assert "Could not read the inputs" in result.stdout
+    assert not (tmpdir / "out").exists()
+
+
+def test_endpoints_predict_unwritable_output(tmpdir):
+    inputs = tmpdir / "inputs.jsonl"
+    inputs.write("[1]\n")
+    with patch.object(EndpointsClient, "get", return_value=_endpoint()):
+        result = invoke_cli_runner(
+            [
+                "endpoints",
+                "predict",
+                "-e",
+                "1",
+                "-i",
+                str(inputs),
+                "-o",
+                str(tmpdir / "missing" / "out"),
+            ],
+            expected_error=True,
+        )
+
+    assert result.exit_code == 1
+    assert "Could not write the predictions" in result.stdout
+
+
+def test_endpoints_predict_inactive_endpoint(tmpdir):
+    with patch.object(EndpointsClient, "get", return_value=_endpoint(False)):
+        result = invoke_cli_runner(
+            ["endpoints", "predict", "-e", "1", "-o", str(tmpdir / "out")],
+            expected_error=True,
+        )
+
+    assert result.exit_code == 1
+    assert "is not active" in result.stdout
+
+
+def test_endpoints_predict_batched(tmpdir):
+    inputs, output = tmpdir / "inputs.jsonl", tmpdir / "predictions.jsonl"
+    inputs.write("".join(f"[{i}]\n" for i in range(6)))
+
+    def predict_batch(uri, batch, job_size, dry_run):
+        return [Prediction(result=args) for args in batch]
+
+    with patch.object(EndpointsClient, "get", return_value=_endpoint()), patch.object(
+        EndpointsClient, "predict_batch", side_effect=predict_batch
+    ) as mock_batch:
+        result = invoke_cli_runner(
+            [
+                "endpoints",
+                "predict",
+                "-e",
+                "1",
+                "-i",
+                str(inputs),
+                "-o",
+                str(output),
+                "--batch-size",
+                "3",
+                "--batch-window",
+                "1",
+            ],
+        )
+
+    assert result.exit_code == 0
+    assert [len(call.args[1]) for call in mock_batch.call_args_list] == [3, 3]
+    assert [json.loads(line)["result"] for line in output.readlines()] == [
+        [i] for i in range(6)
+    ]
+    assert "Batching: batches" in result.stdout
+
+
+def test_endpoints_predict_disk_cache(tmpdir, monkeypatch):
+    monkeypatch.setenv("GIZA_PREDICTION_CACHE_DIR", str(tmpdir / "cache"))
+    inputs, output = tmpdir / "inputs.jsonl", tmpdir / "predictions.jsonl"
+    inputs.write("[1]\n[2]\n")
+    args = ["endpoints", "predict", "-e", "1", "-i", str(inputs), "-o", str(output)]
+
+    with patch.object(EndpointsClient, "get", return_value=_endpoint()), patch.object(
+        EndpointsClient,
+        "predict",
+        side_effect=lambda uri, args, *_: Prediction(result=args, request_id="r"),
+    ) as mock_predict:
+        invoke_cli_runner(args + ["--disk-cache"])
+        result = invoke_cli_runner(args + ["--disk-cache"])
+
+    assert mock_predict.call_count == 2
+    assert "Cache: 2 hits, 0 misses" in result.stdout
+    assert [json.loads(line)["request_id"] for line in output.readlines()] == [
+        "r",
+        "r",
+    ]
+    assert len((tmpdir / "cache" / "1-2").listdir()) == 2
+
+
+def test_endpoints_bench(tmpdir):
+    inputs = tmpdir / "inputs.jsonl"
+    inputs.write("[1]\n[2]\n")
+    with patch.object(EndpointsClient, "get", return_value=_endpoint()), patch.object(
+        EndpointsClient, "retrieve_token"
+    ), patch.object(
+        EndpointsClient, "predict", return_value=Prediction(result=1)
+    ) as mock_predict:
+        result = invoke_cli_runner(
+            [
+                "endpoints",
+                "bench",
+                "-e",
+                "1",
+                "-i",
+                str(inputs),
+                "--requests",
+                "10",
+                "--duration",
+                "5",
+            ]
+        )
+
+    assert result.exit_code == 0
+    assert mock_predict.call_count == 10
+    assert (
+        sorted(call.args[1] for call in mock_predict.call_args_list)
+        == [[1]] * 5 + [[2]] * 5
+    )
+    # Dry runs by default
+    assert mock_predict.call_args.args[3] is True
+    assert "10 requests" in result.stdout
+
+
+def test_endpoints_bench_synthetic_inputs():
+    with patch.object(EndpointsClient, "get", return_value=_endpoint()), patch.object(
+        EndpointsClient, "retrieve_token"
+    ), patch.object(
+        EndpointsClient, "predict", side_effect=HTTPError("boom")
+    ) as mock_predict:
+        result = invoke_cli_runner(
+            ["endpoints", "bench", "-e", "1", "-n", "3", "--input-size", "4"]
+        )
+
+    assert result.exit_code == 0
+    assert len(mock_predict.call_args.args[1]) == 4
+    assert "100.0% errors" in result.stdout
+
+
+def test_endpoints_logs_follow_until_deleted():
+    with patch.object(
+        EndpointsClient, "get", side_effect=[_endpoint(), _endpoint(False)]
+    ), patch.object(
+        EndpointsClient,
+        "get_logs",
+        side_effect=[Logs(logs="a\n", next_offset=2), Logs(logs="b\n", next_offset=4)],
+    ), patch(
+        "giza.cli.utils.log_stream.time.sleep"
+    ):
+        result = invoke_cli_runner(["endpoints", "logs", "-e", "1", "--follow"])
+
+    assert result.exit_code == 0
+    assert "a\nb\n" in result.stdout
+
+
+def test_endpoints_sync_proofs(tmpdir):
+    with patch(
+        "giza.cli.commands.endpoints.sync_proofs",
+        return_value=SyncResult(downloaded=[3], skipped=[1, 2]),
+    ) as mock_sync:
+        result = invoke_cli_runner(
+            ["endpoints", "sync-proofs", "-e", "1", "-o", str(tmpdir), "--verify"]
+        )
+
+    assert result.exit_code == 0
+    assert mock_sync.call_args.args[1] == 1
+    assert mock_sync.call_args.kwargs["verify"] is True
+    assert "1 proofs mirrored, 2 up to date, 0 failed" in result.stdout
+
+
+def test_endpoints_sync_proofs_failed(tmpdir):
+    with patch(
+        "giza.cli.commands.endpoints.sync_proofs",
+        return_value=SyncResult(failed={4: "boom"}),
+    ):
+        result = invoke_cli_runner(
+            ["endpoints", "sync-proofs", "-e", "1", "-o", str(tmpdir)],
+            expected_error=True,
+        )
+
+    assert result.exit_code == 1
+    assert "Proof 4 -> boom" in result.stdout
+
+
+def test_endpoints_sync_proofs_invalid_s3_uri(tmpdir):
+    result = invoke_cli_runner(
+        ["endpoints", "sync-proofs", "-e", "1", "--s3-uri", "bucket"],
+        expected_error=True,
+    )
+
+    assert result.exit_code == 1
+    assert "Invalid S3 uri" in result.stdout
@@ -0,0 +1,270 @@
+import io
+from unittest.mock import patch
+
+import pytest
+
+from giza.cli.commands.jobs import JobsClient, VersionJobsClient, VersionsClient
+from giza.cli.frameworks.cairo import ProofsClient
+from giza.cli.schemas.jobs import Job
+from giza.cli.schemas.logs import Logs
+from giza.cli.schemas.proofs import Proof
+from giza.cli.schemas.versions import Version
+from giza.cli.utils.enums import Framework, JobStatus, VersionStatus
+from giza.cli.utils.runs import COMPLETED, Run, list_runs
+from tests.conftest import invoke_cli_runner
+
+
+def _job(status, job_id=1):
+    return Job(id=job_id, job_name="job", size="S", status=status, elapsed_time=1.0)
+
+
+def _version(status):
+    return Version(
+        version=2,
+        size=1,
+        status=status,
+        created_date="2021-08-31T15:00:00.000000",
+        last_update="2021-08-31T15:00:00.000000",
+        framework=Framework.CAIRO,
+    )
+
+
+def test_jobs_status():
+    with patch.object(
+        JobsClient, "get", return_value=_job(JobStatus.PROCESSING)
+    ) as mock_get:
+        result = invoke_cli_runner(["jobs", "status", "--job-id", "1"])
+
+    assert result.exit_code == 0
+    mock_get.assert_called_once_with(1)
+    assert "status" in result.stdout
+
+
+def test_jobs_status_requires_a_target():
+    result = invoke_cli_runner(["jobs", "status"], expected_error=True)
+
+    assert result.exit_code == 1
+    assert "Provide a job id" in result.stdout
+
+
+def test_jobs_wait_until_completed():
+    statuses = [_job(JobStatus.STARTING), _job(JobStatus.COMPLETED)]
+    with patch.object(JobsClient, "get", side_effect=statuses) as mock_get, patch(
+        "giza.cli.commands.jobs.time.sleep"
+    ):
+        result = invoke_cli_runner(
+            ["jobs", "wait", "--job-id", "1", "--kind", "VERIFY"]
+        )
+
+    assert result.exit_code == 0
+    assert mock_get.call_count == 2
+    assert mock_get.call_args.kwargs == {"params": {"kind": "VERIFY"}}
+    assert "finished with status 'COMPLETED'" in result.stdout
+
+
+def test_jobs_wait_failed_prints_logs():
+    with patch.object(
+        JobsClient, "get", return_value=_job(JobStatus.FAILED)
+    ), patch.object(JobsClient, "get_logs", return_value=Logs(logs="out of memory")):
+        result = invoke_cli_runner(
+            ["jobs", "wait", "--job-id", "1"], expected_error=True
+        )
+
+    assert result.exit_code == 1
+    assert "out of memory" in result.stdout
+
+
+def test_jobs_wait_timeout():
+    with patch.object(JobsClient, "get", return_value=_job(JobStatus.PROCESSING)):
+        result = invoke_cli_runner(
+            ["jobs", "wait", "--job-id", "1", "--timeout", "0"], expected_error=True
+        )
+
+    assert result.exit_code == 1
+    assert "did not finish" in result.stdout
+
+
+def test_jobs_wait_transpilation():
+    statuses = [
+        _version(VersionStatus.PROCESSING),
+        _version(VersionStatus.PARTIALLY_SUPPORTED),
+    ]
+    with patch.object(VersionsClient, "get", side_effect=statuses), patch(
+        "giza.cli.commands.jobs.time.sleep"
+    ):
+        result = invoke_cli_runner(
+            ["jobs", "wait", "--model-id", "1", "--version-id", "2"]
+        )
+
+    assert result.exit_code == 0
+    assert "Version 2 finished with status" in result.stdout
+
+
+def test_jobs_wait_setup_job():
+    with patch.object(
+        VersionJobsClient, "get", return_value=_job(JobStatus.COMPLETED, job_id=3)
+    ) as mock_get:
+        result = invoke_cli_runner(
+            ["jobs", "wait", "--job-id", "3", "--model-id", "1", "--version-id", "2"]
+        )
+
+    assert result.exit_code == 0
+    mock_get.assert_called_once_with(1, 2, 3)
+
+
+def test_jobs_download(tmpdir):
+    proof = Proof(id=5, job_id=1, created_date="2021-08-31T15:00:00.000000")
+    output_path = tmpdir / "zk.proof"
+    with patch.object(
+        JobsClient, "get", return_value=_job(JobStatus.COMPLETED)
+    ), patch.object(ProofsClient, "get_by_job_id", return_value=proof), patch.object(
+        ProofsClient, "download", return_value=io.BytesIO(b"proof")
+    ) as mock_download:
+        result = invoke_cli_runner(
+            ["jobs", "download", "--job-id", "1", "--output-path", str(output_path)]
+        )
+
+    assert result.exit_code == 0
+    mock_download.assert_called_once_with(5, stream=True)
+    assert output_path.read_binary() == b"proof"
+
+
+def test_jobs_download_finishes_the_run(tmpdir):
+    Run.start("prove", Framework.CAIRO, job_id=1)
+    other = Run.start("prove", Framework.CAIRO, job_id=2)
+    proof = Proof(id=5, job_id=1, created_date="2021-08-31T15:00:00.000000")
+    with patch.object(
+        JobsClient, "get", return_value=_job(JobStatus.COMPLETED)
+    ), patch.object(ProofsClient, "get_by_job_id", return_value=proof), patch.object(
+        ProofsClient, "download", return_value=io.BytesIO(b"proof")
+    ):
+        result = invoke_cli_runner(
+            ["jobs", "download", "--job-id", "1", "-o", str(tmpdir / "zk.proof")]
+        )
+
+    assert result.exit_code == 0
+    assert [run.id for run in list_runs()] == [other.id]
+
+
+def test_jobs_wait_records_the_run():
+    completed = Run.start("prove", Framework.CAIRO, job_id=1)
+    failed = Run.start("prove", Framework.CAIRO, job_id=2)
+    with patch.object(JobsClient, "get", return_value=_job(JobStatus.COMPLETED)):
+        invoke_cli_runner(["jobs", "wait", "--job-id", "1"])
+    with patch.object(
+        JobsClient, "get", return_value=_job(JobStatus.FAILED, job_id=2)
+    ), patch.object(JobsClient, "get_logs", return_value=Logs(logs="")):
+        invoke_cli_runner(["jobs", "wait", "--job-id", "2"], expected_error=True)
+
+    (run,) = list_runs()
+    assert run.id == completed.id and run.stage == COMPLETED
+    assert failed.id not in [run.id for run in list_runs()]
+
+
+def test_jobs_download_not_completed(tmpdir):
+    with patch.object(JobsClient, "get", return_value=_job(JobStatus.PROCESSING)):
+        result = invoke_cli_runner(
+            ["jobs", "download", "--job-id", "1", "-o", str(tmpdir / "zk.proof")],
+            expected_error=True,
+        )
+
+    assert result.exit_code == 1
+    assert "only available once it is COMPLETED" in result.stdout
+    assert not (tmpdir / "zk.proof").exists()
+
+
+def test_prove_detach(tmpdir):
+    trace, memory = tmpdir / "trace", tmpdir / "memory"
+    trace.write_binary(b"trace")
+    memory.write_binary(b"memory")
+    with patch(
+        "giza.cli.frameworks.cairo.JobsClient.create",
+        return_value=_job(JobStatus.STARTING, job_id=7),
+    ), patch(
+        "giza.cli.frameworks.cairo.JobsClient.get",
+        side_effect=lambda *args: pytest.fail("The job must not be polled"),
+    ):
+        result = invoke_cli_runner(["prove", str(trace), str(memory), "--detach"])
+
+    assert result.exit_code == 0
+    assert "giza jobs wait --job-id 7" in result.stdout
+    assert "giza jobs download --job-id 7" in result.stdout
+
+
+def test_jobs_watch_refreshes_pending_jobs_together():
+    ticks = [
+        {1: _job(JobStatus.PROCESSING, 1), 2: _job(JobStatus.COMPLETED, 2)},
+        {1: _job(JobStatus.COMPLETED, 1)},
+    ]
+    with patch.object(
+        JobsClient, "get_many", side_effect=ticks
+    ) as mock_get_many, patch("giza.cli.commands.jobs.time.sleep"):
+        result = invoke_cli_runner(["jobs", "watch", "1", "2"])
+
+    assert result.exit_code == 0
+    assert [call.args[0] for call in mock_get_many.call_args_list] == [[1, 2], [1]]
+    assert "All 2 jobs are completed" in result.stdout
+
+
+def test_jobs_watch_failed_job():
+    jobs = {1: _job(JobStatus.FAILED, 1), 2: _job(JobStatus.COMPLETED, 2)}
+    with patch.object(JobsClient, "get_many", return_value=jobs):
+        result = invoke_cli_runner(["jobs", "watch", "1", "2"], expected_error=True)
+
+    assert result.exit_code == 1
+    assert "Failed jobs -> 1" in result.stdout
+
+
+def test_jobs_watch_journal_jobs():
+    Run.start("prove", Framework.CAIRO, job_id=4)
+    Run.start("transpile", Framework.CAIRO, model_id=1, version_id=1)
+    with patch.object(
+        JobsClient, "get_many", return_value={4: _job(JobStatus.COMPLETED, 4)}
+    ) as mock_get_many:
+        result = invoke_cli_runner(["jobs", "watch"])
+
+    assert result.exit_code == 0
+    mock_get_many.assert_called_once_with([4], params=None)
+
+
+def test_jobs_watch_skips_collected_jobs():
+    Run.start("prove", Framework.CAIRO, job_id=4)
+    Run.start("prove", Framework.CAIRO, job_id=5, stage=COMPLETED)
+    with patch.object(
+        JobsClient, "get_many", return_value={4: _job(JobStatus.COMPLETED, 4)}
+    ) as mock_get_many:
+        result = invoke_cli_runner(["jobs", "watch"])
+
+    assert result.exit_code == 0
+    mock_get_many.assert_called_once_with([4], params=None)
+
+
+def test_jobs_watch_without_jobs():
+    result = invoke_cli_runner(["jobs", "watch"], expected_error=True)
+
+    assert result.exit_code == 1
+    assert "No jobs to watch" in result.stdout
+
+
+def test_jobs_logs():
+    with patch.object(JobsClient, "get_logs", return_value=Logs(logs="proving")):
+        result = invoke_cli_runner(["jobs", "logs", "--job-id", "1"])
+
+    assert result.exit_code == 0
+    assert "proving" in result.stdout
+
+
+def test_jobs_logs_follow():
+    statuses = [_job(JobStatus.PROCESSING), _job(JobStatus.COMPLETED)]
+    chunks = [
+        Logs(logs="step 1\n", next_offset=7),
+        Logs(logs="step 2\n", next_offset=14),
+    ]
+    with patch.object(JobsClient, "get", side_effect=statuses), patch.object(
+        JobsClient, "get_logs", side_effect=chunks
+    ) as mock_logs, patch("giza.cli.utils.log_stream.time.sleep"):
+        result = invoke_cli_runner(["jobs", "logs", "--job-id", "1", "--follow"])
+
+    assert result.exit_code == 0
+    assert [call.kwargs["offset"] for call in mock_logs.call_args_list] == [0, 7]
+    assert "step 1\nstep 2\n" in result.stdout
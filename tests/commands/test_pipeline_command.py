@@ -0,0 +1,110 @@
+from unittest.mock import patch
+
+import pytest
+
+from giza.cli.commands.pipeline import load_spec, run_pipeline
+from giza.cli.mock_server import MockApiServer, MockConfig, mock_token
+from giza.cli.utils.enums import JobStatus, ServiceSize, VersionStatus
+from tests.conftest import invoke_cli_runner
+
+TOML_SPEC = """
+[model]
+path = "model.onnx"
+
+[deploy]
+size = "M"
+
+[[proofs]]
+trace = "trace"
+memory = "memory"
+output_path = "zk.proof"
+"""
+
+YAML_SPEC = """
+model:
+  path: model.onnx
+  id: 3
+transpile:
+  download_sierra: true
+"""
+
+
+@pytest.fixture
+def api(monkeypatch):
+    with MockApiServer(config=MockConfig(job_duration=0, payload_size=64)) as server:
+        monkeypatch.setenv("GIZA_TOKEN", mock_token())
+        with patch("giza.cli.commands.pipeline.API_HOST", server.url), patch(
+            "giza.cli.commands.pipeline.PROOF_POLL_INTERVAL", 0
+        ), patch("giza.cli.frameworks.cairo.time.sleep"):
+            yield server
+
+
+def test_load_spec_toml(tmpdir):
+    path = tmpdir / "pipeline.toml"
+    path.write_text(TOML_SPEC, "utf-8")
+
+    spec = load_spec(str(path))
+
+    assert spec.model.path == str(tmpdir / "model.onnx")
+    assert spec.transpile.output_path == str(tmpdir / "cairo_model")
+    assert spec.deploy.size == ServiceSize.M
+    assert spec.proofs[0].trace == str(tmpdir / "trace")
+
+
+def test_load_spec_yaml(tmpdir):
+    path = tmpdir / "pipeline.yml"
+    path.write_text(YAML_SPEC, "utf-8")
+
+    spec = load_spec(str(path))
+
+    assert spec.model.id == 3
+    assert spec.transpile.download_sierra
+    assert spec.deploy is None
+    assert spec.proofs == []
+
+
+def test_pipeline_invalid_spec(tmpdir):
+    path = tmpdir / "pipeline.toml"
+    path.write_text('[model]\npath = "model.onnx"\n[transpiler]\n', "utf-8")
+
+    result = invoke_cli_runner(["pipeline", str(path)], expected_error=True)
+
+    assert result.exit_code == 1
+    assert "Invalid pipeline spec" in result.stdout
+
+
+def test_pipeline_unsupported_format(tmpdir):
+    path = tmpdir / "pipeline.json"
+    path.write_text("{}", "utf-8")
+
+    result = invoke_cli_runner(["pipeline", str(path)], expected_error=True)
+
+    assert result.exit_code == 1
+    assert "Unsupported spec format" in result.stdout
+
+
+def test_run_pipeline(api, tmpdir):
+    for name in ("model.onnx", "trace", "memory"):
+        (tmpdir / name).write_binary(b"data")
+    path = tmpdir / "pipeline.toml"
+    path.write_text(TOML_SPEC, "utf-8")
+
+    results = run_pipeline(load_spec(str(path)))
+
+    assert results["version"].status == VersionStatus.COMPLETED
+    assert results["endpoint"].size == ServiceSize.M
+    assert [job.status for job in results["jobs"].values()] == [JobStatus.COMPLETED]
+    assert (tmpdir / "zk.proof").size() == 64
+    assert (tmpdir / "cairo_model").listdir()
+
+
+def test_pipeline_command(api, tmpdir):
+    (tmpdir / "model.onnx").write_binary(b"data")
+    path = tmpdir / "pipeline.yaml"
+    path.write_text("model:\n  path: model.onnx\n", "utf-8")
+
+    result = invoke_cli_runner(["pipeline", str(path)])
+
+    assert result.exit_code == 0
+    assert "Stage timings: model_lookup" in result.stdout
+    assert "Pipeline finished" in result.stdout
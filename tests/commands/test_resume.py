@@ -0,0 +1,211 @@
+import io
+from unittest.mock import patch
+
+from giza.cli.schemas.jobs import Job
+from giza.cli.schemas.logs import Logs
+from giza.cli.schemas.proofs import Proof
+from giza.cli.schemas.versions import Version
+from giza.cli.utils.enums import Framework, JobStatus, VersionStatus
+from giza.cli.utils.runs import COMPLETED, SUBMITTED, Run, list_runs
+from tests.conftest import invoke_cli_runner
+
+
+def _version(status):
+    return Version(
+        version=2,
+        size=1,
+        status=status,
+        created_date="2021-08-31T15:00:00.000000",
+        last_update="2021-08-31T15:00:00.000000",
+        framework=Framework.CAIRO,
+    )
+
+
+def _job(status, job_id=7):
+    return Job(id=job_id, job_name="job", size="S", status=status)
+
+
+def test_resume_without_runs():
+    result = invoke_cli_runner(["resume"])
+
+    assert result.exit_code == 0
+    assert "There are no workflows to resume" in result.stdout
+
+
+def test_resume_list_and_discard():
+    run = Run.start("prove", Framework.CAIRO, stage=SUBMITTED, job_id=7)
+
+    listed = invoke_cli_runner(["resume", "--list"])
+    discarded = invoke_cli_runner(["resume", run.id, "--discard"])
+
+    assert "prove-" in listed.stdout
+    assert discarded.exit_code == 0
+    assert list_runs() == []
+
+
+def test_resume_unknown_run():
+    result = invoke_cli_runner(["resume", "missing"], expected_error=True)
+
+    assert result.exit_code == 1
+    assert "Workflow missing not found" in result.stdout
+
+
+def test_resume_transpile_uploads_and_waits(tmpdir):
+    model_path = tmpdir / "model.onnx"
+    model_path.write_binary(b"model")
+    run = Run.start(
+        "transpile",
+        Framework.CAIRO,
+        model_id=1,
+        version_id=2,
+        model_path=str(model_path),
+        upload_url="url",
+        output_path=str(tmpdir / "output"),
+        options={"download_model": False, "download_sierra": False},
+    )
+    statuses = [_version(VersionStatus.PROCESSING), _version(VersionStatus.COMPLETED)]
+
+    with patch("giza.cli.commands.resume.VersionsClient") as client, patch(
+        "giza.cli.frameworks.cairo.time.sleep"
+    ):
+        client.return_value.get.side_effect = statuses
+        result = invoke_cli_runner(["resume"])
+
+    assert result.exit_code == 0
+    client.return_value._upload.assert_called_once()
+    assert client.return_value._upload.call_args.args[0] == "url"
+    client.return_value.update.assert_called_once()
+    assert client.return_value.get.call_count == 2
+    assert f"Workflow {run.id} finished" in result.stdout
+    assert list_runs() == []
+
+
+def test_resume_transpile_failed_forgets_the_run():
+    Run.start("transpile", Framework.CAIRO, model_id=1, version_id=2, uploaded=True)
+
+    with patch("giza.cli.commands.resume.VersionsClient") as client:
+        client.return_value.get.return_value = _version(VersionStatus.FAILED)
+        client.return_value.get_logs.return_value = Logs(logs="")
+        result = invoke_cli_runner(["resume"], expected_error=True)
+
+    assert result.exit_code == 1
+    assert "Transpilation failed" in result.stdout
+    client.return_value._upload.assert_not_called()
+    assert list_runs() == []
+
+
+def test_resume_detached_prove(tmpdir):
+    trace, memory = tmpdir / "trace", tmpdir / "memory"
+    trace.write_binary(b"trace")
+    memory.write_binary(b"memory")
+    output_path = tmpdir / "zk.proof"
+    with patch(
+        "giza.cli.frameworks.cairo.JobsClient.create",
+        return_value=_job(JobStatus.STARTING),
+    ):
+        invoke_cli_runner(
+            ["prove", str(trace), str(memory), "-o", str(output_path), "--detach"]
+        )
+    (run,) = list_runs()
+    assert (run.command, run.job_id, run.stage) == ("prove", 7, SUBMITTED)
+
+    proof = Proof(id=5, job_id=7, created_date="2021-08-31T15:00:00.000000")
+    with patch(
+        "giza.cli.frameworks.cairo.JobsClient.get",
+        return_value=_job(JobStatus.COMPLETED),
+    ), patch(
+        "giza.cli.frameworks.cairo.ProofsClient.get_by_job_id", return_value=proof
+    ), patch(
+        "giza.cli.frameworks.cairo.ProofsClient.download",
+        return_value=io.BytesIO(b"proof"),
+    ):
+        result = invoke_cli_runner(["resume", run.id])
+
+    assert result.exit_code == 0
+    assert output_path.read_binary() == b"proof"
+    assert list_runs() == []
+
+
+def test_resume_completed_prove_only_downloads(tmpdir):
+    Run.start(
+        "prove",
+        Framework.CAIRO,
+        stage=COMPLETED,
+        job_id=7,
+        output_path=str(tmpdir / "zk.proof"),
+    )
+    proof = Proof(id=5, job_id=7, created_date="2021-08-31T15:00:00.000000")
+
+    with patch("giza.cli.frameworks.cairo.JobsClient.get") as mock_get, patch(
+        "giza.cli.frameworks.cairo.ProofsClient.get_by_job_id", return_value=proof
+    ), patch(
+        "giza.cli.frameworks.cairo.ProofsClient.download", return_value=io.BytesIO(b"p")
+    ):
+        result = invoke_cli_runner(["resume"])
+
+    assert result.exit_code == 0
+    mock_get.assert_not_called()
+
+
+def test_resume_optimized_transpile_optimizes_again(tmpdir):
+    model_path = tmpdir / "model.onnx"
+    model_path.write_binary(b"model")
+    Run.start(
+        "transpile",
+        Framework.CAIRO,
+        model_id=1,
+        version_id=2,
+        model_path=str(model_path),
+        upload_url="url",
+        options={
+            "download_model": False,
+            "download_sierra": False,
+            "optimize": True,
+            "quantize": True,
+        },
+    )
+
+    def _optimize(src, dst, quantize=False):
+        with open(dst, "wb") as f:
+            f.write(b"optimized")
+
+    uploaded = []
+    with patch("giza.cli.commands.resume.VersionsClient") as client, patch(
+        "giza.cli.commands.resume.optimize_file", side_effect=_optimize
+    ) as mock_optimize:
+        client.return_value.get.return_value = _version(VersionStatus.COMPLETED)
+        client.return_value._upload.side_effect = lambda url, f: uploaded.append(
+            f.read()
+        )
+        result = invoke_cli_runner(["resume"])
+
+    assert result.exit_code == 0
+    assert mock_optimize.call_args.args[0] == str(model_path)
+    assert mock_optimize.call_args.kwargs["quantize"] is True
+    assert uploaded == [b"optimized"]
+
+
+def test_resume_ezkl_prove(tmpdir):
+    output_path = tmpdir / "zk.proof"
+    Run.start(
+        "prove", Framework.EZKL, stage=SUBMITTED, job_id=7, output_path=str(output_path)
+    )
+    proof = Proof(id=5, job_id=7, created_date="2021-08-31T15:00:00.000000")
+
+    with patch(
+        "giza.cli.frameworks.ezkl.JobsClient.get",
+        return_value=_job(JobStatus.COMPLETED),
+    ), patch(
+        "giza.cli.frameworks.ezkl.ProofsClient.get_by_job_id", return_value=proof
+    ), patch(
+        "giza.cli.frameworks.ezkl.ProofsClient.download",
+        return_value=io.BytesIO(b"proof"),
+    ), patch(
+        "giza.cli.frameworks.cairo.wait_for_job"
+    ) as mock_cairo_wait:
+        result = invoke_cli_runner(["resume"])
+
+    assert result.exit_code == 0
+    mock_cairo_wait.assert_not_called()
+    assert output_path.read_binary() == b"proof"
+    assert list_runs() == []
@@ -0,0 +1,98 @@
+from unittest.mock import patch
+
+from giza.cli.frameworks.cairo import JobsClient
+from giza.cli.schemas.jobs import Job
+from giza.cli.utils.enums import JobStatus
+from giza.cli.utils.verification_ledger import (
+    VERIFICATION_LEDGER_DIR_VARIABLE,
+    VERIFIER_VERSION_VARIABLE,
+)
+from tests.conftest import invoke_cli_runner
+
+
+def _job(status):
+    return Job(id=1, job_name="verify", size="S", status=status, elapsed_time=3.0)
+
+
+def _verify(proof, *args, job_status=JobStatus.COMPLETED, expected_error=False):
+    with patch.object(
+        JobsClient, "create", return_value=_job(JobStatus.STARTING)
+    ) as mock_create, patch.object(
+        JobsClient, "get", return_value=_job(job_status)
+    ), patch.object(
+        JobsClient, "get_logs"
+    ):
+        result = invoke_cli_runner(
+            ["verify", "--proof", str(proof), "--framework", "CAIRO", *args],
+            expected_error=expected_error,
+        )
+    return result, mock_create.call_count
+
+
+def test_verify_uses_the_ledger(tmpdir, monkeypatch):
+    monkeypatch.setenv(VERIFICATION_LEDGER_DIR_VARIABLE, str(tmpdir / "ledger"))
+    monkeypatch.setenv(VERIFIER_VERSION_VARIABLE, "1.0")
+    proof = tmpdir / "zk.proof"
+    proof.write_binary(b"proof")
+
+    first, first_jobs = _verify(proof)
+    second, second_jobs = _verify(proof)
+    forced, forced_jobs = _verify(proof, "--force")
+
+    assert first.exit_code == 0 and first_jobs == 1
+    assert second.exit_code == 0 and second_jobs == 0
+    assert "Proof already verified by job 1" in second.stdout
+    assert "Verification result: True" in second.stdout
+    assert "Verification time: 3.0" in second.stdout
+    assert forced.exit_code == 0 and forced_jobs == 1
+
+
+def test_verify_failed_jobs_are_not_recorded(tmpdir, monkeypatch):
+    monkeypatch.setenv(VERIFICATION_LEDGER_DIR_VARIABLE, str(tmpdir / "ledger"))
+    monkeypatch.setenv(VERIFIER_VERSION_VARIABLE, "1.0")
+    proof = tmpdir / "zk.proof"
+    proof.write_binary(b"proof")
+
+    failed, _ = _verify(proof, job_status=JobStatus.FAILED, expected_error=True)
+    retried, jobs = _verify(proof)
+
+    assert failed.exit_code == 1
+    assert retried.exit_code == 0 and jobs == 1
+
+
+def test_verify_skips_the_ledger(tmpdir, monkeypatch):
+    monkeypatch.setenv(VERIFICATION_LEDGER_DIR_VARIABLE, str(tmpdir / "ledger"))
+    monkeypatch.delenv(VERIFIER_VERSION_VARIABLE, raising=False)
+    proof = tmpdir / "zk.proof"
+    proof.write_binary(b"proof")
+
+    # Without a verifier version the results can not be reused
+    _verify(proof)
+    _, unversioned_jobs = _verify(proof)
+    monkeypatch.setenv(VERIFIER_VERSION_VARIABLE, "1.0")
+    # Linked verifications must run so the version gets the result
+    _verify(proof, "--model-id", "1", "--version-id", "1")
+    _, linked_jobs = _verify(proof, "--model-id", "1", "--version-id", "1")
+
+    assert unversioned_jobs == 1 and linked_jobs == 1
+    assert not (tmpdir / "ledger").exists()
+
+
+def test_verify_detached_is_recorded_by_jobs_wait(tmpdir, monkeypatch):
+    monkeypatch.setenv(VERIFICATION_LEDGER_DIR_VARIABLE, str(tmpdir / "ledger"))
+    monkeypatch.setenv(VERIFIER_VERSION_VARIABLE, "1.0")
+    proof = tmpdir / "zk.proof"
+    proof.write_binary(b"proof")
+
+    _, detached_jobs = _verify(proof, "--detach")
+    with patch.object(
+        JobsClient, "get", return_value=_job(JobStatus.COMPLETED)
+    ), patch.object(JobsClient, "get_logs"):
+        waited = invoke_cli_runner(
+            ["jobs", "wait", "--job-id", "1", "--kind", "VERIFY"]
+        )
+    second, second_jobs = _verify(proof)
+
+    assert detached_jobs == 1 and waited.exit_code == 0
+    assert second_jobs == 0
+    assert "Proof already verified by job 1" in second.stdout
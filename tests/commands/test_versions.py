@@ -2,15 +2,17 @@ import zipfile
 from io import BytesIO
 from unittest.mock import patch
 
+import pytest
 from pydantic import ValidationError
 from pydantic_core import InitErrorDetails
 from requests.exceptions import HTTPError
 
 from giza.cli.commands.versions import VersionsClient, VersionStatus
+from giza.cli.schemas.logs import Logs
 from giza.cli.schemas.models import Model, ModelList
 from giza.cli.schemas.versions import Version, VersionList
 from giza.cli.utils.enums import Framework
-from tests.conftest import invoke_cli_runner
+from tests.conftest import invoke_cli_runner, make_onnx_model
 
 
 class ClientStub:
@@ -130,7 +132,7 @@ def test_versions_transpile_successful(tmpdir):
         tmp = BytesIO()
         with zipfile.ZipFile(tmp, mode="w", compression=zipfile.ZIP_DEFLATED) as f:
             f.writestr("file1.txt", "hi")
-        return {"model": tmp.getvalue()}
+        return {"model": BytesIO(tmp.getvalue())}
 
     models = ModelList(
         root=[
@@ -206,7 +208,7 @@ def test_versions_transpile_http_error(tmpdir):
 # Test version transpilation with file
 def test_versions_transpile_file(tmpdir):
     def return_content():
-        return {"model": b"some bytes"}
+        return {"model": BytesIO(b"some bytes")}
 
     models = ModelList(
         root=[
@@ -275,7 +277,7 @@ def test_versions_download_successful(tmpdir):
         tmp = BytesIO()
         with zipfile.ZipFile(tmp, mode="w", compression=zipfile.ZIP_DEFLATED) as f:
             f.writestr("file1.txt", "hi")
-        return {"model": tmp.getvalue()}
+        return {"model": BytesIO(tmp.getvalue())}
 
     with patch.object(VersionsClient, "get", return_value=version), patch.object(
         VersionsClient, "download", return_value=return_content()
@@ -336,7 +338,7 @@ def test_versions_download_file(tmpdir):
     )
 
     def return_content():
-        return {"model": b"some bytes"}
+        return {"model": BytesIO(b"some bytes")}
 
     with patch.object(VersionsClient, "get", return_value=version), patch.object(
         VersionsClient, "download", return_value=return_content()
@@ -469,3 +471,118 @@ def test_versions_update_missing_ids():
 
     assert "Model ID and version ID are required to update the version" in result.stdout
     assert result.exit_code == 1
+
+
+def test_versions_transpile_check(tmpdir):
+    supported = tmpdir / "supported.onnx"
+    supported.write_binary(make_onnx_model([("MatMul", ""), ("Relu", "")]))
+    unsupported = tmpdir / "unsupported.onnx"
+    unsupported.write_binary(make_onnx_model([("MatMul", ""), ("LSTM", "")]))
+
+    with patch("giza.cli.frameworks.cairo.VersionsClient") as mock_client:
+        result = invoke_cli_runner(["versions", "transpile", str(supported), "--check"])
+        failed = invoke_cli_runner(
+            ["transpile", str(unsupported), "--check"], expected_error=True
+        )
+
+    mock_client.assert_not_called()
+    assert result.exit_code == 0
+    assert "All the operators are supported" in result.stdout
+    assert failed.exit_code == 1
+    assert "Unsupported operators -> LSTM" in failed.stdout
+
+
+def test_versions_transpile_optimize(tmpdir):
+    model_path = tmpdir / "model.onnx"
+    model_path.write_binary(make_onnx_model([("Identity", "")]))
+    version = Version(
+        version=1,
+        size=1,
+        description="test_version",
+        status=VersionStatus.COMPLETED,
+        created_date="2021-08-31T15:00:00.000000",
+        last_update="2021-08-31T15:00:00.000000",
+        framework=Framework.CAIRO,
+    )
+    model = Model(id=1, name="model", description="", created_at="", updated_at="")
+    client = ClientStub(version, {})
+    created = []
+    client.create = lambda *args: created.append(args) or (version, "url")
+
+    with patch("giza.cli.frameworks.cairo.VersionsClient", return_value=client), patch(
+        "giza.cli.frameworks.cairo.ModelsClient.get_by_name", return_value=model
+    ), patch("giza.cli.frameworks.cairo.ModelsClient._load_credentials_file"):
+        result = invoke_cli_runner(
+            [
+                "transpile",
+                str(model_path),
+                "--optimize",
+                "--output-path",
+                str(tmpdir / "output"),
+            ]
+        )
+
+    assert "ONNX optimization" in result.stdout
+    assert "Model optimized" in result.stdout
+    # The version keeps the name of the original file
+    assert created[0][2] == "model.onnx"
+
+
+def test_versions_transpile_quantize_requires_optimize(tmpdir):
+    result = invoke_cli_runner(
+        ["transpile", str(tmpdir / "model.onnx"), "--quantize"], expected_error=True
+    )
+
+    assert result.exit_code != 0
+
+
+def test_versions_transpile_detach(tmpdir):
+    model_path = tmpdir / "model.onnx"
+    model_path.write_binary(b"model")
+    version = Version(
+        version=2,
+        size=1,
+        description="test_version",
+        status=VersionStatus.UPLOADED,
+        created_date="2021-08-31T15:00:00.000000",
+        last_update="2021-08-31T15:00:00.000000",
+        framework=Framework.CAIRO,
+    )
+    model = Model(id=1, name="model", description="", created_at="", updated_at="")
+    client = ClientStub(version, {})
+    client.get = lambda *args: pytest.fail("The transpilation must not be polled")
+
+    with patch("giza.cli.frameworks.cairo.VersionsClient", return_value=client), patch(
+        "giza.cli.frameworks.cairo.ModelsClient.get_by_name", return_value=model
+    ), patch("giza.cli.frameworks.cairo.ModelsClient._load_credentials_file"):
+        result = invoke_cli_runner(["transpile", str(model_path), "--detach"])
+
+    assert result.exit_code == 0
+    assert "giza jobs wait --model-id 1 --version-id 2" in result.stdout
+    assert "Downloading" not in result.stdout
+
+
+def test_versions_logs_follow():
+    version = Version(
+        version=1,
+        size=1,
+        status=VersionStatus.PROCESSING,
+        created_date="2022-01-01T00:00:00",
+        last_update="2022-01-01T00:00:00",
+        framework=Framework.CAIRO,
+    )
+    failed = version.model_copy(update={"status": VersionStatus.FAILED})
+    # The whole logs are returned when the API does not support offsets
+    blobs = [Logs(logs="parsing\n"), Logs(logs="parsing\nunsupported op\n")]
+    with patch.object(
+        VersionsClient, "get", side_effect=[version, failed]
+    ), patch.object(VersionsClient, "get_logs", side_effect=blobs), patch(
+        "giza.cli.utils.log_stream.time.sleep"
+    ):
+        result = invoke_cli_runner(
+            ["versions", "logs", "--model-id", "1", "--version-id", "1", "--follow"]
+        )
+
+    assert result.exit_code == 0
+    assert result.stdout.count("parsing") == 1
+    assert "unsupported op" in result.stdout
@@ -1,4 +1,5 @@
 import logging
+from unittest.mock import patch
 
 import pytest
 from typer.testing import CliRunner
@@ -30,7 +31,64 @@ def no_version_check():
     """
     Disable version check for all tests.
     """
-    # As app is a global object, we need to make sure that we reset the callback
-    # TODO: find a better way to do this
-    app.registered_callback.callback = lambda: None
-    yield
+    # The callback also handles global options, so only the check is disabled
+    with patch("giza.cli.cli.check_version"):
+        yield
+
+
+def _protobuf_field(number, value):
+    """
+    Encode a protobuf field, ints as varints and str/bytes as length delimited values.
+    """
+
+    def varint(value):
+        out = bytearray()
+        while True:
+            byte, value = value & 0x7F, value >> 7
+            out.append(byte | (0x80 if value else 0))
+            if not value:
+                return bytes(out)
+
+    if isinstance(value, int):
+        return varint(number << 3) + varint(value)
+    if isinstance(value, str):
+        value = value.encode()
+    return varint(number << 3 | 2) + varint(len(value)) + value
+
+
+def make_onnx_model(nodes, initializers=(), opset=13):
+    """
+    Serialize a minimal ONNX model without depending on `onnx`.
+
+    Args:
+        nodes: `(op_type, domain)` of each node, domain can be empty
+        initializers: `(dims, data_type)` of each initializer
+        opset: version of the default opset
+    """
+    graph = b"".join(
+        _protobuf_field(1, _protobuf_field(4, op_type) + _protobuf_field(7, domain))
+        for op_type, domain in nodes
+    ) + b"".join(
+        _protobuf_field(
+            5,
+            b"".join(_protobuf_field(1, dim) for dim in dims)
+            + _protobuf_field(2, data_type),
+        )
+        for dims, data_type in initializers
+    )
+    return (
+        _protobuf_field(1, 8)
+        + _protobuf_field(2, "pytorch")
+        + _protobuf_field(7, graph)
+        + _protobuf_field(8, _protobuf_field(1, "") + _protobuf_field(2, opset))
+    )
+
+
+@pytest.fixture(autouse=True)
+def runs_dir(tmp_path, monkeypatch):
+    """
+    Keep the journals of the workflows out of the home folder.
+    """
+    path = tmp_path / "runs"
+    monkeypatch.setenv("GIZA_RUNS_DIR", str(path))
+    return path
@@ -1,26 +1,34 @@
 import datetime
 import json
+import os
+import threading
+import time
 from io import BufferedReader
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-from jose import ExpiredSignatureError
+from jose import ExpiredSignatureError, jwt
 from requests import HTTPError
 
 from giza.cli.client import (
     DEFAULT_API_VERSION,
+    GIZA_TOKEN_VARIABLE,
     MODEL_URL_HEADER,
+    TOKEN_RENEWAL_MARGIN,
     ApiClient,
+    EndpointsClient,
     JobsClient,
     ModelsClient,
     ProofsClient,
     VersionsClient,
 )
+from giza.cli.schemas.endpoints import Prediction
 from giza.cli.schemas.jobs import Job, JobCreate
 from giza.cli.schemas.models import Model, ModelCreate, ModelUpdate
 from giza.cli.schemas.proofs import Proof
 from giza.cli.schemas.versions import Version, VersionCreate, VersionList
 from giza.cli.utils.enums import Framework, JobSize, JobStatus, VersionStatus
+from giza.cli.utils.prediction_cache import PredictionCache
 
 
 class ResponseStub:
@@ -372,6 +380,103 @@ def test_jobs_client_create(tmpdir):
     assert job == result
 
 
+def test_jobs_client_get_many(tmpdir):
+    listed = [
+        Job(id=i, job_name="job", size=JobSize.S, status=JobStatus.PROCESSING)
+        for i in range(1, 4)
+    ]
+    missing = Job(id=9, job_name="verify", size=JobSize.S, status=JobStatus.COMPLETED)
+    responses = [
+        ResponseStub([job.model_dump() for job in listed], 200),
+        ResponseStub(missing.model_dump(), 200),
+    ]
+    with patch("pathlib.Path.home", return_value=tmpdir), patch(
+        "requests.Session.get", side_effect=responses
+    ) as mock_request, patch("jose.jwt.decode"):
+        client = JobsClient("http://dummy_host", token="token")
+        result = client.get_many([1, 3, 9])
+
+    # One list call for every job, plus one call for the job missing from it
+    assert mock_request.call_count == 2
+    assert mock_request.call_args.args[0] == "http://dummy_host/api/v1/jobs/9"
+    assert result == {1: listed[0], 3: listed[2], 9: missing}
+
+
+def test_jobs_client_get_many_without_ids(tmpdir):
+    with patch("pathlib.Path.home", return_value=tmpdir), patch(
+        "requests.Session.get"
+    ) as mock_request, patch("jose.jwt.decode"):
+        client = JobsClient("http://dummy_host", token="token")
+        assert client.get_many([]) == {}
+
+    mock_request.assert_not_called()
+
+
+def test_endpoints_client_predict(tmpdir):
+    response = ResponseStub({"result": [3], "request_id": "abc"}, 200)
+    with patch("pathlib.Path.home", return_value=tmpdir), patch(
+        "requests.Session.post", return_value=response
+    ) as mock_request, patch("jose.jwt.decode"):
+        client = EndpointsClient("http://dummy_host", token="token")
+        result = client.predict("http://endpoint/", [1, 2], dry_run=True)
+
+    assert result == Prediction(result=[3], request_id="abc")
+    assert mock_request.call_args.args[0] == "http://endpoint/cairo_run"
+    assert mock_request.call_args.kwargs["json"] == {
+        "args": [1, 2],
+        "job_size": JobSize.S,
+        "dry_run": True,
+    }
+
+
+def test_endpoints_client_predict_cached(tmpdir):
+    response = ResponseStub({"result": [3], "request_id": "abc"}, 200)
+    cache = PredictionCache(1, 2)
+    with patch("pathlib.Path.home", return_value=tmpdir), patch(
+        "requests.Session.post", return_value=response
+    ) as mock_request, patch("jose.jwt.decode"):
+        client = EndpointsClient("http://dummy_host", token="token")
+        first = client.predict("http://endpoint", [1, 2], cache=cache)
+        second = client.predict("http://endpoint", [1, 2], cache=cache)
+        client.predict("http://endpoint", [1, 2], dry_run=True, cache=cache)
+
+    assert first == second == Prediction(result=[3], request_id="abc")
+    # The second call is served by the cache, dry runs always reach the endpoint
+    assert mock_request.call_count == 2
+
+
+def test_endpoints_client_predict_many_keeps_order(tmpdir):
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def predict(uri, args, job_size, dry_run):
+        with lock:
+            in_flight.append(args)
+            peak.append(len(in_flight))
+        # The first inputs finish last
+        time.sleep(0.01 * (10 - args))
+        with lock:
+            in_flight.remove(args)
+        if args == 4:
+            raise HTTPError("boom")
+        return Prediction(result=args * 2)
+
+    with patch("pathlib.Path.home", return_value=tmpdir), patch.object(
+        EndpointsClient, "predict", side_effect=predict
+    ):
+        client = EndpointsClient("http://dummy_host", token="token")
+        results = list(client.predict_many("http://endpoint", range(10), 3))
+
+    assert [r.result for i, r in enumerate(results) if i != 4] == [
+        i * 2 for i in range(10) if i != 4
+    ]
+    assert isinstance(results[4], HTTPError)
+    assert max(peak) <= 3
+    # The endpoint host gets its own pool, sized for the requests in flight
+    assert client.session.get_adapter("http://endpoint/")._pool_maxsize == 3
+
+
 def test_proof_client_get(tmpdir):
     proof_id = 1
     proof = Proof(
@@ -444,3 +549,119 @@ def test_proof_client_download(tmpdir):
 
     mock_request.assert_called()
     assert isinstance(result, bytes)
+
+
+def test_api_client__login_reuses_token_refreshed_by_other_process(tmpdir):
+    giza_folder = tmpdir / ".giza"
+    giza_folder.mkdir()
+    with patch("pathlib.Path.home", return_value=tmpdir):
+        client = ApiClient("http://dummy_host")
+    with open(giza_folder / ".credentials.json", "w") as f:
+        json.dump({"user": "user", "token": "refreshed"}, f)
+
+    with patch.object(ApiClient, "_get_oauth") as mock_oauth, patch("jose.jwt.decode"):
+        client.retrieve_token("user", "password")
+
+    mock_oauth.assert_not_called()
+    assert client.token == "refreshed"
+
+
+def test_api_client__login_renew_with_same_token(tmpdir):
+    giza_folder = tmpdir / ".giza"
+    giza_folder.mkdir()
+    with open(giza_folder / ".credentials.json", "w") as f:
+        json.dump({"user": "user", "token": "old"}, f)
+    with patch("pathlib.Path.home", return_value=tmpdir):
+        client = ApiClient("http://dummy_host")
+
+    def get_oauth(*args):
+        client.token = "new"
+
+    with patch.object(
+        ApiClient, "_get_oauth", side_effect=get_oauth
+    ) as mock_oauth, patch("jose.jwt.decode"):
+        client.retrieve_token("user", "password", renew=True)
+
+    mock_oauth.assert_called_once()
+    with open(giza_folder / ".credentials.json") as f:
+        assert json.load(f) == {"user": "user", "token": "new"}
+
+
+def _build_token(expires_in):
+    return jwt.encode(
+        {"sub": "user", "exp": int(time.time()) + expires_in}, "secret", "HS256"
+    )
+
+
+def test_api_client_auth_header_prefers_api_key_close_to_expiry(tmpdir):
+    with patch("pathlib.Path.home", return_value=tmpdir):
+        client = ApiClient("http://dummy_host")
+    client.api_key = "api_key"
+
+    client.token = _build_token(3600)
+    assert "Authorization" in client._get_auth_header()
+
+    client.token = _build_token(60)
+    assert client._get_auth_header() == {"X-API-Key": "api_key"}
+
+
+def test_api_client_schedules_token_renewal(tmpdir):
+    token = _build_token(3600)
+    with patch("pathlib.Path.home", return_value=tmpdir), patch(
+        "threading.Timer"
+    ) as mock_timer, patch.dict(os.environ, {GIZA_TOKEN_VARIABLE: token}):
+        client = ApiClient("http://dummy_host")
+        client.retrieve_token()
+        client.retrieve_token()
+
+    mock_timer.assert_called_once()
+    delay, callback = mock_timer.call_args.args
+    assert 3600 - TOKEN_RENEWAL_MARGIN - 5 < delay <= 3600 - TOKEN_RENEWAL_MARGIN
+    assert callback == client._renew_token
+    assert client.token == token
+
+
+def test_api_client__renew_token_from_credentials_file(tmpdir):
+    giza_folder = tmpdir / ".giza"
+    giza_folder.mkdir()
+    new_token = _build_token(7200)
+    with patch("pathlib.Path.home", return_value=tmpdir):
+        client = ApiClient("http://dummy_host")
+    client.token = _build_token(60)
+    with open(giza_folder / ".credentials.json", "w") as f:
+        json.dump({"user": "user", "token": new_token}, f)
+
+    with patch("threading.Timer"):
+        renewed = client._renew_token()
+
+    assert renewed
+    assert client.token == new_token
+
+
+def test_api_client__renew_token_without_api_key(tmpdir, capsys):
+    with patch("pathlib.Path.home", return_value=tmpdir):
+        client = ApiClient("http://dummy_host")
+    client.token = _build_token(60)
+
+    assert not client._renew_token()
+    assert "no API key is available" in capsys.readouterr().out
+
+
+def test_api_client_warn_token_expiry(tmpdir, capsys):
+    with patch("pathlib.Path.home", return_value=tmpdir):
+        client = ApiClient("http://dummy_host")
+    client.token = _build_token(3600)
+
+    expires_in = client.warn_token_expiry()
+    # A fresh token outlives the wait
+    assert 3590 < expires_in <= 3600
+    assert "no API key is available" not in capsys.readouterr().out
+
+    client.warn_token_expiry(timeout=7200)
+    assert "no API key is available" in capsys.readouterr().out
+    client.token = _build_token(60)
+    client.warn_token_expiry()
+    assert "no API key is available" in capsys.readouterr().out
+
+    client.api_key = "api_key"
+    assert client.warn_token_expiry() is None
@@ -0,0 +1,192 @@
+import multiprocessing
+import os
+import resource
+import threading
+import time
+import tracemalloc
+from http import client as http_client
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+
+from giza.cli.client import JobsClient, ModelsClient, ProofsClient, VersionsClient
+from giza.cli.mock_server import MockApiServer, MockConfig, mock_token
+from giza.cli.schemas.jobs import JobCreate
+from giza.cli.schemas.models import ModelCreate
+from giza.cli.schemas.versions import VersionCreate, VersionUpdate
+from giza.cli.utils.enums import Framework, JobSize, VersionStatus
+from giza.cli.utils.misc import download_model_or_sierra
+
+MB = 1024 * 1024
+# Size of the synthetic payloads, raise it locally to reproduce OOMs with real sizes
+PAYLOAD_SIZE = int(os.environ.get("GIZA_MEMORY_TEST_SIZE_MB", "32")) * MB
+
+pytestmark = pytest.mark.skipif(
+    not os.path.exists("/proc/self/statm"), reason="RSS sampling needs procfs"
+)
+
+
+def _rss() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize()
+
+
+class MemoryMonitor:
+    """
+    Measure the peak memory used by a block of code.
+
+    Python allocations are traced with `tracemalloc`, and the RSS is sampled in a background
+    thread to cross-check it, catching memory held by C extensions or the allocator.
+    """
+
+    def __init__(self, interval: float = 0.001) -> None:
+        self.interval = interval
+        self.traced_peak = 0
+        self.rss_peak = 0
+        self._baseline = 0
+        self._traced_baseline = 0
+        self._was_tracing = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.rss_peak = max(self.rss_peak, _rss() - self._baseline)
+
+    def __enter__(self) -> "MemoryMonitor":
+        self._baseline = _rss()
+        self._was_tracing = tracemalloc.is_tracing()
+        if not self._was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._traced_baseline, _ = tracemalloc.get_traced_memory()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.rss_peak = max(self.rss_peak, _rss() - self._baseline)
+        _, peak = tracemalloc.get_traced_memory()
+        self.traced_peak = peak - self._traced_baseline
+        if not self._was_tracing:
+            tracemalloc.stop()
+
+    def assert_under(self, budget: float) -> None:
+        assert (
+            self.traced_peak < budget
+        ), f"Traced peak {self.traced_peak / MB:.1f}MB over budget {budget / MB:.1f}MB"
+        assert (
+            self.rss_peak < budget
+        ), f"RSS peak {self.rss_peak / MB:.1f}MB over budget {budget / MB:.1f}MB"
+
+
+def _serve(urls, payload_size):
+    server = MockApiServer(config=MockConfig(job_duration=0, payload_size=payload_size))
+    urls.put(server.url)
+    server.serve_forever(poll_interval=0.05)
+
+
+@pytest.fixture(scope="module")
+def api_url():
+    # The server runs in its own process so its memory is not measured
+    context = multiprocessing.get_context("spawn")
+    urls = context.Queue()
+    process = context.Process(target=_serve, args=(urls, PAYLOAD_SIZE), daemon=True)
+    process.start()
+    yield urls.get(timeout=30)
+    process.terminate()
+    process.join()
+
+
+@pytest.fixture(autouse=True)
+def no_http_debug():
+    # `--debug` in other tests leaves http.client echoing every request body
+    with patch.object(http_client.HTTPConnection, "debuglevel", 0):
+        yield
+
+
+@pytest.fixture
+def payload_file(tmpdir):
+    path = str(tmpdir / "payload")
+    with open(path, "wb") as f:
+        f.write(os.urandom(PAYLOAD_SIZE))
+    return path
+
+
+def _completed_version(api_url, token):
+    model = ModelsClient(api_url, token=token).create(ModelCreate(name="memory"))
+    client = VersionsClient(api_url, token=token)
+    version, upload_url = client.create(
+        model.id, VersionCreate(size=1, framework=Framework.CAIRO), "model.onnx"
+    )
+    client._upload(upload_url, b"onnx")
+    client.update(
+        model.id, version.version, VersionUpdate(status=VersionStatus.UPLOADED)
+    )
+    while client.get(model.id, version.version).status != VersionStatus.COMPLETED:
+        time.sleep(0.01)
+    return client, model.id, version.version
+
+
+def test_upload_streams_the_file(api_url, payload_file):
+    token = mock_token()
+    model = ModelsClient(api_url, token=token).create(ModelCreate(name="upload"))
+    client = VersionsClient(api_url, token=token)
+    _, upload_url = client.create(
+        model.id, VersionCreate(size=PAYLOAD_SIZE, framework=Framework.CAIRO), "model"
+    )
+
+    with open(payload_file, "rb") as f, MemoryMonitor() as monitor:
+        client._upload(upload_url, f)
+
+    monitor.assert_under(0.25 * PAYLOAD_SIZE)
+
+
+def test_job_create_multipart_upload(api_url, payload_file):
+    client = JobsClient(api_url, token=mock_token())
+
+    with open(payload_file, "rb") as trace, open(payload_file, "rb") as memory:
+        with MemoryMonitor() as monitor:
+            client.create(
+                JobCreate(size=JobSize.S, framework=Framework.CAIRO), trace, memory
+            )
+
+    # The multipart body is built in memory, budget for it plus a copy of both files
+    monitor.assert_under(3 * 2 * PAYLOAD_SIZE)
+
+
+def test_proof_download(api_url):
+    token = mock_token()
+    jobs_client = JobsClient(api_url, token=token)
+    job = jobs_client.create(JobCreate(size=JobSize.S, framework=Framework.CAIRO))
+    jobs_client.get(job.id)
+    client = ProofsClient(api_url, token=token)
+    proof = client.get_by_job_id(job.id)
+
+    with MemoryMonitor() as monitor:
+        content = client.download(proof.id)
+
+    assert len(content) == PAYLOAD_SIZE
+    # The content is read in chunks and joined, so it is held twice at most
+    monitor.assert_under(2.5 * PAYLOAD_SIZE)
+
+
+def test_version_download_and_extraction(api_url, tmpdir):
+    client, model_id, version_id = _completed_version(api_url, mock_token())
+
+    with MemoryMonitor() as monitor:
+        downloads = client.download(
+            model_id,
+            version_id,
+            {"download_model": True, "download_sierra": False},
+            stream=True,
+        )
+        with downloads["model"] as content:
+            download_model_or_sierra(content, str(tmpdir), "model")
+
+    assert os.path.getsize(tmpdir / "src" / "payload.bin") == PAYLOAD_SIZE
+    # The archive is spooled to disk and extracted in chunks
+    monitor.assert_under(0.25 * PAYLOAD_SIZE)
@@ -0,0 +1,210 @@
+import time
+
+import pytest
+from requests import HTTPError
+
+from giza.cli.client import (
+    EndpointsClient,
+    JobsClient,
+    ModelsClient,
+    ProofsClient,
+    VersionsClient,
+    WorkspaceClient,
+)
+from giza.cli.mock_server import MockApiServer, MockConfig, mock_token
+from giza.cli.schemas.endpoints import EndpointCreate
+from giza.cli.schemas.jobs import JobCreate
+from giza.cli.schemas.models import ModelCreate
+from giza.cli.schemas.versions import VersionCreate, VersionUpdate
+from giza.cli.utils.enums import Framework, JobKind, JobStatus, VersionStatus
+from giza.cli.utils.prediction_cache import PredictionCache
+
+
+@pytest.fixture
+def server():
+    with MockApiServer(config=MockConfig(job_duration=0, payload_size=64)) as server:
+        yield server
+
+
+def wait_for(get, done):
+    for _ in range(50):
+        entity = get()
+        if done(entity):
+            return entity
+        time.sleep(0.01)
+    raise AssertionError("Timeout waiting for the mock API")
+
+
+def test_transpilation_flow(server, tmpdir):
+    token = mock_token()
+    model = ModelsClient(server.url, token=token).create(ModelCreate(name="model"))
+    client = VersionsClient(server.url, token=token)
+    model_path = tmpdir / "model.onnx"
+    model_path.write_binary(b"onnx")
+
+    version, upload_url = client.create(
+        model.id, VersionCreate(size=4, framework=Framework.CAIRO), "model.onnx"
+    )
+    with open(model_path, "rb") as f:
+        client._upload(upload_url, f)
+    client.update(
+        model.id, version.version, VersionUpdate(status=VersionStatus.UPLOADED)
+    )
+    version = wait_for(
+        lambda: client.get(model.id, version.version),
+        lambda v: v.status == VersionStatus.COMPLETED,
+    )
+    downloads = client.download(
+        model.id,
+        version.version,
+        {"download_model": True, "download_sierra": True},
+    )
+
+    assert ModelsClient(server.url, token=token).get_by_name("model").id == model.id
+    assert len(downloads["inference.sierra.json"]) == 64
+    assert client.download_original(model.id, version.version) == b"onnx"
+
+
+def test_proving_flow(server):
+    token = mock_token()
+    jobs_client = JobsClient(server.url, token=token)
+    job = jobs_client.create(JobCreate(size="S", framework=Framework.CAIRO), b"trace")
+    job = wait_for(
+        lambda: jobs_client.get(job.id), lambda j: j.status == JobStatus.COMPLETED
+    )
+    proofs_client = ProofsClient(server.url, token=token)
+    proof = proofs_client.get_by_job_id(job.id)
+
+    assert len(proofs_client.download(proof.id)) == 64
+    assert proofs_client.verify_proof(proof.id).verification
+    verify_job = jobs_client.create(
+        JobCreate(size="S", kind=JobKind.VERIFY, proof_id=proof.id), None
+    )
+    assert jobs_client.get(verify_job.id).status == JobStatus.COMPLETED
+    assert len(proofs_client.list()) == 1
+
+
+def test_endpoints_and_workspaces(server):
+    token = mock_token()
+    client = EndpointsClient(server.url, token=token)
+    endpoint = client.create(1, 1, EndpointCreate(size="S", model_id=1, version_id=1))
+
+    assert client.get(endpoint.id).uri == f"{server.url}/endpoints/{endpoint.id}"
+    assert len(client.list(params={"model_id": 1}).root) == 1
+    client.delete(endpoint.id)
+    assert client.list(params={"is_active": True}).root == []
+
+    workspaces = WorkspaceClient(server.url, token=token)
+    with pytest.raises(HTTPError):
+        workspaces.get()
+    assert workspaces.create().status == "COMPLETED"
+
+
+def test_error_injection():
+    config = MockConfig(error_rate=1, error_status=503)
+    with MockApiServer(config=config) as server:
+        with pytest.raises(HTTPError) as e:
+            ModelsClient(server.url, token=mock_token()).list()
+
+    assert e.value.response.status_code == 503
+    assert server.state.requests["list_models"] == 1
+
+
+def test_predictions(server):
+    client = EndpointsClient(server.url, token=mock_token())
+    endpoint = client.create(1, 1, EndpointCreate(size="S", model_id=1, version_id=1))
+
+    prediction = client.predict(endpoint.uri, [1, 2])
+    results = list(client.predict_many(endpoint.uri, ([i] for i in range(20)), 4))
+
+    assert prediction.result == [1, 2] and prediction.request_id
+    assert [r.result for r in results] == [[i] for i in range(20)]
+    assert server.state.requests["predict"] == 21
+    client.delete(endpoint.id)
+    with pytest.raises(HTTPError):
+        client.predict(endpoint.uri, [1])
+
+
+def test_predictions_create_proofs(server):
+    client = EndpointsClient(server.url, token=mock_token())
+    endpoint = client.create(1, 1, EndpointCreate(size="S", model_id=1, version_id=1))
+
+    prediction = client.predict(endpoint.uri, [1])
+    client.predict(endpoint.uri, [1], dry_run=True)
+    proofs = client.list_proofs(endpoint.id).root
+    url = client.get_proof_download_url(endpoint.id, proofs[0].id)
+    response = client.session.get(
+        url, headers={"Range": "bytes=10-", "x-amz-checksum-mode": "ENABLED"}
+    )
+    unchecked = client.session.get(url)
+    past_the_end = client.session.get(url, headers={"Range": "bytes=64-"})
+
+    assert [proof.request_id for proof in proofs] == [prediction.request_id]
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == "bytes 10-63/64"
+    assert len(response.content) == 54
+    assert response.headers["x-amz-checksum-sha256"]
+    assert "x-amz-checksum-sha256" not in unchecked.headers
+    assert past_the_end.status_code == 416
+    assert past_the_end.headers["Content-Range"] == "bytes */64"
+
+
+def test_batched_predictions(server):
+    client = EndpointsClient(server.url, token=mock_token())
+    endpoint = client.create(1, 1, EndpointCreate(size="S", model_id=1, version_id=1))
+
+    with client.batcher(endpoint.uri, max_batch_size=5, max_wait=0.5) as batcher:
+        results = list(
+            client.predict_many(
+                endpoint.uri, ([i] for i in range(20)), 2, batcher=batcher
+            )
+        )
+
+    assert [r.result for r in results] == [[i] for i in range(20)]
+    assert len({r.request_id for r in results}) == 20
+    assert server.state.requests["predict"] == 4
+
+
+def test_batched_predictions_reject_other_settings(server):
+    client = EndpointsClient(server.url, token=mock_token())
+    endpoint = client.create(1, 1, EndpointCreate(size="S", model_id=1, version_id=1))
+    cache = PredictionCache(1, 1)
+
+    with client.batcher(endpoint.uri, 5, dry_run=True) as batcher:
+        with pytest.raises(ValueError):
+            list(
+                client.predict_many(
+                    endpoint.uri, [[1], [2]], 2, batcher=batcher, cache=cache
+                )
+            )
+
+    # Nothing is sent, so no dry-run prediction ends up in the cache
+    assert "predict" not in server.state.requests
+    assert cache.get([1]) is None
+
+
+def test_cached_predictions(server):
+    client = EndpointsClient(server.url, token=mock_token())
+    endpoint = client.create(1, 1, EndpointCreate(size="S", model_id=1, version_id=1))
+    cache = PredictionCache(1, 1)
+    inputs = [[i % 5] for i in range(20)]
+
+    first = list(client.predict_many(endpoint.uri, inputs, 1, cache=cache))
+    second = list(client.predict_many(endpoint.uri, inputs, 4, cache=cache))
+
+    assert [r.result for r in second] == inputs
+    assert [r.request_id for r in second] == [r.request_id for r in first]
+    assert server.state.requests["predict"] == 5
+
+
+def test_logs_by_offset(server):
+    client = JobsClient(server.url, token=mock_token())
+    job = client.create(JobCreate(size="S", framework=Framework.CAIRO), b"trace")
+    wait_for(lambda: client.get(job.id), lambda j: j.status == JobStatus.COMPLETED)
+
+    full = client.get_logs(job.id)
+    tail = client.get_logs(job.id, offset=5)
+
+    assert full.next_offset is None
+    assert tail.logs == full.logs[5:]
+    assert tail.next_offset == len(full.logs)
@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+
+from giza.cli.utils.batching import MicroBatcher
+from giza.cli.utils.metrics import metrics, percentile
+
+
+def test_items_within_the_window_are_coalesced():
+    batches = []
+
+    def dispatch(items):
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    with MicroBatcher(dispatch, max_batch_size=4, max_wait=0.2) as batcher:
+        futures = [batcher.submit(i) for i in range(10)]
+        results = [future.result() for future in futures]
+
+    assert results == [i * 2 for i in range(10)]
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert batcher.batch_sizes == {4: 2, 2: 1}
+    assert "4x2" in batcher.report()
+    assert metrics.values("giza_predict_batch_size")[-3:] == [4, 4, 2]
+    assert len(metrics.values("giza_predict_latency_seconds")) >= 10
+
+
+def test_lone_items_are_only_delayed_by_the_window():
+    with MicroBatcher(lambda items: items, max_batch_size=8, max_wait=0.05) as batcher:
+        start = time.perf_counter()
+        assert batcher.submit("a").result() == "a"
+
+    assert time.perf_counter() - start < 0.5
+
+
+def test_items_submitted_from_many_threads():
+    with MicroBatcher(lambda items: items, max_batch_size=16, max_wait=0.1) as batcher:
+        results = {}
+
+        def call(i):
+            results[i] = batcher.submit(i).result()
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert results == {i: i for i in range(16)}
+    assert sum(batcher.batch_sizes.values()) < 16
+
+
+def test_errors_are_fanned_out():
+    def dispatch(items):
+        return [ValueError(item) if item == 1 else item for item in items]
+
+    with MicroBatcher(dispatch, max_batch_size=3, max_wait=0.1) as batcher:
+        futures = [batcher.submit(i) for i in range(3)]
+
+    assert futures[0].result() == 0
+    with pytest.raises(ValueError):
+        futures[1].result()
+    assert futures[2].result() == 2
+
+
+def test_failed_batches_fail_every_item():
+    def dispatch(items):
+        raise ConnectionError("down")
+
+    with MicroBatcher(dispatch, max_batch_size=2, max_wait=0.1) as batcher:
+        futures = [batcher.submit(i) for i in range(2)]
+
+    for future in futures:
+        with pytest.raises(ConnectionError):
+            future.result()
+
+
+def test_closed_batcher_rejects_items():
+    batcher = MicroBatcher(lambda items: items)
+    batcher.close()
+
+    with pytest.raises(RuntimeError):
+        batcher.submit(1)
+
+
+def test_percentile():
+    assert percentile([], 50) == 0
+    assert percentile([3, 1, 2, 4], 50) == 2
+    assert percentile(list(range(1, 101)), 99) == 99
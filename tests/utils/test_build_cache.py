@@ -0,0 +1,75 @@
+import os
+from unittest.mock import patch
+
+from giza.cli.commands.versions import update_sierra
+from giza.cli.utils import build_cache
+from giza.cli.utils.misc import scarb_build
+
+
+def _project(tmpdir):
+    folder = tmpdir / "model" / "inference"
+    (folder / "src").ensure(dir=True)
+    (folder / "Scarb.toml").write("[package]\nname = 'inference'")
+    (folder / "src" / "lib.cairo").write("fn main() {}")
+    return str(folder)
+
+
+def _build(cmd, check, cwd=None):
+    if cmd[1:] == ["build"]:
+        target = os.path.join(cwd, "target", "dev")
+        os.makedirs(target, exist_ok=True)
+        with open(os.path.join(target, "inference.sierra.json"), "w") as f:
+            f.write("{}")
+
+
+def test_source_hash_ignores_build_output(tmpdir):
+    folder = _project(tmpdir)
+    before = build_cache.source_hash(folder)
+    _build(["scarb", "build"], True, cwd=folder)
+
+    assert build_cache.source_hash(folder) == before
+
+    (tmpdir / "model" / "inference" / "src" / "lib.cairo").write("fn main() { 1 }")
+    assert build_cache.source_hash(folder) != before
+
+
+def test_scarb_build_skips_unchanged_sources(tmpdir):
+    folder = _project(tmpdir)
+
+    with patch("subprocess.run", side_effect=_build) as mock_run:
+        scarb_build(folder)
+        scarb_build(folder)
+        assert mock_run.call_count == 2
+
+        (tmpdir / "model" / "inference" / "Scarb.toml").write("[package]\n")
+        scarb_build(folder)
+        assert mock_run.call_count == 4
+
+        scarb_build(folder, use_cache=False)
+        assert mock_run.call_count == 6
+
+
+def test_find_sierra_is_memoized(tmpdir):
+    folder = _project(tmpdir)
+    assert build_cache.find_sierra(folder) is None
+    _build(["scarb", "build"], True, cwd=folder)
+
+    path = build_cache.find_sierra(folder)
+    assert path.endswith("inference.sierra.json")
+    with patch("glob.glob") as mock_glob:
+        assert build_cache.find_sierra(folder) == path
+    mock_glob.assert_not_called()
+
+
+def test_update_sierra_skips_identical_upload(tmpdir):
+    folder = _project(tmpdir)
+    _build(["scarb", "build"], True, cwd=folder)
+    model_path = str(tmpdir / "model")
+
+    with patch("giza.cli.commands.versions.TranspileClient") as mock_client:
+        update_sierra(1, 1, model_path)
+        update_sierra(1, 1, model_path)
+        update_sierra(1, 2, model_path)
+        update_sierra(1, 2, model_path, use_cache=False)
+
+    assert mock_client.return_value.update_transpilation.call_count == 3
@@ -0,0 +1,36 @@
+import json
+import multiprocessing
+import os
+
+from giza.cli.utils.files import atomic_write_json, file_lock
+
+
+def _write_and_read(args):
+    path, lock_path, worker = args
+    for i in range(20):
+        with file_lock(lock_path):
+            atomic_write_json(path, {"worker": worker, "i": i, "data": "x" * 4096})
+        with file_lock(lock_path, shared=True), open(path) as f:
+            json.load(f)
+    return worker
+
+
+def test_atomic_write_json(tmpdir):
+    path = tmpdir / "nested" / "file.json"
+    atomic_write_json(path, {"token": "token"})
+
+    with open(path) as f:
+        assert json.load(f) == {"token": "token"}
+    assert oct(os.stat(path).st_mode & 0o777) == oct(0o600)
+    assert os.listdir(tmpdir / "nested") == ["file.json"]
+
+
+def test_file_lock_concurrent_writers(tmpdir):
+    path = str(tmpdir / "file.json")
+    lock_path = str(tmpdir / "file.lock")
+    with multiprocessing.Pool(4) as pool:
+        workers = pool.map(_write_and_read, [(path, lock_path, w) for w in range(8)])
+
+    assert sorted(workers) == list(range(8))
+    with open(path) as f:
+        assert json.load(f)["i"] == 19
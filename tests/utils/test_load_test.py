@@ -0,0 +1,59 @@
+import threading
+import time
+from unittest.mock import Mock
+
+from requests import HTTPError
+
+from giza.cli.utils.load_test import run_load_test
+
+
+def test_concurrent_requests_until_the_limit():
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+    seen = []
+
+    def call(args):
+        with lock:
+            in_flight.append(args)
+            peak.append(len(in_flight))
+            seen.append(args)
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(args)
+
+    stats = run_load_test(call, [1, 2, 3], 5, concurrency=3, max_requests=12)
+
+    assert stats.requests == 12
+    assert max(peak) == 3
+    assert sorted(seen) == [1] * 4 + [2] * 4 + [3] * 4
+    summary = stats.summary()
+    assert summary["errors"] == 0
+    assert summary["latency_p50_ms"] >= 10
+    assert summary["throughput"] > 0
+
+
+def test_duration_and_rate():
+    start = time.perf_counter()
+    stats = run_load_test(lambda args: None, [1], 0.5, concurrency=4, rate=10)
+
+    assert 0.5 <= time.perf_counter() - start < 1
+    # One token to start with and 10 per second after it
+    assert 4 <= stats.requests <= 7
+
+
+def test_errors_by_kind():
+    response = Mock(status_code=503)
+
+    def call(args):
+        if args == 1:
+            raise HTTPError(response=response)
+        if args == 2:
+            raise TimeoutError()
+
+    stats = run_load_test(call, [0, 1, 2, 1], 5, max_requests=8)
+    summary = stats.summary()
+
+    assert summary["errors_by_kind"] == {"HTTP 503": 4, "TimeoutError": 2}
+    assert summary["error_rate"] == 0.75
+    assert summary["requests"] == 8
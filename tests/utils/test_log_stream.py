@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+from giza.cli.schemas.logs import Logs
+from giza.cli.utils.log_stream import MAX_PARTIAL_LINE, follow_logs
+
+
+def _follow(responses, finished_after):
+    lines, offsets = [], []
+    checks = iter([False] * finished_after + [True])
+
+    def fetch(offset):
+        offsets.append(offset)
+        return responses.pop(0)
+
+    with patch("giza.cli.utils.log_stream.time.sleep"):
+        follow_logs(fetch, lambda: next(checks), lines.append)
+    return lines, offsets
+
+
+def test_reads_by_offset():
+    responses = [
+        Logs(logs="one\ntw", next_offset=6),
+        Logs(logs="o\nthree\n", next_offset=14),
+        Logs(logs="", next_offset=14),
+    ]
+    lines, offsets = _follow(responses, 2)
+
+    assert lines == ["one", "two", "three"]
+    assert offsets == [0, 6, 14]
+
+
+def test_skips_what_was_written_when_the_offset_is_ignored():
+    responses = [
+        Logs(logs="one\n"),
+        Logs(logs="one\ntwo\n"),
+        Logs(logs="one\ntwo\nthree"),
+    ]
+    lines, offsets = _follow(responses, 2)
+
+    assert lines == ["one", "two", "three"]
+    assert offsets == [0, None, None]
+
+
+def test_offsets_honoured_without_next_offset():
+    logs = ["one\n", "one\ntwo\n", "one\ntwo\nthree\n", "one\ntwo\nthree\n"]
+    offsets = []
+
+    def fetch(offset):
+        # Only the new logs are sent, but `next_offset` is missing
+        offsets.append(offset)
+        full = logs.pop(0) if len(logs) > 1 else logs[0]
+        if offset is None:
+            return Logs(logs=full)
+        if offset == 0:
+            return Logs(logs=full, next_offset=len(full))
+        return Logs(logs=full[offset:])
+
+    lines = []
+    checks = iter([False, False, True])
+    with patch("giza.cli.utils.log_stream.time.sleep"):
+        follow_logs(fetch, lambda: next(checks), lines.append)
+
+    assert lines == ["one", "two", "three"]
+    # The offset is not sent anymore once an answer lacks `next_offset`
+    assert offsets == [0, 4, None, None]
+
+
+def test_starts_over_when_the_logs_are_truncated():
+    responses = [Logs(logs="one\ntwo\n"), Logs(logs="new\n")]
+    lines, _ = _follow(responses, 1)
+
+    assert lines == ["one", "two", "new"]
+
+
+def test_long_lines_are_not_buffered():
+    responses = [
+        Logs(logs="x" * (MAX_PARTIAL_LINE + 1)),
+        Logs(logs="y\n", next_offset=MAX_PARTIAL_LINE + 3),
+    ]
+    lines, _ = _follow(responses, 1)
+
+    assert [len(line) for line in lines] == [MAX_PARTIAL_LINE + 1, 1]
@@ -0,0 +1,81 @@
+import json
+from datetime import timedelta
+
+from requests import PreparedRequest, Response
+
+from giza.cli.utils.metrics import Metrics, endpoint_template, record_response
+
+
+def test_endpoint_template():
+    assert (
+        endpoint_template("/api/v1/models/1/versions/22:download")
+        == "/api/v1/models/{id}/versions/{id}:download"
+    )
+    assert endpoint_template("/api/v1/models/") == "/api/v1/models/"
+
+
+def test_metrics_phase_and_counters():
+    metrics = Metrics()
+    metrics.command = "prove"
+    with metrics.phase("upload"):
+        metrics.inc("giza_phase_bytes_total", 10, phase="upload")
+    metrics.inc("giza_phase_bytes_total", 5, phase="upload")
+
+    assert len(metrics.values("giza_phase_duration_seconds", phase="upload")) == 1
+    assert metrics.counter("giza_phase_bytes_total", command="prove") == 15
+
+
+def test_record_response(monkeypatch):
+    import giza.cli.utils.metrics as module
+
+    metrics = Metrics()
+    monkeypatch.setattr(module, "metrics", metrics)
+    request = PreparedRequest()
+    request.prepare(method="PUT", url="http://dummy_host/api/v1/models/3", data=b"1234")
+    response = Response()
+    response.status_code = 200
+    response.request = request
+    response.elapsed = timedelta(seconds=2)
+    response.headers["Content-Length"] = "10"
+
+    record_response(response)
+
+    labels = {"method": "PUT", "endpoint": "/api/v1/models/{id}"}
+    assert metrics.counter("giza_http_requests_total", status=200, **labels) == 1
+    assert metrics.values("giza_http_request_duration_seconds", **labels) == [2.0]
+    assert metrics.values("giza_http_request_size_bytes", **labels) == [4]
+    assert metrics.values("giza_http_response_size_bytes", **labels) == [10]
+
+
+def test_export_json_appends_runs(tmpdir):
+    path = str(tmpdir / "metrics.jsonl")
+    metrics = Metrics()
+    metrics.inc("giza_polls_total", phase="job_wait")
+    metrics.export(path)
+    metrics.export(path)
+
+    with open(path) as f:
+        records = [json.loads(line) for line in f]
+    assert len(records) == 2
+    assert records[0]["counters"] == [
+        {"name": "giza_polls_total", "labels": {"phase": "job_wait"}, "value": 1.0}
+    ]
+
+
+def test_export_prometheus_is_cumulative(tmpdir):
+    path = str(tmpdir / "giza.prom")
+    for _ in range(2):
+        metrics = Metrics()
+        metrics.observe("giza_phase_duration_seconds", 3, phase="upload")
+        metrics.inc("giza_polls_total", 2, phase="job_wait")
+        metrics.export(path)
+
+    with open(path) as f:
+        content = f.read()
+    assert "# TYPE giza_phase_duration_seconds histogram" in content
+    assert 'giza_phase_duration_seconds_bucket{phase="upload",le="2.5"} 0' in content
+    assert 'giza_phase_duration_seconds_bucket{phase="upload",le="5"} 2' in content
+    assert 'giza_phase_duration_seconds_bucket{phase="upload",le="+Inf"} 2' in content
+    assert 'giza_phase_duration_seconds_sum{phase="upload"} 6' in content
+    assert 'giza_phase_duration_seconds_count{phase="upload"} 2' in content
+    assert 'giza_polls_total{phase="job_wait"} 4' in content
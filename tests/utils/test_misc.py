@@ -1,7 +1,16 @@
+import os
+import tempfile
+import zipfile
+from io import BytesIO
+
 import pytest
 
 from giza.cli.exceptions import PasswordError
-from giza.cli.utils.misc import _check_password_strength
+from giza.cli.utils.misc import (
+    _check_password_strength,
+    content_size,
+    download_model_or_sierra,
+)
 
 
 # Test check strength password
@@ -29,3 +38,41 @@ def test__check_password_strength_ok():
     Test that a valid password does not raise an exception.
     """
     _check_password_strength("12345678aA")
+
+
+def _zip(members):
+    tmp = BytesIO()
+    with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as f:
+        for name, content in members.items():
+            f.writestr(name, content)
+    return tmp.getvalue()
+
+
+def test_download_model_or_sierra_extracts_spooled_zip(tmpdir):
+    members = {f"src/file{i}.cairo": os.urandom(1024) for i in range(10)}
+    members["Scarb.toml"] = b"[package]"
+    with tempfile.TemporaryFile() as f:
+        f.write(_zip(members))
+        f.seek(0)
+        assert content_size(f) == f.seek(0, os.SEEK_END)
+        f.seek(0)
+        download_model_or_sierra(f, str(tmpdir), "model")
+
+    for name, content in members.items():
+        assert (tmpdir / name).read_binary() == content
+
+
+def test_download_model_or_sierra_writes_plain_file(tmpdir):
+    download_model_or_sierra(BytesIO(b"sierra"), str(tmpdir), "inference.sierra.json")
+
+    assert (tmpdir / "inference.sierra.json").read_binary() == b"sierra"
+
+
+@pytest.mark.parametrize("name", ["../evil.txt", "src/../../evil.txt", "/tmp/evil.txt"])
+def test_download_model_or_sierra_rejects_unsafe_paths(tmpdir, name):
+    output_path = tmpdir / "output"
+
+    with pytest.raises(zipfile.BadZipFile):
+        download_model_or_sierra(_zip({name: b"evil"}), str(output_path), "model")
+
+    assert not (tmpdir / "evil.txt").exists()
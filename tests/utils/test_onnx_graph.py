@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+import pytest
+
+from giza.cli.utils.compatibility import (
+    SupportedOperators,
+    check_operators,
+    load_supported_operators,
+)
+from giza.cli.utils.onnx_graph import OnnxParseError, load_model, parse_model
+from tests.conftest import make_onnx_model
+
+
+def test_parse_model_counts_operators_and_parameters():
+    content = make_onnx_model(
+        [("MatMul", ""), ("Add", ""), ("Relu", ""), ("MatMul", "")],
+        initializers=[((784, 128), 1), ((128,), 1), ((10,), 7)],
+    )
+
+    model = parse_model(content)
+
+    assert model.ir_version == 8
+    assert model.producer == "pytorch"
+    assert model.opsets == {"ai.onnx": 13}
+    assert model.operators[("ai.onnx", "MatMul")] == 2
+    assert model.parameters == 784 * 128 + 128 + 10
+    assert model.parameters_bytes == (784 * 128 + 128) * 4 + 10 * 8
+    assert model.file_size == len(content)
+
+
+def test_load_model_rejects_invalid_files(tmpdir):
+    empty = tmpdir / "empty.onnx"
+    empty.write_binary(b"")
+    garbage = tmpdir / "garbage.onnx"
+    garbage.write_binary(b"\xff" * 16)
+
+    for path in (empty, garbage):
+        with pytest.raises(OnnxParseError):
+            load_model(str(path))
+
+
+def test_check_operators_reports_unsupported():
+    model = parse_model(
+        make_onnx_model(
+            [("MatMul", ""), ("LSTM", ""), ("TreeEnsembleRegressor", "ai.onnx.ml")]
+        )
+    )
+
+    report = check_operators(
+        model, SupportedOperators(version="1", operators=frozenset({"MatMul"}))
+    )
+
+    assert not report.is_supported
+    assert report.unsupported == {
+        ("ai.onnx", "LSTM"): 1,
+        ("ai.onnx.ml", "TreeEnsembleRegressor"): 1,
+    }
+
+
+def test_supported_operators_are_cached(tmpdir, monkeypatch):
+    monkeypatch.setenv("GIZA_SUPPORTED_OPERATORS_URL", "https://example.com/ops")
+
+    class Response:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"version": "2", "operators": ["MatMul"]}
+
+    with patch("requests.get", return_value=Response()) as mock_get:
+        first = load_supported_operators(giza_dir=tmpdir)
+        second = load_supported_operators(giza_dir=tmpdir)
+
+    mock_get.assert_called_once()
+    assert first.operators == second.operators == frozenset({"MatMul"})
+    assert second.version == "2"
+    assert (tmpdir / "supported_operators.json").exists()
+
+
+def test_supported_operators_fall_back_to_bundled(tmpdir, monkeypatch):
+    monkeypatch.delenv("GIZA_SUPPORTED_OPERATORS_URL", raising=False)
+    assert load_supported_operators(giza_dir=tmpdir).source == "bundled"
+
+    monkeypatch.setenv("GIZA_SUPPORTED_OPERATORS_URL", "http://127.0.0.1:1/ops")
+    assert load_supported_operators(giza_dir=tmpdir).source == "bundled"
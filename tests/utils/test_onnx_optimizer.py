@@ -0,0 +1,146 @@
+from array import array
+
+from giza.cli.utils.onnx_graph import (
+    LENGTH_DELIMITED,
+    VARINT,
+    encode_fields,
+    iter_fields,
+    parse_model,
+)
+from giza.cli.utils.onnx_optimizer import (
+    ATTRIBUTE_NAME,
+    ATTRIBUTE_T,
+    FLOAT,
+    Graph,
+    Node,
+    Tensor,
+    optimize_file,
+    optimize_model,
+)
+
+
+def _value_info(name):
+    return memoryview(encode_fields([(1, LENGTH_DELIMITED, name.encode())]))
+
+
+def _floats(name, dims, values):
+    raw = array("f", values).tobytes()
+    return Tensor(name, dims, FLOAT, [(9, LENGTH_DELIMITED, raw)])
+
+
+def _model(graph, opset=13):
+    opset_import = encode_fields([(1, LENGTH_DELIMITED, b""), (2, VARINT, opset)])
+    return encode_fields(
+        [
+            (1, VARINT, 8),
+            (7, LENGTH_DELIMITED, graph.to_bytes()),
+            (8, LENGTH_DELIMITED, opset_import),
+        ]
+    )
+
+
+def _graph(content):
+    for number, _, value in iter_fields(content):
+        if number == 7:
+            return Graph.parse(value)
+
+
+def test_optimize_model_folds_and_removes_nodes():
+    shape_value = encode_fields(
+        [
+            (ATTRIBUTE_NAME, LENGTH_DELIMITED, b"value"),
+            (ATTRIBUTE_T, LENGTH_DELIMITED, Tensor.from_int64("", [2, 4]).to_bytes()),
+        ]
+    )
+    graph = Graph(
+        nodes=[
+            Node("Constant", "", [], ["shape"], [memoryview(shape_value)]),
+            Node("Reshape", "", ["W0", "shape"], ["W1"]),
+            Node("MatMul", "", ["X", "W1"], ["Y"]),
+            Node("Identity", "", ["Y"], ["Z"]),
+            Node("Relu", "", ["Y"], ["unused"]),
+        ],
+        initializers={
+            "W0": _floats("W0", [4, 2], range(8)),
+            "dead": _floats("dead", [100], range(100)),
+        },
+        inputs=[("X", _value_info("X"))],
+        outputs=[("Z", _value_info("Z"))],
+    )
+
+    optimized, passes = optimize_model(_model(graph))
+
+    after = _graph(optimized)
+    assert [(node.op_type, node.inputs, node.outputs) for node in after.nodes] == [
+        ("MatMul", ["X", "W1"], ["Z"])
+    ]
+    assert list(after.initializers) == ["W1"]
+    assert after.initializers["W1"].dims == [2, 4]
+    assert passes["constant_folding"] == 2
+    assert passes["identity_elimination"] == 1
+    assert passes["dead_initializers"] == 3
+    model = parse_model(optimized)
+    assert model.nodes == 1
+    assert model.parameters == 8
+
+
+def test_optimize_model_bypasses_chained_reshapes():
+    graph = Graph(
+        nodes=[
+            Node("Reshape", "", ["X", "s1"], ["R1"]),
+            Node("Reshape", "", ["R1", "s2"], ["Y"]),
+        ],
+        initializers={
+            "s1": Tensor.from_int64("s1", [4, 2]),
+            "s2": Tensor.from_int64("s2", [-1]),
+        },
+        inputs=[("X", _value_info("X"))],
+        outputs=[("Y", _value_info("Y"))],
+    )
+
+    optimized, passes = optimize_model(_model(graph))
+
+    after = _graph(optimized)
+    assert [(node.inputs, node.outputs) for node in after.nodes] == [
+        (["X", "s2"], ["Y"])
+    ]
+    assert list(after.initializers) == ["s2"]
+    assert passes["reshape_elimination"] == 1
+
+
+def test_optimize_model_keeps_overridable_initializers():
+    graph = Graph(
+        nodes=[Node("Reshape", "", ["W", "shape"], ["Y"])],
+        initializers={
+            "W": _floats("W", [2, 2], range(4)),
+            "shape": Tensor.from_int64("shape", [4]),
+        },
+        inputs=[("W", _value_info("W"))],
+        outputs=[("Y", _value_info("Y"))],
+    )
+
+    optimized, passes = optimize_model(_model(graph))
+
+    assert [node.op_type for node in _graph(optimized).nodes] == ["Reshape"]
+    assert not passes.get("constant_folding")
+
+
+def test_optimize_file_quantizes_to_fixed_point(tmpdir):
+    graph = Graph(
+        nodes=[Node("MatMul", "", ["X", "W"], ["Y"])],
+        initializers={"W": _floats("W", [3], [0.1, -1e6, 2.5])},
+        inputs=[("X", _value_info("X"))],
+        outputs=[("Y", _value_info("Y"))],
+    )
+    src, dst = tmpdir / "model.onnx", tmpdir / "optimized.onnx"
+    src.write_binary(_model(graph))
+
+    report = optimize_file(str(src), str(dst), quantize=True)
+
+    assert report.passes["quantized_initializers"] == 1
+    assert report.before.nodes == report.after.nodes == 1
+    (_, _, raw), *_ = _graph(dst.read_binary()).initializers["W"].fields
+    values = array("f", bytes(raw))
+    assert values[0] == round(0.1 * 2**16) / 2**16
+    assert values[1] == -(2**15)
+    assert values[2] == 2.5
@@ -0,0 +1,45 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from giza.cli.utils.metrics import metrics
+from giza.cli.utils.pipeline import Pipeline
+from giza.cli.utils.tracing import Tracer
+
+
+def test_background_stages_overlap():
+    start = time.perf_counter()
+    with Pipeline() as pipeline:
+        future = pipeline.submit("model_hash", lambda: time.sleep(0.2) or "hash")
+        with pipeline.stage("model_lookup"):
+            time.sleep(0.2)
+        assert future.result() == "hash"
+
+    assert time.perf_counter() - start < 0.35
+    assert set(pipeline.timings) == {"model_hash", "model_lookup"}
+    assert "model_hash 0.2" in pipeline.report()
+    assert "(background)" in pipeline.report()
+    assert metrics.values("giza_phase_duration_seconds", phase="model_hash")
+
+
+def test_background_errors_are_raised_on_result():
+    with Pipeline() as pipeline:
+        future = pipeline.submit("model_hash", open, "/does/not/exist")
+        with pytest.raises(FileNotFoundError):
+            future.result()
+
+    assert "model_hash" in pipeline.timings
+
+
+def test_background_stages_are_traced_under_the_active_span():
+    tracer = Tracer()
+    tracer.enabled = True
+    with patch("giza.cli.utils.pipeline.tracer", tracer), patch(
+        "giza.cli.utils.metrics.tracer", tracer
+    ):
+        with tracer.span("giza versions transpile") as root, Pipeline() as pipeline:
+            pipeline.submit("model_hash", lambda: None).result()
+
+    (stage,) = [span for span in tracer._finished if span.name == "model_hash"]
+    assert stage.parent_id == root.span_id
@@ -0,0 +1,52 @@
+import os
+
+from giza.cli.schemas.endpoints import Prediction
+from giza.cli.utils.prediction_cache import PredictionCache, input_hash
+
+
+def test_input_hash_is_canonical():
+    assert input_hash({"b": [1, 2], "a": 1}) == input_hash({"a": 1, "b": [1, 2]})
+    assert input_hash([1, 2]) != input_hash([2, 1])
+
+
+def test_memory_cache_is_lru():
+    cache = PredictionCache(1, 2, max_entries=2)
+    cache.put([1], Prediction(result=1, request_id="a"))
+    cache.put([2], Prediction(result=2, request_id="b"))
+    assert cache.get([1]).request_id == "a"
+    cache.put([3], Prediction(result=3, request_id="c"))
+
+    assert cache.get([2]) is None
+    assert cache.get([1]).result == 1
+    assert cache.report() == "2 hits, 1 misses"
+
+
+def test_disk_cache_is_shared_by_version(tmp_path):
+    PredictionCache(1, 2, directory=tmp_path).put([1], Prediction(result=1))
+
+    assert PredictionCache(1, 2, directory=tmp_path).get([1]).result == 1
+    assert PredictionCache(1, 3, directory=tmp_path).get([1]) is None
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = PredictionCache(1, 2, directory=tmp_path, max_disk_entries=10)
+    for i in range(10):
+        cache.put([i], Prediction(result=i))
+        os.utime(cache._path(input_hash([i])), (i, i))
+    # Reading an entry refreshes it
+    assert PredictionCache(1, 2, directory=tmp_path).get([0]) is not None
+    cache.put([10], Prediction(result=10))
+
+    files = list((tmp_path / "1-2").glob("*.json"))
+    assert len(files) == 9
+    fresh = PredictionCache(1, 2, directory=tmp_path)
+    assert fresh.get([0]) is not None
+    assert fresh.get([1]) is None and fresh.get([2]) is None
+
+
+def test_unreadable_entries_are_misses(tmp_path):
+    cache = PredictionCache(1, 2, directory=tmp_path)
+    cache.put([1], Prediction(result=1))
+    cache._path(input_hash([1])).write_text("{")
+
+    assert PredictionCache(1, 2, directory=tmp_path).get([1]) is None
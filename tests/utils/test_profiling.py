@@ -0,0 +1,45 @@
+import json
+import socket
+import time
+from unittest.mock import patch
+
+from giza.cli.utils.profiling import Profiler
+from tests.conftest import invoke_cli_runner
+
+
+def test_profiler_measures_sleep_and_restores_patches(tmpdir):
+    original_sleep = time.sleep
+    profiler = Profiler(interval=0.001)
+    profiler.start()
+    time.sleep(0.05)
+    profiler.stop()
+
+    assert time.sleep is original_sleep
+    assert "connect" not in socket.socket.__dict__
+    assert profiler.sleep_time >= 0.05
+    assert profiler.samples > 0
+
+    folded_path, summary_path = profiler.write(str(tmpdir / "profile"), 0.5)
+    with open(folded_path) as f:
+        stacks = [line.rsplit(" ", 1)[0] for line in f]
+    assert any(
+        stack.startswith("MainThread;") and "test_profiler_measures_sleep" in stack
+        for stack in stacks
+    )
+    with open(summary_path) as f:
+        summary = json.load(f)
+    assert summary["import_time"] == 0.5
+    assert summary["wall_time"] >= summary["sleep_time"]
+
+
+def test_profile_option(tmpdir):
+    prefix = str(tmpdir / "profile")
+    with patch("giza.cli.commands.models.ModelsClient") as mock_client:
+        mock_client.return_value.list.return_value.root = []
+        result = invoke_cli_runner(
+            ["--profile", "--profile-output", prefix, "models", "list"]
+        )
+
+    assert "Profile summary" in result.output
+    assert (tmpdir / "profile.folded").exists()
+    assert (tmpdir / "profile.json").exists()
@@ -0,0 +1,124 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from giza.cli.client import EndpointsClient
+from giza.cli.mock_server import MockApiServer, MockConfig, mock_token
+from giza.cli.schemas.endpoints import EndpointCreate
+from giza.cli.utils.files import file_hash
+from giza.cli.utils.proof_sync import (
+    MANIFEST_FILE,
+    ChecksumError,
+    S3Sink,
+    download_resumable,
+    sync_proofs,
+)
+
+
+@pytest.fixture
+def server():
+    with MockApiServer(config=MockConfig(job_duration=0, payload_size=64)) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    client = EndpointsClient(server.url, token=mock_token())
+    endpoint = client.create(1, 1, EndpointCreate(size="S", model_id=1, version_id=1))
+    for i in range(3):
+        client.predict(endpoint.uri, [i])
+    # The proofs are created once their jobs are checked
+    client.list_proofs(endpoint.id)
+    client.endpoint_id = endpoint.id
+    return client
+
+
+def test_only_new_proofs_are_downloaded(server, client, tmp_path):
+    first = sync_proofs(client, client.endpoint_id, tmp_path)
+    client.predict(client.get(client.endpoint_id).uri, [3])
+    second = sync_proofs(client, client.endpoint_id, tmp_path, verify=True)
+
+    assert sorted(first.downloaded) == [1, 2, 3]
+    assert second.downloaded == [4] and sorted(second.skipped) == [1, 2, 3]
+    assert server.state.requests["presigned_get"] == 4
+    manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())
+    assert manifest["proofs"]["4"]["sha256"] == file_hash(tmp_path / "4.proof")
+    assert manifest["proofs"]["4"]["size"] == 64
+
+
+def test_missing_or_corrupted_files_are_downloaded_again(client, tmp_path):
+    sync_proofs(client, client.endpoint_id, tmp_path)
+    (tmp_path / "1.proof").unlink()
+    (tmp_path / "2.proof").write_bytes(b"x" * 64)
+
+    assert sync_proofs(client, client.endpoint_id, tmp_path).downloaded == [1]
+    assert sync_proofs(
+        client, client.endpoint_id, tmp_path, verify=True
+    ).downloaded == [2]
+
+
+def test_downloads_resume_from_the_partial_file(server, client, tmp_path):
+    url = client.get_proof_download_url(client.endpoint_id, 1)
+    content = server.state.objects["proofs/1"]
+    (tmp_path / "1.proof.part").write_bytes(content[:10])
+
+    sha256 = download_resumable(client.session, url, tmp_path / "1.proof")
+
+    assert (tmp_path / "1.proof").read_bytes() == content
+    assert not (tmp_path / "1.proof.part").exists()
+    assert sha256 == file_hash(tmp_path / "1.proof")
+
+
+def test_downloads_finish_a_complete_partial_file(server, client, tmp_path):
+    url = client.get_proof_download_url(client.endpoint_id, 1)
+    content = server.state.objects["proofs/1"]
+    # Stopped after the last chunk, before the file was moved into place
+    (tmp_path / "1.proof.part").write_bytes(content)
+
+    sha256 = download_resumable(client.session, url, tmp_path / "1.proof")
+
+    assert (tmp_path / "1.proof").read_bytes() == content
+    assert not (tmp_path / "1.proof.part").exists()
+    assert sha256 == file_hash(tmp_path / "1.proof")
+
+
+def test_oversized_partial_file_is_removed(server, client, tmp_path):
+    url = client.get_proof_download_url(client.endpoint_id, 1)
+    content = server.state.objects["proofs/1"]
+    (tmp_path / "1.proof.part").write_bytes(content + b"extra")
+
+    with pytest.raises(ChecksumError):
+        download_resumable(client.session, url, tmp_path / "1.proof")
+    assert not (tmp_path / "1.proof.part").exists()
+    download_resumable(client.session, url, tmp_path / "1.proof")
+    assert (tmp_path / "1.proof").read_bytes() == content
+
+
+def test_checksum_mismatch(client, tmp_path):
+    url = client.get_proof_download_url(client.endpoint_id, 1)
+    # A partial file that does not belong to the proof
+    (tmp_path / "1.proof.part").write_bytes(b"corrupted")
+
+    with pytest.raises(ChecksumError):
+        download_resumable(client.session, url, tmp_path / "1.proof")
+    assert not (tmp_path / "1.proof").exists()
+    assert not (tmp_path / "1.proof.part").exists()
+
+
+def test_s3_sink(client, tmp_path):
+    s3 = Mock()
+    sink = S3Sink("s3://archive/giza/proofs", client=s3)
+
+    sync_proofs(client, client.endpoint_id, tmp_path, sink=sink)
+    result = sync_proofs(client, client.endpoint_id, tmp_path, sink=sink)
+
+    assert s3.put_object.call_count == 3
+    assert s3.put_object.call_args.kwargs["Bucket"] == "archive"
+    assert s3.put_object.call_args.kwargs["Key"].startswith("giza/proofs/")
+    assert len(result.skipped) == 3
+
+
+def test_s3_sink_invalid_uri():
+    with pytest.raises(ValueError):
+        S3Sink("https://archive", client=Mock())
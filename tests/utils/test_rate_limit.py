@@ -0,0 +1,228 @@
+from unittest.mock import patch
+
+import pytest
+from requests import HTTPError, PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+from giza.cli.client import ApiClient
+from giza.cli.utils.rate_limit import (
+    QuotaTracker,
+    RateLimitedAdapter,
+    TokenBucket,
+    get_quota_tracker,
+    get_rate_limiter,
+    parse_retry_after,
+    quota_scope,
+)
+
+
+def build_response(status_code, headers=None):
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b""
+    response._content_consumed = True
+    return response
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def build_request():
+    request = PreparedRequest()
+    request.prepare(method="POST", url="http://dummy_host/api/v1/jobs", data=b"data")
+    return request
+
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_token_bucket_unlimited_does_not_wait():
+    bucket = TokenBucket()
+    with patch("time.sleep") as mock_sleep:
+        waited = sum(bucket.acquire() for _ in range(100))
+
+    mock_sleep.assert_not_called()
+    assert waited == 0
+
+
+def test_token_bucket_paces_after_burst():
+    with patch("time.sleep") as mock_sleep, patch(
+        "time.monotonic", side_effect=[0.0, 0.0, 0.0, 0.0, 0.5]
+    ):
+        bucket = TokenBucket(rate=2, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        waited = bucket.acquire()
+
+    mock_sleep.assert_called_once_with(0.5)
+    assert waited == 0.5
+
+
+def test_quota_scope():
+    request = PreparedRequest()
+    request.prepare(
+        method="POST", url="http://dummy_host/api/v1/models/3/versions/12/jobs?x=1"
+    )
+
+    assert quota_scope(request) == "POST /api/v1/models/{id}/versions/{id}/jobs"
+
+
+def test_quota_plenty_left_does_not_throttle():
+    quotas = QuotaTracker()
+    quotas.update(
+        "GET /jobs",
+        {
+            "X-RateLimit-Limit": "1000",
+            "X-RateLimit-Remaining": "999",
+            "X-RateLimit-Reset": "3600",
+        },
+    )
+
+    assert quotas.delay("GET /jobs") == (0.0, False)
+
+
+def test_quota_nearly_used_up_spreads_the_last_requests():
+    with patch("time.monotonic", return_value=100.0):
+        quotas = QuotaTracker()
+        quotas.update(
+            "POST /jobs",
+            {
+                "X-RateLimit-Limit": "100",
+                "X-RateLimit-Remaining": "5",
+                "X-RateLimit-Reset": "50",
+            },
+        )
+        quotas.sent("POST /jobs")
+
+        assert quotas.delay("POST /jobs") == (10.0, False)
+        assert quotas.delay("GET /jobs") == (0.0, False)
+
+
+def test_quota_used_up_waits_for_the_reset():
+    with patch("time.monotonic", return_value=0.0):
+        quotas = QuotaTracker()
+        quotas.update(
+            "POST /jobs", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"}
+        )
+        assert quotas.delay("POST /jobs") == (3.0, True)
+    with patch("time.monotonic", return_value=3.0):
+        assert quotas.delay("POST /jobs") == (0.0, False)
+
+
+def test_adapter_waits_for_a_quota_reset_within_max_wait():
+    clock = FakeClock()
+    quotas = QuotaTracker()
+    with patch("time.sleep", side_effect=clock.sleep), patch(
+        "time.monotonic", side_effect=clock.monotonic
+    ), patch.object(HTTPAdapter, "send", return_value=build_response(201)) as mock_send:
+        quotas.update(
+            "POST /api/v1/jobs",
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"},
+        )
+        adapter = RateLimitedAdapter(TokenBucket(), max_wait=10, quotas=quotas)
+        response = adapter.send(build_request())
+
+    assert response.status_code == 201
+    assert clock.sleeps == [3.0]
+    mock_send.assert_called_once()
+
+
+def test_adapter_fails_when_the_quota_resets_after_max_wait():
+    quotas = QuotaTracker()
+    quotas.update(
+        "POST /api/v1/jobs",
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "86400"},
+    )
+    adapter = RateLimitedAdapter(TokenBucket(), max_wait=10, quotas=quotas)
+    with patch.object(HTTPAdapter, "send") as mock_send, patch(
+        "time.sleep"
+    ) as mock_sleep:
+        response = adapter.send(build_request())
+
+    mock_send.assert_not_called()
+    mock_sleep.assert_not_called()
+    assert response.status_code == 429
+    assert "Quota used up" in response.json()["detail"]
+    with pytest.raises(HTTPError):
+        response.raise_for_status()
+
+
+def test_adapter_quota_of_an_endpoint_does_not_hold_the_others():
+    quotas = QuotaTracker()
+    quotas.update(
+        "POST /api/v1/jobs",
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "86400"},
+    )
+    request = PreparedRequest()
+    request.prepare(method="GET", url="http://dummy_host/api/v1/jobs/1")
+    adapter = RateLimitedAdapter(TokenBucket(), max_wait=10, quotas=quotas)
+    with patch.object(HTTPAdapter, "send", return_value=build_response(200)), patch(
+        "time.sleep"
+    ) as mock_sleep:
+        response = adapter.send(request)
+
+    assert response.status_code == 200
+    mock_sleep.assert_not_called()
+
+
+def test_adapter_queues_rate_limited_requests():
+    clock = FakeClock()
+    responses = [
+        build_response(429, {"Retry-After": "2"}),
+        build_response(429),
+        build_response(201),
+    ]
+    with patch.object(HTTPAdapter, "send", side_effect=responses) as mock_send, patch(
+        "time.sleep", side_effect=clock.sleep
+    ), patch("time.monotonic", side_effect=clock.monotonic):
+        adapter = RateLimitedAdapter(TokenBucket())
+        response = adapter.send(build_request())
+
+    assert response.status_code == 201
+    assert mock_send.call_count == 3
+    assert clock.sleeps == [2.0, 1.0]
+
+
+def test_adapter_gives_up_after_max_wait():
+    adapter = RateLimitedAdapter(TokenBucket(), max_wait=10)
+    with patch.object(
+        HTTPAdapter, "send", return_value=build_response(429, {"Retry-After": "60"})
+    ) as mock_send, patch("time.sleep"):
+        response = adapter.send(build_request())
+
+    mock_send.assert_called_once()
+    assert response.status_code == 429
+
+
+def test_api_client_mounts_shared_adapter(tmpdir):
+    with patch("pathlib.Path.home", return_value=tmpdir):
+        client = ApiClient("http://dummy_host")
+        other = ApiClient("http://dummy_host")
+
+    adapter = client.session.get_adapter("http://dummy_host/api/v1/models")
+    assert isinstance(adapter, RateLimitedAdapter)
+    assert adapter.bucket is other.session.get_adapter("http://dummy_host/").bucket
+    assert adapter.bucket is get_rate_limiter("dummy_host")
+    assert adapter.quotas is get_quota_tracker("dummy_host")
+    assert not isinstance(
+        client.session.get_adapter("https://storage.googleapis.com/upload"),
+        RateLimitedAdapter,
+    )
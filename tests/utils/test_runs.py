@@ -0,0 +1,34 @@
+import json
+
+from giza.cli.utils.runs import COMPLETED, SUBMITTED, Run, list_runs, load_run
+
+
+def test_run_journal_lifecycle(runs_dir):
+    run = Run.start("prove", "CAIRO", stage=SUBMITTED, job_id=1, output_path="zk")
+
+    assert run.path.parent == runs_dir
+    assert json.loads(run.path.read_text())["job_id"] == 1
+    assert (run.path.stat().st_mode & 0o777) == 0o600
+
+    run.update(stage=COMPLETED)
+    loaded = load_run(run.id)
+    assert loaded.stage == COMPLETED
+    assert loaded.output_path == "zk"
+
+    run.finish()
+    assert load_run(run.id) is None
+    # Finishing twice is harmless
+    run.finish()
+
+
+def test_list_runs_most_recent_first(runs_dir):
+    first = Run.start("transpile", "CAIRO", model_id=1, version_id=1)
+    second = Run.start("prove", "CAIRO", job_id=2)
+    first.update(uploaded=True)
+    (runs_dir / "broken.json").write_text("{")
+
+    assert [run.id for run in list_runs()] == [first.id, second.id]
+
+
+def test_list_runs_without_folder(runs_dir):
+    assert list_runs() == []
@@ -0,0 +1,99 @@
+import json
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests import Response
+from requests.adapters import HTTPAdapter
+
+from giza.cli.utils.tracing import SpanKind, StatusCode, TracedSession, Tracer
+
+
+@pytest.fixture
+def enabled_tracer():
+    tracer = Tracer()
+    tracer.enabled = True
+    with patch("giza.cli.utils.tracing.tracer", tracer):
+        yield tracer
+
+
+def test_spans_are_nested():
+    tracer = Tracer()
+    tracer.enabled = True
+    with tracer.span("giza prove") as root:
+        with tracer.span("job_create") as child:
+            assert tracer.current_span is child
+    with pytest.raises(SystemExit), tracer.span("giza verify") as failed:
+        raise SystemExit(1)
+
+    assert child.parent_id == root.span_id
+    assert child.trace_id == root.trace_id
+    assert root.parent_id is None
+    assert failed.status == StatusCode.ERROR
+    assert tracer.current_span is None
+
+
+def test_disabled_tracer_yields_none():
+    tracer = Tracer()
+    with tracer.span("phase") as span:
+        assert span is None
+    tracer.export()
+
+
+def test_export_to_file_without_collector(tmpdir, monkeypatch):
+    path = tmpdir / "traces.jsonl"
+    monkeypatch.setenv("GIZA_TRACES_FILE", str(path))
+    monkeypatch.delenv("OTEL_EXPORTER_OTLP_ENDPOINT", raising=False)
+    tracer = Tracer()
+    tracer.configure()
+    with tracer.span("upload", size=10):
+        pass
+    tracer.export()
+
+    with open(path) as f:
+        payload = json.loads(f.readline())
+    (span,) = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert span["name"] == "upload"
+    assert span["attributes"] == [{"key": "size", "value": {"intValue": "10"}}]
+
+
+def test_export_falls_back_to_file(tmpdir, monkeypatch):
+    path = tmpdir / "traces.jsonl"
+    monkeypatch.setenv("GIZA_TRACES_FILE", str(path))
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318")
+    tracer = Tracer()
+    tracer.configure()
+    with tracer.span("download"):
+        pass
+    with patch(
+        "requests.post", side_effect=requests.ConnectionError
+    ) as mock_post, patch("giza.cli.utils.tracing.echo"):
+        tracer.export()
+
+    assert mock_post.call_args.args[0] == "http://localhost:4318/v1/traces"
+    assert path.exists()
+
+
+def test_traced_session_records_client_spans(enabled_tracer):
+    response = Response()
+    response.status_code = 200
+    response.headers["x-request-id"] = "request-id"
+    response._content = b""
+    session = TracedSession(propagate_to="http://dummy_host/api/v1")
+
+    with patch.object(HTTPAdapter, "send", return_value=response) as mock_send:
+        session.get("http://dummy_host/api/v1/models/1")
+        session.get("https://storage.googleapis.com/upload?signature=secret")
+
+    api_request = mock_send.call_args_list[0].args[0]
+    presigned_request = mock_send.call_args_list[1].args[0]
+    api_span, presigned_span = enabled_tracer._finished
+    assert api_span.kind == SpanKind.CLIENT
+    assert api_span.name == "GET /api/v1/models/{id}"
+    assert api_span.attributes["http.request_id"] == "request-id"
+    assert api_request.headers["traceparent"] == api_span.traceparent
+    assert presigned_span.name == "GET presigned"
+    assert presigned_span.attributes["url.full"] == (
+        "https://storage.googleapis.com/upload"
+    )
+    assert "traceparent" not in presigned_request.headers
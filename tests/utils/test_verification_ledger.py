@@ -0,0 +1,80 @@
+import pytest
+
+from giza.cli.schemas.verify import VerifyResponse
+from giza.cli.utils.metrics import metrics
+from giza.cli.utils.verification_ledger import (
+    VERIFICATION_LEDGER_DIR_VARIABLE,
+    VERIFIER_VERSION_VARIABLE,
+    VerificationLedger,
+    collect_verification,
+    verification_ledger_dir,
+)
+
+
+def test_record_and_get(tmp_path):
+    ledger = VerificationLedger("CAIRO", version="1.0", directory=tmp_path)
+    hits = metrics.counter("giza_verification_ledger_total", result="hit")
+
+    assert ledger.get("abc") is None
+    ledger.record(
+        "abc", VerifyResponse(verification=True, verification_time=2.5), job_id=7
+    )
+    record = VerificationLedger("CAIRO", version="1.0", directory=tmp_path).get("abc")
+
+    assert record.verification is True
+    assert record.verification_time == 2.5
+    assert record.job_id == 7 and record.verified_at is not None
+    assert record.proof_sha256 == "abc" and record.verifier_version == "1.0"
+    assert (tmp_path / "cairo-1.0" / "abc.json").exists()
+    assert metrics.counter("giza_verification_ledger_total", result="hit") > hits
+
+
+def test_verifier_version_isolates_results(tmp_path, monkeypatch):
+    monkeypatch.setenv(VERIFIER_VERSION_VARIABLE, "1.0")
+    VerificationLedger("CAIRO", directory=tmp_path).record(
+        "abc", VerifyResponse(verification=True)
+    )
+
+    assert VerificationLedger("CAIRO", directory=tmp_path).get("abc") is not None
+    assert VerificationLedger("EZKL", directory=tmp_path).get("abc") is None
+    monkeypatch.setenv(VERIFIER_VERSION_VARIABLE, "2.0")
+    assert VerificationLedger("CAIRO", directory=tmp_path).get("abc") is None
+
+
+def test_verifier_version_is_required(tmp_path, monkeypatch):
+    monkeypatch.delenv(VERIFIER_VERSION_VARIABLE, raising=False)
+
+    with pytest.raises(ValueError):
+        VerificationLedger("CAIRO", directory=tmp_path)
+
+
+def test_collect_detached_verification(tmp_path):
+    ledger = VerificationLedger("CAIRO", version="1.0", directory=tmp_path)
+    ledger.submit("abc", 7)
+    ledger.submit("def", 8)
+
+    record = collect_verification(
+        7, VerifyResponse(verification=True, verification_time=2.5), tmp_path
+    )
+
+    assert record.job_id == 7 and record.verification_time == 2.5
+    assert ledger.get("abc").job_id == 7
+    # Failed jobs are dropped without a record, unknown jobs are ignored
+    assert collect_verification(8, None, tmp_path) is None
+    assert ledger.get("def") is None
+    assert collect_verification(7, VerifyResponse(verification=True), tmp_path) is None
+    assert not list((tmp_path / "pending").iterdir())
+
+
+def test_corrupted_entry_is_a_miss(tmp_path):
+    ledger = VerificationLedger("CAIRO", version="1.0", directory=tmp_path)
+    ledger.record("abc", VerifyResponse(verification=True))
+    (tmp_path / "cairo-1.0" / "abc.json").write_text("{")
+
+    assert ledger.get("abc") is None
+
+
+def test_verification_ledger_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(VERIFICATION_LEDGER_DIR_VARIABLE, str(tmp_path))
+
+    assert verification_ledger_dir() == tmp_path